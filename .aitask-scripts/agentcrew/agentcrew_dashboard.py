@@ -14,6 +14,7 @@ from agentcrew.agentcrew_utils import (
     AGENT_STATUSES,
     AGENTCREW_DIR,
     CREW_STATUSES,
+    ReadySet,
     check_agent_alive,
     crew_worktree_path,
     effective_crew_rollup,
@@ -95,6 +96,11 @@ def _read_file_preview(path: str, max_lines: int = 5) -> str:
 class CrewManager:
     """Thin wrapper around agentcrew_utils for TUI data needs."""
 
+    def __init__(self) -> None:
+        # One ReadySet per crew, synced on every load_crew poll so a refresh
+        # only revisits the dependents of agents whose status changed.
+        self._ready_sets: dict[str, ReadySet] = {}
+
     def refresh_all(self) -> list[dict]:
         """Return list of all crews with summary info."""
         return list_crews()
@@ -152,6 +158,13 @@ class CrewManager:
                 ),
             }
 
+        # Readiness: which deps still block each Waiting agent
+        ready_set = self._ready_sets.setdefault(crew_id, ReadySet())
+        ready_set.sync(agents)
+        for name, a in agents.items():
+            a["ready"] = ready_set.is_ready(name)
+            a["unmet_deps"] = ready_set.unmet(name)
+
         # Compute topo order
         dep_graph = {name: a.get("depends_on", []) for name, a in agents.items()}
         try:
@@ -264,10 +277,13 @@ class AgentCard(Static, can_focus=True):
         msg = d.get("last_message", "")
         msg_str = f"  {msg}" if msg else ""
 
-        # Blocked-by info
+        # Blocked-by info: only the dependencies not yet Completed
         blocked = ""
-        if status in ("Waiting", "Ready") and deps:
-            blocked = f"  ⏳ Blocked by: {', '.join(deps)}"
+        unmet = d.get("unmet_deps", deps)
+        if status == "Waiting" and unmet:
+            blocked = f"  ⏳ Blocked by: {', '.join(unmet)}"
+        elif d.get("ready"):
+            blocked = "  ▶ Ready"
 
         # Error message
         error = ""
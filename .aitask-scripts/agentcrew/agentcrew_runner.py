@@ -13,7 +13,9 @@ import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable
+
+import yaml
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
@@ -21,12 +23,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lib"))
 from agentcrew.agentcrew_utils import (
     AGENTCREW_DIR,
     AGENT_STATUSES,
+    ReadySet,
     check_agent_alive,
     compute_crew_progress,
     compute_crew_status,
     crew_worktree_path,
     get_agent_names,
-    get_ready_agents,
     get_stale_agents,
     git_cmd,
     git_commit_push_if_changes,
@@ -50,6 +52,7 @@ from lib.agent_launch_utils import (
     maybe_spawn_minimonitor,
     tmux_window_target,
 )
+from lib.fs_watch import DirWatcher
 from lib.launch_modes import DEFAULT_LAUNCH_MODE, VALID_LAUNCH_MODES
 from lib.tmux_exec import TmuxClient
 
@@ -69,6 +72,10 @@ CONFIG_FILE = "aitasks/metadata/crew_runner_config.yaml"
 
 DEFAULT_INTERVAL = 30
 DEFAULT_MAX_CONCURRENT = 3
+# Watch mode: the longest a runner-side or agent-side change may wait before it
+# is committed and pushed (capped at the interval — the heartbeat must reach the
+# remote at least that often for `--check` on another host to call it alive).
+DEFAULT_COMMIT_LATENCY = 10
 
 _log_handles: dict[str, object] = {}  # agent_name → open file handle for log
 _repo_root: str | None = None  # cached repo root (set in main)
@@ -384,6 +391,31 @@ def enforce_type_limits(ready: list[str], agents: dict[str, dict],
     return filtered
 
 
+def select_launches(agents: dict[str, dict], meta: dict, max_concurrent: int,
+                    groups: list[dict], ready_set: ReadySet,
+                    exclude: set[str] = frozenset()) -> tuple[list[str], list[str]]:
+    """Return ``(ready, to_launch)`` for the current in-memory agent state.
+
+    ``ready`` is every Waiting agent whose dependencies are all Completed
+    (``ready_set`` is synced with ``agents`` first, which only revisits the
+    dependents of agents whose status changed); ``to_launch`` is that set minus
+    ``exclude``, in group-priority order (lower sequence first, no-group last),
+    cut down by per-type limits and then by the free slots under
+    ``max_concurrent``.
+    """
+    ready_set.sync(agents)
+    ready = ready_set.ready()
+    launches = [n for n in ready if n not in exclude]
+    if groups and launches:
+        launches = sorted(
+            launches,
+            key=lambda n: group_sort_key(agents.get(n, {}), groups),
+        )
+    launches = enforce_type_limits(launches, agents, meta)
+    available_slots = max(0, max_concurrent - count_running(agents))
+    return ready, launches[:available_slots]
+
+
 class LaunchError(Exception):
     """Raised by launcher functions when a launch precondition fails
     (e.g. no tmux/terminal available, openshell not implemented).
@@ -815,16 +847,18 @@ def graceful_shutdown(worktree: str, crew_id: str, interval: int, batch: bool) -
 # Main loop
 # ---------------------------------------------------------------------------
 
-def run_loop(worktree: str, crew_id: str, interval: int, max_concurrent: int,
-             once: bool, dry_run: bool, batch: bool,
-             reset_errors: bool = False) -> int:
-    """Run the main orchestration loop."""
-    global _should_stop
+def _start_runner(worktree: str, interval: int, dry_run: bool, batch: bool,
+                  reset_errors: bool) -> tuple[dict, int] | None:
+    """Shared start-up of both loops: read the crew meta, install the signal
+    handlers, announce the runner and apply ``--reset-errors``.
 
+    Returns ``(meta, heartbeat_timeout_seconds)``, or None (after printing the
+    error) when the crew meta file is missing.
+    """
     meta_path = os.path.join(worktree, CREW_META_FILE)
     if not os.path.isfile(meta_path):
         print(f"ERROR: Crew meta file not found: {meta_path}", file=sys.stderr)
-        return 1
+        return None
 
     meta = read_yaml(meta_path)
 
@@ -864,6 +898,21 @@ def run_loop(worktree: str, crew_id: str, interval: int, max_concurrent: int,
             git_commit_push_if_changes(worktree, "runner: reset errored agents",
                                        batch)
 
+    return meta, hb_timeout
+
+
+def run_loop(worktree: str, crew_id: str, interval: int, max_concurrent: int,
+             once: bool, dry_run: bool, batch: bool,
+             reset_errors: bool = False) -> int:
+    """Run the main orchestration loop."""
+    global _should_stop
+
+    started = _start_runner(worktree, interval, dry_run, batch, reset_errors)
+    if started is None:
+        return 1
+    meta, hb_timeout = started
+
+    ready_set = ReadySet()
     iteration = 0
     while not _should_stop:
         iteration += 1
@@ -898,33 +947,15 @@ def run_loop(worktree: str, crew_id: str, interval: int, max_concurrent: int,
         # Process pending commands
         process_pending_commands(worktree, agents, batch)
 
-        # Find ready agents
-        ready = get_ready_agents(worktree)
+        # Find ready agents — from the statuses read above (the pending
+        # commands already folded into them), not a second pass over the files
+        ready, launches = select_launches(agents, meta, max_concurrent,
+                                          load_groups(worktree), ready_set)
         if ready:
             log(f"Ready agents: {', '.join(ready)}", batch)
 
-        # Sort by group priority (lower sequence first, no-group last)
-        groups = load_groups(worktree)
-        if groups and ready:
-            agent_data = {
-                name: read_yaml(os.path.join(worktree, f"{name}_status.yaml"))
-                for name in ready
-            }
-            ready = sorted(
-                ready,
-                key=lambda n: group_sort_key(agent_data.get(n, {}), groups),
-            )
-
-        # Enforce per-type limits
-        ready = enforce_type_limits(ready, agents, meta)
-
-        # Enforce overall max concurrent
-        running_count = count_running(agents)
-        available_slots = max(0, max_concurrent - running_count)
-        ready = ready[:available_slots]
-
         # Launch ready agents
-        for agent_name in ready:
+        for agent_name in launches:
             launch_agent(worktree, agent_name, agents, meta, dry_run, batch)
 
         # Recompute crew status
@@ -937,7 +968,8 @@ def run_loop(worktree: str, crew_id: str, interval: int, max_concurrent: int,
             print(f"PROGRESS:{progress}")
             print(f"ETA:{eta}")
             print(f"RUNNING:{count_running(agents)}")
-            print(f"READY:{len(get_ready_agents(worktree))}")
+            ready_set.sync(agents)
+            print(f"READY:{len(ready_set.ready())}")
         else:
             log(f"Progress: {progress}% | Running: {count_running(agents)}/{max_concurrent} | ETA: {eta}", batch)
 
@@ -979,6 +1011,317 @@ def run_loop(worktree: str, crew_id: str, interval: int, max_concurrent: int,
     return 0
 
 
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+#
+# run_loop above wakes every `interval` seconds and then redoes everything:
+# git pull, a read of every status file, a full `git add -A` / commit / push.
+# With a 40-agent crew an agent that completes right after an iteration waits a
+# whole interval before its dependents launch, and every iteration is a commit.
+# The watch loop instead blocks on the worktree (lib/fs_watch.DirWatcher:
+# inotify, or a stat poll), re-reads only the status files that changed,
+# schedules on that in-memory state immediately, and coalesces the resulting
+# git traffic into one commit per `commit_latency` window. The interval keeps
+# its other duties: heartbeat, git pull (which is how remote edits — a stop
+# request, a command sent from another host — arrive) and stale-heartbeat
+# reporting.
+
+# Worktree entries whose change can alter what the scheduler decides.
+_WATCH_STATUS_SUFFIX = "_status.yaml"
+_WATCH_COMMANDS_SUFFIX = "_commands.yaml"
+_WATCH_GROUPS_FILE = "_groups.yaml"
+
+
+class AgentStatusCache:
+    """``{agent_name: status data}`` kept in memory across watch iterations.
+
+    :meth:`refresh` re-reads a ``<agent>_status.yaml`` only when its
+    ``(mtime_ns, size, inode)`` changed, so a wake-up caused by one agent costs
+    one YAML parse rather than one per agent. A file that fails to parse (caught
+    mid-write by the poll backend, or hand-edited badly) keeps its previous
+    data until the next change to it.
+
+    The returned dicts are the cached objects themselves: the runner's own
+    in-place updates (``agents[name]["status"] = ...`` in launch_agent and
+    process_pending_commands) are visible until the file is re-read.
+    """
+
+    def __init__(self, worktree: str):
+        self.worktree = worktree
+        self._files: dict[str, tuple[tuple, dict]] = {}  # basename → (sig, data)
+        self.reads = 0
+
+    def refresh(self, names: Iterable[str] | None = None) -> dict[str, dict]:
+        """Re-read changed status files and return the current agent map.
+
+        ``names`` are worktree entry names reported changed (anything that is
+        not an agent status file is ignored); None rescans the directory.
+        """
+        if names is None:
+            present = {
+                os.path.basename(p)
+                for p in list_agent_files(self.worktree, _WATCH_STATUS_SUFFIX)
+            }
+            for gone in set(self._files) - present:
+                del self._files[gone]
+            candidates: Iterable[str] = present
+        else:
+            candidates = [
+                n for n in names
+                if n.endswith(_WATCH_STATUS_SUFFIX) and not n.startswith("_")
+            ]
+        for fname in candidates:
+            path = os.path.join(self.worktree, fname)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                self._files.pop(fname, None)
+                continue
+            except OSError:
+                continue
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+            cached = self._files.get(fname)
+            if cached is not None and cached[0] == sig:
+                continue
+            try:
+                data = read_yaml(path)
+            except (OSError, yaml.YAMLError):
+                continue
+            self._files[fname] = (sig, data)
+            self.reads += 1
+        return self.agents()
+
+    def agents(self) -> dict[str, dict]:
+        """The cached agent map, without touching the filesystem."""
+        agents = {}
+        for _sig, data in self._files.values():
+            name = data.get("agent_name", "")
+            if name:
+                agents[name] = data
+        return agents
+
+
+class GitSyncBatcher:
+    """Coalesce worktree changes into one commit + push per latency window.
+
+    :meth:`mark` records that something changed. An ``urgent`` change (a
+    status or command file — what other hosts and the dashboards act on)
+    opens a window of ``max_latency`` seconds; everything changed by then goes
+    out in one :func:`git_commit_push_if_changes` from :meth:`maybe_flush`.
+    Non-urgent churn (agent heartbeats, logs) rides along with the next window
+    or the next interval tick. In dry-run mode nothing is ever committed.
+    """
+
+    def __init__(self, worktree: str, max_latency: float, batch: bool,
+                 dry_run: bool = False):
+        self.worktree = worktree
+        self.max_latency = max(0.0, float(max_latency))
+        self.batch = batch
+        self.dry_run = dry_run
+        self.dirty = False
+        self.deadline: float | None = None
+        self.flushes = 0
+
+    def mark(self, urgent: bool = True) -> None:
+        if self.dry_run:
+            return
+        self.dirty = True
+        if urgent and self.deadline is None:
+            self.deadline = time.monotonic() + self.max_latency
+
+    def maybe_flush(self, message: str) -> bool:
+        """Flush if the window opened by an urgent change has elapsed."""
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return self.flush(message)
+        return False
+
+    def flush(self, message: str) -> bool:
+        """Commit and push now if anything was marked; True if it ran."""
+        if self.dry_run or not self.dirty:
+            return False
+        self.dirty = False
+        self.deadline = None
+        git_commit_push_if_changes(self.worktree, message, self.batch)
+        self.flushes += 1
+        return True
+
+
+def _log_stale_agents(worktree: str, agents: dict[str, dict], hb_timeout: int,
+                      batch: bool) -> None:
+    """get_stale_agents over the in-memory statuses (only the Running agents'
+    ``_alive.yaml`` files are read)."""
+    stale = []
+    for name, data in sorted(agents.items()):
+        if data.get("status") != "Running":
+            continue
+        alive_path = os.path.join(worktree, f"{name}_alive.yaml")
+        if not os.path.isfile(alive_path) or not check_agent_alive(alive_path, hb_timeout):
+            stale.append(name)
+    if stale:
+        log(f"Stale heartbeat (status unchanged): {', '.join(stale)}", batch)
+
+
+def run_watch_loop(worktree: str, crew_id: str, interval: int,
+                   max_concurrent: int, dry_run: bool, batch: bool,
+                   reset_errors: bool = False,
+                   commit_latency: int = DEFAULT_COMMIT_LATENCY) -> int:
+    """Event-driven variant of :func:`run_loop` (``--watch``).
+
+    Same decisions, same batch-mode lines; what differs is when they happen.
+    A status file written by an agent wakes the loop at once and its
+    dependents launch in that wake-up; commits are batched (see
+    :class:`GitSyncBatcher`) with at most ``min(commit_latency, interval)``
+    seconds of delay; the heartbeat, git pull and stale-heartbeat report run
+    every ``interval`` seconds. ``_crew_status.yaml`` and the progress lines
+    are rewritten when an agent status changes, or on the interval tick.
+    """
+    global _should_stop
+
+    started = _start_runner(worktree, interval, dry_run, batch, reset_errors)
+    if started is None:
+        return 1
+    meta, hb_timeout = started
+
+    cache = AgentStatusCache(worktree)
+    ready_set = ReadySet()
+    sync = GitSyncBatcher(worktree, min(commit_latency, interval), batch, dry_run)
+    watcher = DirWatcher(worktree, poll_interval=min(1.0, float(interval)))
+    if batch:
+        print(f"WATCH_MODE:{watcher.backend}")
+    else:
+        log(f"Watching worktree ({watcher.backend}), commit latency "
+            f"{sync.max_latency:.0f}s", batch)
+
+    agents: dict[str, dict] = {}
+    groups: list[dict] = []
+    commands_changed: set[str] = set()
+    # Agents launch_agent left Waiting (dry-run, missing work2do or
+    # agent_string): retried on the next tick, as run_loop retries them every
+    # iteration, rather than on every wake-up in between.
+    deferred: set[str] = set()
+    last_status_sig: tuple | None = None
+    next_tick = time.monotonic()
+    tick = 0
+    stop_requested = False
+
+    with watcher:
+        while not _should_stop:
+            tick_due = time.monotonic() >= next_tick
+            if tick_due:
+                tick += 1
+                log(f"--- Tick {tick} ---", batch)
+                if not dry_run:
+                    update_runner_heartbeat(worktree, interval)
+                    git_pull(worktree, batch)
+                    sync.mark(urgent=False)
+                # A pull can rewrite any file: rescan (only changed files are
+                # actually re-read) and look at every agent's command file.
+                agents = cache.refresh()
+                groups = load_groups(worktree)
+                commands_changed = set(agents)
+                deferred.clear()
+                stop_requested = check_requested_action(worktree) == "stop"
+                if hb_timeout and not stop_requested:
+                    _log_stale_agents(worktree, agents, hb_timeout, batch)
+                next_tick = time.monotonic() + interval
+
+            if stop_requested:
+                graceful_shutdown(worktree, crew_id, interval, batch)
+                break
+
+            # Process pending commands of the agents whose file changed
+            if commands_changed:
+                process_pending_commands(
+                    worktree,
+                    {n: agents[n] for n in sorted(commands_changed) if n in agents},
+                    batch,
+                )
+                commands_changed = set()
+
+            ready, launches = select_launches(agents, meta, max_concurrent,
+                                              groups, ready_set, deferred)
+            if launches:
+                log(f"Ready agents: {', '.join(ready)}", batch)
+            for agent_name in launches:
+                launch_agent(worktree, agent_name, agents, meta, dry_run, batch)
+                if agents[agent_name].get("status") == "Waiting":
+                    deferred.add(agent_name)
+
+            status_sig = tuple(sorted((n, d.get("status")) for n, d in agents.items()))
+            if tick_due or status_sig != last_status_sig:
+                last_status_sig = status_sig
+                if not dry_run:
+                    recompute_crew_status(worktree, agents)
+                progress, eta = compute_progress_eta(agents)
+                if batch:
+                    print(f"PROGRESS:{progress}")
+                    print(f"ETA:{eta}")
+                    print(f"RUNNING:{count_running(agents)}")
+                    ready_set.sync(agents)
+                    print(f"READY:{len(ready_set.ready())}", flush=True)
+                else:
+                    log(f"Progress: {progress}% | Running: {count_running(agents)}/{max_concurrent} | ETA: {eta}", batch)
+
+            all_terminal = all(
+                d.get("status") in ("Completed", "Aborted", "Error")
+                for d in agents.values()
+            ) if agents else False
+            if all_terminal:
+                log("All agents in terminal state — stopping runner", batch)
+                if not dry_run:
+                    write_runner_alive(worktree, interval, status="stopped")
+                    recompute_crew_status(worktree, agents)
+                    sync.mark()
+                    sync.flush("runner: all agents terminal")
+                if batch:
+                    print("ALL_TERMINAL")
+                break
+
+            if tick_due:
+                sync.flush(f"runner: tick {tick}")
+            else:
+                sync.maybe_flush("runner: sync")
+
+            # Sleep until a change, the commit window or the next tick — in
+            # slices of at most a second so SIGTERM is honored promptly
+            # (select() resumes after a signal handler that only sets a flag).
+            wake_at = next_tick if sync.deadline is None else min(next_tick, sync.deadline)
+            changed = watcher.wait(min(1.0, max(0.0, wake_at - time.monotonic())))
+            if changed is None:
+                agents = cache.refresh()
+                groups = load_groups(worktree)
+                commands_changed = set(agents)
+                sync.mark()
+                continue
+            if not changed:
+                continue
+
+            urgent = False
+            status_names = []
+            for fname in changed:
+                if fname.endswith(_WATCH_STATUS_SUFFIX) and not fname.startswith("_"):
+                    status_names.append(fname)
+                    urgent = True
+                elif fname.endswith(_WATCH_COMMANDS_SUFFIX):
+                    commands_changed.add(fname[:-len(_WATCH_COMMANDS_SUFFIX)])
+                    urgent = True
+                elif fname == _WATCH_GROUPS_FILE:
+                    groups = load_groups(worktree)
+                    urgent = True
+                elif fname == RUNNER_ALIVE_FILE:
+                    stop_requested = check_requested_action(worktree) == "stop"
+            if status_names:
+                agents = cache.refresh(status_names)
+            sync.mark(urgent)
+
+    # Final cleanup
+    if _should_stop:
+        graceful_shutdown(worktree, crew_id, interval, batch)
+
+    return 0
+
+
 # ---------------------------------------------------------------------------
 # CLI entry point
 # ---------------------------------------------------------------------------
@@ -995,6 +1338,13 @@ def main() -> int:
     parser.add_argument("--max-concurrent", type=int, default=None,
                         help=f"Max concurrent agents (default: config or {DEFAULT_MAX_CONCURRENT})")
     parser.add_argument("--once", action="store_true", help="Run single iteration")
+    parser.add_argument("--watch", action="store_true",
+                        help="React to worktree changes as they happen instead "
+                             "of once per interval (ignored with --once)")
+    parser.add_argument("--commit-latency", type=int, default=DEFAULT_COMMIT_LATENCY,
+                        help="With --watch: max seconds a change waits to be "
+                             f"committed and pushed (default: {DEFAULT_COMMIT_LATENCY}, "
+                             "capped at the interval)")
     parser.add_argument("--dry-run", action="store_true", help="Show actions without executing")
     parser.add_argument("--batch", action="store_true", help="Structured output")
     parser.add_argument("--check", action="store_true", help="Diagnostic mode")
@@ -1034,9 +1384,14 @@ def main() -> int:
         log(f"  Worktree:       {worktree}")
         log(f"  Interval:       {interval}s")
         log(f"  Max concurrent: {max_concurrent}")
-        log(f"  Mode:           {'once' if args.once else 'continuous'}"
+        mode = "once" if args.once else ("watch" if args.watch else "continuous")
+        log(f"  Mode:           {mode}"
             f"{'  (dry-run)' if args.dry_run else ''}")
 
+    if args.watch and not args.once:
+        return run_watch_loop(worktree, crew_id, interval, max_concurrent,
+                              args.dry_run, args.batch, args.reset_errors,
+                              args.commit_latency)
     return run_loop(worktree, crew_id, interval, max_concurrent,
                     args.once, args.dry_run, args.batch, args.reset_errors)
 
@@ -18,13 +18,13 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from agentcrew.agentcrew_utils import (
     AGENTCREW_DIR,
     AGENT_STATUSES,
+    ReadySet,
     check_agent_alive,
     compute_crew_progress,
     compute_crew_status,
     crew_worktree_path,
     effective_crew_rollup,
     get_agent_names,
-    get_ready_agents,
     get_stale_agents,
     git_commit_push_if_changes,
     list_agent_files,
@@ -156,11 +156,13 @@ def cmd_list(args: argparse.Namespace) -> None:
     timeout = _get_heartbeat_timeout(wt)
     group_filter = getattr(args, "group", None) or None
 
+    agents: dict[str, dict] = {}
     for status_file in list_agent_files(wt, "_status.yaml"):
         data = read_yaml(status_file)
         name = data.get("agent_name", "")
         if not name:
             continue
+        agents[name] = data
         if group_filter and data.get("group", "") != group_filter:
             continue
         status = data.get("status", "Unknown")
@@ -176,12 +178,14 @@ def cmd_list(args: argparse.Namespace) -> None:
 
         print(f"AGENT:{name} STATUS:{status} PROGRESS:{progress} HEARTBEAT:{hb}")
 
-    # Also show ready agents and stale agents (filtered by group if active)
-    ready = get_ready_agents(wt)
+    # Also show ready agents and stale agents (filtered by group if active).
+    # Readiness comes from the statuses read above — across all groups, since
+    # a dependency may live in another group.
+    ready = ReadySet(agents).ready()
     stale = get_stale_agents(wt, timeout)
     if group_filter:
-        from agentcrew.agentcrew_utils import get_group_agents
-        group_members = set(get_group_agents(wt, group_filter))
+        group_members = {n for n, d in agents.items()
+                         if d.get("group", "") == group_filter}
         ready = [a for a in ready if a in group_members]
         stale = [a for a in stale if a in group_members]
     if ready:
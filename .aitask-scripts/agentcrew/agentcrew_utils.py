@@ -356,24 +356,144 @@ def get_ready_agents(worktree_path: str) -> list[str]:
         name = data.get("agent_name", "")
         if name:
             agent_data[name] = data
+    return compute_ready_agents(agent_data)
 
-    ready = []
-    for name, data in agent_data.items():
-        if data.get("status") != "Waiting":
-            continue
-        deps = data.get("depends_on", [])
-        if not deps:
-            ready.append(name)
-            continue
-        # Check all deps are Completed
-        all_done = all(
-            agent_data.get(dep, {}).get("status") == "Completed"
-            for dep in deps
-        )
-        if all_done:
-            ready.append(name)
 
-    return sorted(ready)
+def compute_ready_agents(agent_data: dict[str, dict]) -> list[str]:
+    """:func:`get_ready_agents` over already-loaded ``{name: status data}``.
+
+    For callers that already hold the statuses and must not re-read every
+    status file to answer. One-shot; a caller that asks repeatedly while
+    statuses change (the runner) keeps a :class:`ReadySet` instead.
+    """
+    return ReadySet(agent_data).ready()
+
+
+def _normalize_deps(deps) -> tuple[str, ...]:
+    """``depends_on`` as a duplicate-free tuple (None / "" → no deps)."""
+    if not deps:
+        return ()
+    if isinstance(deps, str):
+        deps = [deps]
+    return tuple(dict.fromkeys(str(d) for d in deps))
+
+
+class ReadySet:
+    """Incrementally maintained set of agents ready to launch.
+
+    An agent is ready when it is ``Waiting`` and every agent in its
+    ``depends_on`` is ``Completed`` (a dependency that does not exist counts as
+    not Completed). Rather than rescanning every Waiting agent's dependency
+    list on each question, the set keeps reverse edges (``dep → dependents``)
+    and, per agent, the number of dependencies not yet Completed. A status
+    change then touches only the changed agent's direct dependents:
+    O(out-degree) instead of O(agents × deps).
+
+    Feed it with :meth:`set_agent` / :meth:`remove` for known changes, or with
+    :meth:`sync` from a ``{name: status data}`` map (the shape
+    ``read_all_agent_statuses`` and the runner's status cache produce), which
+    compares each agent's ``(status, depends_on)`` to what it last saw and
+    applies only the differences.
+    """
+
+    def __init__(self, agent_data: dict[str, dict] | None = None):
+        self._status: dict[str, str] = {}
+        self._deps: dict[str, tuple[str, ...]] = {}
+        self._raw_deps: dict[str, object] = {}  # depends_on as last given, for sync()
+        self._dependents: dict[str, set[str]] = {}
+        self._unmet: dict[str, int] = {}
+        self._ready: set[str] = set()
+        if agent_data:
+            self.sync(agent_data)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._status
+
+    def __len__(self) -> int:
+        return len(self._status)
+
+    def set_agent(self, name: str, status: str, depends_on=()) -> None:
+        """Add agent ``name`` or record its new status / dependencies."""
+        deps = _normalize_deps(depends_on)
+        self._raw_deps[name] = (list(depends_on)
+                                if isinstance(depends_on, (list, tuple))
+                                else depends_on)
+        was_completed = self._status.get(name) == "Completed"
+        self._status[name] = status
+        now_completed = status == "Completed"
+        if was_completed != now_completed:
+            delta = -1 if now_completed else 1
+            for dependent in self._dependents.get(name, ()):
+                self._unmet[dependent] += delta
+                self._refresh(dependent)
+        if self._deps.get(name) != deps:
+            self._unlink(name)
+            for dep in deps:
+                self._dependents.setdefault(dep, set()).add(name)
+            self._deps[name] = deps
+            self._unmet[name] = sum(
+                1 for dep in deps if self._status.get(dep) != "Completed"
+            )
+        self._refresh(name)
+
+    def remove(self, name: str) -> None:
+        """Forget agent ``name``; its dependents see it as not Completed."""
+        if name not in self._status:
+            return
+        if self._status.pop(name) == "Completed":
+            for dependent in self._dependents.get(name, ()):
+                self._unmet[dependent] += 1
+                self._refresh(dependent)
+        self._unlink(name)
+        del self._deps[name]
+        del self._raw_deps[name]
+        del self._unmet[name]
+        self._ready.discard(name)
+
+    def sync(self, agent_data: dict[str, dict]) -> None:
+        """Bring the set in line with ``{name: status data}``.
+
+        O(agents) dictionary lookups; dependency lists are only re-walked
+        for agents whose ``depends_on`` actually changed.
+        """
+        status_of = self._status.get
+        raw_of = self._raw_deps.get
+        for name, data in agent_data.items():
+            status = data.get("status", "")
+            raw = data.get("depends_on")
+            if status_of(name) != status or raw_of(name, ()) != raw or name not in self._status:
+                self.set_agent(name, status, raw)
+        # Every name in agent_data is known now, so extras exist iff the
+        # sizes differ.
+        if len(self._status) != len(agent_data):
+            for name in [n for n in self._status if n not in agent_data]:
+                self.remove(name)
+
+    def ready(self) -> list[str]:
+        """Ready agent names, sorted."""
+        return sorted(self._ready)
+
+    def is_ready(self, name: str) -> bool:
+        return name in self._ready
+
+    def unmet(self, name: str) -> list[str]:
+        """Dependencies of ``name`` that are not (or not yet) Completed."""
+        return [d for d in self._deps.get(name, ())
+                if self._status.get(d) != "Completed"]
+
+    def _unlink(self, name: str) -> None:
+        for dep in self._deps.get(name, ()):
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(name)
+                if not dependents:
+                    del self._dependents[dep]
+
+    def _refresh(self, name: str) -> None:
+        if self._status.get(name) == "Waiting" and self._unmet.get(name) == 0:
+            self._ready.add(name)
+        else:
+            self._ready.discard(name)
 
 # ---------------------------------------------------------------------------
 # Heartbeat
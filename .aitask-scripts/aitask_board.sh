@@ -11,17 +11,10 @@ source "$SCRIPT_DIR/lib/terminal_compat.sh"
 
 PYTHON="$(require_ait_python_fast)"
 
-# Catch the orthogonal "venv exists but lacks deps" case (user updated framework
-# but did not re-run setup, so venv-Python is right version but missing imports).
-missing=()
-"$PYTHON" -c "import textual"    2>/dev/null || missing+=(textual)
-"$PYTHON" -c "import yaml"       2>/dev/null || missing+=(pyyaml)
-"$PYTHON" -c "import linkify_it" 2>/dev/null || missing+=(linkify-it-py)
-if [[ ${#missing[@]} -gt 0 ]]; then
-    die "Missing Python packages: ${missing[*]}. Run 'ait setup' to install all dependencies."
-fi
-
 # Check terminal capabilities (warn on incapable terminals)
 ait_warn_if_incapable_terminal
 
-exec "$PYTHON" "$SCRIPT_DIR/board/aitask_board.py" "$@"
+# Dependency check + TUI run in one interpreter: see lib/tui_zygote.py.
+exec "$PYTHON" "$SCRIPT_DIR/lib/tui_zygote.py" launch \
+    --deps textual,yaml=pyyaml,linkify_it=linkify-it-py \
+    "$SCRIPT_DIR/board/aitask_board.py" "$@"
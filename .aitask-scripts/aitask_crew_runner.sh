@@ -1,7 +1,7 @@
 #!/usr/bin/env bash
 # aitask_crew_runner.sh - Thin bash wrapper for the AgentCrew runner Python CLI.
 #
-# Usage: ait crew runner --crew <id> [--interval N] [--max-concurrent N] [--once] [--dry-run] [--check] [--force]
+# Usage: ait crew runner --crew <id> [--interval N] [--max-concurrent N] [--once] [--watch [--commit-latency N]] [--dry-run] [--check] [--force]
 #
 # Detects Python (venv > system), validates pyyaml is available, then execs
 # into agentcrew/agentcrew_runner.py.
@@ -24,7 +24,7 @@ if ! "$PYTHON" -c "import yaml" 2>/dev/null; then
 fi
 
 if [[ "${1:-}" == "--help" || "${1:-}" == "-h" ]]; then
-    echo "Usage: ait crew runner --crew <id> [--interval N] [--max-concurrent N] [--once] [--dry-run] [--check] [--force]"
+    echo "Usage: ait crew runner --crew <id> [--interval N] [--max-concurrent N] [--once] [--watch [--commit-latency N]] [--dry-run] [--check] [--force]"
     echo ""
     echo "Start or check the crew runner orchestrator."
     exit 0
@@ -15,6 +15,11 @@
 #                                                Append a gate-run block (the
 #                                                guard makes it a no-op once a
 #                                                terminal block exists for run-id)
+#   append-batch <task-id> [--fsync never|always] -- <op> [-- <op> ...]
+#                                                Several appends (op = the
+#                                                append args after <task-id>)
+#                                                under ONE lock and ONE write,
+#                                                in-process in gate_ledger.py
 #   status <task-id>                             Print derived per-gate state
 #   list   <task-id>                             List declared gates (+ registry)
 #   deps-unblock <task-id>                       Decide if this task releases its
@@ -309,6 +314,59 @@ cmd_append() {
     return "$rc"
 }
 
+# append-batch <task-id> [--fsync <policy>] -- <op> [-- <op> ...]
+#
+# The batched writer lives in gate_ledger.py (ledger_transaction): it takes the
+# same gate_<key> lock as cmd_append — a Python port of lib/stale_lock.sh on the
+# same path — and rewrites the file once for all ops. Without python, each op
+# goes through cmd_append in turn: same ledger, one lock + write per op.
+cmd_append_batch() {
+    local task_id="${1:-}"
+    local usage="Usage: aitask_gate.sh append-batch <task-id> [--fsync never|always] -- [--only-if-running <run-id>] <gate> <status> [k=v ...] [-- ...]"
+    [[ -z "$task_id" || $# -lt 2 ]] && die "$usage"
+    shift
+
+    local file
+    file="$(resolve_task_file "$task_id")"
+
+    local py
+    py="$(resolve_python 2>/dev/null || true)"
+    if [[ -n "$py" ]]; then
+        # The python side prints its own usage / lock error; keep its status.
+        local rc=0
+        "$py" "$GATE_LEDGER_PY" append-batch "$file" "${task_id//\//_}" "$@" || rc=$?
+        return "$rc"
+    fi
+
+    if [[ "${1:-}" == "--fsync" ]]; then
+        warn "append-batch: --fsync needs python — ignored"
+        shift 2 || true
+    fi
+    [[ "${1:-}" == "--" ]] || die "$usage"
+    local op=()
+    shift
+    while [[ $# -gt 0 ]]; do
+        if [[ "$1" == "--" ]]; then
+            _gate_append_batch_op "$task_id" "${op[@]}"
+            op=()
+        else
+            op+=("$1")
+        fi
+        shift
+    done
+    _gate_append_batch_op "$task_id" "${op[@]}"
+}
+
+_gate_append_batch_op() {
+    local task_id="$1"
+    shift
+    if [[ "${1:-}" == "--only-if-running" ]]; then
+        cmd_append "$1" "${2:-}" "$task_id" "${@:3}"
+    else
+        cmd_append "$task_id" "$@"
+    fi
+}
+
 # Append one gate-run block. ASSUMES THE CALLER HOLDS THE GATE LOCK for this
 # task — it never locks and never unlocks, so `cmd_begin_procedure` can hold the
 # lock across its live-run check and this append (the mkdir lock is not
@@ -1262,6 +1320,14 @@ Commands:
         for <run-id> (the run is still "running"); else no-op. Used by the
         orchestrator to write a terminal block exactly once per run (t635_11).
 
+  append-batch <task-id> [--fsync never|always] -- <op> [-- <op> ...]
+        Apply several appends under one per-task lock and one atomic rewrite
+        of the task file. Each <op> is what `append` takes after <task-id>:
+        [--only-if-running <run-id>] <gate> <status> [k=v ...]. Runs in-process
+        in lib/gate_ledger.py (same lock as `append`); falls back to one
+        `append` per op when no python is available. --fsync always (or
+        AIT_GATE_FSYNC=always) flushes the file and its directory on write.
+
   status <task-id>
         Print derived current state per gate (last run wins).
 
@@ -1451,6 +1517,7 @@ main() {
     local cmd="${1:-}"
     case "$cmd" in
         append) shift; cmd_append "$@" ;;
+        append-batch) shift; cmd_append_batch "$@" ;;
         status) shift; cmd_status "$@" ;;
         list)   shift; cmd_list "$@" ;;
         deps-unblock) shift; cmd_deps_unblock "$@" ;;
@@ -42,14 +42,6 @@ if [[ "$headless" -eq 1 ]]; then
     exec "$PYTHON" "$SCRIPT_DIR/applink/headless.py" ${fwd[@]+"${fwd[@]}"}
 fi
 
-# Catch the "venv exists but lacks deps" case.
-missing=()
-"$PYTHON" -c "import textual" 2>/dev/null || missing+=(textual)
-"$PYTHON" -c "import yaml"    2>/dev/null || missing+=(pyyaml)
-if [[ ${#missing[@]} -gt 0 ]]; then
-    die "Missing Python packages: ${missing[*]}. Run 'ait setup' to install all dependencies."
-fi
-
 # Check tmux is available
 if ! command -v tmux &>/dev/null; then
     echo "Error: tmux is not installed. The monitor TUI requires tmux." >&2
@@ -59,4 +51,6 @@ fi
 # Check terminal capabilities (warn on incapable terminals)
 ait_warn_if_incapable_terminal
 
-exec "$PYTHON" "$SCRIPT_DIR/monitor/monitor_app.py" "$@"
+# Dependency check + TUI run in one interpreter: see lib/tui_zygote.py.
+exec "$PYTHON" "$SCRIPT_DIR/lib/tui_zygote.py" launch --deps textual,yaml=pyyaml \
+    "$SCRIPT_DIR/monitor/monitor_app.py" "$@"
@@ -10,6 +10,8 @@
 # Subcommands:
 #   run      <task-id> [--gate <name>] [--dry-run]   Run the orchestrator
 #   unlocked <task-id>                               Print the unlocked gate set
+#   cache    <stats [--json] | clear>                Inspect / empty the verifier
+#                                                    result cache
 #
 # `max_parallel_gates` is read from the active execution profile (default 2),
 # capped by core count inside the engine. The engine appends through
@@ -28,6 +30,7 @@ source "$SCRIPT_DIR/lib/yaml_utils.sh"
 
 TASK_DIR="${TASK_DIR:-aitasks}"
 ORCH_PY="$SCRIPT_DIR/lib/gate_orchestrator.py"
+CACHE_PY="$SCRIPT_DIR/lib/gate_result_cache.py"
 REGISTRY="${TASK_DIR}/metadata/gates.yaml"
 PROFILES_DIR="${PROFILES_DIR:-$REPO_ROOT/aitasks/metadata/profiles}"
 
@@ -52,17 +55,28 @@ main() {
     local subcmd="${1:-}"
     case "$subcmd" in
         run|unlocked) shift ;;
+        cache)
+            shift
+            local py
+            py="$(resolve_python)" || die "python3 is required for the gate result cache"
+            case "${1:-}" in
+                stats|clear) exec "$py" "$CACHE_PY" "$@" ;;
+                *) die "Usage: aitask_run_gates.sh cache <stats [--json] | clear>" ;;
+            esac ;;
         --help|-h|"") cat <<'EOF'
 Usage: aitask_run_gates.sh <run|unlocked> <task-id> [options]
+       aitask_run_gates.sh cache <stats [--json] | clear>
 
   run      <task-id> [--gate <name>] [--dry-run]
         Run the gate orchestrator: dispatch unlocked machine-gate verifiers
         within their retry budgets, observe human gates, stop.
   unlocked <task-id>
         Print the gates runnable right now, one per line.
+  cache stats [--json] | cache clear
+        Show or empty the verifier result cache used by `cache: true` gates.
 EOF
             return 0 ;;
-        *) die "Unknown subcommand '$subcmd' (try: run | unlocked)" ;;
+        *) die "Unknown subcommand '$subcmd' (try: run | unlocked | cache)" ;;
     esac
 
     local task_id="${1:-}"
@@ -11,15 +11,9 @@ source "$SCRIPT_DIR/lib/terminal_compat.sh"
 
 PYTHON="$(require_ait_python)"
 
-# Catch the "venv exists but lacks deps" case (framework upgraded but setup not re-run).
-missing=()
-"$PYTHON" -c "import textual" 2>/dev/null || missing+=(textual)
-"$PYTHON" -c "import yaml"    2>/dev/null || missing+=(pyyaml)
-if [[ ${#missing[@]} -gt 0 ]]; then
-    die "Missing Python packages: ${missing[*]}. Run 'ait setup' to install all dependencies."
-fi
-
 # Check terminal capabilities (warn on incapable terminals)
 ait_warn_if_incapable_terminal
 
-exec "$PYTHON" "$SCRIPT_DIR/settings/settings_app.py" "$@"
+# Dependency check + TUI run in one interpreter: see lib/tui_zygote.py.
+exec "$PYTHON" "$SCRIPT_DIR/lib/tui_zygote.py" launch --deps textual,yaml=pyyaml \
+    "$SCRIPT_DIR/settings/settings_app.py" "$@"
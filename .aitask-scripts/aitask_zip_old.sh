@@ -258,7 +258,7 @@ _archive_single_bundle() {
 
     # Create archive and verify
     mkdir -p "$(dirname "$archive_path")"
-    tar -cf - -C "$temp_dir" . | zstd -q -f -o "$archive_path"
+    _archive_create "$archive_path" "$temp_dir"
     _archive_verify "$archive_path" || die "Archive verification failed: $archive_path"
 
     # Remove originals
@@ -422,7 +422,7 @@ cmd_unpack() {
             local remaining
             remaining=$(find "$temp_dir" -type f 2>/dev/null | head -1)
             if [[ -z "$remaining" ]]; then
-                rm "$arch"
+                _archive_remove "$arch"
                 # Remove parent _bN dir if empty
                 local bdir
                 bdir=$(dirname "$arch")
@@ -430,8 +430,8 @@ cmd_unpack() {
             else
                 local new_arch="${arch%.tar.gz}"
                 new_arch="${new_arch%.tar.zst}.tar.zst"
-                tar -cf - -C "$temp_dir" . | zstd -q -f -o "$new_arch"
-                [[ "$arch" != "$new_arch" ]] && rm -f "$arch"
+                _archive_create "$new_arch" "$temp_dir"
+                [[ "$arch" != "$new_arch" ]] && _archive_remove "$arch"
             fi
 
             rm -rf "$temp_dir"
@@ -536,6 +536,9 @@ main() {
         verbose "Committing changes to git..."
         task_git add "$TASK_ARCHIVED_DIR"/_b*/old*.tar.zst 2>/dev/null || true
         task_git add "$PLAN_ARCHIVED_DIR"/_b*/old*.tar.zst 2>/dev/null || true
+        # Index sidecars (lib/archive_index.py) travel with their bundles.
+        task_git add "$TASK_ARCHIVED_DIR"/_b*/old*.tar.zst.idx 2>/dev/null || true
+        task_git add "$PLAN_ARCHIVED_DIR"/_b*/old*.tar.zst.idx 2>/dev/null || true
         task_git add -u "$TASK_ARCHIVED_DIR/" "$PLAN_ARCHIVED_DIR/" 2>/dev/null || true
 
         local commit_msg="ait: Archive old files to numbered bundles
@@ -16,6 +16,13 @@ parser and per-pane frame state: :func:`detect_append` spots a pure bottom-growt
 scroll against the same ``row_sigs`` baseline and :func:`encode_append` frames the
 new bottom rows.
 
+The per-tick hot path is kept linear in the viewport height: :func:`detect_append`
+finds the scroll shift with one Z-array pass over the row signatures, and
+:func:`parse_viewport` memoises each raw line's parsed spans and signature in a
+bounded LRU (:data:`LINE_CACHE_SIZE` lines), so an unchanged row — the bulk of a
+scrolled or lightly edited viewport — is never re-run through the SGR state
+machine. ``aidocs/benchmarks/bench_applink_content.py`` measures both.
+
 ``msgpack`` is imported **lazily** inside the ``encode_*`` functions so importing
 the parser / :class:`Subscription` (e.g. from the router unit test) needs no
 dependency — only the encoders do.
@@ -24,6 +31,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
@@ -254,6 +262,48 @@ def parse_sgr_line(line: str):
     return spans, urls
 
 
+# -- Per-line parse memo ------------------------------------------------------
+#
+# A live viewport changes a handful of rows per tick (a spinner, a streamed
+# line, a scroll), yet parse_snapshot used to run every visible row through the
+# SGR state machine again. capture -e output is self-contained per line (SGR
+# state resets at each line start, see parse_sgr_line), so a raw line always
+# parses to the same spans: memoise (spans, urls, row_signature) keyed by the
+# raw line string. The bound covers every row of a few dozen tall panes with
+# room for the rows that just scrolled out; least-recently-used lines go first.
+#
+# The cached span lists are SHARED by every frame (and every pane) showing that
+# line — callers must treat parse results as read-only, which every encoder
+# already does.
+
+LINE_CACHE_SIZE = 8192
+
+_line_cache: "OrderedDict[str, tuple]" = OrderedDict()
+line_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _parse_line_cached(line: str):
+    """``(spans, urls, sig)`` for one raw capture line, via the bounded LRU."""
+    hit = _line_cache.get(line)
+    if hit is not None:
+        _line_cache.move_to_end(line)
+        line_cache_stats["hits"] += 1
+        return hit
+    spans, urls = parse_sgr_line(line)
+    entry = (spans, urls, row_signature(spans))
+    _line_cache[line] = entry
+    line_cache_stats["misses"] += 1
+    if len(_line_cache) > LINE_CACHE_SIZE:
+        _line_cache.popitem(last=False)
+    return entry
+
+
+def clear_line_cache() -> None:
+    """Drop every memoised line parse (tests / benchmarks)."""
+    _line_cache.clear()
+    line_cache_stats["hits"] = line_cache_stats["misses"] = 0
+
+
 def parse_snapshot(content: str, viewport_height: Optional[int] = None):
     """Parse a ``PaneSnapshot.content`` blob into a list of ``(row_id, spans, urls)``.
 
@@ -281,6 +331,31 @@ def parse_snapshot(content: str, viewport_height: Optional[int] = None):
     (renumbered from 0); ``viewport_height=0`` yields no rows.
     """
     parsed: list = []
+    for row_id, line in enumerate(_viewport_lines(content, viewport_height)):
+        spans, urls, _sig = _parse_line_cached(line)  # row_id 0 == top of viewport
+        parsed.append((row_id, spans, urls))
+    return parsed
+
+
+def parse_viewport(content: str, viewport_height: int):
+    """:func:`parse_snapshot` of the live viewport plus its row-signature map.
+
+    Returns ``(parsed, row_sigs)`` where ``row_sigs`` is ``{row_id:
+    row_signature(spans)}`` — the pair every live push needs (the frame rows and
+    the :func:`deltify` / :func:`detect_append` baseline). Both the parse and the
+    signature come from the per-line LRU, so only rows whose raw text is new
+    since the recent ticks cost anything.
+    """
+    parsed: list = []
+    sigs: dict = {}
+    for row_id, line in enumerate(_viewport_lines(content, viewport_height)):
+        spans, urls, sig = _parse_line_cached(line)
+        parsed.append((row_id, spans, urls))
+        sigs[row_id] = sig
+    return parsed, sigs
+
+
+def _viewport_lines(content: str, viewport_height: Optional[int]) -> list:
     lines = content.split("\n")
     if lines and lines[-1] == "":
         lines = lines[:-1]  # drop the trailing empty cell from a final newline
@@ -289,10 +364,7 @@ def parse_snapshot(content: str, viewport_height: Optional[int] = None):
         # `lines[-0:]` is `lines[:]` (the whole list), so a zero-height pane must
         # short-circuit to no rows rather than emit the full capture.
         lines = lines[-viewport_height:] if viewport_height > 0 else []
-    for row_id, line in enumerate(lines):  # enumerate from 0 == top of viewport
-        spans, urls = parse_sgr_line(line)
-        parsed.append((row_id, spans, urls))
-    return parsed
+    return lines
 
 
 def build_osc8(parsed) -> dict:
@@ -323,7 +395,7 @@ def row_signature(spans) -> int:
     return hash(tuple((s[0], s[1], s[2], s[3], s[4]) for s in spans))
 
 
-def deltify(prev_sigs, parsed):
+def deltify(prev_sigs, parsed, new_sigs=None):
     """Collect the rows that changed vs the client's last-sent baseline.
 
     Returns ``(changed_wire, removed_ids, new_sigs, changed_subset)``:
@@ -342,14 +414,16 @@ def deltify(prev_sigs, parsed):
     which clears the row on the client: delta semantics retain *unlisted* rows, so
     a row that went from content to absent within fixed dims must be explicitly
     cleared or the client would diverge from a fresh keyframe.
+
+    ``new_sigs`` may pass the signature map :func:`parse_viewport` already
+    computed for ``parsed``, so the rows are not hashed a second time.
     """
     assert prev_sigs is not None, "deltify requires a prior keyframe baseline"
-    new_sigs: dict = {}
+    if new_sigs is None:
+        new_sigs = {row_id: row_signature(spans) for row_id, spans, _u in parsed}
     changed_subset: list = []
     for row_id, spans, urls in parsed:
-        sig = row_signature(spans)
-        new_sigs[row_id] = sig
-        if prev_sigs.get(row_id) != sig:
+        if prev_sigs.get(row_id) != new_sigs[row_id]:
             changed_subset.append((row_id, spans, urls))
     removed = [row_id for row_id in prev_sigs if row_id not in new_sigs]
     changed_wire = [[row_id, spans] for row_id, spans, _urls in changed_subset]
@@ -367,25 +441,54 @@ def detect_append(prev_sigs, new_sigs):
     scroll keeps the viewport height) and ``1 <= k < H`` (at least one shared row;
     a full replacement is a keyframe, not an append).
 
-    The check is the cheap prefix comparison the design doc calls for:
-    ``new[i] == prev[i+k]`` for all ``i`` in ``[0, H-1-k]``. The smallest matching
-    ``k`` is returned and is the correct one — the shift condition is fully
-    verified for it, so a client that drops ``k`` top rows, shifts up, and appends
-    the new bottom ``k`` rows converges exactly to ``new`` (``content_transport.md``
-    §append). Cursor / alt-screen / hyperlink gating is the caller's
-    responsibility (``pusher._push_pane``); this is pure signature math.
+    The shift condition is ``new[i] == prev[i+k]`` for all ``i`` in
+    ``[0, H-1-k]``: the length-``H-k`` prefix of ``new`` equals the suffix of
+    ``prev`` starting at ``k``. Testing every ``k`` with a prefix comparison is
+    O(H²) on repetitive panes (blank or repeated rows match deep before
+    failing), so this runs one Z-array pass over ``new + [sentinel] + prev``
+    instead: the Z value at ``prev[k]`` is the longest common prefix of ``new``
+    and ``prev[k:]``, and ``k`` matches exactly when it reaches ``H-k`` — O(H)
+    overall. The smallest matching ``k`` is returned and is the correct one — the
+    shift condition is fully verified for it, so a client that drops ``k`` top
+    rows, shifts up, and appends the new bottom ``k`` rows converges exactly to
+    ``new`` (``content_transport.md`` §append). Cursor / alt-screen / hyperlink
+    gating is the caller's responsibility (``pusher._push_pane``); this is pure
+    signature math.
     """
     if prev_sigs is None:
         return None
     H = len(new_sigs)
     if H == 0 or len(prev_sigs) != H:
         return None
+    seq = [new_sigs.get(i) for i in range(H)]
+    seq.append(_Z_SENTINEL)          # equal to nothing, so no match crosses it
+    seq.extend(prev_sigs.get(i) for i in range(H))
+    z = _z_array(seq)
     for k in range(1, H):
-        if all(new_sigs.get(i) == prev_sigs.get(i + k) for i in range(H - k)):
+        if z[H + 1 + k] >= H - k:
             return k
     return None
 
 
+_Z_SENTINEL = object()
+
+
+def _z_array(seq) -> list:
+    """Z-array of ``seq``: ``z[i]`` = length of the longest common prefix of
+    ``seq`` and ``seq[i:]`` (``z[0]`` is left 0). Linear time."""
+    n = len(seq)
+    z = [0] * n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and seq[z[i]] == seq[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return z
+
+
 def snapshot_to_rows(content: str):
     """Parse a ``PaneSnapshot.content`` blob into ``(rows, osc8)`` for a keyframe.
 
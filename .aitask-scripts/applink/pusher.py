@@ -2,7 +2,8 @@
 
 One :class:`PushScheduler` per WebSocket connection drives the snapshot push
 loop: on each tick it captures pane content (via the shared
-``monitor.capture_all_async``), encodes ``dim``/``keyframe`` frames for changed
+``monitor.capture_all_async`` — in the server, a ``server.CaptureBroadcast``
+that runs one capture for all connections), encodes ``dim``/``keyframe`` frames for changed
 panes (``content.py``), and sends them on the WebSocket **binary** channel, plus
 a JSON ``pane_status`` push at the idle cadence for the pane list's badges.
 
@@ -56,6 +57,14 @@ HIGH_WATER_BYTES = 256 * 1024
 # blowup. An oversize frame is dropped (audited), never sent.
 MAX_PUSH_FRAME_BYTES = 2 * 1024 * 1024   # 2 MiB
 
+# A pane counts as due this much before its cadence has fully elapsed. Behind
+# the server's CaptureBroadcast the loop wakes on fixed clock ticks exactly one
+# cadence apart, but ``now`` is read after the (shared or own) capture, so two
+# ticks' ``now`` differ by the cadence give or take that capture's duration and
+# the timer's lateness. Without the slack that jitter would push a frame to the
+# following tick. Half the fastest allowed cadence: never a whole tick early.
+DUE_SLACK_S = content.FLOOR_FOCUSED_MS / 2 / 1000.0
+
 # Ceiling on a single on-demand history (scrollback pull) capture depth (t1092).
 # Decoupled from the monitor's live `capture_lines` (~200): live frames only need
 # the viewport, but a history pull wants deep scrollback. The per-request depth is
@@ -119,6 +128,11 @@ class PushScheduler:
             while not self._stopped:
                 sub = self._conn.subscription
                 timeout = (sub.next_tick_ms() / 1000.0) if sub is not None else 1.0
+                # Behind the server's CaptureBroadcast, wake on its clock so
+                # connections on one cadence tick (and capture) together.
+                align = getattr(self._monitor, "next_tick_delay", None)
+                if callable(align):
+                    timeout = align(timeout)
                 with contextlib.suppress(asyncio.TimeoutError):
                     await asyncio.wait_for(self._wake.wait(), timeout=timeout)
                 self._wake.clear()
@@ -244,7 +258,7 @@ class PushScheduler:
         dims = (pane.width, pane.height)
         forced = pane_id in sub.force
         cadence_s = sub.cadence_for(pane_id) / 1000.0
-        due = (now - st.last_send_t) >= cadence_s
+        due = (now - st.last_send_t) >= cadence_s - DUE_SLACK_S
 
         # pane_status JSON heartbeat at the idle cadence (drives mobile badges).
         idle_s = sub.cadence_idle_ms / 1000.0
@@ -287,8 +301,13 @@ class PushScheduler:
         # type — keyframe, delta, append, osc8 — viewport-only and aligns row_ids
         # with the viewport-relative cursor row (t1054). Scrollback is reachable
         # via the (future) history RPC with negative row_ids.
-        parsed = content.parse_snapshot(snap.content, dims[1])
-        new_sigs = {row_id: content.row_signature(spans) for row_id, spans, _u in parsed}
+        # Behind the server's CaptureBroadcast the parse is shared with every other
+        # connection showing this content; a bare monitor parses here.
+        parse_viewport = getattr(self._monitor, "parse_viewport", None)
+        if parse_viewport is not None:
+            parsed, new_sigs = parse_viewport(pane_id, snap.content, dims[1])
+        else:
+            parsed, new_sigs = content.parse_viewport(snap.content, dims[1])
 
         # Stage 2 (t822_9): emit a `delta` (changed rows only) against the
         # per-connection baseline when one exists; fall back to a full `keyframe`
@@ -319,7 +338,8 @@ class PushScheduler:
                     sent_append = True
 
         if not emit_keyframe and not sent_append:
-            changed_wire, removed, _ns, changed_subset = content.deltify(st.row_sigs, parsed)
+            changed_wire, removed, _ns, changed_subset = content.deltify(
+                st.row_sigs, parsed, new_sigs)
             if not changed_wire and not removed:
                 # Whole-pane hash moved but no visible row changed (e.g. a trailing
                 # blank line dropped by parse_snapshot) -> nothing to send.
@@ -8,12 +8,16 @@ delegated to ``monitor_core`` via the router; this module only moves frames and
 manages connection lifecycle.
 
 The binary snapshot/data plane is NOT here — it is the next sibling (t822_8).
+What is here is its fan-out: :class:`CaptureBroadcast` sits between the
+monitor and every connection's ``PushScheduler`` so N paired devices share one
+tmux capture, one cursor query and one row parse per pane per tick.
 """
 from __future__ import annotations
 
 import asyncio
 import json
 import sys
+import time
 from pathlib import Path
 
 _APPLINK_DIR = Path(__file__).resolve().parent
@@ -30,6 +34,7 @@ from router import (  # noqa: E402
     ERR_BAD_PAYLOAD, STATE_DISCOVERING, STATE_SUSPENDED,
 )
 from pusher import PushScheduler  # noqa: E402
+import content  # noqa: E402
 import paths  # noqa: E402
 import audit  # noqa: E402
 import tunnel  # noqa: E402
@@ -143,6 +148,148 @@ def load_applink_config(project_root) -> dict:
     }
 
 
+# A capture started less than this long ago is handed to a PushScheduler instead
+# of running a new one. Schedulers wake on the broadcast clock
+# (:meth:`CaptureBroadcast.next_tick_delay`), so the callers of one tick arrive
+# together and this window only has to absorb their scheduling spread: half the
+# fastest cadence a client may request (the focused-pane floor), so the next
+# tick of even the fastest subscriber always gets a fresh capture.
+CAPTURE_SHARE_WINDOW_S = content.FLOOR_FOCUSED_MS / 2 / 1000.0
+
+# A scheduler that wakes this close before a tick of its period counts as
+# woken on it (timer rounding), so its next wait is a whole period.
+TICK_EPSILON_S = 0.005
+
+
+class CaptureBroadcast:
+    """Monitor facade shared by every connection's :class:`PushScheduler`.
+
+    Each PushScheduler ticks on its own subscription's cadence and used to run
+    its own ``capture_all_async`` (a full tmux discovery + capture pass), its
+    own ``capture_cursor_async`` per changed pane and its own
+    ``content.parse_snapshot`` — three phones, three times the tmux and parse
+    work, and overlapping captures superseding each other (``None`` → skipped
+    tick). Handed to the schedulers in place of the monitor, this object:
+
+    * is the schedulers' clock: each one sleeps until the next multiple of its
+      cadence on the shared monotonic timeline (:meth:`next_tick_delay`), so
+      connections on the same cadence tick together whatever their phase at
+      connect time, and the tmux capture rate follows the distinct cadences
+      in use, not the number of connections;
+    * runs at most one ``capture_all_async`` at a time — concurrent callers
+      await the in-flight one — and serves a capture started less than
+      ``share_window_s`` ago to later callers as is;
+    * fetches each pane's cursor once per capture generation;
+    * parses each pane's viewport once per distinct content
+      (:meth:`parse_viewport`), so every connection derives its own delta /
+      append / keyframe decision (its ``PaneState`` stays per connection) from
+      the same parsed rows and row signatures.
+
+    Everything else (``get_pane``, ``capture_pane_content_async`` for history
+    pulls, the session mapping) is delegated to the wrapped monitor unchanged.
+    ``stats`` counts the work done versus the work shared.
+    """
+
+    def __init__(self, monitor, *, clock=None,
+                 share_window_s: float = CAPTURE_SHARE_WINDOW_S) -> None:
+        self._monitor = monitor
+        self._clock = clock if clock is not None else time.monotonic
+        self._share_window_s = share_window_s
+        self._inflight: asyncio.Future | None = None
+        self._snaps: dict | None = None
+        self._snaps_t = 0.0
+        self._cursors: dict[str, asyncio.Future] = {}
+        self._parsed: dict[str, tuple] = {}   # pane_id -> (text, height, parsed, sigs)
+        self.stats = {
+            "captures": 0, "captures_shared": 0,
+            "cursors": 0, "cursors_shared": 0,
+            "parses": 0, "parses_shared": 0,
+        }
+
+    def __getattr__(self, name):
+        if name == "_monitor":      # not yet set (e.g. mid-construction)
+            raise AttributeError(name)
+        return getattr(self._monitor, name)
+
+    def next_tick_delay(self, period_s: float) -> float:
+        """Seconds until the next tick of a ``period_s`` cadence.
+
+        Ticks are the multiples of ``period_s`` on the broadcast clock, shared
+        by every scheduler: two connections with the same cadence wake on the
+        same instants and so share one capture, and cadences that divide each
+        other (the 300 ms focused / 3 s idle defaults) nest. A caller woken
+        on a tick (or a hair before it) is sent to the next one, a whole
+        period later.
+        """
+        if period_s <= 0:
+            return 0.0
+        now = self._clock()
+        tick = (int((now + TICK_EPSILON_S) / period_s) + 1) * period_s
+        return max(0.0, tick - now)
+
+    async def capture_all_async(self):
+        if self._inflight is not None:
+            self.stats["captures_shared"] += 1
+            return await asyncio.shield(self._inflight)
+        if (self._snaps is not None
+                and self._clock() - self._snaps_t < self._share_window_s):
+            self.stats["captures_shared"] += 1
+            return self._snaps
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight = fut
+        # Age is measured from the start: the panes were read from then on.
+        started = self._clock()
+        try:
+            snaps = await self._monitor.capture_all_async()
+        except BaseException:
+            # The initiator sees the fault (its _loop logs it); callers that
+            # joined this capture just skip the tick, as for a superseded one.
+            self._inflight = None
+            fut.set_result(None)
+            raise
+        self._inflight = None
+        self.stats["captures"] += 1
+        if snaps is not None:
+            self._snaps = snaps
+            self._snaps_t = started
+            self._cursors.clear()
+            for pane_id in [p for p in self._parsed if p not in snaps]:
+                del self._parsed[pane_id]
+        fut.set_result(snaps)
+        return snaps
+
+    async def capture_cursor_async(self, pane_id: str):
+        fut = self._cursors.get(pane_id)
+        if fut is not None:
+            self.stats["cursors_shared"] += 1
+        else:
+            fut = asyncio.ensure_future(self._monitor.capture_cursor_async(pane_id))
+            self._cursors[pane_id] = fut
+            self.stats["cursors"] += 1
+        try:
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if self._cursors.get(pane_id) is fut:
+                del self._cursors[pane_id]   # retry on the next request
+            raise
+
+    def parse_viewport(self, pane_id: str, text: str, height: int):
+        """``(parsed, row_sigs)`` of ``text``'s live viewport, shared across
+        connections: ``content.parse_viewport(text, height)`` (the parse plus
+        the ``{row_id: row_signature}`` map), computed once per distinct content.
+        Callers must treat both as read-only."""
+        hit = self._parsed.get(pane_id)
+        if hit is not None and hit[1] == height and (hit[0] is text or hit[0] == text):
+            self.stats["parses_shared"] += 1
+            return hit[2], hit[3]
+        parsed, sigs = content.parse_viewport(text, height)
+        self._parsed[pane_id] = (text, height, parsed, sigs)
+        self.stats["parses"] += 1
+        return parsed, sigs
+
+
 class AppLinkServer:
     """Owns the WebSocket listener, the TmuxMonitor, and the frame router."""
 
@@ -191,7 +338,10 @@ class AppLinkServer:
             agent_prefixes=config["agent_prefixes"],
             tui_names=config["tui_names"],
             compare_mode_default=config["compare_mode_default"],
+            event_driven=config["event_driven"],
+            shared_capture=config["shared_capture"],
         )
+        self._broadcast = CaptureBroadcast(self._monitor)
         self._task_cache = TaskInfoCache(project_root)
         self._router = FrameRouter(
             session_table, profile_gate, self._monitor,
@@ -369,8 +519,10 @@ class AppLinkServer:
         """Return the connection's PushScheduler, starting it on first use."""
         pusher = self._pushers.get(conn)
         if pusher is None:
+            # Every connection captures through the one shared broadcast.
+            monitor = getattr(self, "_broadcast", None) or self._monitor
             pusher = PushScheduler(
-                conn, ws, self._monitor, audit=self._audit,
+                conn, ws, monitor, audit=self._audit,
                 history_capture_lines=getattr(
                     self, "_history_capture_lines", DEFAULT_HISTORY_CAPTURE_LINES),
                 task_resolver=getattr(self, "_task_cache", None),
@@ -47,6 +47,8 @@ from archive_iter import find_archived_markdown_by_id, iter_archived_frontmatter
 import gate_ledger
 import trail_schema
 from atomic_write import atomic_write_text
+from frontmatter_index import shared_index
+from board_change_feed import TaskChangeFeed, TaskChanges
 from task_yaml import (
     _TaskSafeLoader, _FlowListDumper, _normalize_task_ids,
     FRONTMATTER_RE, BOARD_KEYS, BOARD_LAYOUT_KEYS,
@@ -138,6 +140,27 @@ def _task_git_cmd() -> list[str]:
         return ["git", "-C", str(DATA_WORKTREE)]
     return ["git"]
 
+def _task_git_dir() -> Path | None:
+    """Return the git dir whose index tracks the task data, or None.
+
+    Same branch/legacy split as `_task_git_cmd`, but found by reading `.git`
+    rather than by spawning `git rev-parse`: the change feed that needs it is
+    created on paths (By-Trail's `r`) that are pinned to spawn no subprocess.
+    A worktree's `.git` is a `gitdir: <path>` file; a plain checkout's is the
+    directory itself.
+    """
+    root = DATA_WORKTREE if (DATA_WORKTREE / ".git").exists() else Path(".")
+    dotgit = root / ".git"
+    if dotgit.is_dir():
+        return dotgit.resolve()
+    try:
+        text = dotgit.read_text()
+    except OSError:
+        return None
+    if not text.startswith("gitdir:"):
+        return None
+    return (root / text[len("gitdir:"):].strip()).resolve()
+
 def _sanitize_name(name: str) -> str:
     """Sanitize task name: lowercase, underscores, alphanumeric only, max 60 chars."""
     name = name.lower().replace(" ", "_")
@@ -215,6 +238,15 @@ def _get_user_email() -> str:
 
 # --- Data Models & Logic ---
 
+def _frontmatter_index():
+    """The shared parsed-frontmatter index for the live task tree.
+
+    Resolved per call rather than bound at import so a test that repoints
+    ``TASKS_DIR`` gets an index for ITS tree, never the real one.
+    """
+    return shared_index(TASKS_DIR)
+
+
 class Task:
     # Both are READ by reload_and_save_board_fields: the layout set is its
     # "is this a semantic write?" discriminator; the full set is the vocabulary
@@ -296,10 +328,9 @@ class Task:
             self.load_ok = True
             return True
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                raw = f.read()
-
-            result = parse_frontmatter(raw)
+            # Index-backed: an unchanged file is read but not re-parsed. Same
+            # raising contract as the open + parse_frontmatter pair it replaced.
+            result, raw = _frontmatter_index().read(self.filepath)
             if result:
                 self.metadata, self.content, self._original_key_order = result
             else:
@@ -914,19 +945,23 @@ def _iter_active_task_frontmatter(unreadable=None):
 
     The task-named qualifier is what keeps that honest without crying wolf: a
     ``.md`` file under the task dir whose name is not ``t<N>_…`` is a document,
-    not a task, and reporting it would warn on every scan forever."""
+    not a task, and reporting it would warn on every scan forever.
+
+    Reads go through the shared frontmatter index, which re-parses only files
+    whose identity changed — it never serves a snapshot, so the t1365 freshness
+    argument above still holds."""
+    index = _frontmatter_index()
     for pattern in ("*.md", "t*/t*_*.md"):
         for path in sorted(TASKS_DIR.glob(pattern)):
             try:
-                parsed = parse_frontmatter(
-                    path.read_text(encoding="utf-8", errors="replace"))
-                meta = parsed[0] if parsed else None
+                meta = index.metadata(path)
             except Exception:
                 meta = None
             if isinstance(meta, dict):
                 yield path.name, meta
             elif unreadable is not None and parse_task_filename(path.name)[0]:
                 unreadable.append(path.name)
+    index.save()
 
 
 def _iter_trail_frontmatter_records(unreadable=None):
@@ -1203,6 +1238,10 @@ class TaskManager:
         # instead of re-bucketing every task. Invalidated by content signature
         # (see grouped_topic_lanes) and explicitly at the reload seams below.
         self.topic_lane_cache = None
+        # Created by the first sync_tasks() call, not here: plenty of callers
+        # build a TaskManager for one read and never sync, and each feed holds
+        # an inotify instance (a per-user kernel limit) until closed.
+        self._change_feed: TaskChangeFeed | None = None
         self.settings: dict = {}
         # Collapsed in-column task groups, keys `"<col_id>/<slug>"` (t1243_10).
         # THE in-memory truth: `KanbanApp.collapsed_groups` aliases this exact
@@ -1509,6 +1548,8 @@ class TaskManager:
         # than beside `_prune_orphan_collapsed_columns` in `load_metadata` —
         # which runs BEFORE any task exists (t1243_10).
         self._prune_orphan_collapsed_groups()
+        # No-op unless some file was (re)parsed by this load.
+        _frontmatter_index().save()
 
     def load_child_tasks(self):
         self.topic_lane_cache = None
@@ -1554,6 +1595,57 @@ class TaskManager:
                     return True
         return False
 
+    def sync_tasks(self) -> TaskChanges:
+        """Bring task_datas up to date with the task files; report what changed.
+
+        The change-driven sibling of `load_tasks`: only the files the change
+        feed reported are re-read, each through `reload_task`, so a poll over an
+        unchanged tree reads nothing. Falls back to `load_tasks` when the feed
+        cannot say what changed (`changes.rescan`) and on the first call, which
+        creates the feed BEFORE loading so no write can fall between the two.
+
+        A reported file is dropped from memory first, so `reload_task`
+        rebuilds it as a fresh `Task` rather than re-loading the old object in
+        place: the board's reconcile tells a changed card from a kept one by
+        the model it was composed from, and a mounted card still holds the old
+        object.
+
+        Deliberately does not call `clear_gate_cache` (its callers are frozen,
+        see test_board_gate_digest_budget.py): only the reloaded files' gate
+        state is dropped, and every board path that re-renders after a sync
+        goes through `refresh_board`, which clears the rest.
+        """
+        if self._change_feed is None:
+            self._change_feed = TaskChangeFeed(TASKS_DIR, _task_git_dir())
+            self.load_tasks()
+            return TaskChanges(rescan=True, index=True)
+        changes = self._change_feed.poll()
+        if changes.rescan:
+            self.load_tasks()
+            return changes
+        if not changes.tasks:
+            return changes
+        self.topic_lane_cache = None
+        self.archived_task_cache.clear()
+        for name in sorted(changes.tasks):
+            for tasks in (self.task_datas, self.child_task_datas):
+                old = tasks.pop(name, None)
+                if old is not None:
+                    self.gate_state_cache.pop(str(old.filepath), None)
+            self.unreadable_files.discard(name)
+            if not self.reload_task(name):
+                path = TASKS_DIR / name
+                if path.exists() and not Task(path).load_ok:
+                    self.unreadable_files.add(name)
+        self._prune_orphan_collapsed_groups()
+        _frontmatter_index().save()
+        return changes
+
+    def close_change_feed(self):
+        if self._change_feed is not None:
+            self._change_feed.close()
+            self._change_feed = None
+
     def find_task_by_id(self, task_id: str):
         """Find a task (parent or child) by its ID like 't47' or 't47_1'."""
         prefix = f"{task_id}_"
@@ -1634,7 +1726,16 @@ class TaskManager:
 
     def refresh_git_status(self):
         """Query git for modified files in aitasks/ directory."""
+        found = self.probe_git_status()
         self.modified_files.clear()
+        self.modified_files.update(found)
+
+    def probe_git_status(self) -> set[str]:
+        """The git-modified task files, without touching `modified_files`.
+
+        Safe to call from a worker thread; `refresh_git_status` is the
+        apply-in-place wrapper."""
+        found: set[str] = set()
         try:
             result = subprocess.run(
                 [*_task_git_cmd(), "status", "--porcelain", "--", "aitasks/"],
@@ -1650,13 +1751,20 @@ class TaskManager:
                     if filepath.startswith('"') and filepath.endswith('"'):
                         filepath = filepath[1:-1]
                     if filepath.endswith('.md'):
-                        self.modified_files.add(filepath)
+                        found.add(filepath)
         except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
             pass
+        return found
 
     def refresh_lock_map(self):
         """Query aitask_lock.sh --list to build a map of locked tasks."""
+        found = self.probe_lock_map()
         self.lock_map.clear()
+        self.lock_map.update(found)
+
+    def probe_lock_map(self) -> dict[str, dict]:
+        """The current lock map, without touching `lock_map` (thread-safe)."""
+        found: dict[str, dict] = {}
         try:
             result = subprocess.run(
                 ["./.aitask-scripts/aitask_lock.sh", "--list"],
@@ -1669,13 +1777,14 @@ class TaskManager:
                         line.strip()
                     )
                     if m:
-                        self.lock_map[m.group(1)] = {
+                        found[m.group(1)] = {
                             "locked_by": m.group(2),
                             "hostname": m.group(3),
                             "locked_at": m.group(4),
                         }
         except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
             pass
+        return found
 
     def clear_gate_cache(self):
         self.gate_state_cache.clear()
@@ -3050,6 +3159,12 @@ class TaskCard(Static):
             # would restyle the In-Flight / By-Trail cards too. Set only when
             # True so every other card kind stays class-free.
             self.add_class("markable-card")
+        # Render model bookkeeping for `KanbanApp._reconcile_column`: the model
+        # built ahead of compose, the one compose actually painted, and the
+        # mark state the ☑/☐ label shows.
+        self._pending_model = None
+        self._rendered_model = None
+        self.painted_mark = False
 
     # Shared with lib/topic_semantics.py (t1210_2) — same parser everywhere.
     _parse_filename = staticmethod(parse_task_filename)
@@ -3064,7 +3179,28 @@ class TaskCard(Static):
         """
         return self.markable and self.task_data.filename in self.app.marked
 
-    def compose(self):
+    def card_model(self) -> tuple:
+        """What this card renders, as plain comparable data.
+
+        `(title_parts, info_rows)`, each a tuple of `(content, classes)` pairs
+        in render order. `compose` turns it into Labels one-for-one, and
+        `KanbanApp._reconcile_column` compares it between a mounted card and a
+        freshly built one to decide whether a refresh must replace the card at
+        all — so everything a card shows has to come through here, or a
+        refresh would keep a card that now renders differently.
+
+        The ☑/☐ mark is deliberately NOT part of it: it is live app state
+        repainted in place by `KanbanApp._repaint_card_mark` (see
+        `painted_mark`), and a mark toggle must not read as a changed card.
+
+        Built at most once per construction: the reconciler asks before the
+        card mounts, and `compose` then consumes the same tuple.
+        """
+        if self._pending_model is None:
+            self._pending_model = self._build_card_model()
+        return self._pending_model
+
+    def _build_card_model(self) -> tuple:
         meta = self.task_data.metadata
         effort = meta.get('effort', '')
         labels = meta.get('labels', [])
@@ -3073,25 +3209,22 @@ class TaskCard(Static):
 
         task_num, task_name = self._parse_filename(self.task_data.filename)
         is_modified = self.manager.is_modified(self.task_data) if self.manager else False
-        with Horizontal(classes="task-title-row"):
-            if self.markable:
-                marked = self._is_marked()
-                yield Label(MARK_CHECKED if marked else MARK_UNCHECKED,
-                            classes="task-mark task-marked" if marked else "task-mark")
-            # Follow-up provenance gutter (t1468_3). Deliberately NOT hung off
-            # the mark above: `markable=True` is set only in
-            # `KanbanColumn.task_block`, so TopicColumn cards and child cards
-            # have no mark and must still show the glyph.
-            followup = _followup_marker(meta)
-            if followup:
-                yield Label(_followup_glyph_text(followup),
-                            classes="task-followup-glyph")
-            if task_num:
-                display_num = f"{task_num} *" if is_modified else task_num
-                num_classes = "task-number task-modified" if is_modified else "task-number"
-                yield Label(display_num, classes=num_classes)
-            yield Label(task_name, classes="task-title")
+        title = []
+        # Follow-up provenance gutter (t1468_3). Deliberately NOT hung off the
+        # mark: `markable=True` is set only in `KanbanColumn.task_block`, so
+        # TopicColumn cards and child cards have no mark and must still show the
+        # glyph. Carried as the `(glyph, colour)` marker, which compares by
+        # value; `compose` turns it into the coloured Text.
+        followup = _followup_marker(meta)
+        if followup:
+            title.append((followup, "task-followup-glyph"))
+        if task_num:
+            display_num = f"{task_num} *" if is_modified else task_num
+            num_classes = "task-number task-modified" if is_modified else "task-number"
+            title.append((display_num, num_classes))
+        title.append((task_name, "task-title"))
 
+        rows = []
         info = []
         if effort: info.append(f"💪 {effort}")
         if labels: info.append(f"🏷️ {','.join(labels)}")
@@ -3106,14 +3239,14 @@ class TaskCard(Static):
             info.append(f"[dim]@{contributor}[/dim]")
 
         if info:
-            yield Label(" | ".join(info), classes="task-info")
+            rows.append(" | ".join(info))
 
         # Lock indicator on its own line
         if self.manager:
             lock_id = task_num.lstrip("t")
             if lock_id in self.manager.lock_map:
                 lock_info = self.manager.lock_map[lock_id]
-                yield Label(f"\U0001f512 {lock_info['locked_by']}", classes="task-info")
+                rows.append(f"\U0001f512 {lock_info['locked_by']}")
 
         unresolved_deps = []
         if self.manager:
@@ -3152,16 +3285,16 @@ class TaskCard(Static):
             status_parts.append(f"📋 {status}")
         if assigned_to: status_parts.append(f"👤 {assigned_to}")
         if status_parts:
-            yield Label(" | ".join(status_parts), classes="task-info")
+            rows.append(" | ".join(status_parts))
 
         if unresolved_deps:
-            yield Label(f"🔗 {', '.join(unresolved_deps)}", classes="task-info")
+            rows.append(f"🔗 {', '.join(unresolved_deps)}")
         if xdep_display:
-            yield Label(f"↗ {', '.join(xdep_display)}", classes="task-info")
+            rows.append(f"↗ {', '.join(xdep_display)}")
 
         folded_into = meta.get('folded_into')
         if folded_into:
-            yield Label(f"\U0001f4ce folded into t{folded_into}", classes="task-info")
+            rows.append(f"\U0001f4ce folded into t{folded_into}")
 
         if self.manager and not self.is_child:
             if implementing_children:
@@ -3171,12 +3304,44 @@ class TaskCard(Static):
                     child_label = f"\u26a1 {child_num}"
                     if child_email:
                         child_label += f" \U0001f464 {child_email}"
-                    yield Label(child_label, classes="task-info")
+                    rows.append(child_label)
                 remaining = total_children - len(implementing_children)
                 if remaining > 0:
-                    yield Label(f"\U0001f476 {remaining} more children", classes="task-info")
+                    rows.append(f"\U0001f476 {remaining} more children")
             elif total_children > 0:
-                yield Label(f"\U0001f476 {total_children} children", classes="task-info")
+                rows.append(f"\U0001f476 {total_children} children")
+        return tuple(title), tuple((row, "task-info") for row in rows)
+
+    def render_signature(self) -> tuple:
+        """Everything about this card a refresh could change, compared by value.
+
+        The model it last composed when mounted, the model it would compose
+        otherwise — so a mounted card and its freshly built replacement compare
+        equal exactly when swapping them would paint the same thing.
+        """
+        model = self._rendered_model
+        if model is None:
+            model = self.card_model()
+        return (type(self), self.markable, self.is_child, self.column_id,
+                self._priority_border_color(), model)
+
+    def compose(self):
+        model = self.card_model()
+        self._pending_model = None
+        self._rendered_model = model
+        title, rows = model
+        with Horizontal(classes="task-title-row"):
+            if self.markable:
+                marked = self._is_marked()
+                self.painted_mark = marked
+                yield Label(MARK_CHECKED if marked else MARK_UNCHECKED,
+                            classes="task-mark task-marked" if marked else "task-mark")
+            for content, classes in title:
+                if classes == "task-followup-glyph":
+                    content = _followup_glyph_text(content)
+                yield Label(content, classes=classes)
+        for content, classes in rows:
+            yield Label(content, classes=classes)
 
     def _priority_border_color(self):
         priority = self.task_data.metadata.get('priority', 'normal')
@@ -4298,9 +4463,77 @@ class TrailSummaryScreen(ModalScreen):
         self.dismiss(None)
 
 
+@dataclass
+class ColumnRow:
+    """One unit of a `KanbanColumn` as DATA — no widget behind it.
+
+    A windowed column (`KanbanColumn.VIRTUALIZE_MIN_ROWS`) keeps one of these
+    for EVERY unit it holds while mounting only the few near its viewport, so
+    the filter pass, the focus pin and the window itself are decided from rows,
+    not from widgets that may not exist. `key` is exactly the
+    `_column_unit_key` of the widget the row builds: the reconciler, the hidden
+    set and the pinned focus all speak that one vocabulary.
+
+    A group row carries `column_id`, `members` and `collapsed` under the names
+    `GroupHeader` uses, so `KanbanApp._group_header_matches` and
+    `_group_match_count` decide an unmounted header exactly as a mounted one.
+    """
+    key: tuple
+    column_id: str
+    task: "Task | None" = None          # "card" / "child" rows
+    slug: str = ""                      # "group" rows
+    members: list = field(default_factory=list)
+    collapsed: bool = False
+    # `· N match` badge from the last filter pass, painted when the header
+    # mounts; a header that is already mounted is repainted by the pass itself.
+    match_count: int | None = None
+
+    @property
+    def kind(self) -> str:
+        return self.key[0]
+
+
+class RowSpacer(Static):
+    """Blank stand-in for a run of unmounted rows in a windowed `KanbanColumn`.
+
+    Exactly as tall as the rows it replaces (measured once laid out, estimated
+    until then), so the scrollbar and every mounted row sit where a fully
+    mounted column would put them. `ordinal` is its position among the
+    column's spacers — the reconciliation key, since spacers have no task.
+    """
+
+    def __init__(self, lines: int, ordinal: int = 0):
+        super().__init__(classes="row-spacer")
+        self.ordinal = ordinal
+        self.lines = 0
+        self.set_lines(lines)
+
+    def set_lines(self, lines: int) -> None:
+        if self.lines != lines:
+            self.lines = lines
+            self.styles.height = lines
+
+
 class KanbanColumn(VerticalScroll):
     """A vertical column of tasks."""
 
+    #: Above this many rows (cards, group headers and expanded child rows) the
+    #: column is WINDOWED: it keeps a `ColumnRow` for every unit but mounts only
+    #: the rows around its viewport, with `RowSpacer`s standing in for the rest.
+    #: Each card is a TaskCard with its own subtree, so a long Done column used to
+    #: cost thousands of widgets on every mount, every filter pass and every
+    #: whole-tree `query()`. Below the threshold the column composes every row,
+    #: exactly as before.
+    VIRTUALIZE_MIN_ROWS = 150
+    #: Rows kept mounted past each edge of the viewport, so `↑`/`↓` and a short
+    #: wheel scroll always reach a mounted neighbour before the re-window lands.
+    WINDOW_OVERSCAN = 12
+    #: Lines a row is assumed to take until it has been laid out once: a card is
+    #: border + title + one info line + its 1-line bottom margin.
+    _ROW_LINES_ESTIMATE = {"group": 1, "card": 6, "child": 6}
+    #: Viewport height assumed by a compose that runs before the first layout.
+    _UNLAID_VIEW_LINES = 50
+
     def __init__(self, col_id: str, title: str, color: str, manager: TaskManager,
                  expanded_tasks: set = None, collapsed: bool = False,
                  collapsed_groups: set = None):
@@ -4317,6 +4550,15 @@ class KanbanColumn(VerticalScroll):
         # which still points at the app's set. `collapsed_groups` is appended
         # last so no existing positional argument shifts (t1243_9).
         self.collapsed_groups = collapsed_groups if collapsed_groups is not None else set()
+        # Windowed-mode state (`VIRTUALIZE_MIN_ROWS`), all keyed by
+        # `_column_unit_key` and never by widget: `_reconcile_column` composes
+        # throwaway widgets it may discard, so nothing here may hold one.
+        self.windowed = False
+        self.rows: list = []
+        self.hidden_rows: set = set()      # keys the last filter pass hid
+        self._row_lines_measured: dict = {}  # key -> laid-out lines
+        self._focus_key = None             # the row kept mounted for focus
+        self._rewindow_queued = False
 
     def is_group_collapsed(self, slug: str) -> bool:
         """Whether `(this column, slug)` is collapsed.
@@ -4342,6 +4584,7 @@ class KanbanColumn(VerticalScroll):
 
         # Task Cards — only render when not collapsed
         if self.collapsed:
+            self.rows, self.windowed = [], False
             yield CollapsedColumnPlaceholder(self.col_id)
         else:
             tasks = self.manager.get_column_tasks(self.col_id)
@@ -4352,25 +4595,61 @@ class KanbanColumn(VerticalScroll):
             if tasks:
                 placeholder.styles.display = "none"
             yield placeholder
-            # Units, not bare tasks (t1243_9). `build_column_units` is the INV-R
-            # derivation: it sorts by (boardidx, filename) itself, so the render
-            # order is a pure function of the persisted state however this caller
-            # ordered its input. Never re-derive grouping here.
-            for slug, members in build_column_units(tasks):
-                # A single-member group renders as a plain card. board_groups
-                # deliberately KEEPS its slug (so a member moving away never
-                # silently dissolves the group) and leaves the draw-a-header
-                # decision to us — mirroring how `_build_topic_lanes` collapses
-                # singleton lanes.
-                if slug and len(members) > 1:
-                    yield GroupHeader(self.col_id, slug, members,
-                                      self.is_group_collapsed(slug))
-                    if self.is_group_collapsed(slug):
-                        # Members AND their `.child-wrapper` rows stay unmounted:
-                        # `task_block` emits both, so skipping it drops both.
-                        continue
-                for task in members:
-                    yield from self.task_block(task)
+            self.rows = self.build_rows(tasks)
+            self.windowed = len(self.rows) > self.VIRTUALIZE_MIN_ROWS
+            if not self.windowed:
+                for row in self.rows:
+                    yield self.row_widget(row)
+                return
+            # Keys a filter pass hid stay hidden across a recompose until the
+            # pass it queues re-decides them, so the first window is already
+            # cut over the rows that will be shown.
+            self.hidden_rows &= {row.key for row in self.rows}
+            ordinal = 0
+            for item in self._window_plan():
+                if isinstance(item, int):
+                    yield RowSpacer(item, ordinal)
+                    ordinal += 1
+                else:
+                    yield self._reserve(self.row_widget(item), item)
+
+    def build_rows(self, tasks) -> list:
+        """Every unit this column renders, in render order, as `ColumnRow`s.
+
+        Units, not bare tasks (t1243_9). `build_column_units` is the INV-R
+        derivation: it sorts by (boardidx, filename) itself, so the render
+        order is a pure function of the persisted state however this caller
+        ordered its input. Never re-derive grouping here.
+        """
+        rows = []
+        for slug, members in build_column_units(tasks):
+            # A single-member group renders as a plain card. board_groups
+            # deliberately KEEPS its slug (so a member moving away never
+            # silently dissolves the group) and leaves the draw-a-header
+            # decision to us — mirroring how `_build_topic_lanes` collapses
+            # singleton lanes.
+            if slug and len(members) > 1:
+                collapsed = self.is_group_collapsed(slug)
+                rows.append(ColumnRow(("group", slug), self.col_id, slug=slug,
+                                      members=members, collapsed=collapsed))
+                if collapsed:
+                    # Members AND their `.child-wrapper` rows stay unmounted:
+                    # `task_rows` yields both, so skipping it drops both.
+                    continue
+            for task in members:
+                rows.extend(self.task_rows(task))
+        return rows
+
+    def task_rows(self, task) -> list:
+        """The rows one task contributes: its card, plus — when the parent is
+        expanded — one child row per child task."""
+        rows = [ColumnRow(("card", task.filename), self.col_id, task=task)]
+        if task.filename in self.expanded_tasks:
+            task_num, _ = TaskCard._parse_filename(task.filename)
+            for child in self.manager.get_child_tasks_for_parent(task_num):
+                rows.append(ColumnRow(("child", child.filename), self.col_id,
+                                      task=child))
+        return rows
 
     def task_block(self, task):
         """The widgets one task contributes to this column.
@@ -4384,18 +4663,237 @@ class KanbanColumn(VerticalScroll):
         composed it in the first place. Keeping ONE generator is what stops a
         transplanted card from drifting from a composed one.
         """
-        # The ONE markable construction site in the file (t1243_6): a parent card
-        # in a persistent kanban column. TopicColumn's cards, the child card
-        # below, and the Trail/In-Flight subclasses all leave markable=False.
-        yield TaskCard(task, self.manager, column_id=self.col_id, markable=True)
-        # Render children if parent is expanded
-        if task.filename in self.expanded_tasks:
-            task_num, _ = TaskCard._parse_filename(task.filename)
-            children = self.manager.get_child_tasks_for_parent(task_num)
-            for child in children:
-                with Horizontal(classes="child-wrapper"):
-                    yield Static("↳", classes="child-connector")
-                    yield TaskCard(child, self.manager, is_child=True, column_id=self.col_id)
+        for row in self.task_rows(task):
+            yield self.row_widget(row)
+
+    def row_widget(self, row: ColumnRow):
+        """Build the widget for one row — every unit this column mounts comes
+        from here, whether composed, transplanted or mounted by `rewindow`."""
+        if row.kind == "group":
+            header = GroupHeader(self.col_id, row.slug, row.members, row.collapsed)
+            header.set_match_count(row.match_count)
+            return header
+        if row.kind == "card":
+            # The ONE markable construction site in the file (t1243_6): a parent
+            # card in a persistent kanban column. TopicColumn's cards, the child
+            # card below, and the Trail/In-Flight subclasses all leave
+            # markable=False.
+            return TaskCard(row.task, self.manager, column_id=self.col_id,
+                            markable=True)
+        # Built by argument rather than as a `with` block so the row carries its
+        # card: `_column_unit_key` / `_column_unit_signature` read it before
+        # anything mounts.
+        card = TaskCard(row.task, self.manager, is_child=True, column_id=self.col_id)
+        wrapper = Horizontal(Static("↳", classes="child-connector"), card,
+                             classes="child-wrapper")
+        wrapper.child_card = card
+        return wrapper
+
+    # --- Windowed mode ---------------------------------------------------------
+
+    def _row_lines(self, row: ColumnRow) -> int:
+        return self._row_lines_measured.get(row.key) or self._ROW_LINES_ESTIMATE[row.kind]
+
+    def _window_plan(self) -> list:
+        """What a windowed column mounts now: `ColumnRow`s, and between them an
+        `int` line count wherever a `RowSpacer` stands in for unmounted rows.
+
+        Cut over the rows the filter shows — a hidden row is neither mounted nor
+        counted — to the viewport plus `WINDOW_OVERSCAN` rows each side. The row
+        focus last rested on stays mounted wherever it is, so focus is never on
+        a widget the window removed and `↑`/`↓` from it still have a start.
+        """
+        rows = [r for r in self.rows if r.key not in self.hidden_rows]
+        if not rows:
+            return []
+        lines = [self._row_lines(r) for r in rows]
+        top = self.scroll_y - self._lines_above_rows()
+        bottom = top + (self.scrollable_content_region.height or self._UNLAID_VIEW_LINES)
+        first = last = None
+        y = 0
+        for i, n in enumerate(lines):
+            if y >= bottom:
+                break
+            if first is None and y + n > top:
+                first = i
+            last = i
+            y += n
+        if first is None:
+            # Scrolled past the end (the column just shrank): show the tail.
+            first = last = len(rows) - 1
+        keep = set(range(max(0, first - self.WINDOW_OVERSCAN),
+                         min(len(rows), last + 1 + self.WINDOW_OVERSCAN)))
+        if self._focus_key is not None:
+            keep.update(i for i, r in enumerate(rows) if r.key == self._focus_key)
+        plan, gap = [], 0
+        for i, (row, n) in enumerate(zip(rows, lines)):
+            if i in keep:
+                if gap:
+                    plan.append(gap)
+                    gap = 0
+                plan.append(row)
+            else:
+                gap += n
+        if gap:
+            plan.append(gap)
+        return plan
+
+    def _lines_above_rows(self) -> int:
+        """Lines the column header (and a showing placeholder) take above row 0."""
+        lines = 0
+        for widget in self.children:
+            if _column_unit_key(widget) not in (("header",), ("empty",), ("collapsed",)):
+                break
+            if widget.styles.display != "none":
+                lines += _outer_lines(widget)
+        return lines
+
+    def _measure(self, live: list) -> None:
+        """Record the laid-out height of every mounted row, holding the view still.
+
+        A row mounted ABOVE the viewport took its real height where its spacer
+        had reserved `_row_lines`' guess, which shifted everything below it by
+        the difference. Scrolling by that difference puts the rows the user is
+        looking at back where they were.
+        """
+        y = shift = 0
+        for widget in live:
+            if widget.styles.display == "none":
+                continue
+            lines = _outer_lines(widget)
+            if getattr(widget, "window_reserved", False):
+                y += lines
+                continue
+            key = _column_unit_key(widget)
+            if lines and key is not None and key[0] in self._ROW_LINES_ESTIMATE:
+                assumed = (self._row_lines_measured.get(key)
+                           or self._ROW_LINES_ESTIMATE[key[0]])
+                self._row_lines_measured[key] = lines
+                if lines != assumed and y + lines <= self.scroll_y:
+                    shift += lines - assumed
+            y += lines
+        if shift:
+            self.scroll_to(y=self.scroll_y + shift, animate=False, immediate=True)
+
+    def rewindow(self) -> None:
+        """Re-cut a windowed column's mounted rows to its scroll position, in place.
+
+        Rows that stay in the window keep their widgets; rows leaving it are
+        removed and rows entering it are built by `row_widget` and mounted at
+        their position, with the spacers resized around them. A no-op for a
+        column that is not windowed.
+        """
+        self._rewindow_queued = False
+        if not self.windowed or not self.is_attached:
+            return
+        live = [w for w in self.children if not w._pruning]
+        self._measure(live)
+        head, spacers, by_key = [], [], {}
+        for widget in live:
+            key = _column_unit_key(widget)
+            if isinstance(widget, RowSpacer):
+                spacers.append(widget)
+            elif key in (("header",), ("empty",), ("collapsed",)):
+                head.append(widget)
+            else:
+                by_key[key] = widget
+        ordered, fresh = list(head), set()
+        ordinal = 0
+        for item in self._window_plan():
+            if isinstance(item, int):
+                if spacers:
+                    widget = spacers.pop(0)
+                    widget.set_lines(item)
+                    widget.ordinal = ordinal
+                else:
+                    widget = RowSpacer(item, ordinal)
+                    fresh.add(widget)
+                ordinal += 1
+            else:
+                widget = by_key.pop(item.key, None)
+                if widget is None:
+                    widget = self._reserve(self.row_widget(item), item)
+                    fresh.add(widget)
+            ordered.append(widget)
+        stale = spacers
+        for widget in by_key.values():
+            if widget.has_focus_within:
+                # The focused row is pinned, so a focused widget outside the
+                # plan is one the filter just hid. It stays mounted (hidden)
+                # for one more window: `apply_filter`'s rescue has to find it
+                # to move focus off it.
+                ordered.insert(len(head), widget)
+            else:
+                stale.append(widget)
+        if not fresh and not stale and ordered == live:
+            return
+        if stale:
+            # Hidden first: removal is asynchronous, and a stale row still in
+            # the layout next to the spacer that replaced it counts twice.
+            for widget in stale:
+                widget.styles.display = "none"
+            self.remove_children(stale)
+        _place_children(self, ordered, fresh)
+
+    def _reserve(self, widget, row: ColumnRow):
+        """Hold a freshly built row at its expected height until it has laid out.
+
+        A widget mounted this cycle has no content yet, and the layout pass that
+        runs before its compose lands gives it NO height: the column shrinks
+        under its scroll position, which Textual then clamps for good. Released
+        after the widget's first refresh, when `_measure` can read the real
+        height.
+        """
+        widget.styles.height = self._row_lines(row)
+        widget.window_reserved = True
+        widget.call_after_refresh(self._release, widget)
+        return widget
+
+    def _release(self, widget) -> None:
+        widget.styles.height = None
+        # Still reserved for `_measure` until the layout that gives the widget
+        # its own height has run.
+        self.call_after_refresh(self._released, widget)
+
+    def _released(self, widget) -> None:
+        widget.window_reserved = False
+        self._queue_rewindow()
+
+    def reveal(self, key) -> bool:
+        """Mount `key`'s row now and keep it mounted; False when this column
+        does not show such a row (not here, collapsed away, or filtered out)."""
+        if (not self.windowed or key in self.hidden_rows
+                or not any(row.key == key for row in self.rows)):
+            return False
+        self._focus_key = key
+        self.rewindow()
+        return True
+
+    def _queue_rewindow(self) -> None:
+        """One `rewindow` after the next refresh, however many triggers fire."""
+        if not self._rewindow_queued:
+            self._rewindow_queued = True
+            self.call_after_refresh(self.rewindow)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if self.windowed and round(old_value) != round(new_value):
+            self._queue_rewindow()
+
+    def on_resize(self, event) -> None:
+        if self.windowed:
+            self._queue_rewindow()
+
+    def on_descendant_focus(self, event) -> None:
+        """Remember which row holds focus, so every window keeps it mounted."""
+        widget = event.widget
+        if isinstance(widget, GroupHeader):
+            self._focus_key = ("group", widget.slug)
+        elif isinstance(widget, TaskCard):
+            self._focus_key = ("child" if widget.is_child else "card",
+                               widget.task_data.filename)
+        else:
+            self._focus_key = None
 
     def on_mount(self):
         if self.collapsed:
@@ -4407,6 +4905,105 @@ class KanbanColumn(VerticalScroll):
         self.styles.border = ("round", self.col_color)
         self.styles.margin = (0, 1)
 
+
+def _outer_lines(widget) -> int:
+    """Lines `widget` takes in a vertical layout, margins included."""
+    margin = widget.styles.margin
+    return widget.outer_size.height + margin.top + margin.bottom
+
+
+def _column_unit_key(widget):
+    """Identity of one `KanbanColumn` child across refreshes, or None.
+
+    The reconciliation key (`KanbanApp._reconcile_column`): a task's card is
+    the same unit for as long as the task keeps its filename, whatever its
+    content does. None means "not a shape `KanbanColumn.compose` builds", and
+    the reconciler then recomposes the column rather than guess.
+    """
+    if isinstance(widget, ColumnHeader):
+        return ("header",)
+    if isinstance(widget, CollapsedColumnPlaceholder):
+        return ("collapsed",)
+    if isinstance(widget, EmptyColumnPlaceholder):
+        return ("empty",)
+    if isinstance(widget, GroupHeader):
+        return ("group", widget.slug)
+    if isinstance(widget, RowSpacer):
+        return ("spacer", widget.ordinal)
+    if type(widget) is TaskCard and not widget.is_child:
+        return ("card", widget.task_data.filename)
+    card = getattr(widget, "child_card", None)
+    if card is not None:
+        return ("child", card.task_data.filename)
+    return None
+
+
+def _column_unit_signature(widget) -> tuple:
+    """What one `KanbanColumn` child paints, compared by value.
+
+    Equal signatures mean the mounted widget can stay: swapping in the fresh
+    one would paint the same thing. Read from the widget's live attributes —
+    `_sync_header_count` and `GroupHeader.set_collapsed` repaint in place, so
+    a build-time snapshot would go stale under them. Placeholders have no
+    content of their own: `apply_filter` owns their label and display. Nor
+    does a `RowSpacer`: a kept one adopts the fresh height (`_adopt_unit`).
+    """
+    if isinstance(widget, ColumnHeader):
+        return (widget.col_title, widget.task_count, widget.is_collapsed,
+                widget.editable)
+    if isinstance(widget, GroupHeader):
+        return (widget.collapsed,
+                tuple(m.filename for m in widget.members),
+                tuple(_followup_marker(m.metadata) for m in widget.members))
+    if isinstance(widget, TaskCard):
+        return widget.render_signature()
+    card = getattr(widget, "child_card", None)
+    if card is not None:
+        return card.render_signature()
+    return ()
+
+
+def _place_children(parent, ordered: list, fresh: set) -> None:
+    """Make `parent`'s live children read `ordered`, touching as little as possible.
+
+    `fresh` widgets are mounted in runs right after their predecessor; the
+    others are already children and are moved only when their relative order
+    changed. Children the caller is removing may still sit in the node list
+    (pruning is asynchronous), which is why every placement is relative to a
+    widget in `ordered` rather than an index.
+    """
+    kept = [w for w in ordered if w not in fresh]
+    kept_set = set(kept)
+    in_order = [w for w in parent.children if w in kept_set] == kept
+    prev = None
+    run: list = []
+
+    def flush():
+        if not run:
+            return
+        if prev is not None:
+            parent.mount_all(run, after=prev)
+        elif parent.children:
+            parent.mount_all(run, before=0)
+        else:
+            parent.mount_all(run)
+
+    for widget in ordered:
+        if widget in fresh:
+            run.append(widget)
+            continue
+        flush()
+        if run:
+            prev, run = run[-1], []
+        if not in_order:
+            if prev is not None:
+                parent.move_child(widget, after=prev)
+            else:
+                parent.move_child(widget, before=0)
+        prev = widget
+    flush()
+
+
 class CycleField(Static):
     """A focusable widget that cycles through predefined options with Left/Right keys."""
 
@@ -8288,6 +8885,13 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         self.base_filter = "all"          # "all" | "locked" | "free" | "inflight" | "bytopic" | "bytrail"
         self.git_filter_active = False
         self.type_filter_active = False
+        # Whether any card may currently be hidden by a filter pass. While it is
+        # False and the filter state does not narrow, a reconciling refresh can
+        # scope its `apply_filter` to the columns it touched (`_reconcile_kanban`).
+        self._filter_narrowed = False
+        # Supersession counter for `_probe_worker`: a probe whose generation
+        # is no longer current when it lands is discarded.
+        self._probe_gen = 0
         self._view_auto_expanded: set = set()
         self.expanded_tasks: set = set()
         # Collapsed in-column task groups, keyed "<col_id>/<slug>" (t1243_9),
@@ -8666,6 +9270,9 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         # anchors are not queryable yet.
         self.call_after_refresh(self._claim_startup_focus)
 
+    def on_unmount(self):
+        self.manager.close_change_feed()
+
     def _apply_filter_reflow(self, width: int | None = None):
         """Reflow the filter row when the terminal is too narrow for both parts.
 
@@ -8892,24 +9499,71 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         else:
             self.sub_title = "Auto-refresh: off"
 
-    def _refresh_board_data(self):
-        """Reload task files from disk and refresh the board.
+    def _refresh_board_data(self, force: bool = False):
+        """Reload changed task files from disk and refresh the board.
 
         The passive data path shared by the `r` key (outside By-Trail), the
-        auto-refresh timer, and programmatic callers — never opens dialogs."""
+        auto-refresh timer, and programmatic callers — never opens dialogs.
+
+        Change-driven: `sync_tasks` re-reads only the files the change feed
+        reported, and when nothing changed the board is left alone — an idle
+        tick mounts nothing and re-derives nothing. `force` (the `r` key)
+        re-renders regardless, which also re-probes what no file event can
+        announce: cross-repo dependency statuses and the code digest behind
+        signed gates.
+
+        Git status and the lock listing are never run here. They are the
+        subprocess half of a refresh (5s and 10s timeouts, and the lock listing
+        fetches from the remote), so `_probe_worker` runs them off the UI
+        thread and re-renders only if their answer changed. Locks are probed on
+        every call: they live on the remote lock branch, which no local event
+        covers. Git status only when the feed says it may have moved."""
         focused = self._focused_card()
         refocus = focused.task_data.filename if focused else ""
-        self.manager.load_tasks()
+        changes = self.manager.sync_tasks()
+        if changes.data or force:
+            if self.base_filter == "locked":
+                self._auto_expand_locked()
+            self.refresh_board(refocus_filename=refocus, refresh_git=False)
+        self._probe_gen += 1
+        self._probe_worker(self._probe_gen, changes.git or force)
+
+    @work(thread=True)
+    def _probe_worker(self, gen: int, git: bool):
+        """Git status (if asked) and the lock listing off the UI thread."""
+        modified = self.manager.probe_git_status() if git else None
+        locks = self.manager.probe_lock_map()
+        self.app.call_from_thread(self._on_probe, gen, modified, locks)
+
+    def _on_probe(self, gen: int, modified: set[str] | None,
+                  locks: dict[str, dict]):
+        # Supersession guard: a newer probe is in flight and will land after.
+        if gen != self._probe_gen:
+            return
+        changed = False
+        if modified is not None and modified != self.manager.modified_files:
+            self.manager.modified_files.clear()
+            self.manager.modified_files.update(modified)
+            changed = True
+        if locks != self.manager.lock_map:
+            self.manager.lock_map.clear()
+            self.manager.lock_map.update(locks)
+            changed = True
+        if not changed:
+            return
+        focused = self._focused_card()
         if self.base_filter == "locked":
             self._auto_expand_locked()
-        self.refresh_board(refocus_filename=refocus, refresh_locks=True)
+        self.refresh_board(
+            refocus_filename=focused.task_data.filename if focused else "",
+            refresh_git=False)
 
     def action_refresh_board(self):
         """`r` outside By-Trail: refresh board data.
 
         In By-Trail this action is hidden by check_action and the key falls
         through to action_trail_refresh_local (t1268)."""
-        self._refresh_board_data()
+        self._refresh_board_data(force=True)
 
     def _rerender_trail(self, refocus_filename: str = ""):
         """Re-mount the By-Trail lanes from in-memory state only.
@@ -8967,7 +9621,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
             return
         focused = self._focused_card()
         refocus = focused.task_data.filename if focused else ""
-        self.manager.load_tasks()          # pure file I/O
+        self.manager.sync_tasks()          # pure file I/O
         self._rerender_trail(refocus)
 
     def action_trail_refresh_drift(self):
@@ -9021,13 +9675,16 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         self._run_sync(show_notification=True, show_overlay=True)
 
     def refresh_board(self, refocus_filename: str = "", refresh_locks: bool = False,
-                      refocus_col_id: str = ""):
+                      refocus_col_id: str = "", refresh_git: bool = True):
         # Default the column fallback to whatever holds focus right now, so every
         # caller (manual `r`, the auto-refresh tick, view switches) preserves an
         # empty / collapsed column without opting in. Must be read HERE: the
         # teardown below removes the focused widget, and Textual drops focus with it.
         refocus_col_id = refocus_col_id or self._get_focused_col_id() or ""
-        self.manager.refresh_git_status()
+        # `refresh_git=False` is for callers that keep `modified_files` current
+        # themselves — `_refresh_board_data` probes it in a worker.
+        if refresh_git:
+            self.manager.refresh_git_status()
         if refresh_locks:
             self.manager.refresh_lock_map()
         self.manager.clear_gate_cache()
@@ -9051,6 +9708,10 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
                 severity="warning")
 
         container = self.query_one("#board_container")
+        if (self.base_filter not in ("inflight", "bytopic", "bytrail")
+                and self._reconcile_kanban(container, refocus_filename,
+                                           refocus_col_id)):
+            return
         container.remove_children()
 
         if self.base_filter == "inflight":
@@ -9079,26 +9740,8 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
             self._queue_refocus(refocus_filename, refocus_col_id)
             return
 
-        # 1. Unordered/Backlog Column (Dynamic)
-        unordered_tasks = self.manager.get_column_tasks("unordered")
-        if unordered_tasks:
-            is_collapsed = self.manager.is_column_collapsed("unordered")
-            container.mount(KanbanColumn(
-                "unordered", "Unsorted / Inbox", "gray", self.manager,
-                self.expanded_tasks, collapsed=is_collapsed,
-                collapsed_groups=self.collapsed_groups,
-            ))
-
-        # 2. Configured Columns
-        for col_id in self.manager.column_order:
-            conf = next((c for c in self.manager.columns if c["id"] == col_id), None)
-            if conf:
-                is_collapsed = self.manager.is_column_collapsed(col_id)
-                container.mount(KanbanColumn(
-                    conf["id"], conf["title"], conf["color"], self.manager,
-                    self.expanded_tasks, collapsed=is_collapsed,
-                    collapsed_groups=self.collapsed_groups,
-                ))
+        for col_id, title, color in self._kanban_column_specs():
+            container.mount(self._new_kanban_column(col_id, title, color))
 
         # Defer until after Textual processes pending mounts so the freshly
         # composed TaskCards are queryable; otherwise view-mode filters silently
@@ -9112,8 +9755,13 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         """Focus the card for `filename`; fall back to its column if it is gone.
 
         A refresh can drop the card entirely (task archived/deleted) or hide it
-        (filtered out), in which case focus would otherwise be lost.
+        (filtered out), in which case focus would otherwise be lost. In a
+        windowed column the card may simply not be mounted: its column is asked
+        to mount it first.
         """
+        for col in self._windowed_columns():
+            if col.reveal(("card", filename)) or col.reveal(("child", filename)):
+                break
         for card in self.query(TaskCard):
             if card.task_data.filename == filename and card.styles.display != "none":
                 card.focus()
@@ -9172,6 +9820,139 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         new_children = _compose_widgets(col_widget)
         col_widget.mount_all(new_children)
 
+    def _kanban_column_specs(self) -> list:
+        """`(col_id, title, color)` for every kanban column, in board order.
+
+        The Unsorted / Inbox column first, and only while it holds tasks; then
+        the configured columns in `column_order`.
+        """
+        specs = []
+        if self.manager.get_column_tasks("unordered"):
+            specs.append(("unordered", "Unsorted / Inbox", "gray"))
+        for col_id in self.manager.column_order:
+            conf = next((c for c in self.manager.columns if c["id"] == col_id), None)
+            if conf:
+                specs.append((conf["id"], conf["title"], conf["color"]))
+        return specs
+
+    def _new_kanban_column(self, col_id: str, title: str, color: str) -> KanbanColumn:
+        return KanbanColumn(
+            col_id, title, color, self.manager, self.expanded_tasks,
+            collapsed=self.manager.is_column_collapsed(col_id),
+            collapsed_groups=self.collapsed_groups,
+        )
+
+    def _reconcile_kanban(self, container, refocus_filename: str = "",
+                          refocus_col_id: str = "") -> bool:
+        """Bring the mounted kanban board up to date in place; False = cannot.
+
+        The keyed alternative to tearing `#board_container` down: columns are
+        matched by `col_id`, and inside a kept column every header, group header
+        and card by `_column_unit_key` (the task filename for a card). Only what
+        actually changed is added, removed, moved or rebuilt — an auto-refresh
+        tick over an unchanged board mounts nothing at all, keeps focus and
+        scroll positions, and does not flicker.
+
+        A column is rebuilt whole when its title, colour or collapsed state
+        changed: its shell styles itself from those in `on_mount`.
+
+        Refuses (returns False, having touched nothing) when the container holds
+        anything but kanban columns — coming back from In-Flight / By-Topic /
+        By-Trail is a full rebuild, as before.
+
+        The filter pass is scoped to the touched columns only when nothing can
+        be hidden, neither now nor by the previous pass: a kept card keeps the
+        display the previous pass gave it, so any narrowing filter needs the
+        whole-board pass (lock map, git status and search results may have
+        moved under cards whose content did not).
+        """
+        live = [c for c in container.children if not c._pruning]
+        if not all(type(c) is KanbanColumn for c in live):
+            return False
+        by_id = {c.col_id: c for c in live}
+        ordered, fresh, changed = [], set(), set()
+        for col_id, title, color in self._kanban_column_specs():
+            col = by_id.pop(col_id, None)
+            if (col is not None and col.col_title == title and col.col_color == color
+                    and col.collapsed == self.manager.is_column_collapsed(col_id)):
+                col.manager = self.manager
+                col.expanded_tasks = self.expanded_tasks
+                col.collapsed_groups = self.collapsed_groups
+                if self._reconcile_column(col):
+                    changed.add(col_id)
+            else:
+                if col is not None:
+                    col.remove()
+                col = self._new_kanban_column(col_id, title, color)
+                fresh.add(col)
+                changed.add(col_id)
+            ordered.append(col)
+        for col in by_id.values():
+            col.remove()
+        _place_children(container, ordered, fresh)
+
+        narrows = (self.base_filter != "all" or self.git_filter_active
+                   or self.type_filter_active or bool(self.search_filter))
+        if narrows or self._filter_narrowed:
+            # Deferred for the same reason as the rebuild path below.
+            self.call_after_refresh(self.apply_filter)
+        elif changed:
+            self.call_after_refresh(self.apply_filter, changed)
+        self._queue_refocus(refocus_filename, refocus_col_id)
+        return True
+
+    def _reconcile_column(self, col_widget: KanbanColumn) -> bool:
+        """Update a mounted column to what it would compose now; True if it changed.
+
+        Composes the column afresh (widgets only — nothing mounts) and diffs it
+        against the mounted children by `_column_unit_key`. A mounted unit whose
+        `_column_unit_signature` matches its fresh counterpart stays and adopts
+        the new task data; anything else is replaced, dropped or mounted at its
+        position. Falls back to `_recompose_column` when a child is not a shape
+        `KanbanColumn.compose` builds.
+        """
+        live = [w for w in col_widget.children if not w._pruning]
+        keys = [_column_unit_key(w) for w in live]
+        if None in keys:
+            self._recompose_column(col_widget)
+            return True
+        by_key = {}
+        for key, widget in zip(keys, live):
+            by_key.setdefault(key, widget)
+        ordered, fresh = [], set()
+        for new in _compose_widgets(col_widget):
+            old = by_key.pop(_column_unit_key(new), None)
+            if old is not None and \
+                    _column_unit_signature(old) == _column_unit_signature(new):
+                self._adopt_unit(old, new)
+                ordered.append(old)
+            else:
+                ordered.append(new)
+                fresh.add(new)
+        if not fresh and ordered == live:
+            return False
+        kept = set(ordered)
+        col_widget.remove_children([w for w in live if w not in kept])
+        _place_children(col_widget, ordered, fresh)
+        return True
+
+    def _adopt_unit(self, old, new) -> None:
+        """Point a kept unit at the freshly loaded task data behind `new`.
+
+        The signatures matched, so nothing repaints — except a card's ☑/☐, which
+        is live app state rather than task content (`TaskCard.card_model`).
+        """
+        if isinstance(old, TaskCard):
+            old.task_data = new.task_data
+            if old.markable and old.painted_mark != old._is_marked():
+                self._repaint_card_mark(old)
+        elif isinstance(old, GroupHeader):
+            old.members = new.members
+        elif getattr(old, "child_card", None) is not None:
+            old.child_card.task_data = new.child_card.task_data
+        elif isinstance(old, RowSpacer):
+            old.set_lines(new.lines)
+
     def refresh_column(self, col_id: str, refocus_filename: str = "",
                        refocus_col_id: str = ""):
         """Re-render a single column's contents without layout changes."""
@@ -9471,6 +10252,42 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         # Computed once per pass — it is what keeps an idle board from walking a
         # single member for the badge, since the count cannot short-circuit.
         narrowing = visible is not None or bool(self.search_filter)
+        self._filter_narrowed = narrowing or (cols is not None and self._filter_narrowed)
+
+        # A windowed column (`KanbanColumn.VIRTUALIZE_MIN_ROWS`) mounts only the
+        # rows near its viewport, so the unit loop above and the header loop
+        # below see only a slice of it.
+        # Its rows are decided from DATA by the same rules — a header by
+        # `_group_header_matches`, a parent card by itself or a child, a child
+        # row by itself — and re-cut over the result right away, so the focus
+        # rescue below can land on a row that was not mounted until now.
+        windowed = self._windowed_columns(cols)
+        for col in windowed:
+            hidden = set()
+            for row in col.rows:
+                if row.kind == "group":
+                    v = self._group_header_matches(row, visible, self.search_filter,
+                                                   child_index)
+                    row.match_count = None
+                    if narrowing and v and row.collapsed:
+                        n = self._group_match_count(row, visible, self.search_filter,
+                                                    child_index)
+                        if n < len(row.members):
+                            row.match_count = n
+                else:
+                    v = task_matches_filter(row.task, visible, self.search_filter)
+                    if not v and row.kind == "card":
+                        v = self._any_child_matches(row.task, visible,
+                                                    self.search_filter, child_index())
+                if v:
+                    cols_with_visible.add(col.col_id)
+                else:
+                    hidden.add(row.key)
+            if col.rows:
+                cols_with_units.add(col.col_id)
+            col.hidden_rows = hidden
+            col.rewindow()
+
         headers = list(self._filter_group_headers(cols))
         for header in headers:
             # Counted as a unit for the same reason it feeds `cols_with_visible`:
@@ -9517,6 +10334,9 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
                 and (cols is None or focused.column_id in cols)
                 and focused.styles.display == "none"):
             self._refocus_column(focused.column_id)
+        for col in windowed:
+            # Drops the hidden row the rescue just moved focus off, if any.
+            col._queue_rewindow()
 
     def _is_busy(self, filename: str, task) -> bool:
         """A task is busy when status==Implementing OR present in lock_map."""
@@ -9751,7 +10571,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         # full re-read here made entering the view noticeably slow.
         refresh_locks = False
         if name == "inflight":
-            self.manager.load_tasks()
+            self.manager.sync_tasks()
             refresh_locks = True
 
         # By-Trail supersession token: entering AND leaving are re-entry
@@ -10018,6 +10838,33 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         """
         return next((c for c in self._column_widgets() if c.col_id == col_id), None)
 
+    def _windowed_columns(self, cols=None) -> list:
+        """The windowed `KanbanColumn`s (`VIRTUALIZE_MIN_ROWS`), scoped like
+        `_filter_units`.
+
+        Read off `#board_container`'s direct children rather than through
+        `query(KanbanColumn)`: `query()` walks the whole tree (see
+        `_filter_units`), and the filter pass asks on every keystroke.
+        """
+        return [c for c in self.query_one("#board_container").children
+                if isinstance(c, KanbanColumn) and c.windowed and not c._pruning
+                and (cols is None or c.col_id in cols)]
+
+    def _from_viewport(self, col_id: str, units: list) -> list:
+        """`units` from the first one reaching `col_id`'s viewport, when windowed.
+
+        A windowed column's first mounted units are `WINDOW_OVERSCAN` rows
+        ABOVE its viewport, so a position counted from them would land
+        off-screen; counted from the viewport it means what it means in a
+        fully mounted column scrolled to the top. Other columns are returned
+        unchanged.
+        """
+        col = next(iter(self._windowed_columns({col_id})), None)
+        if col is None:
+            return units
+        top = col.scrollable_content_region.y
+        return [u for u in units if u.region.bottom > top] or units
+
     @staticmethod
     def _rows_inside(viewport, region) -> bool:
         """True when `region`'s rows lie wholly within `viewport`'s rows.
@@ -10121,7 +10968,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         placeholder = self._column_placeholder(col_id)
         if placeholder is not None and placeholder.styles.display != "none":
             return placeholder
-        units = self._visible_column_units(col_id)
+        units = self._from_viewport(col_id, self._visible_column_units(col_id))
         if units:
             return units[min(preferred_pos, len(units) - 1)]
         return None
@@ -10154,6 +11001,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         label = labels.first()
         label.update(MARK_CHECKED if marked else MARK_UNCHECKED)
         label.set_class(marked, "task-marked")
+        card.painted_mark = marked
 
     def action_toggle_mark(self) -> None:
         """`space`: toggle the focused parent card's mark (t1243_6)."""
@@ -10456,7 +11304,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         # target column to a position the user never looked at (t1248).
         # Indexed over NAVIGATION STOPS (t1243_9), so a group header occupies a
         # position like any other unit and `←`/`→` preserve it unchanged.
-        old_units = self._visible_column_units(cur_col)
+        old_units = self._from_viewport(cur_col, self._visible_column_units(cur_col))
         source = focused
         if source is not None and not self._card_fully_visible(source):
             source = self._viewport_anchor(old_units, source) or source
@@ -11065,7 +11913,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         # while the modal is open would strand the board's card references with
         # no focused card to restore (_focused_card queries "TaskCard:focus",
         # which is empty behind a modal).
-        self.manager.load_tasks()
+        self.manager.sync_tasks()
         # A watch belongs to the trail it was installed for (t1268).
         self._stop_trail_watch()
         self.active_trail_handle = handle
@@ -11448,7 +12296,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         with self.suspend():
             subprocess.call([editor, str(filepath)])
 
-        self.manager.load_tasks()
+        self.manager.sync_tasks()
         self.refresh_board(refocus_filename=filename)
 
     def action_sync_remote(self):
@@ -11502,7 +12350,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         elif status == STATUS_ERROR:
             self.app.call_from_thread(self.notify, f"Sync error: {result.error_message}", severity="error")
 
-        self.app.call_from_thread(self.manager.load_tasks)
+        self.app.call_from_thread(self.manager.sync_tasks)
         self.app.call_from_thread(self.refresh_board, refresh_locks=True)
         # A sync that pulled new task data can change the drift verdict, so
         # re-check freshness for the active trail (t1268).
@@ -11515,7 +12363,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
             if resolve:
                 self._run_interactive_sync_shared()
             else:
-                self.manager.load_tasks()
+                self.manager.sync_tasks()
                 self.refresh_board()
         self.push_screen(SyncConflictScreen(files), on_result)
 
@@ -11523,7 +12371,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
     async def _run_interactive_sync_shared(self):
         """Run shared interactive sync helper, then refresh board state."""
         def reload():
-            self.manager.load_tasks()
+            self.manager.sync_tasks()
             self.refresh_board(refresh_locks=True)
         run_interactive_sync(self.app, on_done=reload)
 
@@ -11667,7 +12515,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
                 ret = subprocess.call([wrapper, "invoke", "pick", num])
             if ret != 0:
                 self.notify(CODEAGENT_FAILURE_NOTICE, severity="error")
-            self.manager.load_tasks()
+            self.manager.sync_tasks()
             self.refresh_board(refocus_filename=filename)
 
     @work(exclusive=True)
@@ -11686,7 +12534,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
                 ret = subprocess.call([wrapper, "invoke", operation, num])
             if ret != 0:
                 self.notify(CODEAGENT_FAILURE_NOTICE, severity="error")
-            self.manager.load_tasks()
+            self.manager.sync_tasks()
             self.refresh_board(refocus_filename=filename)
 
     @work(exclusive=True)
@@ -11719,7 +12567,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
                 ret = subprocess.call(args)
             if ret != 0 and error_notice:
                 self.notify(error_notice, severity="error")
-            self.manager.load_tasks()
+            self.manager.sync_tasks()
             self.refresh_board(refocus_filename=refocus_filename)
 
     def action_create_task(self):
@@ -11751,7 +12599,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
                             create_result.session, win_name,
                             window_index=create_result.window,
                         )
-            self.manager.load_tasks()
+            self.manager.sync_tasks()
             self.refresh_board()
         self.push_screen(screen, on_create_result)
 
@@ -12049,7 +12897,10 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         """
         if task_group_slug(task):
             return True
-        return any(self._column_widget_has_group(w) for w in col_widgets)
+        # A windowed column's DOM is a slice of its rows between spacers, which
+        # neither in-place path can splice into: it recomposes too.
+        return any(w.windowed or self._column_widget_has_group(w)
+                   for w in col_widgets)
 
     def _card_block(self, col_widget, card) -> list:
         """A parent card plus the `.child-wrapper` rows that belong to it.
@@ -12917,7 +13768,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         finally:
             self.app.call_from_thread(self.pop_screen)
 
-        self.app.call_from_thread(self.manager.load_tasks)
+        self.app.call_from_thread(self.manager.sync_tasks)
         self.app.call_from_thread(self.refresh_board)
 
     @staticmethod
@@ -13086,7 +13937,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         finally:
             self.app.call_from_thread(self.pop_screen)
 
-        self.app.call_from_thread(self.manager.load_tasks)
+        self.app.call_from_thread(self.manager.sync_tasks)
         self.app.call_from_thread(self.refresh_board)
 
         # After the parent has been reloaded, check for orphan-archive prompt.
@@ -13203,7 +14054,7 @@ class KanbanApp(TuiSwitcherMixin, ShortcutsMixin, App):
         self._run_sync(show_notification=True)
 
         # Reload and refresh board
-        self.app.call_from_thread(self.manager.load_tasks)
+        self.app.call_from_thread(self.manager.sync_tasks)
         self.app.call_from_thread(self.refresh_board, refocus_filename=new_filename)
 
     def _git_commit_tasks(self, tasks: list[Task], message: str):
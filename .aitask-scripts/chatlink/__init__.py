@@ -8,6 +8,8 @@ renders them as chat components and routes the answers back. Protocol spec:
 Modules: ``relay`` (spool + schemas + identity; stdlib-only — the agent
 side imports nothing else), ``render`` (question → ``chat`` components;
 gateway side only), ``relay_ask`` (the agent-side blocking ask CLI),
+``relay_watch`` (spool-write wakeups, inotify with a polling fallback;
+stdlib-only, used on both sides),
 ``paths`` (secure runtime dirs + config resolution; gateway side),
 ``config`` (gateway config schema + fault-tolerant loader; gateway side),
 ``policy`` (deny-by-default authorization above ``IdentityClaims``, with
@@ -22,7 +24,7 @@ pump + payload completion sink; gateway side), ``payload_guard``
 payload → ``aitask_create.sh`` + push), ``chatlink_app`` (the Textual TUI
 behind ``ait chatlink`` — the ONLY module that may import Textual).
 
-Contract: ``relay`` and ``relay_ask`` import ONLY from within ``chatlink/``
+Contract: ``relay``, ``relay_ask`` and ``relay_watch`` import ONLY from within ``chatlink/``
 and the stdlib — no ``chat/`` module, no aitasks framework module
 (guard-tested by ``tests/test_chatlink_relay.sh``). ``render`` may import
 ``chat``; ``paths``/``config``/``policy`` may import ``yaml`` /
@@ -19,6 +19,11 @@
    level-triggered (state re-derived from disk each tick), so a dropped
    event is regenerated on the next tick. A scan-tick exception is audited
    and skipped, never daemon-fatal.
+6. Wakeups are edge hints, the sweep is the truth: spool writes
+   (``relay_watch.SpoolWatcher`` over the relay root) trigger an immediate
+   scan of just the sessions they name, and the full scan still runs every
+   ``interval_s`` as a consistency sweep — so a lost or coalesced event
+   costs at most one sweep interval, exactly the pre-watcher latency.
 
 **Crash window note:** ``complete_session`` persists ``awaiting_payload``
 before validating. A crash inside that window leaves a non-terminal record
@@ -42,14 +47,22 @@ from .intake import (
 )
 from .payload_guard import PayloadRejected, validate_payload
 from .relay import Answer, RelayError, SessionDir
+from .relay_watch import SESSION, SpoolWatcher
 from .render import RenderRejected
 from .sessions_store import SessionsStore
 from .task_create import TaskCreateError, create_task_from_payload
 
-#: Pump cadence + queue bound (level-triggered scan ⇒ drops are safe).
-FLOW_SCAN_INTERVAL_S = 2.0
+#: Full consistency-sweep cadence while the relay root is watched, the
+#: scan cadence when it cannot be (missing root / watcher failure), and the
+#: queue bound (level-triggered scan ⇒ drops are safe).
+FLOW_SCAN_INTERVAL_S = 30.0
+FLOW_UNWATCHED_SCAN_INTERVAL_S = 2.0
 FLOW_QUEUE_MAX = 256
 
+#: Spool writes that can make a flow event ready (answers and status.json
+#: are written by the gateway itself — nothing to pump).
+_WAKE_KINDS = frozenset({"question", "payload", SESSION})
+
 QUESTION_READY = "question_ready"
 PAYLOAD_READY = "payload_ready"
 
@@ -70,18 +83,24 @@ class FlowEvent:
 
 
 def scan_flow_events(store: SessionsStore, relay_root: Path,
-                     audit=None) -> list:
+                     audit=None, session_ids=None) -> list:
     """One level-triggered scan pass: derive ready events from disk.
 
     Pure read (blocking I/O — run via ``asyncio.to_thread``). Emits
     ``QUESTION_READY`` for each pending question with no posted marker and
     ``PAYLOAD_READY`` when ``payload.json`` exists — for non-terminal
     sessions only. The loop-side handlers re-validate everything.
+    ``session_ids`` limits the pass to those sessions (a watcher wakeup);
+    None scans every record (the sweep).
     """
     from .daemon import scan_one_session  # deferred: daemon imports flow
 
     events: list[FlowEvent] = []
-    records, _corrupt = store.list_records()
+    if session_ids is None:
+        records, _corrupt = store.list_records()
+    else:
+        records = [r for r in map(store.load, sorted(session_ids))
+                   if r is not None]
     for record in records:
         if record.is_terminal:
             continue
@@ -100,25 +119,111 @@ def scan_flow_events(store: SessionsStore, relay_root: Path,
 
 async def run_flow_pump(*, store: SessionsStore, relay_root: Path,
                         flow_q: asyncio.Queue, stop: asyncio.Event,
-                        audit, interval_s: float = FLOW_SCAN_INTERVAL_S) -> None:
-    """Background scan loop; its only side effect is ``flow_q.put_nowait``."""
-    while not stop.is_set():
-        try:
-            events = await asyncio.to_thread(
-                scan_flow_events, store, relay_root, audit)
-            for ev in events:
-                try:
-                    flow_q.put_nowait(ev)
-                except asyncio.QueueFull:
-                    audit.warning(
-                        "flow queue full — dropped %s for %s (regenerated "
-                        "next scan)", ev.kind, ev.session_id)
-        except Exception as exc:  # noqa: BLE001 — pump must never die
-            audit.error("flow scan failed: %s: %s", type(exc).__name__, exc)
+                        audit, interval_s: float = FLOW_SCAN_INTERVAL_S,
+                        watch: bool = True) -> None:
+    """Background scan loop; its only side effect is ``flow_q.put_nowait``.
+
+    Full sweep on entry and every ``interval_s``; between sweeps, spool
+    writes wake a scan of the sessions they touched (concurrency contract
+    6). Without a watcher (``watch=False``, or the relay root does not
+    exist yet) the sweep keeps the pre-watcher cadence,
+    ``FLOW_UNWATCHED_SCAN_INTERVAL_S`` (or ``interval_s`` if shorter). Lost
+    events re-open the watcher — the relay root may have been recreated —
+    and sweep.
+    """
+    watcher: SpoolWatcher | None = None
+    loop = asyncio.get_running_loop()
+    next_sweep = loop.time()
+    try:
+        while not stop.is_set():
+            if watch and watcher is None and relay_root.is_dir():
+                watcher = await asyncio.to_thread(
+                    SpoolWatcher, relay_root, root=True,
+                    poll_interval=FLOW_UNWATCHED_SCAN_INTERVAL_S)
+                next_sweep = loop.time()   # writes before the watch landed
+            now = loop.time()
+            if now >= next_sweep:
+                next_sweep = now + (interval_s if watcher is not None else
+                                    min(interval_s,
+                                        FLOW_UNWATCHED_SCAN_INTERVAL_S))
+                await _pump_once(store, relay_root, flow_q, audit, None)
+                continue
+            changed = await _next_spool_wakeup(watcher, stop,
+                                               next_sweep - now)
+            if changed is None:            # events were lost: sweep now
+                watcher.close()
+                watcher = None
+                next_sweep = loop.time()
+            elif changed:
+                await _pump_once(store, relay_root, flow_q, audit, changed)
+    finally:
+        if watcher is not None:
+            watcher.close()
+
+
+async def _next_spool_wakeup(watcher: SpoolWatcher | None,
+                             stop: asyncio.Event, timeout: float):
+    """Wait up to ``timeout`` for spool writes (or ``stop``).
+
+    Returns the session ids worth rescanning — empty on timeout, on stop,
+    or when nothing relevant changed — or None when events were lost and
+    the caller should sweep. The inotify fd is awaited on the loop itself
+    (``add_reader``); the poll backend diffs its snapshot in a worker
+    thread every ``poll_interval``.
+    """
+    if watcher is None:
+        await _wait_stop(stop, timeout)
+        return set()
+    fd = watcher.fileno()
+    if fd is None:
+        if not await _wait_stop(stop, min(timeout, watcher.poll_interval)):
+            return set()
+        events = await asyncio.to_thread(watcher.read_events)
+    else:
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        loop.add_reader(fd, readable.set)
+        waiters = [asyncio.ensure_future(stop.wait()),
+                   asyncio.ensure_future(readable.wait())]
         try:
-            await asyncio.wait_for(stop.wait(), timeout=interval_s)
-        except asyncio.TimeoutError:
-            pass
+            await asyncio.wait(waiters, timeout=timeout,
+                               return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            loop.remove_reader(fd)
+            for w in waiters:
+                w.cancel()
+        if not readable.is_set():
+            return set()
+        events = watcher.read_events()
+    if events is None:
+        return None
+    return {ev.session_id for ev in events if ev.kind in _WAKE_KINDS}
+
+
+async def _wait_stop(stop: asyncio.Event, timeout: float) -> bool:
+    """Sleep up to ``timeout``; False when ``stop`` was set meanwhile."""
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=max(timeout, 0))
+    except asyncio.TimeoutError:
+        return True
+    return False
+
+
+async def _pump_once(store: SessionsStore, relay_root: Path,
+                     flow_q: asyncio.Queue, audit, session_ids) -> None:
+    """One scan (full, or of ``session_ids``) → ``flow_q``; never raises."""
+    try:
+        events = await asyncio.to_thread(
+            scan_flow_events, store, relay_root, audit, session_ids)
+        for ev in events:
+            try:
+                flow_q.put_nowait(ev)
+            except asyncio.QueueFull:
+                audit.warning(
+                    "flow queue full — dropped %s for %s (regenerated "
+                    "next scan)", ev.kind, ev.session_id)
+    except Exception as exc:  # noqa: BLE001 — pump must never die
+        audit.error("flow scan failed: %s: %s", type(exc).__name__, exc)
 
 
 # --------------------------------------------------------------------- #
@@ -35,6 +35,7 @@ __all__ = [
     "create_session_dir",
     "mint_session_id",
     "parse_custom_id",
+    "spool_entry_kind",
 ]
 
 # --- Protocol constants (aidocs/chat/qa_relay_protocol.md) ---
@@ -467,6 +468,20 @@ def _read_json(path: Path) -> dict | None:
 
 
 _QUESTION_RE = re.compile(r"^question-(\d{1,6})\.json$")
+_ENTRY_RE = re.compile(r"^(question|answer)-(\d{1,6})\.json$")
+_FIXED_ENTRIES = {"status.json": "status", "payload.json": "payload"}
+
+
+def spool_entry_kind(name: str) -> tuple[str, int] | None:
+    """Classify a spool file name: ``("question"|"answer", seq)``,
+    ``("status"|"payload", -1)``, or None for anything else (``*.tmp``
+    staging files included) — the layout knowledge ``relay_watch`` needs to
+    turn directory events into spool events without duplicating it."""
+    m = _ENTRY_RE.match(name)
+    if m:
+        return m.group(1), int(m.group(2))
+    kind = _FIXED_ENTRIES.get(name)
+    return None if kind is None else (kind, -1)
 
 
 @dataclass
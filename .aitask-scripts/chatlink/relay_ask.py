@@ -2,11 +2,13 @@
 
 Runs inside the spawned (sandboxed) agent; the ONLY thing the agent needs to
 ask a question. Writes the next-seq question into the session spool, blocks
-polling for the answer, prints a line-oriented result, and — per the durable
-timeout rule (spec §Timeout/cancel ownership) — records a `status: timeout`
-answer itself when nobody answered in time.
+until the answer lands (woken by ``relay_watch`` — inotify where available,
+else a ``POLL_INTERVAL_S`` poll), prints a line-oriented result, and — per
+the durable timeout rule (spec §Timeout/cancel ownership) — records a
+`status: timeout` answer itself when nobody answered in time.
 
-Contract: **stdlib-only** (imports only ``chatlink.relay``); never hangs
+Contract: **stdlib-only** (imports only ``chatlink.relay`` and
+``chatlink.relay_watch``); never hangs
 past the timeout; exit 0 for every terminal answer status (answered /
 timeout / cancelled — fail-safe), exit 2 only for usage/environment errors.
 
@@ -37,7 +39,9 @@ from chatlink.relay import (
     SessionDir,
     assign_option_values,
 )
+from chatlink.relay_watch import SpoolWatcher
 
+#: Answer-wait cadence when the spool cannot be watched (poll backend).
 POLL_INTERVAL_S = 1.0
 # Default deliberately under the ~120 s default Bash-tool timeout of a
 # calling headless agent (spike finding — see the protocol doc).
@@ -112,12 +116,16 @@ def main(argv: list[str] | None = None) -> int:
     label_by_value = {o.value: o.label for o in options}
     deadline = time.monotonic() + args.timeout
 
-    while time.monotonic() < deadline:
-        answer = _read_valid_answer(session, seq)
-        if answer is not None:
-            _emit(answer, label_by_value)
-            return 0
-        time.sleep(min(POLL_INTERVAL_S, max(deadline - time.monotonic(), 0)))
+    # The watch starts after the question is written; an answer that beat
+    # it is caught by the read at the top of the loop. Any wakeup re-reads
+    # the answer file (one small read) rather than trusting the event.
+    with SpoolWatcher(session_path, poll_interval=POLL_INTERVAL_S) as watcher:
+        while time.monotonic() < deadline:
+            answer = _read_valid_answer(session, seq)
+            if answer is not None:
+                _emit(answer, label_by_value)
+                return 0
+            watcher.wait(max(deadline - time.monotonic(), 0))
 
     # Deadline reached — final poll, then durably record the timeout
     # (never overwriting an answer that raced in).
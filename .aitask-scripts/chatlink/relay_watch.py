@@ -0,0 +1,301 @@
+"""relay_watch — wake on relay spool writes instead of polling for them.
+
+Both ends of the Q&A relay used to discover spool changes by polling: the
+agent-side ``relay_ask`` re-read ``answer-<seq>.json`` every
+``POLL_INTERVAL_S`` and the gateway's flow pump rescanned every session
+every ``FLOW_SCAN_INTERVAL_S`` — a poll interval of latency on each half of
+every chat round trip, and a full directory sweep every tick even when
+nothing changed. :class:`SpoolWatcher` turns question / answer / status /
+payload writes into :class:`SpoolEvent`\\ s as they land:
+
+  * ``inotify`` (Linux) through ``ctypes``: the spool's atomic writes
+    surface as ``IN_MOVED_TO`` (``os.replace``) or ``IN_CREATE``
+    (``os.link``, the never-overwrite answer publish), so an event always
+    names a complete file; ``*.tmp`` staging names are ignored.
+  * ``poll`` everywhere else (macOS, a Docker Desktop bind mount, exhausted
+    watch limits) and under ``AIT_FS_WATCH=poll``: a stat snapshot diffed
+    every ``poll_interval`` — the old cadence, but only changed sessions are
+    reported.
+
+Two shapes: a watcher over ONE session dir (``relay_ask``) or, with
+``root=True``, over the relay root and every session dir in it, new ones
+included (the flow pump). ``None`` from :meth:`SpoolWatcher.read_events` /
+:meth:`SpoolWatcher.wait` means "events were lost — rescan everything"
+(queue overflow, the watched dir vanished, a session watch could not be
+added). Events are hints, never state: consumers re-derive everything from
+the spool, which keeps the restart-derivability contract intact.
+
+Same inotify technique as ``lib/fs_watch.py``, re-implemented here because
+this module runs on the agent side, which is stdlib-only and may import
+nothing outside ``chatlink/`` (guard-tested by
+``tests/test_chatlink_relay.sh``).
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from chatlink.relay import spool_entry_kind
+
+_FORCE_ENV = "AIT_FS_WATCH"   # shared with lib/fs_watch.py
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_GONE = _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED
+_SESSION_MASK = (_IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE_SELF
+                 | _IN_MOVE_SELF | _IN_ONLYDIR)
+_ROOT_MASK = (_IN_CREATE | _IN_MOVED_TO | _IN_DELETE | _IN_MOVED_FROM
+              | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+_EVENT_HEADER = struct.Struct("iIII")   # wd, mask, cookie, len
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+SESSION = "session"   # a session dir appeared or went away
+
+
+@dataclass(frozen=True)
+class SpoolEvent:
+    session_id: str
+    kind: str  # question | answer | status | payload | session
+    seq: int = -1
+
+
+def _load_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        init1 = libc.inotify_init1
+        add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    init1.argtypes = [ctypes.c_int]
+    init1.restype = ctypes.c_int
+    add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    add_watch.restype = ctypes.c_int
+    return init1, add_watch
+
+
+class SpoolWatcher:
+    """Report relay spool writes under ``path`` as :class:`SpoolEvent` lists.
+
+    ::
+
+        with SpoolWatcher(session_dir) as w:
+            events = w.wait(timeout=30)   # [] on timeout, None = rescan
+
+    ``fileno()`` is the inotify fd (None on the poll backend) so an asyncio
+    caller can ``loop.add_reader`` it and call the non-blocking
+    :meth:`read_events` when it fires, instead of parking a thread in
+    :meth:`wait`.
+    """
+
+    def __init__(self, path: str | Path, *, root: bool = False,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self.path = Path(path)
+        self.root = root
+        self.poll_interval = poll_interval
+        self.backend = "poll"
+        self._fd = -1
+        self._add_watch = None
+        self._wds: dict[int, str | None] = {}   # wd → session id (None: root)
+        self._snapshot: dict[tuple[str, str], tuple] | None = None
+        if os.environ.get(_FORCE_ENV, "").strip().lower() != "poll":
+            self._open_inotify()
+        if self._fd < 0:
+            self._snapshot = self._scan()
+
+    # -- inotify ------------------------------------------------------- #
+
+    def _open_inotify(self) -> None:
+        api = _load_inotify()
+        if api is None:
+            return
+        init1, self._add_watch = api
+        fd = init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return
+        self._fd = fd
+        if self.root:
+            ok = self._watch(None, self.path, _ROOT_MASK)
+            if ok:
+                for sid in self._session_ids():
+                    self._watch(sid, self.path / sid, _SESSION_MASK)
+        else:
+            ok = self._watch(self.path.name, self.path, _SESSION_MASK)
+        if not ok:
+            self.close()
+            return
+        self.backend = "inotify"
+
+    def _watch(self, sid: str | None, path: Path, mask: int) -> bool:
+        wd = self._add_watch(self._fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            return False
+        self._wds[wd] = sid
+        return True
+
+    def _session_ids(self) -> list[str]:
+        try:
+            with os.scandir(self.path) as it:
+                return [e.name for e in it if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            return []
+
+    def _drain(self) -> list[SpoolEvent] | None:
+        events: dict[SpoolEvent, None] = {}   # ordered, de-duplicated
+        rescan = False
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            except OSError as exc:
+                if exc.errno == errno.EINTR:
+                    continue
+                return None
+            if not buf:
+                break
+            off = 0
+            while off + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, off)
+                off += _EVENT_HEADER.size
+                name = os.fsdecode(buf[off:off + length].split(b"\0", 1)[0])
+                off += length
+                if not self._apply(wd, mask, name, events):
+                    rescan = True
+        return None if rescan else list(events)
+
+    def _apply(self, wd: int, mask: int, name: str,
+               events: dict[SpoolEvent, None]) -> bool:
+        """Fold one raw event into ``events``; False means "rescan"."""
+        if mask & _IN_Q_OVERFLOW or wd not in self._wds:
+            return not mask & _IN_Q_OVERFLOW
+        sid = self._wds[wd]
+        if sid is None or not self.root:
+            if mask & _GONE:                  # the watched dir itself
+                self._wds.pop(wd, None)
+                return False
+        if sid is None:                       # root: a session dir came/went
+            if mask & _IN_ISDIR and name:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    # Files written before the watch lands are covered by
+                    # the consumer rescanning the session on this event.
+                    if not self._watch(name, self.path / name, _SESSION_MASK):
+                        return False
+                events[SpoolEvent(name, SESSION)] = None
+            return True
+        if mask & _GONE:                      # a session dir was removed
+            self._wds.pop(wd, None)
+            events[SpoolEvent(sid, SESSION)] = None
+            return True
+        kind = spool_entry_kind(name)
+        if kind is not None:
+            events[SpoolEvent(sid, kind[0], kind[1])] = None
+        return True
+
+    # -- polling ------------------------------------------------------- #
+
+    def _scan(self) -> dict[tuple[str, str], tuple]:
+        snap: dict[tuple[str, str], tuple] = {}
+        dirs = ([(sid, self.path / sid) for sid in self._session_ids()]
+                if self.root else [(self.path.name, self.path)])
+        for sid, path in dirs:
+            snap[(sid, "")] = ()              # the session dir itself
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if spool_entry_kind(entry.name) is None:
+                            continue
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        snap[(sid, entry.name)] = (st.st_mtime_ns, st.st_size,
+                                                   st.st_ino)
+            except OSError:
+                continue
+        return snap
+
+    def _diff(self) -> list[SpoolEvent]:
+        snap = self._scan()
+        old, self._snapshot = self._snapshot or {}, snap
+        events: dict[SpoolEvent, None] = {}
+        for key in sorted(snap.keys() | old.keys()):
+            if snap.get(key) == old.get(key):
+                continue
+            sid, name = key
+            if not name:
+                events[SpoolEvent(sid, SESSION)] = None
+            elif (sid, "") in snap:           # not the fallout of a removal
+                kind = spool_entry_kind(name)
+                events[SpoolEvent(sid, kind[0], kind[1])] = None
+        return list(events)
+
+    # -- public -------------------------------------------------------- #
+
+    def fileno(self) -> int | None:
+        return self._fd if self._fd >= 0 else None
+
+    def read_events(self) -> list[SpoolEvent] | None:
+        """Whatever changed since the last call, without blocking."""
+        if self._fd >= 0:
+            return self._drain()
+        return self._diff()
+
+    def wait(self, timeout: float | None) -> list[SpoolEvent] | None:
+        """Block up to ``timeout`` seconds (None = forever) for spool writes.
+
+        Returns the events — ``[]`` on timeout, and possibly ``[]`` early
+        when only ignored entries (``*.tmp``) changed — or None to rescan.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if self._fd >= 0:
+            try:
+                ready, _, _ = select.select([self._fd], [], [], timeout)
+            except InterruptedError:
+                return []
+            return self._drain() if ready else []
+        while True:
+            step = self.poll_interval
+            if deadline is not None:
+                step = min(step, max(0.0, deadline - time.monotonic()))
+            if step:
+                time.sleep(step)
+            events = self._diff()
+            if events or (deadline is not None
+                          and time.monotonic() >= deadline):
+                return events
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._wds.clear()
+
+    def __enter__(self) -> "SpoolWatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -5,11 +5,12 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+from textual import work
 from textual.binding import Binding
 from textual.message import Message
+from textual.worker import get_current_worker
 
 from rich.style import Style
-from rich.syntax import Syntax
 from rich.text import Text
 
 # Resolve the shared base widget from lib/ even when code_viewer is imported
@@ -21,6 +22,9 @@ if str(_LIB) not in sys.path:
 from numbered_source_view import NumberedSourceView  # noqa: E402
 from annotation_data import AnnotationRange  # noqa: E402
 from tui_layout import is_narrow_terminal  # noqa: E402
+from highlight_engine import (  # noqa: E402
+    HighlightCache, blob_hash, guess_lexer, highlight_chunks, plain_lines,
+)
 
 ANNOTATION_COLORS = [
     "cyan", "green", "yellow", "magenta",
@@ -94,6 +98,17 @@ class CodeViewer(NumberedSourceView):
 
     _INNER_ID = "code_display"
 
+    # Files up to this many lines are highlighted inline on load, too fast to
+    # notice. Larger ones render plain lines at once and are highlighted by a
+    # background worker (highlight_engine), a viewport's worth first.
+    SYNC_HIGHLIGHT_MAX_LINES = 500
+    HIGHLIGHT_FIRST_CHUNK = 200
+    HIGHLIGHT_CHUNK_LINES = 2000
+
+    # Finished highlights by (path, blob hash), shared by every viewer, so
+    # reopening a recently viewed file skips highlighting altogether.
+    _highlight_cache = HighlightCache()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._file_path: Path | None = None
@@ -115,6 +130,10 @@ class CodeViewer(NumberedSourceView):
         self._viewport_margin: int = 30
         # Wrap mode: "truncate" (default) or "wrap"
         self._wrap_mode: str = "truncate"
+        # Background highlighting: the generation tags chunks so a worker for a
+        # file that has since been replaced cannot paint over the new one.
+        self._highlight_gen: int = 0
+        self._highlighting: bool = False
 
     def _placeholder(self) -> str:
         return "Select a file to view"
@@ -128,6 +147,13 @@ class CodeViewer(NumberedSourceView):
         self._selection_active = False
         self._viewport_mode = False
         self._viewport_start = 0
+        self._highlight_gen += 1
+        self._highlighting = False
+
+    @property
+    def highlighting(self) -> bool:
+        """True while the background worker is still highlighting the file."""
+        return self._highlighting
 
     def _show_message(self, message: str) -> None:
         """Show a placeholder message instead of code content."""
@@ -198,17 +224,87 @@ class CodeViewer(NumberedSourceView):
         content = content.expandtabs(4)
 
         self._reset_state()
-        # Highlight via the shared base (uses CodeViewer._select_lexer →
-        # file-aware lexer guessing). One highlighted Text per source line; the
-        # count matches splitlines() (the existing render indexes up to
-        # _total_lines, so they are already equal).
-        self._lines = self._highlight(content)
+        blob = blob_hash(content)
+        cached = self._highlight_cache.get(file_path, blob)
+        if cached is not None:
+            self._lines = list(cached)
+        elif content.count("\n") < self.SYNC_HIGHLIGHT_MAX_LINES:
+            # Highlight via the shared base (uses CodeViewer._select_lexer →
+            # file-aware lexer guessing). One highlighted Text per source line;
+            # the count matches splitlines() (the existing render indexes up
+            # to _total_lines, so they are already equal).
+            self._lines = self._highlight(content)
+            self._highlight_cache.put(file_path, blob, list(self._lines))
+        else:
+            # Large file: show it now from plain lines (same count, same
+            # background) and let the worker swap highlighted chunks in.
+            self._lines = plain_lines(content)
+            self._highlighting = True
+            self._highlight_worker(self._highlight_gen, file_path, blob, content)
         self._total_lines = len(self._lines)
         self._viewport_mode = self._total_lines > self._viewport_threshold
 
         self._rebuild_display()
         self.scroll_home(animate=False)
 
+    @work(thread=True, exclusive=True, group="code_highlight")
+    def _highlight_worker(
+        self, gen: int, file_path: Path, blob: str, content: str,
+    ) -> None:
+        """Highlight a large file off the UI thread, handing lines over in chunks.
+
+        Lexer guessing runs here too: for an extension Pygments cannot decide
+        on, ``guess_lexer`` scores the whole text. Opening another file cancels
+        this worker (exclusive group) and bumps ``_highlight_gen``, so a chunk
+        already in flight is dropped by ``_apply_highlight``.
+        """
+        worker = get_current_worker()
+        lines: list[Text] | None = []
+        try:
+            chunks = highlight_chunks(
+                content,
+                guess_lexer(file_path, content),
+                first_chunk=self.HIGHLIGHT_FIRST_CHUNK,
+                chunk_lines=self.HIGHLIGHT_CHUNK_LINES,
+            )
+            for start, chunk in chunks:
+                if worker.is_cancelled:
+                    return
+                lines.extend(chunk)
+                self.app.call_from_thread(self._apply_highlight, gen, start, chunk)
+        except Exception:
+            # A lexer failure (or the app shutting down) leaves the plain
+            # lines up: the file stays readable, just uncoloured.
+            lines = None
+        if worker.is_cancelled:
+            return
+        try:
+            self.app.call_from_thread(
+                self._finish_highlight, gen, file_path, blob, lines,
+            )
+        except Exception:
+            pass
+
+    def _apply_highlight(self, gen: int, start: int, chunk: list[Text]) -> None:
+        """Swap highlighted lines in; re-render only if they are on screen."""
+        if gen != self._highlight_gen:
+            return
+        end = min(start + len(chunk), len(self._lines))
+        if end <= start:
+            return
+        self._lines[start:end] = chunk[: end - start]
+        render_start, render_end = self._render_range()
+        if start < render_end and end > render_start:
+            self._rebuild_display()
+
+    def _finish_highlight(
+        self, gen: int, file_path: Path, blob: str, lines: list[Text] | None,
+    ) -> None:
+        if lines is not None:
+            self._highlight_cache.put(file_path, blob, lines)
+        if gen == self._highlight_gen:
+            self._highlighting = False
+
     def set_annotations(self, annotations: list[AnnotationRange]) -> None:
         """Set annotation data and rebuild display if annotations are visible."""
         self._annotations = annotations
@@ -304,7 +400,7 @@ class CodeViewer(NumberedSourceView):
     # row styling, and the wrap/truncate toggle.
 
     def _select_lexer(self, code: str) -> str:
-        return Syntax.guess_lexer(str(self._file_path), code=code)
+        return guess_lexer(self._file_path, code)
 
     def _wrap(self) -> bool:
         return self._wrap_mode == "wrap"
@@ -7,19 +7,23 @@ adapted from toad (https://github.com/batrachianai/toad).
 
 from __future__ import annotations
 
+import heapq
 import re
+import threading
 from functools import lru_cache
 from operator import itemgetter
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Sequence
 
 from rich.text import Text
 
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container
 from textual.message import Message
 from textual.widgets import Input, OptionList
 from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 
 
 # ---------------------------------------------------------------------------
@@ -122,6 +126,116 @@ class PathFuzzySearch:
             yield score(candidate, offsets), offsets
 
 
+# ---------------------------------------------------------------------------
+# Candidate index
+# ---------------------------------------------------------------------------
+
+# How many candidates to score between two cancellation checks.
+_CANCEL_CHECK_EVERY = 256
+
+
+def _is_subsequence(needle: str, haystack: str) -> bool:
+    it = iter(haystack)
+    return all(ch in it for ch in needle)
+
+
+class PathSearchIndex:
+    """Candidate prefilter for ``PathFuzzySearch`` over a fixed path list.
+
+    ``PathFuzzySearch`` matches the query as a *subsequence*, so the only
+    thing every match is guaranteed to share with the query is its character
+    set: a path scores above zero only if it contains each (casefolded) query
+    character. The index keeps one posting bitset per character -- bit ``i``
+    set when ``paths[i]`` contains it -- and a query's candidates are the AND
+    of its characters' bitsets, which skips the alignment scorer for every
+    path that cannot match. Contiguous n-grams would prune harder but are not
+    a valid filter here ("fsw" must still find ``file_search_widget``).
+
+    Built once per path list: ``FileSearchWidget.set_files`` starts the build
+    off the UI thread, and a search that gets there first builds it itself.
+    """
+
+    def __init__(self, paths: Sequence[str], case_sensitive: bool = False) -> None:
+        self.paths = list(paths)
+        self.case_sensitive = case_sensitive
+        self._postings: dict[str, int] | None = None
+        self._lock = threading.Lock()
+
+    def fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.casefold()
+
+    def _build(self) -> dict[str, int]:
+        # One pass over the paths per distinct character, each producing the
+        # whole bitset as a binary literal: far cheaper in Python than setting
+        # bits one (path, character) pair at a time.
+        folded = [self.fold(path) for path in reversed(self.paths)]
+        alphabet = set().union(*map(set, folded)) if folded else set()
+        return {
+            ch: int("".join(["1" if ch in path else "0" for path in folded]), 2)
+            for ch in alphabet
+        }
+
+    def build(self) -> None:
+        """Build the postings now (idempotent, thread-safe)."""
+        with self._lock:
+            if self._postings is None:
+                self._postings = self._build()
+
+    def candidates(
+        self, query: str, within: Sequence[int] | None = None
+    ) -> list[int]:
+        """Ascending indices of paths containing every character of ``query``.
+
+        With ``within`` (ascending indices, e.g. the previous keystroke's
+        matches), only those are considered.
+        """
+        self.build()
+        mask = (1 << len(self.paths)) - 1
+        for ch in set(self.fold(query)):
+            mask &= self._postings.get(ch, 0)
+            if not mask:
+                return []
+        bits = bin(mask)[:1:-1]  # bits[i] == "1" <=> bit i set
+        if within is not None:
+            return [i for i in within if i < len(bits) and bits[i] == "1"]
+        out: list[int] = []
+        i = bits.find("1")
+        while i != -1:
+            out.append(i)
+            i = bits.find("1", i + 1)
+        return out
+
+    def search(
+        self,
+        query: str,
+        fuzzy: PathFuzzySearch,
+        limit: int,
+        within: Sequence[int] | None = None,
+        cancelled: Callable[[], bool] = lambda: False,
+    ) -> tuple[list[tuple[float, Sequence[int], str]], list[int]] | None:
+        """Score the candidates for ``query`` and return the best ``limit``.
+
+        Returns ``(top, matched)``, where ``top`` is exactly the first
+        ``limit`` entries of every match ``(score, positions, path)`` stably
+        sorted by descending score, and ``matched`` the ascending indices of
+        every path that matched (the ``within`` for a longer query). Returns
+        None once ``cancelled()`` reports true.
+        """
+        scored: list[tuple[float, Sequence[int], str]] = []
+        matched: list[int] = []
+        paths = self.paths
+        for n, i in enumerate(self.candidates(query, within)):
+            if n % _CANCEL_CHECK_EVERY == 0 and cancelled():
+                return None
+            score, positions = fuzzy.match(query, paths[i])
+            if score > 0:
+                scored.append((score, positions, paths[i]))
+                matched.append(i)
+        # nlargest is documented equal to sorted(..., reverse=True)[:limit],
+        # ties included, without sorting every match.
+        return heapq.nlargest(limit, scored, key=itemgetter(0)), matched
+
+
 # ---------------------------------------------------------------------------
 # File search widget
 # ---------------------------------------------------------------------------
@@ -172,6 +286,10 @@ class FileSearchWidget(Container):
         super().__init__(**kwargs)
         self._all_files: list[str] = []
         self._fuzzy = PathFuzzySearch()
+        self._index = PathSearchIndex([])
+        # (index, folded query, matched indices) of the last completed search:
+        # a query that extends it only needs to rescore those matches.
+        self._last_search: tuple[PathSearchIndex, str, list[int]] | None = None
 
     def compose(self) -> ComposeResult:
         yield Input(placeholder="Search files...", id="file_search_input")
@@ -180,27 +298,67 @@ class FileSearchWidget(Container):
     def set_files(self, files: list[str]) -> None:
         """Populate the searchable file list (relative paths)."""
         self._all_files = sorted(files)
+        self._index = PathSearchIndex(self._all_files)
+        self._last_search = None
+        if self.is_mounted:
+            self._build_index(self._index)
+
+    @work(thread=True, exclusive=True, group="file_search_index")
+    def _build_index(self, index: PathSearchIndex) -> None:
+        index.build()
 
     # --- event handlers ---------------------------------------------------
 
     def on_input_changed(self, event: Input.Changed) -> None:
         query = event.value.strip()
-        ol = self.query_one("#file_search_results", OptionList)
 
         if not query:
+            self.workers.cancel_group(self, "file_search")
+            ol = self.query_one("#file_search_results", OptionList)
             ol.clear_options()
             ol.add_class("-hidden")
             return
 
-        scored: list[tuple[float, Sequence[int], str]] = []
-        for path in self._all_files:
-            score, positions = self._fuzzy.match(query, path)
-            if score > 0:
-                scored.append((score, positions, path))
-
-        scored.sort(key=itemgetter(0), reverse=True)
-        top = scored[:_MAX_RESULTS]
-
+        within = None
+        index = self._index
+        last = self._last_search
+        if last is not None and last[0] is index and _is_subsequence(
+                last[1], index.fold(query)):
+            # Every match for the longer query also matched the shorter one.
+            within = last[2]
+        self._run_search(index, query, within)
+
+    @work(thread=True, exclusive=True, group="file_search")
+    def _run_search(
+        self, index: PathSearchIndex, query: str, within: list[int] | None
+    ) -> None:
+        """Score off the UI thread; a newer keystroke cancels this one."""
+        worker = get_current_worker()
+        result = index.search(query, self._fuzzy, _MAX_RESULTS, within,
+                              cancelled=lambda: worker.is_cancelled)
+        if result is None or worker.is_cancelled:
+            return
+        self.app.call_from_thread(self._show_results, index, query, *result)
+
+    def _show_results(
+        self,
+        index: PathSearchIndex,
+        query: str,
+        top: list[tuple[float, Sequence[int], str]],
+        matched: list[int],
+    ) -> None:
+        # A worker can finish between a newer keystroke and its cancellation
+        # taking effect; only results for what the box shows now may land.
+        if index is not self._index:
+            return
+        try:
+            current = self.query_one("#file_search_input", Input).value.strip()
+        except Exception:
+            return
+        if current != query:
+            return
+        self._last_search = (index, index.fold(query), matched)
+        ol = self.query_one("#file_search_results", OptionList)
         ol.clear_options()
         for _score, positions, path in top:
             ol.add_option(Option(self._highlight(path, positions), id=path))
@@ -0,0 +1,192 @@
+"""Incremental syntax highlighting for the code browser's ``CodeViewer``.
+
+``CodeViewer.load_file`` used to run ``Syntax.guess_lexer`` and highlight the
+whole file into per-line ``Text`` before anything was shown, so opening a
+20k-line generated file or a large log froze the browser for seconds. This
+module splits that work into three pieces:
+
+* :func:`plain_lines` — the instant fallback: one unstyled ``Text`` per source
+  line, carrying the theme's background so the swap to highlighted lines does
+  not flash. The viewer renders these right away.
+* :func:`highlight_chunks` — the highlight itself, yielded a chunk of lines at
+  a time. The Pygments token stream is a generator whose frame holds the
+  lexer's state (its state stack, the offset into the text), so between
+  chunks the lexer is simply suspended and resumes exactly where it stopped —
+  no re-lexing from the top, and the result is identical to a one-shot
+  ``Syntax.highlight(code).split("\\n")``. The first chunk is small (about a
+  viewport), so the lines on screen turn highlighted first; later chunks are
+  larger to keep the UI-thread hand-offs few.
+* :class:`HighlightCache` — finished highlights, keyed by ``(path, blob
+  hash)`` and evicted least-recently-used, so reopening a recent file is
+  instant and an edited file (new blob) is never served stale lines.
+
+Only ``rich`` (and the Pygments it bundles) + stdlib: importable under PyPy,
+codebrowser's fast path.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Iterator
+
+from rich.syntax import Syntax
+from rich.text import Text
+
+THEME = "monokai"
+
+
+def blob_hash(content: str) -> str:
+    """Git blob id of *content* (as ``git hash-object`` would hash its UTF-8 bytes).
+
+    Computed in-process: one SHA-1 over the text, no ``git`` subprocess. Equal
+    to the index's blob id for a UTF-8, LF-terminated file; for anything else it
+    is still a stable content key, which is all the cache needs.
+    """
+    data = content.encode("utf-8", "surrogateescape")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def guess_lexer(path, code: str) -> str:
+    """Pygments lexer name for *path*, using *code* when the extension is ambiguous."""
+    return Syntax.guess_lexer(str(path), code=code)
+
+
+def _line_template(theme: str) -> Text:
+    """An empty line styled the way ``Syntax.highlight`` styles its output."""
+    base_style = Syntax.get_theme(theme).get_background_style()
+    justify = "default" if base_style.transparent_background else "left"
+    return Text(justify=justify, style=base_style)
+
+
+def _split_source(code: str) -> list[str]:
+    """Source lines, counted the way ``Syntax.highlight(...).split("\\n")`` counts.
+
+    A final newline does not open an extra (empty) line.
+    """
+    lines = code.split("\n")
+    if code.endswith("\n"):
+        lines.pop()
+    return lines
+
+
+def plain_lines(code: str, theme: str = THEME) -> list[Text]:
+    """One unstyled ``Text`` per source line: the fallback shown before highlighting."""
+    template = _line_template(theme)
+    lines = []
+    for source in _split_source(code):
+        line = template.blank_copy()
+        line.append(source)
+        lines.append(line)
+    return lines
+
+
+def highlight_chunks(
+    code: str,
+    lexer_name: str,
+    first_chunk: int = 200,
+    chunk_lines: int = 2000,
+    theme: str = THEME,
+) -> Iterator[tuple[int, list[Text]]]:
+    """Highlight *code*, yielding ``(start_line, lines)`` chunks in file order.
+
+    The first chunk holds *first_chunk* lines, every later one *chunk_lines*.
+    Concatenated, the chunks equal ``Syntax(code, lexer_name,
+    theme=theme).highlight(code).split("\\n")`` — same lexer options (Rich's
+    ``Syntax.lexer``), same theme styles, same per-line base style.
+
+    Stop iterating at any point to abandon the work; nothing is held beyond the
+    suspended generator.
+    """
+    syntax = Syntax(code, lexer_name, theme=theme)
+    lexer = syntax.lexer
+    template = _line_template(theme)
+    total = len(_split_source(code))
+    if lexer is None:
+        # Unknown lexer: Syntax.highlight would append the code unstyled.
+        if total:
+            yield 0, plain_lines(code, theme)
+        return
+    style_for = Syntax.get_theme(theme).get_style_for_token
+
+    start = 0
+    limit = first_chunk
+    chunk: list[Text] = []
+    pieces: list[tuple[str, object]] = []
+    for token_type, token in lexer.get_tokens(code):
+        style = style_for(token_type)
+        while token:
+            piece, newline, token = token.partition("\n")
+            if piece:
+                pieces.append((piece, style))
+            if not newline:
+                continue
+            line = template.blank_copy()
+            line.append_tokens(pieces)
+            pieces = []
+            chunk.append(line)
+            if len(chunk) >= limit:
+                yield start, chunk
+                start += len(chunk)
+                chunk = []
+                limit = chunk_lines
+    if pieces:
+        line = template.blank_copy()
+        line.append_tokens(pieces)
+        chunk.append(line)
+    # The lexer terminates the text with a newline; never emit more lines than
+    # the source has (the plain fallback's count is the viewer's line count).
+    chunk = chunk[:max(0, total - start)]
+    if chunk:
+        yield start, chunk
+
+
+class HighlightCache:
+    """LRU of finished highlights keyed by ``(path, blob hash)``.
+
+    Bounded by entry count and by total cached lines (one huge log must not
+    pin memory for the session); the least-recently-used entries go first.
+    An entry larger than the whole line budget is not cached at all.
+
+    The cache is class-level, shared by every viewer for the whole session, and
+    a highlighted line (a ``Text`` with its spans and styles) weighs about
+    1 KB, more on dense lines: the line budget keeps it to some 50-60 MB. A file too big for it is
+    re-highlighted in the background on reopen, like a first open.
+    """
+
+    MAX_ENTRIES = 16
+    MAX_LINES = 50_000
+
+    def __init__(self, max_entries: int | None = None, max_lines: int | None = None):
+        self.max_entries = max_entries or self.MAX_ENTRIES
+        self.max_lines = max_lines or self.MAX_LINES
+        self._entries: OrderedDict[tuple[str, str], list[Text]] = OrderedDict()
+        self._lines = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path, blob: str) -> list[Text] | None:
+        """Cached lines for *path* at *blob*, promoted to most-recently-used."""
+        key = (str(path), blob)
+        lines = self._entries.get(key)
+        if lines is not None:
+            self._entries.move_to_end(key)
+        return lines
+
+    def put(self, path, blob: str, lines: list[Text]) -> None:
+        key = (str(path), blob)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._lines -= len(old)
+        if len(lines) > self.max_lines:
+            return
+        self._entries[key] = lines
+        self._lines += len(lines)
+        while len(self._entries) > self.max_entries or self._lines > self.max_lines:
+            _key, evicted = self._entries.popitem(last=False)
+            self._lines -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._lines = 0
@@ -17,7 +17,15 @@ from typing import Iterable, List, Optional, Tuple
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lib"))
 
 from task_yaml import parse_frontmatter
-from archive_iter import iter_all_archived_markdown, iter_archived_frontmatter, iter_all_archived_tar_files
+from archive_iter import (
+    iter_all_archived_markdown,
+    iter_all_archived_tar_files,
+    iter_archive_bundles,
+    iter_loose_archived_markdown,
+    numbered_archive_paths,
+)
+from history_index import HistoryIndex
+from stats_cache import bundle_digest
 
 
 @dataclass
@@ -70,76 +78,157 @@ def _extract_name_from_filename(filename: str) -> str:
     return name.removesuffix(".md")
 
 
-def _build_commit_map(project_root: Path) -> dict:
-    """Build task_id -> (hash, date, message) map from git log."""
-    commit_map: dict = {}
-    try:
-        result = subprocess.run(
-            ["git", "log", "--all", "--grep=(t", "--format=%H %aI %s"],
-            capture_output=True,
-            text=True,
-            cwd=project_root,
-        )
-        if result.returncode == 0:
-            task_id_re = re.compile(r"\(t(\d+(?:_\d+)?)\)")
-            for line in result.stdout.strip().splitlines():
-                if not line:
-                    continue
-                parts = line.split(" ", 2)
-                if len(parts) < 3:
-                    continue
-                hash_val, date_val, msg = parts
-                for match in task_id_re.finditer(msg):
-                    tid = match.group(1)
-                    if tid not in commit_map or date_val > commit_map[tid][1]:
-                        commit_map[tid] = (hash_val[:12], date_val, msg)
-    except (OSError, subprocess.SubprocessError):
-        pass
-    return commit_map
+_TASK_COMMIT_RE = re.compile(r"\(t(\d+(?:_\d+)?)\)")
+_ARCHIVE_COMMIT_RE = re.compile(r"^ait:\s+Archive completed t(\d+(?:_\d+)?)\b")
+
+
+def _keep_latest(commit_map: dict, tid: str, entry: Tuple[str, str, str]) -> None:
+    """Keep the most recent anchor per task; on a date tie, the first seen."""
+    if tid not in commit_map or entry[1] > commit_map[tid][1]:
+        commit_map[tid] = entry
+
 
+def _scan_task_commits(
+    project_root: Path, revs: List[str]
+) -> Optional[Tuple[dict, dict]]:
+    """Build the task-commit and archive-commit maps over ``revs`` in one git log.
 
-def _build_archive_commit_map(project_root: Path) -> dict:
-    """Build task_id -> (hash, date, message) map from archive commits.
+    Returns ``(commit_map, archive_map)``, each task_id -> (hash, date, message),
+    or None when git failed. ``revs`` may hold ``^<oid>`` exclusions.
 
-    Archive commits (e.g. ``ait: Archive completed t787 task and plan files``)
-    are written by ``aitask_archive.sh`` and serve as fallback anchors for
-    tasks that have no ``(tNN)``-tagged source commit (manual-verification,
-    brainstorm, etc.).
+    ``commit_map`` anchors tasks on ``(tNN)``-tagged commits. ``archive_map``
+    anchors them on archive commits (e.g. ``ait: Archive completed t787 task
+    and plan files``), which ``aitask_archive.sh`` writes and which serve as
+    fallback anchors for tasks that have no ``(tNN)``-tagged source commit
+    (manual-verification, brainstorm, etc.). Both greps run in the same walk.
     """
-    archive_map: dict = {}
     try:
         result = subprocess.run(
             [
                 "git",
                 "log",
-                "--all",
+                "--stdin",
+                "--grep=(t",
                 "--grep=^ait: Archive completed t",
                 "--format=%H %aI %s",
             ],
+            input="".join(f"{rev}\n" for rev in revs),
             capture_output=True,
             text=True,
+            errors="replace",
             cwd=project_root,
         )
-        if result.returncode == 0:
-            archive_re = re.compile(
-                r"^ait:\s+Archive completed t(\d+(?:_\d+)?)\b"
-            )
-            for line in result.stdout.strip().splitlines():
-                if not line:
-                    continue
-                parts = line.split(" ", 2)
-                if len(parts) < 3:
-                    continue
-                hash_val, date_val, msg = parts
-                m = archive_re.match(msg)
-                if not m:
-                    continue
-                tid = m.group(1)
-                if tid not in archive_map or date_val > archive_map[tid][1]:
-                    archive_map[tid] = (hash_val[:12], date_val, msg)
     except (OSError, subprocess.SubprocessError):
-        pass
-    return archive_map
+        return None
+    if result.returncode != 0:
+        return None
+    commit_map: dict = {}
+    archive_map: dict = {}
+    for line in result.stdout.splitlines():
+        parts = line.split(" ", 2)
+        if len(parts) < 3:
+            continue
+        hash_val, date_val, msg = parts
+        entry = (hash_val[:12], date_val, msg)
+        for match in _TASK_COMMIT_RE.finditer(msg):
+            _keep_latest(commit_map, match.group(1), entry)
+        m = _ARCHIVE_COMMIT_RE.match(msg)
+        if m:
+            _keep_latest(archive_map, m.group(1), entry)
+    return commit_map, archive_map
+
+
+def _ref_tips(project_root: Path) -> Optional[dict]:
+    """Return refname -> commit OID for every ref ``git log --all`` walks.
+
+    That is HEAD plus every ref under ``refs/`` that peels to a commit. Returns
+    None when git failed (not a repository, git missing).
+    """
+    try:
+        refs = subprocess.run(
+            [
+                "git",
+                "for-each-ref",
+                "--format=%(objecttype)%(*objecttype) %(objectname) %(refname)",
+            ],
+            capture_output=True,
+            text=True,
+            errors="replace",
+            cwd=project_root,
+        )
+        head = subprocess.run(
+            ["git", "rev-parse", "--verify", "-q", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=project_root,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if refs.returncode != 0:
+        return None
+    tips = {}
+    for line in refs.stdout.splitlines():
+        parts = line.split(" ", 2)
+        if len(parts) == 3 and parts[0] in ("commit", "tagcommit"):
+            tips[parts[2]] = parts[1]
+    if head.returncode == 0 and head.stdout.strip():
+        tips["HEAD"] = head.stdout.strip()
+    return tips
+
+
+def _history_only_grew(project_root: Path, old: List[str], new: List[str]) -> bool:
+    """True when every commit reachable from ``old`` is reachable from ``new``.
+
+    False after a rewrite (rebase, reset, deleted branch) or when an old tip
+    has been garbage-collected -- anchors on commits that dropped out of the
+    history must go, and only a full scan can tell which ones they were.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-list", "--count", "--stdin"],
+            input="".join(f"{oid}\n" for oid in old)
+            + "".join(f"^{oid}\n" for oid in new),
+            capture_output=True,
+            text=True,
+            cwd=project_root,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0 and result.stdout.strip() == "0"
+
+
+def _refresh_commit_maps(project_root: Path, index: HistoryIndex) -> Tuple[dict, dict]:
+    """Bring ``index``'s commit maps up to the current refs; return them.
+
+    Unchanged tips cost two cheap git calls. When history only grew, only the
+    new commits are logged and merged in; a newer commit wins a date tie, as
+    it would have come first in a full ``git log``. Anything else rescans.
+    """
+    tips = _ref_tips(project_root)
+    if tips is None:
+        return {}, {}
+    new = sorted(set(tips.values()))
+    old = sorted(set(index.refs.values())) if index.refs is not None else None
+    if old == new:
+        if index.refs != tips:
+            index.set_commit_maps(tips, index.commit_map, index.archive_map)
+        return index.commit_map, index.archive_map
+    if new and old and _history_only_grew(project_root, old, new):
+        scanned = _scan_task_commits(project_root, new + [f"^{oid}" for oid in old])
+        if scanned is not None:
+            commit_map = dict(index.commit_map)
+            archive_map = dict(index.archive_map)
+            for merged, added in ((commit_map, scanned[0]), (archive_map, scanned[1])):
+                for tid, entry in added.items():
+                    if tid not in merged or entry[1] >= merged[tid][1]:
+                        merged[tid] = entry
+            index.set_commit_maps(tips, commit_map, archive_map)
+            return commit_map, archive_map
+    scanned = _scan_task_commits(project_root, new) if new else ({}, {})
+    if scanned is None:
+        return {}, {}
+    index.set_commit_maps(tips, *scanned)
+    return scanned
 
 
 def _mtime_anchor(
@@ -208,34 +297,98 @@ def _merge_chunk(
     return tasks
 
 
+def _task_rows(entries: Iterable[Tuple[str, str]]) -> List[list]:
+    """``[task_id, metadata, filename]`` for each task file with frontmatter."""
+    rows = []
+    for filename, text in entries:
+        try:
+            metadata = _extract_metadata(text)
+        except Exception:
+            continue
+        if metadata is None:
+            continue
+        tid = _extract_task_id_from_filename(filename)
+        if tid is not None:
+            rows.append([tid, metadata, filename])
+    return rows
+
+
+def _sorted_index(
+    rows: list, commit_map: dict, archive_commit_map: dict, archived_dir: Path
+) -> List[CompletedTask]:
+    tasks = _merge_chunk(rows, commit_map, archive_commit_map, archived_dir)
+    tasks.sort(key=lambda t: t.commit_date, reverse=True)
+    return tasks
+
+
 def load_task_index_progressive(
     project_root: Path, chunk_size: int = 200
 ) -> Iterable[List[CompletedTask]]:
     """Yield progressively growing task index in chunks.
 
-    Phase 1: git log (fast) to build commit map.
-    Phase 2: archive scan in batches of chunk_size, merging and sorting
-    after each batch.
+    With a persisted history index (see history_index.py), the first chunk is
+    assembled from it straight away -- recorded commit maps and bundle rows,
+    plus the loose files -- and the one remaining chunk is the exact index
+    once the commit maps and bundles have been brought up to date.
+
+    Cold: git log (fast) builds the commit maps, then the archive is scanned
+    in batches of chunk_size, merging and sorting after each batch.
     """
     archived_dir = project_root / "aitasks" / "archived"
-    commit_map = _build_commit_map(project_root)
-    archive_commit_map = _build_archive_commit_map(project_root)
+    index = HistoryIndex.for_project(project_root)
+    rows = _task_rows(iter_loose_archived_markdown(archived_dir))
+    paths = numbered_archive_paths(archived_dir)
+    relpaths = {path: path.relative_to(archived_dir).as_posix() for path in paths}
+
+    previewed = False
+    if index.refs is not None:
+        preview = list(rows)
+        for path in paths:
+            preview.extend(index.rows_at(relpaths[path]) or ())
+        yield _sorted_index(preview, index.commit_map, index.archive_map, archived_dir)
+        previewed = True
+
+    commit_map, archive_commit_map = _refresh_commit_maps(project_root, index)
+    digests = {path: bundle_digest(path) for path in paths}
+    misses = iter_archive_bundles(
+        [path for path in paths if index.get(digests[path]) is None])
 
     tasks: List[CompletedTask] = []
     buffer: list = []
-    for filename, metadata in iter_archived_frontmatter(archived_dir, _extract_metadata):
-        tid = _extract_task_id_from_filename(filename)
-        if tid is not None:
-            buffer.append((tid, metadata, filename))
-        if len(buffer) >= chunk_size:
-            tasks.extend(_merge_chunk(buffer, commit_map, archive_commit_map, archived_dir))
-            tasks.sort(key=lambda t: t.commit_date, reverse=True)
-            buffer = []
-            yield list(tasks)
-    # Final flush
-    if buffer:
+
+    def flush() -> None:
+        nonlocal buffer
         tasks.extend(_merge_chunk(buffer, commit_map, archive_commit_map, archived_dir))
         tasks.sort(key=lambda t: t.commit_date, reverse=True)
+        buffer = []
+
+    def all_rows():
+        yield from rows
+        for path in paths:
+            digest = digests[path]
+            bundle_rows = index.get(digest)
+            if bundle_rows is None:
+                _path, entries, complete = next(misses)
+                bundle_rows = _task_rows(entries)
+                if complete and digest is not None and bundle_digest(path) == digest:
+                    index.put(relpaths[path], digest, bundle_rows)
+            else:
+                index.note_path(relpaths[path], digest)
+            yield from bundle_rows
+
+    try:
+        for row in all_rows():
+            buffer.append(row)
+            if len(buffer) >= chunk_size:
+                flush()
+                if not previewed:
+                    yield list(tasks)
+    finally:
+        misses.close()
+    index.save(d for d in digests.values() if d is not None)
+    # Final flush
+    if buffer:
+        flush()
     yield list(tasks)
 
 
@@ -0,0 +1,179 @@
+"""history_index.py - persisted completed-task history index for the code browser.
+
+Opening the history screen used to run ``git log --all --grep=(t`` and a
+second ``git log --all`` for archive commits over the whole history, then
+decode every numbered archive bundle and YAML-parse every task in it — on
+every open, although almost all of that input is append-only.
+
+This module persists what ``history_data`` derives from it:
+
+* the two commit maps (task id -> ``(short hash, author date, subject)``) for
+  ``(tNN)``-tagged commits and ``ait: Archive completed tNN`` commits, together
+  with the tip OID of every ref they were computed over. A later open logs
+  only the commits reachable from the current tips and not from the recorded
+  ones (``git log <new> ^<old>``) and merges them in;
+* per numbered bundle, keyed by the SHA-1 of its bytes (see
+  ``stats_cache.bundle_digest`` for why not path or mtime), the
+  ``[task id, frontmatter, filename]`` rows ``history_data`` extracts from it.
+  Only new or changed bundles are decoded. The last path each digest was seen
+  at is kept too, so the loader can assemble a first screen before hashing a
+  single bundle.
+
+Loose archived files are never cached: they are few, and about to be bundled.
+
+Persistence is one JSON file per project under
+``${XDG_CACHE_HOME:-~/.cache}/ait/history/``, written atomically and only when
+something changed. It is a cache, never a source of truth: a missing, corrupt
+or version-mismatched file is discarded, and ``AIT_HISTORY_INDEX=0`` turns
+persistence off (the loader then behaves exactly as a cold open).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "lib"))
+
+from cache_store import dir_cache_path, json_safe, write_cache_text
+
+# Bump whenever the commit-map rules or the row layout change, so entries
+# produced by older code are discarded wholesale.
+HISTORY_INDEX_VERSION = 1
+
+_ENV_DISABLE = "AIT_HISTORY_INDEX"
+
+CommitMap = Dict[str, Tuple[str, str, str]]
+
+
+def default_index_path(project_root: Path) -> Path:
+    """The persisted index file for ``project_root`` (one per resolved dir)."""
+    return dir_cache_path("history", project_root)
+
+
+def _load_commit_map(raw) -> Optional[CommitMap]:
+    if not isinstance(raw, dict):
+        return None
+    out: CommitMap = {}
+    for tid, entry in raw.items():
+        if not (isinstance(entry, list) and len(entry) == 3
+                and all(isinstance(v, str) for v in entry)):
+            return None
+        out[tid] = tuple(entry)
+    return out
+
+
+class HistoryIndex:
+    """Ref tips + commit maps + per-bundle task rows, persisted as JSON."""
+
+    def __init__(self, path: Optional[Path] = None, persist: bool = True):
+        self._path = path
+        self._persist = persist and path is not None
+        # None until commit maps have been recorded for some set of ref tips.
+        self.refs: Optional[Dict[str, str]] = None
+        self.commit_map: CommitMap = {}
+        self.archive_map: CommitMap = {}
+        self._bundles: Dict[str, List[list]] = {}
+        self._paths: Dict[str, str] = {}
+        self._dirty = False
+        if self._persist:
+            self._load()
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> "HistoryIndex":
+        persist = os.environ.get(_ENV_DISABLE, "1") != "0"
+        return cls(default_index_path(project_root), persist=persist)
+
+    def _load(self) -> None:
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(doc, dict) or doc.get("version") != HISTORY_INDEX_VERSION:
+            return
+        refs = doc.get("refs")
+        commit_map = _load_commit_map(doc.get("commits"))
+        archive_map = _load_commit_map(doc.get("archive_commits"))
+        if (isinstance(refs, dict) and commit_map is not None
+                and archive_map is not None
+                and all(isinstance(v, str) for v in refs.values())):
+            self.refs = refs
+            self.commit_map = commit_map
+            self.archive_map = archive_map
+        bundles = doc.get("bundles")
+        if isinstance(bundles, dict):
+            for digest, rows in bundles.items():
+                if isinstance(rows, list) and all(
+                        isinstance(r, list) and len(r) == 3
+                        and isinstance(r[1], dict) for r in rows):
+                    self._bundles[digest] = rows
+        paths = doc.get("paths")
+        if isinstance(paths, dict):
+            self._paths = {p: d for p, d in paths.items() if d in self._bundles}
+
+    # --- commit maps ---
+
+    def set_commit_maps(self, refs: Dict[str, str], commit_map: CommitMap,
+                        archive_map: CommitMap) -> None:
+        """Record the maps as computed over exactly the tips in ``refs``."""
+        self.refs = dict(refs)
+        self.commit_map = commit_map
+        self.archive_map = archive_map
+        self._dirty = True
+
+    # --- bundle rows ---
+
+    def get(self, digest: Optional[str]) -> Optional[List[list]]:
+        if digest is None:
+            return None
+        return self._bundles.get(digest)
+
+    def rows_at(self, relpath: str) -> Optional[List[list]]:
+        """Rows last recorded for the bundle at ``relpath`` (unverified)."""
+        return self._bundles.get(self._paths.get(relpath, ""))
+
+    def put(self, relpath: str, digest: str, rows: List[list]) -> bool:
+        """Store ``rows`` for a bundle. Returns False when not persistable."""
+        if not all(json_safe(r[1]) for r in rows):
+            return False
+        self._bundles[digest] = rows
+        self._paths[relpath] = digest
+        self._dirty = True
+        return True
+
+    def note_path(self, relpath: str, digest: str) -> None:
+        if self._paths.get(relpath) != digest and digest in self._bundles:
+            self._paths[relpath] = digest
+            self._dirty = True
+
+    def save(self, live_digests: Iterable[str]) -> bool:
+        """Persist, keeping only ``live_digests``. Never raises.
+
+        Returns True when a file was written.
+        """
+        if not self._persist:
+            return False
+        live = set(live_digests)
+        stale = [d for d in self._bundles if d not in live]
+        for digest in stale:
+            del self._bundles[digest]
+        self._paths = {p: d for p, d in self._paths.items() if d in live}
+        if not (self._dirty or stale):
+            return False
+        self._dirty = False
+        doc = {
+            "version": HISTORY_INDEX_VERSION,
+            "refs": self.refs,
+            "commits": self.commit_map,
+            "archive_commits": self.archive_map,
+            "bundles": self._bundles,
+            "paths": self._paths,
+        }
+        return write_cache_text(self._path, json.dumps(doc, separators=(",", ":")))
+
+    def __len__(self) -> int:
+        return len(self._bundles)
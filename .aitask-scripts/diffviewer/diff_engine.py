@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import difflib
+import heapq
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from .plan_loader import load_plan
-from .md_parser import parse_sections, normalize_section
+from .md_parser import Section, parse_sections, normalize_section
 
 
 @dataclass
@@ -70,6 +72,109 @@ def compute_classical_diff(
     return hunks
 
 
+@dataclass(frozen=True)
+class _ParsedPlan:
+    """A plan's sections plus what structural matching compares them by.
+
+    Computed once per distinct plan text (see ``_parse_plan``) and shared
+    between comparisons, so must be treated as read-only.
+    """
+    sections: list[Section]
+    headings: list[str]   # normalized heading per section
+    contents: list[str]   # normalized content per section, joined
+
+
+@lru_cache(maxsize=32)
+def _parse_plan(lines: tuple[str, ...]) -> _ParsedPlan:
+    """Parse and normalize a plan once.
+
+    Cached by content: a multi-diff compares the same main plan against every
+    other plan, and the viewer recomputes its diffs whenever it is reopened.
+    """
+    sections = parse_sections(list(lines))
+    norm = [normalize_section(s) for s in sections]
+    return _ParsedPlan(
+        sections=sections,
+        headings=[n.heading for n in norm],
+        contents=[''.join(n.content_lines) for n in norm],
+    )
+
+
+# Stages of a candidate pair in _match_by_content's queue. Each bounds the
+# next from above: real_quick_ratio() >= quick_ratio() >= ratio().
+_BOUND_LENGTHS, _BOUND_CHARS, _EXACT = 0, 1, 2
+
+
+@lru_cache(maxsize=8192)
+def _content_ratio(main_content: str, other_content: str) -> float:
+    """``SequenceMatcher.ratio()`` of two normalized section contents.
+
+    Cached by content: plans in one brainstorm set share most of their
+    sections verbatim, so a multi-diff keeps meeting the same pairs.
+    """
+    return difflib.SequenceMatcher(None, main_content, other_content).ratio()
+
+
+def _match_by_content(
+    main: _ParsedPlan,
+    other: _ParsedPlan,
+    unmatched_main: list[int],
+    unmatched_other: list[int],
+    similarity_threshold: float,
+) -> list[tuple[int, int]]:
+    """Greedily pair sections by content similarity, best ratio first.
+
+    Same result as computing ``SequenceMatcher.ratio()`` for every pair,
+    keeping those above the threshold and matching them in (stably) sorted
+    order, but lazily: pairs are queued under a cheap upper bound and only
+    tightened -- length bound, then character-multiset bound, then the real
+    ratio -- when they reach the head of the queue. A pair is accepted once
+    its exact ratio is at the head, i.e. no pending bound can beat it, so a
+    pair whose section was already taken never runs the full ratio. Ties
+    resolve by (main, other) index, as the stable sort did.
+    """
+    matchers: dict[int, difflib.SequenceMatcher] = {}
+    queue: list[tuple[float, int, int, int]] = []
+    for mi in unmatched_main:
+        mc = main.contents[mi]
+        for oi in unmatched_other:
+            oc = other.contents[oi]
+            if not mc and not oc:
+                continue
+            bound = 2.0 * min(len(mc), len(oc)) / (len(mc) + len(oc))
+            if bound > similarity_threshold:
+                queue.append((-bound, mi, oi, _BOUND_LENGTHS))
+    heapq.heapify(queue)
+
+    taken_main: set[int] = set()
+    taken_other: set[int] = set()
+    matches: list[tuple[int, int]] = []
+    while queue:
+        _neg_value, mi, oi, stage = heapq.heappop(queue)
+        if mi in taken_main or oi in taken_other:
+            continue
+        if stage == _EXACT:
+            matches.append((mi, oi))
+            taken_main.add(mi)
+            taken_other.add(oi)
+            continue
+        if stage == _BOUND_LENGTHS:
+            sm = matchers.get(oi)
+            if sm is None:
+                # One matcher per other section: its character counts are
+                # computed once, whichever main section it is bounded against.
+                sm = matchers[oi] = difflib.SequenceMatcher(None)
+                sm.set_seq2(other.contents[oi])
+            sm.set_seq1(main.contents[mi])
+            value, stage = sm.quick_ratio(), _BOUND_CHARS
+        else:
+            value = _content_ratio(main.contents[mi], other.contents[oi])
+            stage = _EXACT
+        if value > similarity_threshold:
+            heapq.heappush(queue, (-value, mi, oi, stage))
+    return matches
+
+
 def compute_structural_diff(
     main_lines: list[str],
     other_lines: list[str],
@@ -82,52 +187,38 @@ def compute_structural_diff(
     Sections that appear at different positions are tagged as 'moved'.
     """
     # Phase 1: Parse and normalize
-    main_sections = parse_sections(main_lines)
-    other_sections = parse_sections(other_lines)
-    main_norm = [normalize_section(s) for s in main_sections]
-    other_norm = [normalize_section(s) for s in other_sections]
+    main = _parse_plan(tuple(main_lines))
+    other = _parse_plan(tuple(other_lines))
+    main_sections = main.sections
+    other_sections = other.sections
 
-    # Phase 2: Heading-based matching
+    # Phase 2: Heading-based matching (each main section takes the first
+    # still-unmatched other section with the same normalized heading)
     matched_main: set[int] = set()
     matched_other: set[int] = set()
     matches: list[tuple[int, int]] = []  # (main_idx, other_idx)
 
-    for mi, mn in enumerate(main_norm):
-        if mi in matched_main:
-            continue
-        for oi, on in enumerate(other_norm):
-            if oi in matched_other:
-                continue
-            if mn.heading == on.heading:
-                matches.append((mi, oi))
-                matched_main.add(mi)
-                matched_other.add(oi)
-                break
+    by_heading: dict[str, list[int]] = {}
+    for oi in reversed(range(len(other_sections))):
+        by_heading.setdefault(other.headings[oi], []).append(oi)
+    for mi, heading in enumerate(main.headings):
+        pending = by_heading.get(heading)
+        if pending:
+            oi = pending.pop()
+            matches.append((mi, oi))
+            matched_main.add(mi)
+            matched_other.add(oi)
 
     # Phase 3: Content similarity matching for unmatched sections
-    unmatched_main = [i for i in range(len(main_norm)) if i not in matched_main]
-    unmatched_other = [i for i in range(len(other_norm)) if i not in matched_other]
+    unmatched_main = [i for i in range(len(main_sections)) if i not in matched_main]
+    unmatched_other = [i for i in range(len(other_sections)) if i not in matched_other]
 
     if unmatched_main and unmatched_other:
-        # Compute all similarity pairs
-        candidates: list[tuple[float, int, int]] = []
-        for mi in unmatched_main:
-            mc = ''.join(main_norm[mi].content_lines)
-            for oi in unmatched_other:
-                oc = ''.join(other_norm[oi].content_lines)
-                if not mc and not oc:
-                    continue
-                ratio = difflib.SequenceMatcher(None, mc, oc).ratio()
-                if ratio > similarity_threshold:
-                    candidates.append((ratio, mi, oi))
-
-        # Greedy matching: pick highest ratio first
-        candidates.sort(key=lambda x: x[0], reverse=True)
-        for _ratio, mi, oi in candidates:
-            if mi not in matched_main and oi not in matched_other:
-                matches.append((mi, oi))
-                matched_main.add(mi)
-                matched_other.add(oi)
+        for mi, oi in _match_by_content(main, other, unmatched_main,
+                                        unmatched_other, similarity_threshold):
+            matches.append((mi, oi))
+            matched_main.add(mi)
+            matched_other.add(oi)
 
     # Phase 4: Classify and generate hunks
     source = [source_plan] if source_plan else []
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""archive_index.py - random-access numbered archives via a sidecar member index.
+
+A plain ``_bN/oldM.tar.zst`` bundle is one zstd frame over one tar stream, so
+reading a single task out of it means decompressing from the start until the
+member turns up: ``find_archived_markdown_by_id`` paid a ``zstd -dc`` fork plus,
+on average, half a bundle's decode for every archived-parent lookup the board
+makes.
+
+INDEXED LAYOUT. An indexed bundle is still an ordinary ``.tar.zst`` -- every
+reader in the tree (``zstd -dc | tar``, ``lib/archive_utils.sh``,
+``archive_iter``) keeps working unchanged -- but it is written as one zstd
+frame PER TAR MEMBER (header + data + padding), followed by a final frame for
+the end-of-archive blocks. zstd decoders concatenate the output of consecutive
+frames, so the stream decodes to exactly the tar it always was. Beside it sits
+``oldM.tar.zst.idx``::
+
+    {"version": 1, "archive_bytes": <size>,
+     "members": [[<member name>, <frame offset>, <frame length>], ...]}
+
+A lookup is then one ``seek`` plus one small frame decode.
+
+TRUST BUT VERIFY. The sidecar is git-tracked next to the bundle, so a tool that
+rewrites the bundle without knowing about it (an older checkout's
+``aitask_zip_old.sh``, a hand-run ``tar | zstd``) can leave it stale. Three
+checks reject a sidecar: a version mismatch, ``archive_bytes`` differing from
+the bundle's size, and a decoded frame that does not parse as the tar member
+the index names. Any rejection returns ``INDEX_UNAVAILABLE`` and the caller
+falls back to the streaming scan -- a bad index costs speed, never a wrong
+answer.
+
+Decoding prefers an in-process binding (stdlib ``compression.zstd`` on 3.14+,
+else the ``zstandard`` package) and falls back to feeding the single frame to
+``zstd -dc``, which is still one small decode instead of half a bundle.
+
+CLI (used by ``lib/archive_utils.sh``)::
+
+    archive_index.py create <archive.tar.zst> <source_dir>
+    archive_index.py reindex <archive.tar.zst>
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+
+# Sentinel: "no usable index" -- distinct from ``None`` ("the index is valid and
+# the member is not in this bundle"), which lets the caller skip the scan.
+INDEX_UNAVAILABLE = object()
+
+_ZSTD_MAGIC = 0xFD2FB528
+
+
+def _load_binding():
+    try:
+        from compression import zstd as _stdlib_zstd  # Python 3.14+
+        return "stdlib", _stdlib_zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard as _zstandard
+        return "zstandard", _zstandard
+    except ImportError:
+        return None, None
+
+
+_BINDING_NAME, _BINDING = _load_binding()
+
+
+def inprocess_codec() -> str | None:
+    """Name of the in-process zstd binding in use, or ``None`` (CLI only)."""
+    return _BINDING_NAME
+
+
+def index_path_for(archive_path: Path) -> Path:
+    return archive_path.with_name(archive_path.name + INDEX_SUFFIX)
+
+
+# ---------------------------------------------------------------------------
+# zstd frame helpers
+# ---------------------------------------------------------------------------
+
+def decompress_frames(data: bytes) -> bytes:
+    """Decode one or more concatenated zstd frames, in process when possible."""
+    if _BINDING_NAME == "stdlib":
+        return _BINDING.decompress(data)
+    if _BINDING_NAME == "zstandard":
+        out = []
+        reader = _BINDING.ZstdDecompressor().stream_reader(
+            io.BytesIO(data), read_across_frames=True)
+        while True:
+            chunk = reader.read(1 << 16)
+            if not chunk:
+                break
+            out.append(chunk)
+        return b"".join(out)
+    proc = subprocess.run(["zstd", "-dcq"], input=data,
+                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                          check=True)
+    return proc.stdout
+
+
+def _compress_chunks(chunks: List[bytes]) -> List[bytes]:
+    """Compress each chunk into its own independent zstd frame."""
+    if _BINDING_NAME == "stdlib":
+        return [_BINDING.compress(c) for c in chunks]
+    if _BINDING_NAME == "zstandard":
+        cctx = _BINDING.ZstdCompressor(write_checksum=True)
+        return [cctx.compress(c) for c in chunks]
+    # CLI: `zstd -c f1 f2 ...` emits one frame per input file, concatenated --
+    # one fork for the whole bundle. Frame boundaries are recovered by walking
+    # the frame headers rather than trusting anything else about the output.
+    with tempfile.TemporaryDirectory(prefix="ait_archive_index_") as tmp:
+        names = []
+        for i, chunk in enumerate(chunks):
+            name = os.path.join(tmp, f"{i:06d}")
+            with open(name, "wb") as f:
+                f.write(chunk)
+            names.append(name)
+        proc = subprocess.run(["zstd", "-q", "-c", *names],
+                              stdout=subprocess.PIPE, check=True)
+    data = proc.stdout
+    bounds = frame_bounds(data)
+    if len(bounds) != len(chunks):
+        raise ValueError(f"zstd emitted {len(bounds)} frames for "
+                         f"{len(chunks)} inputs")
+    return [data[start:start + length] for start, length in bounds]
+
+
+def frame_bounds(data: bytes) -> List[Tuple[int, int]]:
+    """``(offset, length)`` of every zstd / skippable frame in ``data``.
+
+    Walks frame and block headers only (RFC 8878 §3.1); nothing is decoded.
+    Raises ``ValueError`` on anything that is not a well-formed frame sequence.
+    """
+    bounds = []
+    pos = 0
+    end = len(data)
+    while pos < end:
+        if end - pos < 8:
+            raise ValueError("truncated frame header")
+        magic = int.from_bytes(data[pos:pos + 4], "little")
+        if 0x184D2A50 <= magic <= 0x184D2A5F:          # skippable frame
+            size = int.from_bytes(data[pos + 4:pos + 8], "little")
+            bounds.append((pos, 8 + size))
+            pos += 8 + size
+            continue
+        if magic != _ZSTD_MAGIC:
+            raise ValueError(f"bad zstd magic at offset {pos}")
+        fhd = data[pos + 4]
+        fcs_flag = fhd >> 6
+        single_segment = (fhd >> 5) & 1
+        has_checksum = (fhd >> 2) & 1
+        dict_flag = fhd & 3
+        cur = pos + 5
+        if not single_segment:
+            cur += 1                                    # window descriptor
+        cur += (0, 1, 2, 4)[dict_flag]
+        cur += (single_segment, 2, 4, 8)[fcs_flag]
+        while True:
+            if cur + 3 > end:
+                raise ValueError("truncated block header")
+            header = int.from_bytes(data[cur:cur + 3], "little")
+            last = header & 1
+            block_type = (header >> 1) & 3
+            block_size = header >> 3
+            if block_type == 3:
+                raise ValueError("reserved block type")
+            cur += 3 + (1 if block_type == 1 else block_size)
+            if last:
+                break
+        if has_checksum:
+            cur += 4
+        if cur > end:
+            raise ValueError("truncated frame")
+        bounds.append((pos, cur - pos))
+        pos = cur
+    return bounds
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def _tar_chunks(source_dir: Path) -> Tuple[List[str], List[bytes]]:
+    """Tar ``source_dir`` and split the stream at member boundaries.
+
+    Member names use the ``./<rel>`` form ``tar -cf - -C <dir> .`` produces,
+    which ``aitask_zip_old.sh unpack`` strips with ``${match#./}``. Directory
+    entries are kept so an extract recreates ``tN/`` child directories.
+    """
+    buf = io.BytesIO()
+    names: List[str] = []
+    bounds: List[int] = [0]
+    with tarfile.open(fileobj=buf, mode="w", format=tarfile.PAX_FORMAT) as tf:
+        for root, dirs, files in os.walk(source_dir):
+            dirs.sort()
+            rel_root = os.path.relpath(root, source_dir)
+            entries = [(d, True) for d in dirs] + [(f, False) for f in sorted(files)]
+            for name, _is_dir in entries:
+                full = os.path.join(root, name)
+                rel = name if rel_root == "." else os.path.join(rel_root, name)
+                arcname = "./" + rel
+                tf.add(full, arcname=arcname, recursive=False)
+                names.append(arcname)
+                bounds.append(tf.offset)
+    data = buf.getvalue()
+    chunks = [data[bounds[i]:bounds[i + 1]] for i in range(len(names))]
+    chunks.append(data[bounds[-1]:])                    # end-of-archive blocks
+    return names, chunks
+
+
+def write_indexed_archive(source_dir: Path, archive_path: Path) -> None:
+    """Create ``archive_path`` from ``source_dir`` in the indexed layout.
+
+    Both files are staged beside their targets and renamed into place, bundle
+    first: a crash in between leaves a new bundle with an old (size-mismatched,
+    therefore ignored) sidecar, never the reverse.
+    """
+    names, chunks = _tar_chunks(Path(source_dir))
+    frames = _compress_chunks(chunks)
+    members = []
+    offset = 0
+    for name, frame in zip(names, frames):
+        members.append([name, offset, len(frame)])
+        offset += len(frame)
+    blob = b"".join(frames)
+
+    archive_path = Path(archive_path)
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    _replace_bytes(archive_path, blob)
+    doc = {"version": INDEX_VERSION, "archive_bytes": len(blob),
+           "members": members}
+    _replace_bytes(index_path_for(archive_path),
+                   (json.dumps(doc, separators=(",", ":")) + "\n").encode())
+
+
+def _replace_bytes(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent),
+                               prefix="." + path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def reindex_archive(archive_path: Path) -> None:
+    """Rewrite an existing bundle (any layout) into the indexed layout."""
+    archive_path = Path(archive_path)
+    with tempfile.TemporaryDirectory(prefix="ait_reindex_") as tmp:
+        raw = decompress_frames(archive_path.read_bytes())
+        with tarfile.open(fileobj=io.BytesIO(raw), mode="r:") as tf:
+            tf.extractall(path=tmp, filter="data")
+        write_indexed_archive(Path(tmp), archive_path)
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+def load_index(archive_path: Path):
+    """The validated member list for ``archive_path``, or ``None``."""
+    try:
+        with open(index_path_for(archive_path), "r", encoding="utf-8") as f:
+            doc = json.load(f)
+        size = archive_path.stat().st_size
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(doc, dict) or doc.get("version") != INDEX_VERSION
+            or doc.get("archive_bytes") != size):
+        return None
+    members = doc.get("members")
+    if not isinstance(members, list):
+        return None
+    out = []
+    for row in members:
+        if (not isinstance(row, list) or len(row) != 3
+                or not isinstance(row[0], str)
+                or not all(isinstance(v, int) and v >= 0 for v in row[1:])
+                or row[1] + row[2] > size):
+            return None
+        out.append((row[0], row[1], row[2]))
+    return out
+
+
+def read_indexed_member(
+    archive_path: Path,
+    matches: Callable[[str], bool],
+):
+    """``(basename, text)`` of the first ``.md`` member whose basename matches.
+
+    Returns ``None`` when the index is valid and nothing matches (the bundle
+    does not hold the task), or ``INDEX_UNAVAILABLE`` when there is no usable
+    index -- the caller must then scan the bundle the slow way.
+    """
+    members = load_index(archive_path)
+    if members is None:
+        return INDEX_UNAVAILABLE
+    for name, offset, length in members:
+        base = os.path.basename(name)
+        if not name.endswith(".md") or not matches(base):
+            continue
+        try:
+            with open(archive_path, "rb") as f:
+                f.seek(offset)
+                frame = f.read(length)
+            tar_bytes = decompress_frames(frame)
+            # Two zero blocks terminate the one-member stream for tarfile.
+            with tarfile.open(fileobj=io.BytesIO(tar_bytes + b"\0" * 1024),
+                              mode="r:") as tf:
+                member = tf.next()
+                if member is None or member.name != name or not member.isfile():
+                    return INDEX_UNAVAILABLE
+                extracted = tf.extractfile(member)
+                if extracted is None:
+                    return INDEX_UNAVAILABLE
+                text = extracted.read().decode("utf-8", errors="replace")
+        except (OSError, tarfile.TarError, subprocess.SubprocessError,
+                ValueError):
+            return INDEX_UNAVAILABLE
+        return base, text
+    return None
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) == 3 and argv[0] == "create":
+        write_indexed_archive(Path(argv[2]), Path(argv[1]))
+        return 0
+    if len(argv) == 2 and argv[0] == "reindex":
+        reindex_archive(Path(argv[1]))
+        return 0
+    print("usage: archive_index.py create <archive> <source_dir>\n"
+          "       archive_index.py reindex <archive>", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    if shutil.which("zstd") is None and _BINDING is None:
+        print("archive_index.py: no zstd binding and no zstd CLI",
+              file=sys.stderr)
+        sys.exit(1)
+    sys.exit(main(sys.argv[1:]))
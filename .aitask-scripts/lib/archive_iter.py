@@ -7,14 +7,42 @@ Usage:
     from archive_iter import iter_all_archived_markdown
     for name, content in iter_all_archived_markdown(Path("aitasks/archived")):
         process(name, content)
+
+Decoding backend: ``.tar.zst`` bundles are decoded in process when a zstd
+binding is importable (see ``archive_index.inprocess_codec``), and through a
+streaming ``zstd -dc`` child otherwise. Either way the output is identical.
+
+Full scans (``iter_numbered_archives`` and everything built on it --
+``stats_data.collect_stats``, ``history_data`` and trail discovery) decode
+bundles concurrently on a small thread pool and yield them strictly in
+bundle order, so callers see exactly the sequence the serial scan produced.
+Threads are enough: the work is either in a ``zstd`` child process or in a
+binding that releases the GIL, and the tar parsing left in Python is a small
+fraction of it. ``AIT_ARCHIVE_SCAN_WORKERS=1`` restores the serial scan.
 """
 
+import io
 import os
 import re
 import subprocess
 import tarfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, List, Tuple
+
+from archive_index import (
+    INDEX_UNAVAILABLE,
+    decompress_frames,
+    inprocess_codec,
+    read_indexed_member,
+)
+
+SCAN_WORKERS_ENV = "AIT_ARCHIVE_SCAN_WORKERS"
+
+# Bundles decoded ahead of the consumer, per worker. Bounds peak memory to a
+# handful of decoded bundles however early (or late) the caller stops reading.
+_PREFETCH_PER_WORKER = 2
 
 
 def archive_path_for_id(task_id: int, archived_dir: Path) -> Path:
@@ -60,7 +88,13 @@ def find_archived_markdown_by_id(
     for archive_path in archive_paths:
         if not archive_path.exists():
             continue
-        found = _find_in_archive_iter(normalized, _iter_single_archive(archive_path))
+        # Indexed bundles (lib/archive_index.py) answer with one seek + one
+        # frame decode; an absent or stale sidecar falls through to the scan.
+        found = read_indexed_member(
+            archive_path, lambda name: _filename_matches_task_id(name, normalized))
+        if found is INDEX_UNAVAILABLE:
+            found = _find_in_archive_iter(
+                normalized, _iter_single_archive(archive_path))
         if found:
             return found
 
@@ -69,19 +103,99 @@ def find_archived_markdown_by_id(
 
 def iter_numbered_archives(archived_dir: Path) -> Iterable[Tuple[str, str]]:
     """Yield (filename, text_content) from all numbered archives."""
+    yield from _iter_archives_ordered(numbered_archive_paths(archived_dir))
+
+
+def numbered_archive_paths(archived_dir: Path) -> List[Path]:
+    """Numbered bundles in scan order: every .tar.zst, then orphan .tar.gz."""
     # Primary: .tar.zst
     zst_archives = sorted(archived_dir.glob("_b*/old*.tar.zst"))
     # Fallback: .tar.gz (only those without a .tar.zst counterpart)
     gz_archives = sorted(archived_dir.glob("_b*/old*.tar.gz"))
 
-    seen_stems = set()
-    for archive in zst_archives:
-        seen_stems.add(archive.with_suffix("").with_suffix(""))  # strip .tar.zst
-        yield from _iter_single_archive(archive)
-    for archive in gz_archives:
-        stem = archive.with_suffix("").with_suffix("")  # strip .tar.gz
-        if stem not in seen_stems:
-            yield from _iter_single_archive(archive)
+    seen_stems = {a.with_suffix("").with_suffix("") for a in zst_archives}
+    return zst_archives + [
+        a for a in gz_archives
+        if a.with_suffix("").with_suffix("") not in seen_stems
+    ]
+
+
+def _scan_workers() -> int:
+    """Pool size for full scans: ``$AIT_ARCHIVE_SCAN_WORKERS`` or min(8, cores)."""
+    try:
+        workers = int(os.environ.get(SCAN_WORKERS_ENV, ""))
+    except ValueError:
+        workers = min(8, os.cpu_count() or 1)
+    return max(1, workers)
+
+
+def _read_single_archive(
+    archive_path: Path,
+) -> Tuple[List[Tuple[str, str]], bool]:
+    """Materialize one bundle (the unit of work for the pool).
+
+    Returns ``(entries, complete)``: ``complete`` is False when decoding
+    failed part-way, in which case ``entries`` holds what was read before the
+    failure -- exactly what the lenient ``_iter_single_archive`` yields.
+    """
+    entries: List[Tuple[str, str]] = []
+    try:
+        for entry in _iter_single_archive_strict(archive_path):
+            entries.append(entry)
+    except _READ_ERRORS:
+        return entries, False
+    return entries, True
+
+
+def iter_archive_bundles(
+    archive_paths: List[Path],
+    workers: int | None = None,
+) -> Iterable[Tuple[Path, List[Tuple[str, str]], bool]]:
+    """Yield ``(path, entries, complete)`` per bundle, in order, decoding ahead.
+
+    Bundle ``i + 1 .. i + window`` decode on the pool while the caller consumes
+    bundle ``i``. Closing the generator early cancels whatever has not started;
+    bundles already in flight finish in the background and are discarded.
+    ``complete`` is False for a bundle that could not be fully decoded (see
+    ``_read_single_archive``) -- callers that persist anything derived from
+    ``entries`` must not persist it then.
+    """
+    if workers is None:
+        workers = _scan_workers()
+    if workers <= 1 or len(archive_paths) <= 1:
+        for archive in archive_paths:
+            yield (archive, *_read_single_archive(archive))
+        return
+
+    pool = ThreadPoolExecutor(max_workers=min(workers, len(archive_paths)),
+                              thread_name_prefix="ait-archive-scan")
+    queue = deque(archive_paths)
+    pending = deque()
+
+    def submit(archive):
+        pending.append((archive, pool.submit(_read_single_archive, archive)))
+
+    try:
+        while queue and len(pending) < workers * _PREFETCH_PER_WORKER:
+            submit(queue.popleft())
+        while pending:
+            archive, future = pending.popleft()
+            entries, complete = future.result()
+            if queue:
+                submit(queue.popleft())
+            yield archive, entries, complete
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_archives_ordered(
+    archive_paths: List[Path],
+    workers: int | None = None,
+) -> Iterable[Tuple[str, str]]:
+    """Yield every entry of ``archive_paths`` in order (see iter_archive_bundles)."""
+    for _archive, entries, _complete in iter_archive_bundles(archive_paths,
+                                                             workers):
+        yield from entries
 
 
 def iter_legacy_archive(archived_dir: Path) -> Iterable[Tuple[str, str]]:
@@ -114,6 +228,15 @@ def iter_all_archived_markdown(
     Scans in order: loose parent files, loose child files (in subdirs),
     then numbered tar.gz archives. Does NOT scan legacy old.tar.gz.
     """
+    yield from iter_loose_archived_markdown(archived_dir)
+    # Numbered archives only (no legacy)
+    yield from iter_numbered_archives(archived_dir)
+
+
+def iter_loose_archived_markdown(
+    archived_dir: Path,
+) -> Iterable[Tuple[str, str]]:
+    """Yield (filename, text_content) for loose parent, then child, files."""
     if archived_dir.exists():
         # Loose parent tasks
         for path in sorted(archived_dir.glob("t*_*.md")):
@@ -129,8 +252,6 @@ def iter_all_archived_markdown(
                 yield path.name, path.read_text(encoding="utf-8", errors="replace")
             except OSError:
                 continue
-    # Numbered archives only (no legacy)
-    yield from iter_numbered_archives(archived_dir)
 
 
 def iter_archived_frontmatter(
@@ -175,37 +296,72 @@ def _find_in_archive_iter(
     return None
 
 
+_READ_ERRORS = (tarfile.TarError, OSError, subprocess.SubprocessError)
+
+
 def _iter_single_archive(archive_path: Path) -> Iterable[Tuple[str, str]]:
-    """Yield (filename, text_content) for .md files in a single archive."""
+    """Yield (filename, text_content) for .md files in a single archive.
+
+    Lenient: a bundle that cannot be (fully) decoded yields what it could and
+    then stops, silently.
+    """
     try:
-        if archive_path.name.endswith(".tar.zst"):
-            proc = subprocess.Popen(
-                ["zstd", "-dc", str(archive_path)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-            )
-            try:
-                with tarfile.open(fileobj=proc.stdout, mode="r|") as tf:
-                    for member in tf:
-                        if not member.isfile() or not member.name.endswith(".md"):
-                            continue
-                        extracted = tf.extractfile(member)
-                        if extracted is None:
-                            continue
-                        text = extracted.read().decode("utf-8", errors="replace")
-                        yield os.path.basename(member.name), text
-            finally:
-                proc.stdout.close()
-                proc.wait()
-        else:
-            with tarfile.open(archive_path, "r:gz") as tf:
-                for member in tf.getmembers():
-                    if not member.isfile() or not member.name.endswith(".md"):
-                        continue
-                    extracted = tf.extractfile(member)
-                    if extracted is None:
-                        continue
-                    text = extracted.read().decode("utf-8", errors="replace")
-                    yield os.path.basename(member.name), text
-    except (tarfile.TarError, OSError, subprocess.SubprocessError):
+        yield from _iter_single_archive_strict(archive_path)
+    except _READ_ERRORS:
         return
+
+
+def _iter_single_archive_strict(archive_path: Path) -> Iterable[Tuple[str, str]]:
+    """As ``_iter_single_archive``, but a decode failure raises (_READ_ERRORS)."""
+    if archive_path.name.endswith(".tar.zst"):
+        if inprocess_codec() is not None:
+            yield from _iter_zst_inprocess(archive_path)
+        else:
+            yield from _iter_zst_subprocess(archive_path)
+    else:
+        with tarfile.open(archive_path, "r:gz") as tf:
+            yield from _iter_markdown_members(tf)
+
+
+def _iter_zst_inprocess(archive_path: Path) -> Iterable[Tuple[str, str]]:
+    data = archive_path.read_bytes()
+    try:
+        raw = decompress_frames(data)
+    except Exception as exc:
+        # Each binding has its own ZstdError; surface them all as the one
+        # "not a readable archive" error the callers already handle.
+        raise tarfile.ReadError(f"cannot decode {archive_path}: {exc}") from exc
+    with tarfile.open(fileobj=io.BytesIO(raw), mode="r:") as tf:
+        yield from _iter_markdown_members(tf)
+
+
+def _iter_zst_subprocess(archive_path: Path) -> Iterable[Tuple[str, str]]:
+    proc = subprocess.Popen(
+        ["zstd", "-dc", str(archive_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as tf:
+            yield from _iter_markdown_members(tf)
+        # tarfile stops at the end-of-archive blocks; drain the padding so
+        # zstd is not killed by SIGPIPE and its exit status means something.
+        proc.stdout.read()
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    if proc.returncode != 0:
+        # A truncated or corrupt frame can still leave a tar prefix that
+        # parsed cleanly -- the exit status is the only signal.
+        raise subprocess.CalledProcessError(proc.returncode, "zstd -dc")
+
+
+def _iter_markdown_members(tf: tarfile.TarFile) -> Iterable[Tuple[str, str]]:
+    for member in tf:
+        if not member.isfile() or not member.name.endswith(".md"):
+            continue
+        extracted = tf.extractfile(member)
+        if extracted is None:
+            continue
+        text = extracted.read().decode("utf-8", errors="replace")
+        yield os.path.basename(member.name), text
@@ -89,9 +89,38 @@ _archive_extract_all() {
     fi
 }
 
+# Create (or overwrite) a bundle from source_dir. Written in the indexed layout
+# by lib/archive_index.py when an interpreter and the helper are available: one
+# zstd frame per tar member plus an "<archive>.idx" sidecar, so a single task
+# reads with one seek + one frame decode. The result is still a plain .tar.zst
+# to every reader above. Otherwise falls back to the single-stream
+# `tar | zstd` and removes any sidecar, which would describe the old bundle.
+# The helper's existence is probed, not assumed: test fixtures hand-copy a
+# subset of lib/ (see the source-on-startup rule in shell_conventions.md). A
+# helper that is present but FAILS is different: it is warned about, with the
+# last line of its stderr, so a broken helper does not pass for a missing one
+# while bundles quietly lose the indexed layout.
 _archive_create() {
     local archive="$1" source_dir="$2"
-    tar -cf - -C "$source_dir" . | zstd -q -o "$archive"
+    local helper="${SCRIPT_DIR}/lib/archive_index.py" py="" err=""
+    if [[ -f "$helper" ]] && declare -F resolve_python >/dev/null; then
+        py="$(resolve_python 2>/dev/null || true)"
+    fi
+    if [[ -n "$py" ]]; then
+        if err="$("$py" "$helper" create "$archive" "$source_dir" 2>&1 >/dev/null)"; then
+            return 0
+        fi
+        err="$(printf '%s\n' "$err" | sed '/^[[:space:]]*$/d' | tail -n 1)"
+        warn "archive_index.py could not write $(basename "$archive") (${err:-no error output}); writing it without the .idx index"
+    fi
+    rm -f "${archive}.idx"
+    tar -cf - -C "$source_dir" . | zstd -q -f -o "$archive"
+}
+
+# Remove a bundle together with its index sidecar (if any).
+_archive_remove() {
+    local archive="$1"
+    rm -f "$archive" "${archive}.idx"
 }
 
 _archive_verify() {
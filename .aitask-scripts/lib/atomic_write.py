@@ -18,7 +18,8 @@ artifact`` / ``ait attach`` / ``ait fold`` run their whole transaction under the
 global attach lock (``lib/attachment_lock.sh``).
 
 Atomic *visibility*, not crash durability: there is no ``fsync``, matching
-``gate_ledger``, ``attachment_meta``, ``config_utils`` and ``agent_marks``. A
+``attachment_meta``, ``config_utils``, ``agent_marks`` and ``gate_ledger``'s
+default (its ``AIT_GATE_FSYNC=always`` policy is opt-in). A
 crash between the write and the rename leaves the ORIGINAL file intact, which is
 the property that matters for git-tracked task data.
 
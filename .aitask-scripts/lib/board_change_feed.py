@@ -0,0 +1,159 @@
+"""board_change_feed.py - which task files changed since the board last looked.
+
+The board's auto-refresh tick and `r` used to call ``TaskManager.load_tasks``:
+re-read every ``aitasks/*.md`` and ``aitasks/t*/t*_*.md``, rebuild every
+``Task``, then shell out to ``git status`` and ``aitask_lock.sh --list`` on the
+UI thread — on a board where, most ticks, nothing at all had changed.
+
+:class:`TaskChangeFeed` watches the task tree instead (``lib/fs_watch.py``'s
+:class:`~fs_watch.DirSetWatcher`: inotify where available, a stat pass
+otherwise) and answers "what changed since the last :meth:`TaskChangeFeed.poll`"
+as a :class:`TaskChanges`: the task file basenames to reload, or ``rescan``
+when the answer is not knowable (a queue overflow, a parent directory that went
+away with its children, the task dir itself replaced). The board feeds the
+names to ``TaskManager.reload_task``; a ``rescan`` is the old full load.
+
+What is watched
+---------------
+* ``aitasks/`` itself — parent task files, and the appearance/removal of the
+  ``t<N>/`` directories that hold child tasks;
+* every ``aitasks/t<N>/`` — child task files. A directory that appears later is
+  watched from then on, and the ``.md`` files already inside it are reported
+  (they may have been written before the watch existed);
+* the task data's git dir, for its ``index`` only. ``git status`` output can
+  change without any task file changing (``git add``, a commit, a checkout), so
+  an index write is reported as ``index`` and the board re-probes git status.
+  With no git dir (or one that cannot be watched) every poll reports ``index``,
+  which is the old always-probe behaviour.
+
+Locks are NOT watched: they live on the remote ``aitask-locks`` branch and
+``aitask_lock.sh --list`` fetches it, so no local event announces a lock taken
+on another machine. The board keeps probing them on its timer, off the UI
+thread.
+
+``archived/`` and ``metadata/`` are not task files and are never reported.
+
+Stdlib only.
+"""
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+
+from fs_watch import DirSetWatcher
+
+_PARENT_DIR = re.compile(r"^t\d+$")
+
+
+@dataclass
+class TaskChanges:
+    """One :meth:`TaskChangeFeed.poll` result.
+
+    ``tasks`` holds task file basenames (parent or child), exactly the key
+    ``TaskManager.reload_task`` takes. ``rescan`` means "reload everything";
+    ``tasks`` is then meaningless. ``index`` means the git index was written.
+    """
+
+    tasks: set[str] = field(default_factory=set)
+    rescan: bool = False
+    index: bool = False
+
+    @property
+    def data(self) -> bool:
+        """Whether task data changed (the board has something to re-render)."""
+        return self.rescan or bool(self.tasks)
+
+    @property
+    def git(self) -> bool:
+        """Whether ``git status`` may now answer differently."""
+        return self.data or self.index
+
+
+class TaskChangeFeed:
+    """Accumulate task-tree changes between polls. Never blocks.
+
+    ::
+
+        feed = TaskChangeFeed(TASKS_DIR, git_dir)
+        manager.load_tasks()          # after the feed exists: nothing is missed
+        ...
+        changes = feed.poll()         # TaskChanges
+
+    The first poll after construction reports only what changed after the
+    constructor returned, so the caller's initial full load must come after it.
+    """
+
+    def __init__(self, tasks_dir, git_dir=None, force_poll: bool = False):
+        self.tasks_dir = str(tasks_dir)
+        self.git_dir = str(git_dir) if git_dir else ""
+        self._watcher = DirSetWatcher(force_poll=force_poll)
+        self._index_watched = bool(self.git_dir) and self._watcher.add(self.git_dir)
+        self._watch_tree()
+
+    @property
+    def backend(self) -> str:
+        return self._watcher.backend
+
+    def _watch_tree(self) -> None:
+        """(Re)watch the task dir and every parent dir under it."""
+        if not self._watcher.add(self.tasks_dir):
+            return
+        try:
+            names = os.listdir(self.tasks_dir)
+        except OSError:
+            return
+        for name in names:
+            if _PARENT_DIR.match(name):
+                self._watcher.add(os.path.join(self.tasks_dir, name))
+
+    def poll(self) -> TaskChanges:
+        changes = TaskChanges(index=not self._index_watched)
+        if not self._watcher.watching(self.tasks_dir):
+            # Never existed or went away: nothing to trust until it is back.
+            self._watch_tree()
+            changes.rescan = True
+            return changes
+        events = self._watcher.poll()
+        if events is None:
+            self._watch_tree()
+            changes.rescan = True
+            return changes
+        for dirpath, name in events:
+            if dirpath == self.git_dir:
+                if not name:
+                    self._index_watched = self._watcher.add(self.git_dir)
+                    changes.index = True
+                elif name == "index":
+                    changes.index = True
+            elif not name:
+                # The task dir, or a parent dir whose children went with it:
+                # which names vanished is no longer knowable.
+                changes.rescan = True
+            elif dirpath != self.tasks_dir:
+                if name.endswith(".md"):
+                    changes.tasks.add(name)
+            elif name.endswith(".md"):
+                changes.tasks.add(name)
+            elif _PARENT_DIR.match(name):
+                self._parent_dir_event(os.path.join(dirpath, name), changes)
+        if changes.rescan:
+            self._watch_tree()
+        return changes
+
+    def _parent_dir_event(self, path: str, changes: TaskChanges) -> None:
+        if os.path.isdir(path):
+            if self._watcher.watching(path):
+                return
+            if self._watcher.add(path):
+                try:
+                    changes.tasks.update(n for n in os.listdir(path)
+                                         if n.endswith(".md"))
+                except OSError:
+                    changes.rescan = True
+        elif self._watcher.watching(path):
+            self._watcher.remove(path)
+            changes.rescan = True
+
+    def close(self) -> None:
+        self._watcher.close()
@@ -0,0 +1,118 @@
+"""cache_store.py - shared plumbing for ait's persisted per-directory caches.
+
+Several read-mostly indexes keep one JSON file per resolved directory under
+``${XDG_CACHE_HOME:-~/.cache}/ait/<kind>/`` — ``frontmatter_index``
+(``frontmatter/``), ``stats_cache`` (``stats/``), codebrowser's
+``history_index`` (``history/``), ``gate_result_cache`` (``gates/``) and
+``gate_ledger``'s code-digest memo (``digest/``). They share where those files
+live, how a value is vetted before it is written as JSON, and how a kind
+directory is kept bounded; all three are here so the five stay in step.
+
+Bounding: a file is named after the directory it caches, and a directory that
+is gone (a removed worktree, every test's temp tree) is never looked up again,
+so its file would stay forever. Whenever a write creates a new file,
+:func:`prune_kind_dir` drops the kind's files not written for ``MAX_AGE_S`` and
+then the least recently written beyond ``MAX_FILES``. Existing files are only
+rewritten, so a stable set of checkouts never pays for the scan; losing a live
+file only costs its directory one rebuild.
+
+Stdlib only.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from atomic_write import atomic_write_text
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+MAX_FILES = 64
+MAX_AGE_S = 30 * 24 * 3600
+
+
+def cache_root() -> Path:
+    """``${XDG_CACHE_HOME:-~/.cache}/ait``, read from the environment on each call."""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(root) / "ait"
+
+
+def dir_cache_path(kind: str, directory) -> Path:
+    """The ``kind`` cache file for ``directory``.
+
+    Keyed by a digest of the resolved directory so two checkouts (or a test's
+    temp tree) never share a file.
+    """
+    digest = hashlib.sha1(
+        str(Path(directory).resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_root() / kind / f"{digest}.json"
+
+
+def json_safe(value) -> bool:
+    """True when ``value`` survives ``json.loads(json.dumps(value))`` unchanged."""
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, list):
+        return all(json_safe(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and json_safe(v) for k, v in value.items())
+    return False
+
+
+def write_cache_text(path, text: str) -> bool:
+    """Atomically write the cache file ``path``; prune its kind dir when the
+    file is new. Never raises: returns False when nothing was written.
+
+    Only a kind directory of :func:`cache_root` is pruned — a cache given an
+    explicit path elsewhere may share its directory with files not ours.
+    """
+    path = Path(path)
+    new = not path.exists()
+    try:
+        atomic_write_text(str(path), text)
+    except OSError:
+        return False
+    if new and path.parent.parent == cache_root():
+        prune_kind_dir(path.parent, keep=path)
+    return True
+
+
+def prune_kind_dir(directory, keep=None, max_files: int = MAX_FILES,
+                   max_age_s: float = MAX_AGE_S) -> int:
+    """Delete ``directory``'s stale ``*.json`` cache files; return how many.
+
+    Stale means not written for ``max_age_s``, or beyond the ``max_files`` most
+    recently written. ``keep`` (the file just written) is never deleted, and
+    neither is anything but ``*.json`` — a concurrent writer's temp file stays.
+    Never raises.
+    """
+    keep = Path(keep) if keep is not None else None
+    files = []
+    try:
+        with os.scandir(directory) as it:
+            for ent in it:
+                if not ent.name.endswith(".json") or ent.name.startswith("."):
+                    continue
+                if keep is not None and ent.name == keep.name:
+                    continue
+                try:
+                    files.append((ent.stat(follow_symlinks=False).st_mtime, ent.path))
+                except OSError:
+                    continue
+    except OSError:
+        return 0
+    files.sort(reverse=True)                  # newest first
+    cutoff = time.time() - max_age_s
+    room = max_files - (1 if keep is not None else 0)
+    removed = 0
+    for i, (mtime, path) in enumerate(files):
+        if i < room and mtime >= cutoff:
+            continue
+        try:
+            os.unlink(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
@@ -0,0 +1,265 @@
+"""frontmatter_index.py - persistent parsed-frontmatter cache for live task files.
+
+Every full load of the task tree used to re-open and YAML-parse every
+``aitasks/*.md`` and ``aitasks/t*/t*_*.md``: ``TaskManager.load_tasks`` on each
+board refresh, ``_iter_active_task_frontmatter`` again for trail discovery, the
+monitor's sibling lookups, and ``trail_gather.load_tree``. YAML parsing is the
+dominant cost of all of them, and nearly every file is unchanged between two
+loads.
+
+This module keeps the *result* of ``task_yaml.parse_frontmatter`` — metadata,
+body offset and original key order — keyed by the file's absolute path and
+validated by its identity ``(st_size, st_mtime_ns, st_ino)``, the same tuple
+git's own index uses to skip rehashing. An unchanged file is read but never
+re-parsed; a changed, replaced or renamed file fails the identity check and is
+parsed again.
+
+IDENTITY IS TAKEN FROM THE OPEN FILE, NOT FROM A PRIOR ``stat``. Every in-tree
+writer replaces task files by rename (``lib/atomic_write.py`` /
+``lib/atomic_write.sh``), so a ``stat`` followed by an ``open`` can observe two
+different inodes; pairing the old identity with the new bytes would pin stale
+metadata against fresh content forever. ``os.fstat`` on the descriptor we read
+from cannot disagree with what was read. (``parse_text`` serves callers that
+read the file themselves; it requires the stat to precede the read, which errs
+towards a miss instead.)
+
+WHAT IS NOT CACHED. A file whose YAML raises is never recorded — the raise is
+part of the contract every caller relies on (see ``_iter_active_task_frontmatter``
+in the board) and must repeat on every read until the file is fixed. A file with
+no frontmatter at all *is* recorded, as a negative entry.
+
+Persistence is a JSON file under ``${XDG_CACHE_HOME:-~/.cache}/ait/frontmatter/``
+(the artifact cache's root), one per task directory, written atomically and
+only when an entry changed. It is a cache, never a source of truth: a missing,
+corrupt or version-mismatched file is silently discarded, and two processes
+racing to save simply last-writer-wins. Metadata that does not survive a JSON
+round trip unchanged (a YAML ``date``, a non-string key) is still cached in
+memory for the process but is not persisted. ``AIT_FRONTMATTER_INDEX=0``
+disables persistence entirely (the in-memory layer stays on).
+
+Callers receive a fresh metadata dict on every call — they mutate it (the
+board's ``Task.save`` path does), and a shared dict would leak those edits into
+the next reader.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+
+from cache_store import dir_cache_path, json_safe, write_cache_text
+from task_yaml import FRONTMATTER_RE, parse_frontmatter
+
+# Bump whenever parse_frontmatter's OUTPUT changes shape (a new normalized key,
+# a different coercion) so stale persisted entries are discarded wholesale.
+INDEX_VERSION = 1
+
+_ENV_DISABLE = "AIT_FRONTMATTER_INDEX"
+
+def default_index_path(tasks_dir: Path) -> Path:
+    """The persisted index file for ``tasks_dir``.
+
+    Keyed by a digest of the resolved directory so two checkouts (or a test's
+    temp tree) never share an index.
+    """
+    return dir_cache_path("frontmatter", tasks_dir)
+
+
+class _Entry:
+    __slots__ = ("identity", "meta_json", "meta", "body_offset", "key_order",
+                 "has_frontmatter")
+
+    def __init__(self, identity, meta_json, meta, body_offset, key_order,
+                 has_frontmatter):
+        self.identity = identity
+        self.meta_json = meta_json      # str when persistable, else None
+        self.meta = meta                # private copy when NOT persistable
+        self.body_offset = body_offset
+        self.key_order = key_order
+        self.has_frontmatter = has_frontmatter
+
+    def metadata(self) -> dict:
+        if self.meta_json is not None:
+            return json.loads(self.meta_json)
+        return copy.deepcopy(self.meta)
+
+
+class FrontmatterIndex:
+    """Identity-validated cache of ``parse_frontmatter`` results.
+
+    Thread-safe: the board reads task files from ``@work(thread=True)`` workers
+    while the UI thread reloads single tasks.
+    """
+
+    def __init__(self, index_path: Path | None = None, persist: bool = True):
+        self._path = index_path
+        self._persist = persist and index_path is not None
+        self._entries: dict[str, _Entry] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        # Hit / miss counters: cheap, and the only way to tell from the outside
+        # that a refresh actually reused anything.
+        self.hits = 0
+        self.misses = 0
+        if self._persist:
+            self._load()
+
+    # --- persistence ---------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(doc, dict) or doc.get("version") != INDEX_VERSION:
+            return
+        entries = doc.get("entries")
+        if not isinstance(entries, dict):
+            return
+        for path, raw in entries.items():
+            try:
+                size, mtime_ns, ino, meta_json, offset, key_order, has_fm = raw
+                entry = _Entry((int(size), int(mtime_ns), int(ino)), meta_json,
+                               None, int(offset), list(key_order), bool(has_fm))
+            except (TypeError, ValueError):
+                continue
+            if entry.has_frontmatter and not isinstance(meta_json, str):
+                continue
+            self._entries[path] = entry
+
+    def save(self) -> bool:
+        """Persist the index if anything changed since the last save.
+
+        Entries for files that no longer exist are dropped first, so an
+        archived or deleted task does not keep its row forever. Never raises:
+        a failed save only costs the next process a re-parse. Returns True when
+        a file was written.
+        """
+        if not self._persist:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            rows = {}
+            for path, entry in list(self._entries.items()):
+                if not os.path.exists(path):
+                    del self._entries[path]
+                    continue
+                if entry.has_frontmatter and entry.meta_json is None:
+                    continue
+                size, mtime_ns, ino = entry.identity
+                rows[path] = [size, mtime_ns, ino, entry.meta_json,
+                              entry.body_offset, entry.key_order,
+                              entry.has_frontmatter]
+            self._dirty = False
+        text = json.dumps({"version": INDEX_VERSION, "entries": rows},
+                          separators=(",", ":"))
+        return write_cache_text(self._path, text)
+
+    # --- lookup --------------------------------------------------------------
+
+    def read(self, path, errors: str = "strict"):
+        """Read ``path`` and return ``(parsed, raw)``.
+
+        ``parsed`` is exactly what ``parse_frontmatter(raw)`` would return —
+        ``(metadata, body, original_key_order)`` or ``None`` — served from the
+        index when the file's identity is unchanged. ``raw`` is the full text,
+        for callers that keep it (``trail_gather`` stores it on the row).
+
+        Raises ``OSError`` / ``UnicodeDecodeError`` from the read and whatever
+        ``parse_frontmatter`` raises on malformed YAML, just like the
+        ``read_text`` + ``parse_frontmatter`` pair it replaces.
+        """
+        key = os.path.abspath(os.fspath(path))
+        with open(key, "r", encoding="utf-8", errors=errors) as f:
+            st = os.fstat(f.fileno())
+            raw = f.read()
+        return self._parse(key, raw, st), raw
+
+    def parse_text(self, path, raw: str, st: os.stat_result):
+        """``parse_frontmatter(raw)`` for text the caller already read itself.
+
+        ``st`` MUST have been sampled BEFORE ``raw`` was read. Keyed that way, a
+        read racing a rename-rewrite files the new bytes under the old inode's
+        identity, which no later read can present again — a miss, never a
+        stale hit. Sampled after the read, it would pin the old bytes under the
+        new identity for good.
+        """
+        return self._parse(os.path.abspath(os.fspath(path)), raw, st)
+
+    def _parse(self, key: str, raw: str, st: os.stat_result):
+        identity = (st.st_size, st.st_mtime_ns, st.st_ino)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.identity == identity:
+                self.hits += 1
+                if not entry.has_frontmatter:
+                    return None
+                return (entry.metadata(), raw[entry.body_offset:],
+                        list(entry.key_order))
+            self.misses += 1
+
+        parsed = parse_frontmatter(raw)   # raises on malformed YAML: not cached
+        if parsed is None:
+            entry = _Entry(identity, None, None, 0, [], False)
+        else:
+            metadata, _body, key_order = parsed
+            offset = FRONTMATTER_RE.match(raw).start(2)
+            if json_safe(metadata):
+                entry = _Entry(identity, json.dumps(metadata), None, offset,
+                               list(key_order), True)
+            else:
+                entry = _Entry(identity, None, copy.deepcopy(metadata), offset,
+                               list(key_order), True)
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty = True
+        return parsed
+
+    def parse_file(self, path, errors: str = "strict"):
+        """``parse_frontmatter`` of ``path``'s contents, index-backed."""
+        return self.read(path, errors=errors)[0]
+
+    def metadata(self, path, errors: str = "replace"):
+        """Just the metadata dict of ``path``, or ``None`` without frontmatter.
+
+        Defaults to ``errors="replace"`` like the trail-discovery scan it
+        serves. Same raising contract as :meth:`read`.
+        """
+        parsed = self.parse_file(path, errors=errors)
+        return parsed[0] if parsed else None
+
+    def forget(self, path) -> None:
+        """Drop one entry (a caller that knows the file was rewritten)."""
+        key = os.path.abspath(os.fspath(path))
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_SHARED: dict[str, FrontmatterIndex] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_index(tasks_dir) -> FrontmatterIndex:
+    """The process-wide index for ``tasks_dir``, created on first use.
+
+    One instance per resolved task directory, so the board, its trail worker
+    and a monitor serving several projects each reuse the same entries.
+    """
+    key = str(Path(tasks_dir).resolve())
+    with _SHARED_LOCK:
+        index = _SHARED.get(key)
+        if index is None:
+            persist = os.environ.get(_ENV_DISABLE, "1") != "0"
+            index = FrontmatterIndex(default_index_path(Path(key)),
+                                     persist=persist)
+            _SHARED[key] = index
+        return index
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""fs_watch.py - wait for changes to the entries of one directory.
+
+Long-running loops that react to files other processes write (the agentcrew
+runner watching agent ``*_status.yaml`` files is the first caller) used to sleep
+a fixed interval and then re-read everything. :class:`DirWatcher` lets them
+block until something in the directory actually changed and tells them WHICH
+entries changed, so the reaction is immediate and the re-read is limited to
+those files.
+
+Two backends, same contract:
+
+  * ``inotify`` (Linux) through ``ctypes`` — no third-party dependency, no
+    polling; events arrive as the writer closes or renames the file.
+  * ``poll`` everywhere else (and wherever inotify cannot be set up: macOS,
+    exhausted watch limits, some network filesystems): an ``os.scandir`` stat
+    snapshot of the directory diffed every ``poll_interval`` seconds.
+
+``AIT_FS_WATCH=poll`` forces the polling backend (tests, or a filesystem whose
+inotify events are unreliable, e.g. a bind mount written from another host).
+
+The watch is NON-recursive: only entries directly inside ``path``. A caller
+that needs a full rescan (an inotify queue overflow, or just "I don't trust
+the events") gets ``None`` from :meth:`DirWatcher.wait` instead of a name set.
+
+:class:`DirSetWatcher` is the non-blocking sibling for callers that own an
+event loop and watch a changing SET of directories (the board's task feed:
+``aitasks/``, one dir per parent with children, the git index dir): one
+inotify instance for all of them — instances are a per-user kernel limit
+(128 by default), watches are not — and a :meth:`DirSetWatcher.poll` that
+returns whatever changed since the last call without ever sleeping.
+
+Stdlib only.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+
+_FORCE_ENV = "AIT_FS_WATCH"
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+# IN_MODIFY is deliberately absent: a writer produces one per write() call and
+# the file is only complete at IN_CLOSE_WRITE (or at IN_MOVED_TO for a
+# rename-into-place writer). IN_ATTRIB catches `touch` and chmod.
+_WATCH_MASK = (_IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_CREATE
+               | _IN_DELETE | _IN_ATTRIB | _IN_DELETE_SELF | _IN_MOVE_SELF)
+_EVENT_HEADER = struct.Struct("iIII")   # wd, mask, cookie, len
+
+DEFAULT_POLL_INTERVAL = 1.0
+# After the first event, keep draining for this long so a burst (git checkout
+# rewriting twenty files, an editor's write + rename) is reported as one batch.
+DEFAULT_SETTLE = 0.05
+
+
+def _load_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        init1 = libc.inotify_init1
+        add_watch = libc.inotify_add_watch
+        rm_watch = libc.inotify_rm_watch
+    except (OSError, AttributeError):
+        return None
+    init1.argtypes = [ctypes.c_int]
+    init1.restype = ctypes.c_int
+    add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    add_watch.restype = ctypes.c_int
+    rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    rm_watch.restype = ctypes.c_int
+    return init1, add_watch, rm_watch
+
+
+class DirWatcher:
+    """Report which entries of ``path`` changed, blocking until one does.
+
+    ::
+
+        with DirWatcher(worktree) as w:
+            while True:
+                changed = w.wait(timeout=30)   # set of names, or None = rescan
+                ...
+
+    ``backend`` is ``"inotify"`` or ``"poll"`` once constructed. ``wait`` never
+    raises for a vanished directory: it reports ``None`` (rescan) and lets the
+    caller discover the problem the way it would without a watcher.
+    """
+
+    def __init__(self, path: str, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 settle: float = DEFAULT_SETTLE):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.settle = settle
+        self._fd = -1
+        self._snapshot: dict[str, tuple] | None = None
+        self.backend = "poll"
+        if os.environ.get(_FORCE_ENV, "").strip().lower() != "poll":
+            self._fd = self._open_inotify()
+            if self._fd >= 0:
+                self.backend = "inotify"
+        if self._fd < 0:
+            self._snapshot = self._scan()
+
+    def _open_inotify(self) -> int:
+        api = _load_inotify()
+        if api is None:
+            return -1
+        init1, add_watch, _rm_watch = api
+        fd = init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return -1
+        if add_watch(fd, os.fsencode(self.path), _WATCH_MASK) < 0:
+            os.close(fd)
+            return -1
+        return fd
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> "DirWatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- waiting -----------------------------------------------------------
+
+    def wait(self, timeout: float | None) -> set[str] | None:
+        """Block up to ``timeout`` seconds (None = forever) for changes.
+
+        Returns the set of changed entry names — empty on timeout — or None
+        when the caller should rescan everything (queue overflow, the watched
+        directory itself moved or vanished).
+        """
+        if self._fd >= 0:
+            return self._wait_inotify(timeout)
+        return self._wait_poll(timeout)
+
+    def _wait_inotify(self, timeout: float | None) -> set[str] | None:
+        try:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+        except InterruptedError:
+            return set()
+        if not ready:
+            return set()
+        names: set[str] = set()
+        rescan = self._drain(names)
+        deadline = time.monotonic() + self.settle
+        while not rescan:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            try:
+                ready, _, _ = select.select([self._fd], [], [], left)
+            except InterruptedError:
+                break
+            if not ready:
+                break
+            rescan = self._drain(names)
+        return None if rescan else names
+
+    def _drain(self, names: set[str]) -> bool:
+        """Read every queued event into ``names``; True means "rescan"."""
+        rescan = False
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return rescan
+            except OSError as exc:
+                if exc.errno == errno.EINTR:
+                    continue
+                return True
+            if not buf:
+                return rescan
+            off = 0
+            while off + _EVENT_HEADER.size <= len(buf):
+                _wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, off)
+                off += _EVENT_HEADER.size
+                raw = buf[off:off + length].split(b"\0", 1)[0]
+                off += length
+                if mask & (_IN_Q_OVERFLOW | _IN_IGNORED | _IN_DELETE_SELF
+                           | _IN_MOVE_SELF):
+                    rescan = True
+                elif raw:
+                    names.add(os.fsdecode(raw))
+
+    def _scan(self) -> dict[str, tuple]:
+        return _scan_dir(self.path)
+
+    def _wait_poll(self, timeout: float | None) -> set[str] | None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            step = self.poll_interval
+            if deadline is not None:
+                step = min(step, max(0.0, deadline - time.monotonic()))
+            if step:
+                time.sleep(step)
+            snap = self._scan()
+            old, self._snapshot = self._snapshot or {}, snap
+            changed = {n for n in snap.keys() | old.keys() if snap.get(n) != old.get(n)}
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+
+class DirSetWatcher:
+    """Report which entries of a set of directories changed, without blocking.
+
+    ::
+
+        w = DirSetWatcher([tasks_dir])
+        w.add(tasks_dir / "t47")
+        ...
+        changed = w.poll()   # {(dir, name), ...}, or None = rescan everything
+
+    A ``(dir, "")`` pair means the directory itself went away (or was
+    replaced); its watch is dropped and ``add`` must be called again should it
+    come back. Directories are reported by the exact string they were added
+    with. Same backends and ``AIT_FS_WATCH=poll`` override as
+    :class:`DirWatcher`; on the poll backend every :meth:`poll` is one
+    ``os.scandir`` stat pass per directory.
+    """
+
+    def __init__(self, paths=(), force_poll: bool = False):
+        self._fd = -1
+        self._add_watch = None
+        self._rm_watch = None
+        self._wds: dict[int, str] = {}
+        self._dirs: dict[str, int | dict[str, tuple]] = {}   # wd, or poll snapshot
+        self._lost = False
+        self.backend = "poll"
+        if not force_poll and os.environ.get(_FORCE_ENV, "").strip().lower() != "poll":
+            api = _load_inotify()
+            if api is not None:
+                init1, self._add_watch, self._rm_watch = api
+                self._fd = init1(_IN_NONBLOCK | _IN_CLOEXEC)
+                if self._fd >= 0:
+                    self.backend = "inotify"
+        for path in paths:
+            self.add(path)
+
+    def fileno(self) -> int | None:
+        return self._fd if self._fd >= 0 else None
+
+    def watching(self, path) -> bool:
+        return str(path) in self._dirs
+
+    def add(self, path) -> bool:
+        """Start watching ``path``; False if it cannot be watched (missing)."""
+        path = str(path)
+        if path in self._dirs:
+            return True
+        if self._fd >= 0:
+            wd = self._add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                return False
+            self._wds[wd] = path
+            self._dirs[path] = wd
+            return True
+        if not os.path.isdir(path):
+            return False
+        self._dirs[path] = _scan_dir(path)
+        return True
+
+    def remove(self, path) -> None:
+        """Stop watching ``path`` and release its kernel watch.
+
+        Kernel watches count against ``fs.inotify.max_user_watches``; a board
+        session adds and drops ``t<N>/`` child dirs for hours, so dropping only
+        our bookkeeping would leak one per removal. EINVAL from
+        ``inotify_rm_watch`` (the kernel already dropped the watch with its
+        directory) is expected and ignored; events still queued for the wd are
+        skipped by :meth:`_drain`.
+        """
+        entry = self._dirs.pop(str(path), None)
+        if self._fd >= 0 and isinstance(entry, int):
+            self._wds.pop(entry, None)
+            self._rm_watch(self._fd, entry)
+
+    def poll(self) -> set[tuple[str, str]] | None:
+        """Everything that changed since the last call; None means "rescan"."""
+        if self._fd >= 0:
+            changed = self._drain()
+        else:
+            changed = set()
+            for path, old in list(self._dirs.items()):
+                if not os.path.isdir(path):
+                    del self._dirs[path]
+                    changed.add((path, ""))
+                    continue
+                snap = self._dirs[path] = _scan_dir(path)
+                changed.update((path, n) for n in snap.keys() | old.keys()
+                               if snap.get(n) != old.get(n))
+        if self._lost:
+            self._lost = False
+            return None
+        return changed
+
+    def _drain(self) -> set[tuple[str, str]]:
+        changed: set[tuple[str, str]] = set()
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            except OSError as exc:
+                if exc.errno == errno.EINTR:
+                    continue
+                self._lost = True
+                return changed
+            if not buf:
+                return changed
+            off = 0
+            while off + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, off)
+                off += _EVENT_HEADER.size
+                raw = buf[off:off + length].split(b"\0", 1)[0]
+                off += length
+                if mask & _IN_Q_OVERFLOW:
+                    self._lost = True
+                    continue
+                path = self._wds.get(wd)
+                if path is None or self._dirs.get(path) != wd:
+                    continue                  # a removed (or re-added) watch
+                if mask & (_IN_IGNORED | _IN_DELETE_SELF | _IN_MOVE_SELF):
+                    del self._dirs[path]
+                    self._wds.pop(wd, None)
+                    changed.add((path, ""))
+                elif raw:
+                    changed.add((path, os.fsdecode(raw)))
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._wds.clear()
+        self._dirs.clear()
+
+
+def _scan_dir(path: str) -> dict[str, tuple]:
+    snap: dict[str, tuple] = {}
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                snap[entry.name] = (st.st_mtime_ns, st.st_size, st.st_ino, st.st_mode)
+    except OSError:
+        pass
+    return snap
@@ -20,6 +20,13 @@ PyYAML, so the fallback works in environments where PyYAML is unavailable.
 
 CLI:
     gate_ledger.py append       <task-file> <gate> <status> [key=value ...]
+    gate_ledger.py append-batch <task-file> <lock-key> [--fsync never|always]
+                                 -- [--only-if-running <run-id>] <gate> <status>
+                                    [key=value ...] [-- ...]
+                                 -> every op under ONE per-task gate lock (the
+                                    lock aitask_gate.sh takes) and ONE atomic
+                                    write; echoes each block written. A guarded
+                                    op whose run is closed writes nothing.
     gate_ledger.py status       <task-file>
     gate_ledger.py list         <task-file> [registry.yaml]
     gate_ledger.py deps-unblock <task-file> [registry.yaml]
@@ -58,13 +65,19 @@ Supported append keys (anything else is ignored with a warning):
 """
 from __future__ import annotations
 
+import contextlib
 import datetime
 from dataclasses import dataclass, field
 import hashlib
+import json
 import os
 import re
+import shutil
+import stat
 import subprocess
 import sys
+import threading
+import time
 
 SECTION_HEADER = "## Gate Runs"
 SECTION_COMMENT = (
@@ -495,25 +508,476 @@ def append_block(text: str, gate: str, status: str, fields: dict) -> tuple[str,
     return out, block
 
 
-def _atomic_write(path: str, content: str) -> None:
+def _atomic_write(path: str, content: str, fsync: bool = False) -> None:
     """Write content to path atomically via an adjacent tempfile + os.replace.
 
     The task file lives under the ``aitasks/`` *directory* symlink but is itself
     a regular file, so replacing it in place keeps the data-worktree layout
     intact. The tempfile is created in the same directory to keep the rename on
-    one filesystem (truly atomic).
+    one filesystem (truly atomic). Its name carries the thread id as well as the
+    pid: the in-process writer below can have several threads writing (different
+    task files) in one directory at once.
+
+    ``fsync=True`` flushes the data before the rename and the directory entry
+    after it, so the new content survives a power loss, not just a crash of
+    this process. Off by default — see :func:`fsync_policy`.
     """
     d = os.path.dirname(path) or "."
-    tmp = os.path.join(d, f".aitask_gate.{os.getpid()}.tmp")
+    tmp = os.path.join(d, f".aitask_gate.{os.getpid()}.{threading.get_ident()}.tmp")
     try:
         with open(tmp, "w", encoding="utf-8") as fh:
             fh.write(content)
+            if fsync:
+                fh.flush()
+                os.fsync(fh.fileno())
         os.replace(tmp, path)
+        if fsync:
+            dfd = os.open(d, os.O_RDONLY)
+            try:
+                os.fsync(dfd)
+            finally:
+                os.close(dfd)
     finally:
         if os.path.exists(tmp):
             os.remove(tmp)
 
 
+# --- In-process batched writer --------------------------------------------
+#
+# Every ledger event used to be one `aitask_gate.sh append` process: bash
+# start-up, three sourced libs, the mkdir lock, an awk scan, a cat/mv rewrite of
+# the task file. The orchestrator records at least two events per machine
+# attempt (`running` + terminal), so a multi-gate run paid that stack over and
+# over. The writer below does the same thing in-process: it takes the SAME
+# per-task lock `aitask_gate.sh` takes (a Python port of lib/stale_lock.sh —
+# same path, same guard, same pid/owner files, so bash and Python writers
+# exclude each other), reads the file once, applies any number of
+# :func:`append_block` operations to the text in memory and writes it back once.
+#
+# The lock protocol below mirrors stale_lock.sh invariant by invariant; read the
+# header of that file before changing either side.
+
+_GATE_LOCK_RETRIES = 20       # aitask_gate.sh acquire_gate_lock: 20 x 0.3s
+_GATE_LOCK_SLEEP = 0.3
+_GUARD_RELEASE_TRIES = 40     # stale_lock_release: 40 x 0.05s
+_GUARD_RELEASE_SLEEP = 0.05
+
+FSYNC_POLICIES = ("never", "always")
+_FSYNC_ENV = "AIT_GATE_FSYNC"
+
+# The repo whose locks we share: this lib's own repo root, exactly as
+# stale_lock.sh derives _AIT_STALE_LOCK_ROOT (never the ambient cwd).
+_LOCK_REPO_ROOT = os.path.realpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+
+class LedgerLockError(RuntimeError):
+    """The per-task gate lock could not be resolved, acquired or released."""
+
+
+def _warn(msg: str) -> None:
+    sys.stderr.write(f"Warning: {msg}\n")
+
+
+def posix_cksum(data: bytes) -> int:
+    """POSIX ``cksum`` CRC (not zlib's CRC-32): MSB-first, length appended.
+
+    ait_lock_dir names the lock base after ``printf '%s' ROOT | cksum``; the
+    Python side must arrive at the same directory.
+    """
+    crc = 0
+
+    def feed(byte: int) -> None:
+        nonlocal crc
+        crc ^= byte << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else crc << 1
+            crc &= 0xFFFFFFFF
+
+    for byte in data:
+        feed(byte)
+    n = len(data)
+    while n:
+        feed(n & 0xFF)
+        n >>= 8
+    return ~crc & 0xFFFFFFFF
+
+
+def lock_dir(name: str) -> str:
+    """Python twin of ``ait_lock_dir``: the lock path for ``name``.
+
+    ``$AITASKS_LOCK_DIR`` wins; otherwise a per-user, per-repo base under
+    ``$TMPDIR``, created owner-only and refused when it is a symlink, not a
+    directory, or owned by another uid (raises :class:`LedgerLockError`).
+    """
+    base = os.environ.get("AITASKS_LOCK_DIR", "")
+    if base:
+        if not os.path.isdir(base):
+            try:
+                os.makedirs(base, exist_ok=True)
+            except OSError as exc:
+                raise LedgerLockError(
+                    f"stale_lock: cannot create AITASKS_LOCK_DIR '{base}'") from exc
+        return os.path.join(base, name)
+    cks = posix_cksum(_LOCK_REPO_ROOT.encode())
+    base = os.path.join(os.environ.get("TMPDIR") or "/tmp",
+                        f"aitask-locks-{os.getuid()}-{cks}")
+    try:
+        os.mkdir(base, 0o700)
+    except OSError:
+        if os.path.islink(base):
+            raise LedgerLockError(f"stale_lock: lock base '{base}' is a symlink — refusing")
+        if not os.path.isdir(base):
+            raise LedgerLockError(
+                f"stale_lock: lock base '{base}' exists and is not a directory — refusing")
+        owner = os.stat(base).st_uid
+        if owner != os.getuid():
+            raise LedgerLockError(
+                f"stale_lock: lock base '{base}' is owned by uid {owner} — refusing")
+        try:
+            os.chmod(base, 0o700)
+        except OSError:
+            pass
+    return os.path.join(base, name)
+
+
+def _lock_describe(path: str) -> str:
+    """Twin of ``stale_lock_describe`` — the recovery hint after exhaustion."""
+    try:
+        with open(os.path.join(path, "pid")) as fh:
+            pid = fh.read().strip()
+    except OSError:
+        pid = ""
+    if pid:
+        hint = (f" (held by pid {pid} at {path} — remove that directory if that "
+                "process is gone")
+    else:
+        hint = f" (lock at {path} — remove it if its holder is gone"
+    if os.path.exists(path + ".gc"):
+        hint += (f"; stale-reclaim guard {path}.gc present — remove it too if no "
+                 "reclaim is running")
+    return hint + ")"
+
+
+def _rm_verified(path: str) -> bool:
+    """``_stale_lock_rm_verified``: only for the lock dir, only under the guard."""
+    shutil.rmtree(path, ignore_errors=True)
+    if os.path.lexists(path):
+        _warn(f"stale_lock: could not remove '{path}' — retained")
+        return False
+    return True
+
+
+def _guard_release(gc: str) -> bool:
+    """``_stale_lock_gc_release``: rmdir's own result is authoritative."""
+    try:
+        os.rmdir(gc)
+        return True
+    except OSError:
+        return False
+
+
+def _pid_alive(pid: int) -> bool:
+    """``kill -0`` with EPERM counted as alive (never displace what might run)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _read_small(path: str) -> str:
+    try:
+        with open(path) as fh:
+            return fh.read().strip()
+    except OSError:
+        return ""
+
+
+def _reclaim_under_guard(path: str, label: str) -> bool:
+    """``_stale_lock_reclaim_under_gc``; the caller HOLDS the guard. True iff
+    the lock-dir state changed and mkdir should be retried at once."""
+    if not os.path.isdir(path):
+        return True
+    holder = _read_small(os.path.join(path, "pid"))
+    if holder.isdigit():
+        if _pid_alive(int(holder)):
+            return False
+        _warn(f"Reclaiming {label} from dead holder pid {holder}")
+        return _rm_verified(path)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return True
+    age = int(time.time()) - int(mtime)
+    if age <= int(os.environ.get("_STALE_LOCK_WINDOW", "120")):
+        return False
+    _warn(f"Removing stale {label} (age: {age}s)")
+    return _rm_verified(path)
+
+
+def _dir_lock_acquire(path: str, label: str, retries: int, sleep_s: float):
+    """``stale_lock_acquire``: return ``(token, attempts)``, or None when the
+    retries are exhausted; raise when the publish or the guard fails closed.
+
+    The recorded holder pid is this process's — like the bash side, a lock is
+    taken from one place at a time per process (see ``_KEY_LOCKS``).
+    """
+    gc = path + ".gc"
+    attempt = 0
+    while True:
+        attempt += 1
+        reclaimed = False
+        try:
+            os.mkdir(gc)
+        except OSError:
+            pass
+        else:
+            try:
+                os.mkdir(path)
+            except OSError:
+                reclaimed = _reclaim_under_guard(path, label)
+                if not _guard_release(gc):
+                    reclaimed = False
+            else:
+                pid = str(os.getpid())
+                token = f"{pid}-{os.urandom(4).hex()}-{int(time.time())}"
+                try:
+                    with open(os.path.join(path, "pid"), "w") as fh:
+                        fh.write(pid + "\n")
+                    with open(os.path.join(path, "owner"), "w") as fh:
+                        fh.write(token + "\n")
+                    published = (_read_small(os.path.join(path, "pid")) == pid
+                                 and _read_small(os.path.join(path, "owner")) == token)
+                except OSError:
+                    published = False
+                if published:
+                    if _guard_release(gc):
+                        return token, attempt
+                    if not _rm_verified(path):
+                        _warn(f"stale_lock: lock '{path}' also retained")
+                    raise LedgerLockError(
+                        f"stale_lock: guard '{gc}' retained — acquire failed closed")
+                _warn(f"stale_lock: could not publish identity into '{path}'")
+                if _rm_verified(path):
+                    if not _guard_release(gc):
+                        _warn(f"stale_lock: guard '{gc}' retained")
+                else:
+                    _warn(f"stale_lock: partial lock retained — keeping guard '{gc}' "
+                          "(fail closed)")
+                raise LedgerLockError(f"could not publish identity into '{path}'")
+        if attempt >= retries:
+            return None
+        if not reclaimed:
+            time.sleep(sleep_s)
+
+
+def _dir_lock_release(path: str, token: str) -> bool:
+    """``stale_lock_release``: False when our lock or the guard is retained."""
+    if not os.path.lexists(path):
+        return True
+    gc = path + ".gc"
+    tries = 0
+    while True:
+        try:
+            os.mkdir(gc)
+            break
+        except OSError:
+            tries += 1
+            if tries >= _GUARD_RELEASE_TRIES:
+                _warn(f"stale_lock: guard '{gc}' busy — lock '{path}' NOT released")
+                return False
+            time.sleep(_GUARD_RELEASE_SLEEP)
+    ok = True
+    if token and _read_small(os.path.join(path, "owner")) == token:
+        ok = _rm_verified(path)
+    else:
+        _warn(f"stale_lock: not owner of '{path}' — leaving intact")
+    if not _guard_release(gc):
+        _warn(f"stale_lock: guard '{gc}' retained")
+        ok = False
+    return ok
+
+
+# One in-process mutex per lock key. The mkdir lock alone would still be
+# correct between threads (a thread waiting on its own pid's lock just sees a
+# live holder), but it would poll in 0.3s sleeps; the threading lock hands the
+# key over at once. Contention on either level feeds the metric below.
+_KEY_LOCKS: dict[str, threading.Lock] = {}
+_KEY_LOCKS_GUARD = threading.Lock()
+
+_WRITER_STATS_LOCK = threading.Lock()
+_WRITER_STATS_ZERO = {
+    "transactions": 0,     # ledger_transaction() entries that took the lock
+    "blocks": 0,           # blocks appended
+    "skipped": 0,          # only-if-running appends that were no-ops
+    "writes": 0,           # atomic rewrites of a task file
+    "fsyncs": 0,           # writes that were fsync'd
+    "lock_contended": 0,   # acquisitions that had to wait for another holder
+    "lock_wait_s": 0.0,    # total time spent waiting for the lock
+    "lock_wait_max_s": 0.0,
+}
+_WRITER_STATS = dict(_WRITER_STATS_ZERO)
+
+
+def _bump(**deltas) -> None:
+    with _WRITER_STATS_LOCK:
+        for key, value in deltas.items():
+            if key == "lock_wait_max_s":
+                _WRITER_STATS[key] = max(_WRITER_STATS[key], value)
+            else:
+                _WRITER_STATS[key] += value
+
+
+def writer_stats() -> dict:
+    """Counters of the in-process writer since import (or the last reset)."""
+    with _WRITER_STATS_LOCK:
+        return dict(_WRITER_STATS)
+
+
+def reset_writer_stats() -> None:
+    with _WRITER_STATS_LOCK:
+        _WRITER_STATS.update(_WRITER_STATS_ZERO)
+
+
+def fsync_policy(explicit: str | None = None) -> str:
+    """Resolve the fsync policy: ``explicit``, else ``$AIT_GATE_FSYNC``, else
+    ``never``.
+
+    ``never`` matches the bash writer (write + rename: crash-safe, but a power
+    loss may lose the last blocks). ``always`` fsyncs the file and its directory
+    on every write. An unknown explicit value raises ValueError; an unknown env
+    value warns and falls back to ``never``.
+    """
+    if explicit is not None:
+        if explicit not in FSYNC_POLICIES:
+            raise ValueError(f"invalid fsync policy '{explicit}' "
+                             f"(one of: {', '.join(FSYNC_POLICIES)})")
+        return explicit
+    env = os.environ.get(_FSYNC_ENV, "").strip()
+    if not env:
+        return "never"
+    if env not in FSYNC_POLICIES:
+        _warn(f"ignoring {_FSYNC_ENV}={env} (one of: {', '.join(FSYNC_POLICIES)})")
+        return "never"
+    return env
+
+
+def run_status(text: str, run_id: str) -> str | None:
+    """The status of the LAST marker carrying ``run=<run_id>`` (or None).
+
+    The ``--only-if-running`` rule: a run is still open iff this is ``running``
+    (mirrors aitask_gate.sh's _gate_run_is_running).
+    """
+    last = None
+    for r in parse_gate_run_blocks(text):
+        if r.run_id == run_id:
+            last = r.status
+    return last
+
+
+class LedgerTransaction:
+    """The task text while the lock is held; appends are applied in memory.
+
+    Obtained from :func:`ledger_transaction`, which writes ``text`` back once
+    on a clean exit when anything was appended.
+    """
+
+    def __init__(self, path: str, text: str):
+        self.path = path
+        self.text = text
+        self.blocks: list[str] = []
+
+    def run_status(self, run_id: str) -> str | None:
+        return run_status(self.text, run_id)
+
+    def append(self, gate: str, status: str, fields: dict | None = None,
+               only_if_running: str | None = None) -> str | None:
+        """Append one block; return it, or None when ``only_if_running`` names
+        a run that is no longer open (the guarded no-op of ``append
+        --only-if-running``). Empty field values are dropped, as the bash path
+        treats them."""
+        if status not in VALID_STATUSES:
+            raise ValueError(f"invalid status '{status}' "
+                             f"(one of: {', '.join(VALID_STATUSES)})")
+        if only_if_running and self.run_status(only_if_running) != "running":
+            _bump(skipped=1)
+            return None
+        clean = {k: str(v) for k, v in (fields or {}).items()
+                 if k in SUPPORTED_KEYS and v is not None and v != ""}
+        clean.pop("status", None)
+        self.text, block = append_block(self.text, gate, status, clean)
+        self.blocks.append(block)
+        return block
+
+
+@contextlib.contextmanager
+def ledger_transaction(path: str, lock_key: str, fsync: str | None = None):
+    """Hold the task's gate lock for a batch of appends; yield a
+    :class:`LedgerTransaction`.
+
+    ::
+
+        with ledger_transaction(task_file, task_id) as tx:
+            tx.append("tests", "fail", {"run": rid}, only_if_running=rid)
+            tx.append("tests", "error", {"note": "..."})
+
+    ``lock_key`` is the task id (``/`` mapped to ``_`` as aitask_gate.sh does),
+    so this lock and ``aitask_gate.sh append`` serialize against each other.
+    The file is read once after the lock is taken and written once, atomically,
+    on a clean exit — an exception inside the block writes nothing. Reentrant
+    use for the same key from one thread deadlocks, as the bash lock would.
+    """
+    key = lock_key.replace("/", "_")
+    do_fsync = fsync_policy(fsync) == "always"
+    with _KEY_LOCKS_GUARD:
+        tlock = _KEY_LOCKS.setdefault(key, threading.Lock())
+    started = time.monotonic()
+    contended = not tlock.acquire(blocking=False)
+    if contended:
+        tlock.acquire()
+    try:
+        ldir = lock_dir(f"gate_{key}")
+        got = _dir_lock_acquire(ldir, f"gate lock for {key}",
+                                _GATE_LOCK_RETRIES, _GATE_LOCK_SLEEP)
+        if got is None:
+            # Same text aitask_gate.sh dies with (pinned by
+            # tests/test_gate_lock_characterization.sh), same recovery hint.
+            raise LedgerLockError(
+                f"Failed to acquire gate append lock for {key} after "
+                f"{_GATE_LOCK_RETRIES} attempts{_lock_describe(ldir)}")
+        token, attempts = got
+        waited = time.monotonic() - started
+        _bump(transactions=1, lock_contended=int(contended or attempts > 1),
+              lock_wait_s=waited, lock_wait_max_s=waited)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                tx = LedgerTransaction(path, fh.read())
+            yield tx
+            if tx.blocks:
+                _atomic_write(path, tx.text, fsync=do_fsync)
+                _bump(writes=1, blocks=len(tx.blocks), fsyncs=int(do_fsync))
+        finally:
+            released = _dir_lock_release(ldir, token)
+        if not released:
+            raise LedgerLockError(
+                f"gate lock not released — the key stays wedged ({ldir})")
+    finally:
+        tlock.release()
+
+
+def append_batch(path: str, lock_key: str, ops, fsync: str | None = None) -> list:
+    """Apply ``ops`` — ``(gate, status, fields[, only_if_running])`` tuples —
+    under one lock acquisition and one write. Returns the block written for
+    each op, or None for a guarded no-op."""
+    with ledger_transaction(path, lock_key, fsync=fsync) as tx:
+        return [tx.append(*op) for op in ops]
+
+
 # --- Registry (minimal, stdlib-only 2-level parse) ------------------------
 
 def _frontmatter_text(text: str) -> str:
@@ -979,7 +1443,7 @@ def _default_gate_meta() -> dict:
         "type": "", "description": "", "blocks_dependents": False,
         "verifier": "", "max_retries": 0, "unlocks": None,
         "timeout_seconds": None, "signal": "", "signal_target": "",
-        "kind": "",
+        "kind": "", "cache": False, "cache_env": [],
     }
 
 
@@ -990,7 +1454,8 @@ def _default_gate_meta() -> dict:
 _SCALAR_GATE_KEYS = ("type", "kind", "description", "verifier",
                      "signal", "signal_target")
 _GATE_FIELD_KEYS = _SCALAR_GATE_KEYS + ("blocks_dependents", "max_retries",
-                                        "timeout_seconds", "unlocks")
+                                        "timeout_seconds", "unlocks",
+                                        "cache", "cache_env")
 
 
 @dataclass(frozen=True)
@@ -1116,7 +1581,7 @@ def read_registry_text(text: str) -> dict[str, dict]:
         key, val = rec.key, rec.value
         if key in _SCALAR_GATE_KEYS:
             meta[key] = val.strip("'\"")
-        elif key == "blocks_dependents":
+        elif key in ("blocks_dependents", "cache"):
             meta[key] = _truthy(val)
         elif key == "max_retries":
             meta[key] = _int_or(val, 0)
@@ -1128,6 +1593,10 @@ def read_registry_text(text: str) -> dict[str, dict]:
             else:
                 inline = _parse_inline_list(val)
                 meta[key] = inline if inline is not None else [val.strip("'\"")]
+        elif key == "cache_env":
+            inline = _parse_inline_list(val)
+            meta[key] = (inline if inline is not None
+                         else [v for v in re.split(r"[,\s]+", val.strip("'\"")) if v])
         # Unknown keys are ignored, exactly as before.
     return gates
 
@@ -1298,7 +1767,8 @@ def read_registry(registry_file: str) -> dict[str, dict]:
     """Parse gates.yaml with ``re`` only (stdlib, no PyYAML).
 
     Returns ``name -> {type, kind, description, blocks_dependents, verifier,
-    max_retries, unlocks, timeout_seconds, signal, signal_target}``.
+    max_retries, unlocks, timeout_seconds, signal, signal_target, cache,
+    cache_env}``.
 
     - ``blocks_dependents`` (t635_3) marks a gate required-to-pass before the
       owning task's dependents unblock; defaults to ``False``.
@@ -1313,6 +1783,10 @@ def read_registry(registry_file: str) -> dict[str, dict]:
       ``- a`` form.
     - ``timeout_seconds`` (t635_11) — int or ``None``.
     - ``signal`` / ``signal_target`` (t635_11) — human-gate signal kind + target.
+    - ``cache`` — opt a machine gate into the verifier result cache
+      (``gate_result_cache``); default ``False``.
+    - ``cache_env`` — names of environment variables whose values are part of
+      that cache's key (inline ``[A, B]`` or ``A, B``); default ``[]``.
 
     The parser is **indent-aware**: a gate header is a ``name:`` at the first
     gate's indent depth; deeper-indented ``name:`` lines (e.g. a block-form
@@ -1631,38 +2105,194 @@ def _git(args: list[str], cwd: str) -> str | None:
     return r.stdout if r.returncode == 0 else None
 
 
-def code_digest(cwd: str | None = None) -> str | None:
+# The digest is HEAD plus, for every path that may differ from it, the git blob
+# id of what is in the worktree — the code state ``git diff HEAD`` plus the
+# untracked files describe, but built from one hash PER FILE so each can be
+# remembered. (It used to stream the raw ``git diff HEAD`` text and every
+# untracked file's bytes through a single SHA-256, which left nothing to reuse:
+# any edit to a dirty tree re-ran the diff and re-read every untracked byte.)
+#
+# The paths come from ONE ``git status --porcelain=v2`` call: git's index
+# answers "is this tracked file clean" without reading it, and each record
+# carries the path's HEAD mode and blob id. A listed path whose worktree (mode,
+# blob) equals HEAD's — staged and then restored, say — contributes nothing, so
+# the value depends on content alone, not on how it got there. No ``--branch``:
+# its ahead/behind counts move on every fetch without touching the code.
+#
+# Per-file memo: a path's blob id is remembered under its (size, mtime_ns, ino,
+# st_mode) the same way git's index skips re-reading a file whose stat it has
+# already seen, so a call re-reads only the files whose stat changed. Racy files
+# — modified within ``_DIGEST_RACY_NS`` of the call — are never remembered,
+# since a same-size rewrite inside one timestamp tick would otherwise be
+# invisible (git's "racy clean" problem); nor is a file whose stat moved while
+# it was being read. The memo holds only the paths of the latest status, so it
+# is bounded by the dirty set.
+#
+# The value is persisted — in human-gate witnesses (``code_digest=``) and the
+# engine's ``stuckhash:`` notes. A witness signed before this recipe reads as
+# stale once and must be re-signed; a ``stuckhash:`` simply stops matching.
+#
+# Persistence: ``${XDG_CACHE_HOME:-~/.cache}/ait/digest/<cwd hash>.json``.
+# A cache, never a source of truth; ``AIT_DIGEST_CACHE=0`` disables it.
+
+_DIGEST_CACHE_VERSION = 3
+_DIGEST_CACHE_ENV = "AIT_DIGEST_CACHE"
+_DIGEST_RACY_NS = 2_000_000_000
+_LIB_DIR = os.path.dirname(os.path.abspath(__file__))
+_GIT_NO_MODE = "000000"
+
+
+def _cache_store():
+    # Imported here: the rest of this module needs nothing beside it on sys.path.
+    if _LIB_DIR not in sys.path:
+        sys.path.insert(0, _LIB_DIR)
+    import cache_store
+    return cache_store
+
+
+def _digest_cache_path(cwd: str) -> str:
+    return str(_cache_store().dir_cache_path("digest", cwd))
+
+
+def _status_entries(out: str):
+    """Yield ``(path, head_mode, head_oid)`` for each path a ``status
+    --porcelain=v2 -z`` names; the HEAD side is ``None`` for unmerged and
+    untracked paths (never equal to the worktree, so always hashed)."""
+    for rec in out.split("\0"):
+        if rec.startswith("1 "):
+            f = rec.split(" ", 8)
+            yield f[8], f[3], f[6]
+        elif rec.startswith("u "):
+            yield rec.split(" ", 10)[10], None, None
+        elif rec.startswith("? "):
+            yield rec[2:], None, None
+
+
+def _blob_oid(data: bytes, algo: str) -> str:
+    """The git blob id of ``data`` (what ``git hash-object`` prints, unfiltered)."""
+    h = hashlib.new(algo)
+    h.update(b"blob %d\0" % len(data))
+    h.update(data)
+    return h.hexdigest()
+
+
+def _worktree_blob(top: str, rel: str, algo: str, memo: dict | None,
+                   fresh: dict, started_ns: int) -> tuple[str, str]:
+    """``(mode, blob id)`` of ``rel`` as the worktree has it, git-style:
+    ``120000`` and the link text for a symlink, ``160000`` and its HEAD for a
+    submodule, ``000000`` for a missing path. Regular files are served from
+    ``memo`` when their stat is unchanged; a file read here that is not racy is
+    recorded in ``fresh``."""
+    path = os.path.join(top, rel)
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return _GIT_NO_MODE, ""
+    if stat.S_ISLNK(st.st_mode):
+        try:
+            return "120000", _blob_oid(os.fsencode(os.readlink(path)), algo)
+        except OSError:
+            return _GIT_NO_MODE, ""
+    if stat.S_ISDIR(st.st_mode):
+        sub = _git(["rev-parse", "HEAD"], path)
+        return "160000", (sub or "").strip()
+    mode = "100755" if st.st_mode & 0o100 else "100644"
+    key = [st.st_size, st.st_mtime_ns, st.st_ino, st.st_mode]
+    known = memo.get(rel) if memo is not None else None
+    if known is not None and known[:4] == key:
+        fresh[rel] = known
+        return mode, known[4]
+    try:
+        with open(path, "rb") as fh:
+            oid = _blob_oid(fh.read(), algo)
+        after = os.lstat(path)
+    except OSError:
+        return _GIT_NO_MODE, ""
+    if (st.st_mtime_ns < started_ns - _DIGEST_RACY_NS
+            and [after.st_size, after.st_mtime_ns, after.st_ino, after.st_mode] == key):
+        fresh[rel] = key + [oid]
+    return mode, oid
+
+
+def _compute_code_digest(cwd: str, memo: dict | None = None,
+                         fresh: dict | None = None) -> str | None:
     """Digest of the repo's CODE state — HEAD + staged/unstaged + untracked.
 
     Returns a short hex digest, or ``None`` when git is unavailable / the repo
     has no commits (in which case the stopping heuristic stays inert and the
-    plain retry budget governs). ``git diff HEAD`` captures BOTH staged and
-    unstaged tracked changes; ``ls-files --others`` adds untracked content. The
-    task/plan data paths are excluded so ledger appends do not flip the digest.
+    plain retry budget governs). Staged and unstaged tracked changes both count
+    (the worktree is compared to HEAD, as ``git diff HEAD`` does), and so does
+    untracked content. The task/plan data paths are excluded so ledger appends
+    do not flip the digest.
+
+    ``memo`` maps a path to its last (stat, blob id) and skips re-reading files
+    whose stat matches; ``fresh`` receives the entries worth keeping for the
+    next call. Callers go through :func:`code_digest`, which persists them.
     """
-    cwd = cwd or os.getcwd()
-    head = _git(["rev-parse", "HEAD"], cwd)
-    if head is None:
+    revs = _git(["rev-parse", "--show-toplevel", "HEAD"], cwd)
+    if revs is None:
+        return None
+    # Optional locks stay on: like the ``git diff HEAD`` this replaced, status
+    # writes back a refreshed index when it can, so a stat-dirty index (after a
+    # checkout or touch) is re-read once rather than on every call.
+    out = _git(["status", "--porcelain=v2", "-z", "--untracked-files=all",
+                "--no-renames", "--", ".", *_DIGEST_EXCLUDES], cwd)
+    if out is None:
         return None
+    top, head = revs.splitlines()[:2]
+    algo = "sha256" if len(head) == 64 else "sha1"
+    fresh = {} if fresh is None else fresh
+    started_ns = time.time_ns()
     h = hashlib.sha256()
     h.update(head.encode())
-    diff = _git(["diff", "HEAD", "--", ".", *_DIGEST_EXCLUDES], cwd) or ""
-    h.update(diff.encode())
-    others = _git(["ls-files", "--others", "--exclude-standard", "--", ".",
-                   *_DIGEST_EXCLUDES], cwd) or ""
-    for rel in sorted(others.splitlines()):
-        rel = rel.strip()
-        if not rel:
+    for rel, head_mode, head_oid in sorted(_status_entries(out)):
+        mode, oid = _worktree_blob(top, rel, algo, memo, fresh, started_ns)
+        if (mode, oid) == (head_mode, head_oid):
             continue
-        h.update(rel.encode())
-        try:
-            with open(os.path.join(cwd, rel), "rb") as fh:
-                h.update(fh.read())
-        except OSError:
-            pass
+        h.update(f"\0{rel}\0{mode} {oid}".encode("utf-8", "surrogateescape"))
     return h.hexdigest()[:16]
 
 
+def _load_digest_memo(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            doc = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(doc, dict) or doc.get("version") != _DIGEST_CACHE_VERSION:
+        return {}
+    files = doc.get("files")
+    if not isinstance(files, dict):
+        return {}
+    return {rel: e for rel, e in files.items()
+            if isinstance(e, list) and len(e) == 5
+            and all(isinstance(v, int) for v in e[:4]) and isinstance(e[4], str)}
+
+
+def _save_digest_memo(path: str, files: dict) -> None:
+    _cache_store().write_cache_text(
+        path, json.dumps({"version": _DIGEST_CACHE_VERSION, "files": files}))
+
+
+def code_digest(cwd: str | None = None) -> str | None:
+    """Digest of the repo's CODE state — see :func:`_compute_code_digest`.
+
+    Rehashes only the files whose stat changed since the last call (the
+    per-file memo above); the value is always exactly what
+    ``_compute_code_digest`` returns without it.
+    """
+    cwd = cwd or os.getcwd()
+    if os.environ.get(_DIGEST_CACHE_ENV, "1") == "0":
+        return _compute_code_digest(cwd)
+    path = _digest_cache_path(cwd)
+    memo = _load_digest_memo(path)
+    fresh: dict = {}
+    digest = _compute_code_digest(cwd, memo, fresh)
+    if digest is not None and fresh != memo:
+        _save_digest_memo(path, fresh)
+    return digest
+
+
 def task_id_from_file(path: str) -> str:
     """Best-effort task id from a task filename (fallback when none is given)."""
     m = _TASK_ID_RE.match(os.path.basename(path))
@@ -2079,6 +2709,64 @@ def _parse_kv(args: list[str]) -> dict:
     return fields
 
 
+_APPEND_BATCH_USAGE = (
+    "Usage: gate_ledger.py append-batch <file> <lock-key> [--fsync never|always] "
+    "-- [--only-if-running <run-id>] <gate> <status> [k=v ...] [-- ...]\n")
+
+
+def _parse_batch_ops(args: list[str]) -> list[tuple] | None:
+    """Split ``-- op -- op ...`` into append ops; None on a malformed op."""
+    ops = []
+    groups: list[list[str]] = []
+    for a in args:
+        if a == "--":
+            groups.append([])
+        elif not groups:
+            return None
+        else:
+            groups[-1].append(a)
+    for g in groups:
+        guard = None
+        if g[:1] == ["--only-if-running"]:
+            if len(g) < 2 or not g[1]:
+                return None
+            guard, g = g[1], g[2:]
+        if len(g) < 2:
+            return None
+        ops.append((g[0], g[1], _parse_kv(g[2:]), guard))
+    return ops
+
+
+def _cli_append_batch(args: list[str]) -> int:
+    if len(args) < 2:
+        sys.stderr.write(_APPEND_BATCH_USAGE)
+        return 2
+    path, key, rest = args[0], args[1], args[2:]
+    fsync = None
+    if rest[:1] == ["--fsync"]:
+        if len(rest) < 2:
+            sys.stderr.write(_APPEND_BATCH_USAGE)
+            return 2
+        fsync, rest = rest[1], rest[2:]
+    ops = _parse_batch_ops(rest)
+    if not ops:
+        sys.stderr.write(_APPEND_BATCH_USAGE)
+        return 2
+    for _gate, status, _fields, _guard in ops:
+        if status not in VALID_STATUSES:
+            sys.stderr.write(f"Error: invalid status '{status}' (one of: {', '.join(VALID_STATUSES)})\n")
+            return 2
+    try:
+        blocks = append_batch(path, key, ops, fsync=fsync)
+    except (LedgerLockError, ValueError, OSError) as exc:
+        sys.stderr.write(f"Error: {exc}\n")
+        return 1
+    for block in blocks:
+        if block is not None:
+            sys.stdout.write(block + "\n")
+    return 0
+
+
 def main(argv: list[str]) -> int:
     if not argv:
         sys.stderr.write(__doc__ or "")
@@ -2101,6 +2789,9 @@ def main(argv: list[str]) -> int:
         sys.stdout.write(block + "\n")
         return 0
 
+    if cmd == "append-batch":
+        return _cli_append_batch(argv[1:])
+
     if cmd == "status":
         if len(argv) < 2:
             sys.stderr.write("Usage: gate_ledger.py status <file>\n")
@@ -4,9 +4,10 @@
 The headless, stateless, re-entrant engine that *runs* a task's declared gates.
 It reads the task file + ``aitasks/metadata/gates.yaml`` registry, derives the
 current per-gate state from the ledger, computes which gates are unlocked, runs
-the unlocked machine-gate verifiers (in parallel, within their retry budgets),
-observes human gates without ever self-signalling, and stops — all derived from
-the ledger, with no frontmatter writes.
+the unlocked machine-gate verifiers (dataflow-scheduled: each starts as soon as
+its own predecessors are satisfied, within their retry budgets), observes human
+gates without ever self-signalling, and stops — all derived from the ledger,
+with no frontmatter writes.
 
 This module is **Layer 1**: a pure, unit-testable engine wrapped by
 ``aitask_run_gates.sh`` (which ``ait gates run`` / ``ait gates unlocked`` and the
@@ -20,8 +21,12 @@ Design notes:
   * **Exit code is authoritative.** A verifier may append its own terminal
     block (rich body fields), but its status MUST match its exit code; on
     mismatch the engine appends an ``error`` malformed-correction (last-wins).
-  * **Appends go through ``aitask_gate.sh``** so the per-task lock + atomic
-    write are reused; the engine never writes the task file directly.
+  * **Appends take ``aitask_gate.sh``'s per-task lock, in-process**
+    (``gate_ledger.ledger_transaction``: same lock path and protocol, so the
+    engine and shell writers still serialize). The ``running`` blocks of every
+    gate admitted together share one lock acquisition and one atomic write, and
+    a terminal reconcile checks and appends under a single lock; the engine
+    never writes the task file outside a transaction.
   * **Human-gate signatures are re-validated on every observation** (t1409),
     including after a ``pass`` is already recorded: a witness signed against a
     different code state is demoted in ``_read_state`` and re-pends. Otherwise a
@@ -45,13 +50,14 @@ import os
 import re
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import gate_ledger as gl  # noqa: E402
+import gate_result_cache as grc  # noqa: E402
 
 SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-GATE_SH = os.path.join(SCRIPTS_DIR, "aitask_gate.sh")
 DEFAULT_REGISTRY = os.path.join("aitasks", "metadata", "gates.yaml")
 
 SATISFIED = gl.SATISFIED_STATUSES  # {"pass", "skip"}
@@ -250,19 +256,6 @@ def resolve_verifier(verifier: str) -> list[str] | None:
     return [verifier]
 
 
-def _gate_append(task_id: str, gate: str, status: str, *, only_if_running: str | None = None,
-                 **fields) -> None:
-    """Append a gate-run block via aitask_gate.sh (reuses its per-task lock)."""
-    cmd = [GATE_SH, "append"]
-    if only_if_running:
-        cmd += ["--only-if-running", only_if_running]
-    cmd += [task_id, gate, status]
-    for k, v in fields.items():
-        if v is not None and v != "":
-            cmd.append(f"{k}={v}")
-    subprocess.run(cmd, capture_output=True, text=True)
-
-
 def _spawn_verifier(vcmd: list[str], task_id: str, attempt: int, run_id: str,
                     timeout) -> int:
     """Run the verifier subprocess; return an exit code (3=error on failure to
@@ -277,18 +270,8 @@ def _spawn_verifier(vcmd: list[str], task_id: str, attempt: int, run_id: str,
         return 3
 
 
-def _current_run_status(file: str, run_id: str):
-    """Derive the latest status recorded for ``run_id`` (or None)."""
-    last = None
-    with open(file, encoding="utf-8") as fh:
-        for r in gl.parse_gate_run_blocks(fh.read()):
-            if r.run_id == run_id:
-                last = r.status
-    return last
-
-
 def reconcile_terminal(task_id: str, file: str, gate: str, run_id: str,
-                       exit_status: str, attempt: int, reports: list) -> None:
+                       exit_status: str, attempt: int, reports: list) -> list:
     """Make the ledger's terminal status agree with the exit code (concerns 4,6,B).
 
     The exit code is authoritative. Three cases:
@@ -298,18 +281,57 @@ def reconcile_terminal(task_id: str, file: str, gate: str, run_id: str,
       * a terminal block exists but DISAGREES → the verifier self-reported a
         status contradicting its exit code: append a fresh-run_id ``error``
         malformed-correction (last-marker-wins overrides) and report it.
+
+    The check and the append happen in ONE ledger transaction, so a verifier
+    (or anyone) appending through ``aitask_gate.sh`` cannot slip a block in
+    between them, and the file is read and written once.
+
+    Returns the terminal ``(run_id, status)`` blocks the ledger now holds for
+    this dispatch, in file order, so the scheduler can fold them into its
+    in-memory state without re-parsing the task file.
+    """
+    try:
+        with gl.ledger_transaction(file, task_id) as tx:
+            cur = tx.run_status(run_id)
+            if cur is None or cur == "running":
+                tx.append(gate, exit_status,
+                          {"run": run_id, "attempt": str(attempt), "type": "machine"},
+                          only_if_running=run_id)
+                return [(run_id, exit_status)]
+            if cur == exit_status:
+                return [(run_id, cur)]
+            note = (f"malformed: verifier reported {cur} but exit code mapped to "
+                    f"{exit_status}; treated as error")
+            # The correction's run id is what aitask_gate.sh would default to;
+            # passing it explicitly lets the caller fold the block under the
+            # same id.
+            correction = gl.iso_now()
+            tx.append(gate, "error", {"run": correction, "attempt": str(attempt),
+                                      "type": "machine", "note": note})
+            reports.append(f"  ⚠ {gate}: {note}")
+            return [(run_id, cur), (correction, "error")]
+    except (gl.LedgerLockError, OSError) as exc:
+        reports.append(f"  ⚠ {gate}: ledger append failed: {exc}")
+        return [(run_id, exit_status)]
+
+
+def _folded_run(gate: str, run_id: str, status: str, note: str | None = None):
+    """An in-memory stand-in for a block the engine just appended or observed.
+
+    Carries exactly what the scheduling predicates read — ``status``, the run id
+    and the ``stuckhash:`` note — so ``compute_unlocked`` / ``is_stuck`` answer
+    the same as they would after re-parsing the file.
     """
-    cur = _current_run_status(file, run_id)
-    if cur is None or cur == "running":
-        _gate_append(task_id, gate, exit_status, only_if_running=run_id,
-                     run=run_id, attempt=str(attempt), type="machine")
-        return
-    if cur == exit_status:
-        return
-    note = (f"malformed: verifier reported {cur} but exit code mapped to "
-            f"{exit_status}; treated as error")
-    _gate_append(task_id, gate, "error", attempt=str(attempt), type="machine", note=note)
-    reports.append(f"  ⚠ {gate}: {note}")
+    return gl.GateRun(name=gate, icon=gl.ICONS.get(status, "⚠"),
+                      fields={"run": run_id, "status": status},
+                      body_fields={"note": note} if note else {})
+
+
+def _record_timing(timings: list | None, gate: str, attempt: int,
+                   queued_at: float | None, started: float) -> None:
+    if timings is not None:
+        queued = started - queued_at if queued_at is not None else 0.0
+        timings.append((gate, attempt, queued, time.monotonic() - started))
 
 
 # --- the engine -----------------------------------------------------------
@@ -323,6 +345,14 @@ class Engine:
         self.max_parallel = max(1, min(max_parallel, os.cpu_count() or 1))
         self.reports = reports
         self.digest = code_digest()
+        # Opt-in verifier result cache (``cache: true`` gates only); loading it
+        # is skipped entirely when no gate asks for it.
+        self.cache = (grc.GateResultCache.for_project()
+                      if any(m.get("cache") for m in self.registry.values())
+                      else None)
+        # Gates whose verifier did not resolve this run: closed with one
+        # ``error`` and never re-opened by a later round or pass.
+        self._unresolved: set[str] = set()
 
     def _read_state(self):
         with open(self.file, encoding="utf-8") as fh:
@@ -350,24 +380,98 @@ class Engine:
                                                self.task_id, self.digest)
         return active, state, _runs_by_gate(runs)
 
-    def _run_machine_gate(self, gate: str, runs_by_gate: dict) -> None:
-        meta = self.registry.get(gate, {})
+    def _run_machine_gate(self, gate: str, runs_by_gate: dict,
+                          use_cache: bool = True) -> list:
         # Budget slot k of max_retries+1, deliberately NOT gl.next_attempt (the
-        # ledger ordinal) — line 359 reports this number alongside the budget, so
-        # it must stay the budget's own count. See gl.next_attempt (t1262).
+        # ledger ordinal) — the report line names this number alongside the
+        # budget, so it must stay the budget's own count. See gl.next_attempt
+        # (t1262).
         attempt = _attempts_used(runs_by_gate.get(gate, [])) + 1
+        return self._execute_machine_gate(gate, attempt, use_cache=use_cache)
+
+    def _cache_key(self, gate: str, meta: dict, vcmd) -> str | None:
+        if self.cache is None or not meta.get("cache") or vcmd is None:
+            return None
+        return grc.cache_key(gate, vcmd, self.digest, meta.get("cache_env") or ())
+
+    def _append(self, *ops) -> list:
+        """Write ``ops`` — ``(gate, status, fields)`` — under one lock
+        acquisition and one rewrite of the task file (see
+        :func:`gate_ledger.ledger_transaction`). A lock or I/O failure is
+        reported, not raised: the authoritative re-read in ``_run`` then sees
+        what the ledger really holds."""
+        try:
+            return gl.append_batch(self.file, self.task_id, ops)
+        except (gl.LedgerLockError, OSError) as exc:
+            self.reports.append(f"  ⚠ ledger append failed: {exc}")
+            return [None] * len(ops)
+
+    def _open_attempt(self, gate: str, attempt: int, use_cache: bool = True):
+        """Plan how one attempt opens, without writing anything.
+
+        Returns ``(op, folded, job)``: the ledger op to append, its in-memory
+        stand-in, and the verifier job to run once the op is written — None
+        when there is nothing to run. A ``cache: true`` gate whose verdict is
+        cached for the current code digest opens (and closes) with one ``pass``
+        citing the original run; ``use_cache=False`` (``--gate``) skips the
+        lookup but still records a fresh pass. A verifier that does not
+        resolve closes the attempt with one ``error`` naming it. Everything else
+        opens with a ``running`` block carrying the ``stuckhash:`` note.
+        """
+        meta = self.registry.get(gate, {})
         run_id = f"{gl.iso_now()}-{gate}-a{attempt}"
-        note = f"stuckhash:{self.digest}" if self.digest else None
-        _gate_append(self.task_id, gate, "running", run=run_id, attempt=str(attempt),
-                     type="machine", verifier=meta.get("verifier", ""), note=note)
         vcmd = resolve_verifier(meta.get("verifier", ""))
+        key = self._cache_key(gate, meta, vcmd)
+        hit = self.cache.lookup(key) if use_cache and key else None
+        fields = {"run": run_id, "attempt": str(attempt), "type": "machine",
+                  "verifier": meta.get("verifier", "")}
+        if hit is not None:
+            note = (f"cached: reuses pass of run {hit['run']} (t{hit['task']}) "
+                    f"at code {self.digest}")
+            self.reports.append(f"  {gate}: pass (attempt {attempt}, cached from "
+                                f"run {hit['run']})")
+            return ((gate, "pass", {**fields, "note": note}),
+                    _folded_run(gate, run_id, "pass", note), None)
         if vcmd is None:
-            return
+            # A bare ``running`` would leave the gate eligible, and every round
+            # would open another one; a terminal error takes it off the ready set.
+            self._unresolved.add(gate)
+            note = f"verifier {meta.get('verifier', '')!r} could not be resolved"
+            self.reports.append(f"  {gate}: error (attempt {attempt}): {note}")
+            return ((gate, "error", {**fields, "note": note}),
+                    _folded_run(gate, run_id, "error", note), None)
+        note = f"stuckhash:{self.digest}" if self.digest else None
+        return ((gate, "running", {**fields, "note": note}),
+                _folded_run(gate, run_id, "running", note),
+                (gate, attempt, run_id, vcmd, key, meta))
+
+    def _run_attempt(self, job, timings: list | None = None,
+                     queued_at: float | None = None) -> list:
+        """Run an opened attempt's verifier and reconcile it; return the
+        terminal stand-ins for the caller to fold (see :meth:`_fold`).
+
+        Thread-safe: touches no shared engine state except ``reports`` /
+        ``timings`` appends and the (locked) result cache.
+        """
+        started = time.monotonic()
+        gate, attempt, run_id, vcmd, key, meta = job
         code = _spawn_verifier(vcmd, self.task_id, attempt, run_id,
                                meta.get("timeout_seconds"))
         status = map_exit(code, meta.get("type", "machine"))
-        reconcile_terminal(self.task_id, self.file, gate, run_id, status, attempt, self.reports)
+        terminal = reconcile_terminal(self.task_id, self.file, gate, run_id, status,
+                                      attempt, self.reports)
+        if key and terminal[-1] == (run_id, "pass"):
+            self.cache.store(key, gate, run_id, self.task_id, self.digest)
         self.reports.append(f"  {gate}: {status} (attempt {attempt})")
+        _record_timing(timings, gate, attempt, queued_at, started)
+        return [_folded_run(gate, rid, st) for rid, st in terminal]
+
+    def _execute_machine_gate(self, gate: str, attempt: int,
+                              use_cache: bool = True) -> list:
+        """Open, run and reconcile one attempt; return every block it produced."""
+        op, folded, job = self._open_attempt(gate, attempt, use_cache)
+        self._append(op)
+        return [folded] + (self._run_attempt(job) if job is not None else [])
 
     def _signal_state(self, gate: str) -> tuple[str, str | None]:
         """Classify this gate's signal witness — see :func:`gate_ledger.witness_state`,
@@ -375,34 +479,79 @@ class Engine:
         both this engine and the read-side archival guard."""
         return gl.witness_state(gate, self.registry, self.task_id, self.digest)
 
-    def _handle_human(self, gate: str, state: dict) -> bool:
+    def _handle_human(self, gate: str, state: dict) -> str | None:
         """Read-side only: pass if a CURRENT signal is present, else pending.
         NEVER self-signals. A witness code-bound to a different state (``stale``)
-        is not honored — it re-pends with a note so the human re-signs (t635_15)."""
+        is not honored — it re-pends with a note so the human re-signs (t635_15).
+
+        Returns the status appended (``pass`` / ``pending``), or None when the
+        ledger already said ``pending`` and nothing was written."""
         kind, recorded = self._signal_state(gate)
         if kind in ("fresh", "unstamped"):
             note = f"signed_digest:{recorded}" if recorded else None
-            _gate_append(self.task_id, gate, "pass", type="human", note=note)
+            self._append((gate, "pass", {"type": "human", "note": note}))
             self.reports.append(f"  {gate}: pass (human signal observed)")
-            return True
+            return "pass"
         cur = state.get(gate)
         if kind == "stale":
             note = (f"stale signature: signed against {recorded}, code now "
                     f"{self.digest} — re-sign with 'ait gate pass'")
             if cur is None or cur.status != "pending":
-                _gate_append(self.task_id, gate, "pending", type="human", note=note)
+                self._append((gate, "pending", {"type": "human", "note": note}))
                 self.reports.append(f"  {gate}: pending — {note}")
-                return True
+                return "pending"
             self.reports.append(f"  {gate}: pending — {note}")
-            return False
+            return None
         # absent
         if cur is None or cur.status != "pending":
-            _gate_append(self.task_id, gate, "pending", type="human")
+            self._append((gate, "pending", {"type": "human"}))
             self.reports.append(f"  {gate}: pending — awaiting human signal")
-            return True
-        return False
+            return "pending"
+        return None
+
+    def _machine_runnable(self, gate: str, runs_by_gate: dict) -> bool:
+        meta = self.registry.get(gate, {})
+        return (meta.get("type") == "machine"
+                and meta.get("kind") != "procedure"
+                and bool(meta.get("verifier"))
+                and gate not in self._unresolved
+                and not is_stuck(runs_by_gate.get(gate, []), self.digest))
+
+    @staticmethod
+    def _fold(state: dict, runs_by_gate: dict, blocks: list) -> None:
+        """Apply just-written blocks to the derived view, last-marker-wins —
+        the same derivation ``_read_state`` performs over the whole file."""
+        for r in blocks:
+            runs_by_gate.setdefault(r.name, []).append(r)
+            state[r.name] = r
 
     def run(self, gate=None, dry_run=False) -> int:
+        before = gl.writer_stats()
+        try:
+            rc = self._run(gate, dry_run)
+        finally:
+            if self.cache is not None:
+                self.cache.save()
+        self._report_ledger_stats(before)
+        return rc
+
+    def _report_ledger_stats(self, before: dict) -> None:
+        """One line on what the ledger writes cost: blocks vs. rewrites of the
+        task file, and how long appends waited on the per-task lock (another
+        writer — a verifier, ``ait gate``, a second engine — holding it).
+
+        The counters are process-wide; the delta is this run's share unless
+        several engines run in one process at once."""
+        now = gl.writer_stats()
+        d = {k: now[k] - before[k] for k in now if k != "lock_wait_max_s"}
+        if not d["transactions"]:
+            return
+        self.reports.append(
+            f"Ledger: {d['blocks']} block(s) in {d['writes']} write(s); lock "
+            f"waited {d['lock_wait_s']:.2f}s ({d['lock_contended']} of "
+            f"{d['transactions']} acquisitions contended)")
+
+    def _run(self, gate=None, dry_run=False) -> int:
         # `active` is the enforced set (t635_33). An empty set — no gates, an
         # opt-out, or a fully profile-filtered task — prints the same sentinel
         # line SKILL.md Step 9 branches on for the legacy inline fallback.
@@ -413,12 +562,17 @@ class Engine:
         if gate is not None:
             return self._force_one(gate)
         # Safety backstop only — the real terminators are the empty-unlocked
-        # return and the no-progress break. Sized for the worst case: every
-        # gate's full retry budget plus the unlock-chain depth.
+        # return and the no-progress break. Each pass of `_dispatch` already
+        # runs every gate it can to completion, so the loop normally settles in
+        # two passes; sized as before for the worst case anyway.
         total_budget = sum((self.registry.get(g, {}).get("max_retries", 0) or 0) + 1
                            for g in active)
-        for _ in range(total_budget + len(active) + 2):
-            active, state, runs_by_gate = self._read_state()
+        for n in range(total_budget + len(active) + 2):
+            if n:
+                # Authoritative re-read after a dispatch pass: picks up anything
+                # the in-memory fold cannot see (an only-if-running append that
+                # lost a race, a signal recorded while we ran).
+                active, state, runs_by_gate = self._read_state()
             if all(_satisfied(state, g) for g in active):
                 self.reports.append("All gates satisfied. Task ready for archive "
                                     "(suggest status: Done — not auto-applied).")
@@ -431,11 +585,7 @@ class Engine:
                             f"  {g}: " + blocked_reason(g, active, self.registry,
                                                         state, runs_by_gate, self.digest))
                 return 0
-            machine = [g for g in unlocked
-                       if self.registry.get(g, {}).get("type") == "machine"
-                       and self.registry.get(g, {}).get("kind") != "procedure"
-                       and self.registry.get(g, {}).get("verifier")
-                       and not is_stuck(runs_by_gate.get(g, []), self.digest)]
+            machine = [g for g in unlocked if self._machine_runnable(g, runs_by_gate)]
             human = [g for g in unlocked if self.registry.get(g, {}).get("type") == "human"]
             if dry_run:
                 self.reports.append("Dry run — would dispatch:")
@@ -451,19 +601,85 @@ class Engine:
                         f"  {g}: " + blocked_reason(g, active, self.registry,
                                                     state, runs_by_gate, self.digest))
                 return 0
-            changed = False
-            if machine:
-                workers = min(self.max_parallel, len(machine))
-                with ThreadPoolExecutor(max_workers=workers) as ex:
-                    list(ex.map(lambda g: self._run_machine_gate(g, runs_by_gate), machine))
-                changed = True
-            for g in human:
-                if self._handle_human(g, state):
-                    changed = True
-            if not changed:
+            if not self._dispatch(active, state, runs_by_gate, total_budget):
                 break
         return 0
 
+    def _dispatch(self, active: list[str], state: dict, runs_by_gate: dict,
+                  budget: int) -> bool:
+        """Dataflow pass: run every gate as soon as ITS predecessors are satisfied.
+
+        There are no wave barriers. A gate is submitted to one shared pool of
+        ``max_parallel`` workers the moment ``compute_unlocked`` admits it; each
+        completion is folded into ``state`` / ``runs_by_gate`` in memory and the
+        unlocked set recomputed at once, so a successor (or a retry) starts while
+        unrelated slow gates are still running. The opening blocks of every gate
+        admitted in one round are written as one ledger batch before their
+        verifiers start. Human gates are observed once per pass.
+
+        Every machine dispatch folds a terminal status, which either satisfies
+        the gate or consumes an attempt, so the pass ends within the gates'
+        combined retry budget; ``budget`` caps dispatches regardless.
+
+        Reports per-attempt queue latency (unlocked → a worker picked it up) and
+        run latency. Returns True when anything was dispatched or appended.
+        """
+        changed = False
+        observed: set[str] = set()
+        in_flight: dict = {}   # future -> gate
+        timings: list = []
+        dispatched = 0
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as ex:
+            while True:
+                progressed = False
+                busy = set(in_flight.values())
+                opened = []
+                for g in compute_unlocked(active, self.registry, state, runs_by_gate):
+                    if g in busy:
+                        continue
+                    if self.registry.get(g, {}).get("type") == "human":
+                        if g in observed:
+                            continue
+                        observed.add(g)
+                        status = self._handle_human(g, state)
+                        if status:
+                            changed = progressed = True
+                            self._fold(state, runs_by_gate,
+                                       [_folded_run(g, gl.iso_now(), status)])
+                        continue
+                    if dispatched >= budget or not self._machine_runnable(g, runs_by_gate):
+                        continue
+                    attempt = _attempts_used(runs_by_gate.get(g, [])) + 1
+                    opened.append((attempt, time.monotonic(), *self._open_attempt(g, attempt)))
+                    dispatched += 1
+                    changed = True
+                if opened:
+                    self._append(*(op for _, _, op, _, _ in opened))
+                    for attempt, queued_at, _op, folded, job in opened:
+                        self._fold(state, runs_by_gate, [folded])
+                        if job is None:
+                            # Closed already (a cache hit) — or nothing to run.
+                            _record_timing(timings, folded.name, attempt, queued_at,
+                                           time.monotonic())
+                            progressed = True
+                            continue
+                        fut = ex.submit(self._run_attempt, job, timings, queued_at)
+                        in_flight[fut] = folded.name
+                if progressed:
+                    continue   # a human pass / cache hit may have unlocked successors
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    del in_flight[fut]
+                    self._fold(state, runs_by_gate, fut.result())
+        if timings:
+            self.reports.append("Gate timing (queued / ran):")
+            for g, attempt, queued, ran in timings:
+                self.reports.append(f"  {g} (attempt {attempt}): "
+                                    f"{queued:.2f}s / {ran:.2f}s")
+        return changed
+
     def _force_one(self, gate: str) -> int:
         """`--gate`: force-run one gate, overriding skip-already-passed + budget,
         but only when its predecessors are satisfied (concern 7)."""
@@ -480,7 +696,7 @@ class Engine:
         if meta.get("type") == "human":
             self._handle_human(gate, state)
         elif meta.get("verifier"):
-            self._run_machine_gate(gate, runs_by_gate)
+            self._run_machine_gate(gate, runs_by_gate, use_cache=False)
         else:
             self.reports.append(f"{gate}: no verifier configured — nothing to run")
         return 0
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""gate_result_cache.py - content-addressed verifier result cache for the gate engine.
+
+``gate_orchestrator`` spawns a machine gate's verifier from scratch on every
+dispatch, even when the very same gate already passed against the very same
+code — several child tasks sharing one worktree state, or a task re-gated
+after a frontmatter-only edit (task files are outside ``code_digest``).
+
+A gate that opts in with ``cache: true`` in ``gates.yaml`` has each PASS
+recorded here under a key built from:
+
+* the gate name;
+* the resolved verifier command, plus the SHA-1 of the verifier script's bytes
+  when it is a file (a verifier outside the repo is not covered by the code
+  digest);
+* ``gate_ledger.code_digest()`` — HEAD + staged/unstaged + untracked code;
+* the values of the environment variables the gate lists in ``cache_env``.
+
+On a hit the engine appends a ``pass`` block whose note cites the original run
+id and task instead of running the verifier. Only passes are cached: a fail is
+cheap to re-confirm and the retry budget / stopping heuristic own that path.
+Without a code digest (git absent) nothing is cached.
+
+Eviction happens on save: entries unused for ``AIT_GATE_CACHE_TTL_DAYS``
+(default 30) are dropped, then the least recently used beyond
+``AIT_GATE_CACHE_MAX_ENTRIES`` (default 512). Hit / miss / store / eviction
+counters are kept for ``ait gates cache stats``.
+
+Persistence is one JSON file per working directory (the same scope as
+``code_digest``) under ``${XDG_CACHE_HOME:-~/.cache}/ait/gates/``, written
+atomically and merged with what other engine processes wrote in the
+meantime. It is a cache, never a source of truth: a missing, corrupt or
+version-mismatched file is discarded, and ``AIT_GATE_CACHE=0`` turns it off
+(no lookups, no stores).
+
+Stdlib only (mirrors ``gate_ledger.py``).
+
+CLI:
+    gate_result_cache.py stats [--json]
+    gate_result_cache.py clear
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cache_store import dir_cache_path, write_cache_text  # noqa: E402
+
+# Bump whenever the key recipe or the entry layout changes, so entries written
+# by older code are discarded wholesale.
+GATE_CACHE_VERSION = 1
+
+_ENV_DISABLE = "AIT_GATE_CACHE"
+_ENV_MAX_ENTRIES = "AIT_GATE_CACHE_MAX_ENTRIES"
+_ENV_TTL_DAYS = "AIT_GATE_CACHE_TTL_DAYS"
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_DAYS = 30
+
+_COUNTERS = ("hits", "misses", "stores", "evictions")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.environ.get(name, "")))
+    except ValueError:
+        return default
+
+
+def enabled() -> bool:
+    return os.environ.get(_ENV_DISABLE, "1") != "0"
+
+
+def default_cache_path(project_root: str | None = None) -> Path:
+    """The persisted cache file for ``project_root`` (one per resolved dir)."""
+    return dir_cache_path("gates", project_root or os.getcwd())
+
+
+def _file_sha1(path: str) -> str:
+    h = hashlib.sha1()
+    try:
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                h.update(chunk)
+    except OSError:
+        return ""
+    return h.hexdigest()
+
+
+def cache_key(gate: str, vcmd: list[str], digest: str | None,
+              env_names=(), environ=None) -> str | None:
+    """Content key for one gate's verdict, or None when uncacheable (no digest)."""
+    if not digest or not vcmd:
+        return None
+    environ = os.environ if environ is None else environ
+    h = hashlib.sha256()
+    for part in (str(GATE_CACHE_VERSION), gate, "\0".join(vcmd),
+                 _file_sha1(vcmd[0]) if os.path.isfile(vcmd[0]) else "", digest):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    for name in sorted(set(env_names)):
+        # An unset variable and an empty one are different environments.
+        value = environ.get(name)
+        h.update(f"{name}\0{'' if value is None else '=' + value}\x1f".encode("utf-8"))
+    return h.hexdigest()
+
+
+class GateResultCache:
+    """Key -> recorded passing run, persisted as JSON. Thread-safe.
+
+    Entry layout: ``{"gate", "run", "task", "digest", "stored", "used",
+    "hits"}`` — ``run`` / ``task`` are what a cache-hit ledger block cites.
+    """
+
+    def __init__(self, path: Path | None = None, persist: bool = True,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: float = DEFAULT_TTL_DAYS * 86400, clock=time.time):
+        self._path = path
+        self._persist = persist and path is not None
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._counters = dict.fromkeys(_COUNTERS, 0)
+        # Counter increments and touched keys since load, for the merge on save.
+        self._delta = dict.fromkeys(_COUNTERS, 0)
+        self._touched: set[str] = set()
+        self._dirty = False
+        if self._persist:
+            self._entries, self._counters = self._load()
+
+    @classmethod
+    def for_project(cls, project_root: str | None = None) -> "GateResultCache":
+        return cls(default_cache_path(project_root), persist=enabled(),
+                   max_entries=_env_int(_ENV_MAX_ENTRIES, DEFAULT_MAX_ENTRIES),
+                   ttl_seconds=_env_int(_ENV_TTL_DAYS, DEFAULT_TTL_DAYS) * 86400)
+
+    def _load(self) -> tuple[dict, dict]:
+        entries: dict[str, dict] = {}
+        counters = dict.fromkeys(_COUNTERS, 0)
+        try:
+            with open(self._path, "r", encoding="utf-8") as fh:
+                doc = json.load(fh)
+        except (OSError, ValueError):
+            return entries, counters
+        if not isinstance(doc, dict) or doc.get("version") != GATE_CACHE_VERSION:
+            return entries, counters
+        raw = doc.get("entries")
+        if isinstance(raw, dict):
+            for key, entry in raw.items():
+                if (isinstance(entry, dict)
+                        and all(isinstance(entry.get(k), str)
+                                for k in ("gate", "run", "task", "digest"))
+                        and all(isinstance(entry.get(k), (int, float))
+                                for k in ("stored", "used", "hits"))):
+                    entries[key] = entry
+        raw = doc.get("counters")
+        if isinstance(raw, dict):
+            for name in _COUNTERS:
+                if isinstance(raw.get(name), int):
+                    counters[name] = raw[name]
+        return entries, counters
+
+    def _count(self, name: str, n: int = 1) -> None:
+        self._counters[name] += n
+        self._delta[name] += n
+        self._dirty = True
+
+    def _expired(self, entry: dict, now: float) -> bool:
+        return bool(self.ttl_seconds) and now - entry["used"] > self.ttl_seconds
+
+    # --- lookups / stores ---
+
+    def lookup(self, key: str | None) -> dict | None:
+        """The recorded passing run for ``key`` (a copy), or None on a miss."""
+        if key is None or not self._persist:
+            return None
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry, now):
+                self._count("misses")
+                return None
+            entry["used"] = now
+            entry["hits"] += 1
+            self._touched.add(key)
+            self._count("hits")
+            return dict(entry)
+
+    def store(self, key: str | None, gate: str, run_id: str, task_id: str,
+              digest: str) -> None:
+        if key is None or not self._persist:
+            return
+        with self._lock:
+            now = self._clock()
+            self._entries[key] = {"gate": gate, "run": run_id, "task": task_id,
+                                  "digest": digest, "stored": now, "used": now,
+                                  "hits": 0}
+            self._touched.add(key)
+            self._count("stores")
+
+    def clear(self) -> int:
+        """Drop every entry and counter; returns the number of entries dropped."""
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries = {}
+            self._counters = dict.fromkeys(_COUNTERS, 0)
+            self._delta = dict.fromkeys(_COUNTERS, 0)
+            self._touched = set()
+            self._dirty = True
+            self._write()
+            return dropped
+
+    # --- persistence ---
+
+    def _evict(self, entries: dict, now: float) -> int:
+        doomed = [k for k, e in entries.items() if self._expired(e, now)]
+        for key in doomed:
+            del entries[key]
+        overflow = len(entries) - self.max_entries
+        if overflow > 0:
+            by_age = sorted(entries, key=lambda k: entries[k]["used"])
+            for key in by_age[:overflow]:
+                del entries[key]
+            return len(doomed) + overflow
+        return len(doomed)
+
+    def _write(self) -> bool:
+        doc = {"version": GATE_CACHE_VERSION, "counters": self._counters,
+               "entries": self._entries}
+        if not write_cache_text(self._path, json.dumps(doc, separators=(",", ":"))):
+            return False
+        self._dirty = False
+        return True
+
+    def save(self) -> bool:
+        """Merge with the file as it is NOW, evict, persist. Never raises.
+
+        Another engine process may have stored results since we loaded: their
+        entries are kept, ours win for the keys this process touched, and
+        counters are re-based on the file's plus our increments.
+        """
+        if not self._persist:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            disk_entries, disk_counters = self._load()
+            for key in self._touched:
+                if key in self._entries:
+                    disk_entries[key] = self._entries[key]
+            counters = {n: disk_counters[n] + self._delta[n] for n in _COUNTERS}
+            evicted = self._evict(disk_entries, self._clock())
+            counters["evictions"] += evicted
+            self._entries, self._counters = disk_entries, counters
+            self._delta = dict.fromkeys(_COUNTERS, 0)
+            self._touched = set()
+            return self._write()
+
+    # --- reporting ---
+
+    def stats(self) -> dict:
+        with self._lock:
+            per_gate: dict[str, dict] = {}
+            for entry in self._entries.values():
+                g = per_gate.setdefault(entry["gate"], {"entries": 0, "hits": 0})
+                g["entries"] += 1
+                g["hits"] += int(entry["hits"])
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                "path": str(self._path) if self._path else "",
+                "enabled": self._persist,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_days": self.ttl_seconds / 86400,
+                **self._counters,
+                "hit_rate": (self._counters["hits"] / lookups) if lookups else 0.0,
+                "gates": dict(sorted(per_gate.items())),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def format_stats(st: dict) -> list[str]:
+    """Human-readable ``ait gates cache stats`` lines."""
+    if not st["enabled"]:
+        return [f"Gate result cache: disabled ({_ENV_DISABLE}=0)"]
+    lines = [
+        f"Gate result cache: {st['path']}",
+        f"  entries:   {st['entries']} (max {st['max_entries']}, "
+        f"expire after {st['ttl_days']:g} days unused)",
+        f"  lookups:   {st['hits']} hits, {st['misses']} misses "
+        f"({st['hit_rate'] * 100:.0f}% hit rate)",
+        f"  stored:    {st['stores']} passes, {st['evictions']} evicted",
+    ]
+    if st["gates"]:
+        width = max(len(g) for g in st["gates"])
+        lines.append("  per gate:")
+        for gate, g in st["gates"].items():
+            lines.append(f"    {gate:<{width}}  {g['entries']} entries, {g['hits']} hits")
+    return lines
+
+
+def main(argv: list[str]) -> int:
+    cmd = argv[0] if argv else ""
+    if cmd == "stats":
+        st = GateResultCache.for_project().stats()
+        if "--json" in argv[1:]:
+            sys.stdout.write(json.dumps(st, indent=2) + "\n")
+        else:
+            sys.stdout.write("\n".join(format_stats(st)) + "\n")
+        return 0
+    if cmd == "clear":
+        cache = GateResultCache.for_project()
+        if not enabled():
+            sys.stdout.write(f"Gate result cache disabled ({_ENV_DISABLE}=0); nothing to clear.\n")
+            return 0
+        sys.stdout.write(f"Cleared {cache.clear()} cached gate result(s).\n")
+        return 0
+    sys.stderr.write(__doc__ or "")
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
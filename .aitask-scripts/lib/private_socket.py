@@ -0,0 +1,50 @@
+"""private_socket.py - ownership checks for the per-user Unix-socket services.
+
+The monitor snapshot service (``monitor/snapshot_service.py``) and the TUI
+zygote (``lib/tui_zygote.py``) listen on a socket under
+``${XDG_RUNTIME_DIR:-/tmp}/aitasks-…-<uid>/``, and what crosses it is private:
+pane contents one way, a launcher's whole environment and its terminal fds the
+other. With the ``/tmp`` fallback the directory name is guessable, so another
+local user could create it first (or plant a symlink there) and receive every
+connection. Both ends therefore check:
+
+* :func:`private_dir` — before binding or connecting: the directory (created
+  ``0700`` when missing) is a real directory, not a symlink, owned by us, with
+  no group/other permission bits;
+* :func:`peer_uid` — on an accepted or connected socket: the uid of the process
+  at the other end (``SO_PEERCRED``), so a server refuses foreign clients and a
+  client refuses a foreign server.
+
+Stdlib only.
+"""
+from __future__ import annotations
+
+import os
+import socket
+import stat
+import struct
+
+
+def private_dir(path: str) -> bool:
+    """Create ``path`` 0700 if needed; False unless it is ours and private."""
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid()
+            and not st.st_mode & 0o077)
+
+
+def peer_uid(sock) -> int | None:
+    """Uid of the process at the other end of a Unix socket, or None when the
+    platform cannot say (no ``SO_PEERCRED``) or the query fails."""
+    if sock is None or not hasattr(socket, "SO_PEERCRED"):
+        return None
+    try:
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                                struct.calcsize("3i"))
+    except OSError:
+        return None
+    # struct ucred is (pid, uid, gid).
+    return struct.unpack("3i", creds)[1]
@@ -0,0 +1,123 @@
+"""stats_cache.py - persisted per-bundle task records for ``stats_data``.
+
+``collect_stats`` used to rebuild every Counter from scratch on each ``ait
+stats`` / stats-TUI launch, re-decoding every numbered archive bundle and
+re-parsing every archived task in it. Archived tasks never change, so all but
+the newest bundle's work was repeated on every run.
+
+This module keeps, per bundle, the compact TIME-INDEPENDENT records
+``stats_data`` extracts from each task (completion date, labels, issue type,
+raw ``implemented_with``, phase spans). Everything relative to "today" — the
+7d / 30d totals, week offsets, this-week DOW buckets — and everything derived
+from project metadata (the codeagent / model normalisation, which follows the
+``models_*.json`` files) is recomputed from the records on every run, so a
+cached record can never go stale by the calendar moving on.
+
+KEYED BY CONTENT DIGEST. A bundle's key is the SHA-1 of its bytes, not its
+path or mtime: bundles are git-tracked, so a fresh clone, a checkout or a
+rebase rewrites every mtime without changing a byte, and a re-packed bundle
+(``aitask_zip_old.sh unpack``) changes content under the same path. Hashing a
+compressed bundle is a small fraction of decoding it. Digests not seen in a
+run are pruned on save.
+
+Persistence is one JSON file per archive directory under
+``${XDG_CACHE_HOME:-~/.cache}/ait/stats/``, written atomically and only when
+something changed. Like the frontmatter index it is a cache, never a source of
+truth: a missing, corrupt or version-mismatched file is discarded, and
+``AIT_STATS_CACHE=0`` turns persistence off.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from cache_store import dir_cache_path, write_cache_text
+
+# Bump whenever stats_data's record layout or extraction rules change, so
+# records extracted by older code are discarded wholesale.
+STATS_CACHE_VERSION = 1
+
+_ENV_DISABLE = "AIT_STATS_CACHE"
+
+
+def default_cache_path(archive_dir: Path) -> Path:
+    """The persisted cache file for ``archive_dir`` (one per resolved dir)."""
+    return dir_cache_path("stats", archive_dir)
+
+
+def bundle_digest(path: Path) -> Optional[str]:
+    """SHA-1 of a bundle's bytes, or ``None`` when it cannot be read."""
+    h = hashlib.sha1()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+class StatsCache:
+    """Bundle digest -> list of stats records, persisted as JSON."""
+
+    def __init__(self, path: Optional[Path] = None, persist: bool = True):
+        self._path = path
+        self._persist = persist and path is not None
+        self._bundles: Dict[str, List[list]] = {}
+        self._dirty = False
+        if self._persist:
+            self._load()
+
+    @classmethod
+    def for_archive_dir(cls, archive_dir: Path) -> "StatsCache":
+        persist = os.environ.get(_ENV_DISABLE, "1") != "0"
+        return cls(default_cache_path(archive_dir), persist=persist)
+
+    def _load(self) -> None:
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(doc, dict) or doc.get("version") != STATS_CACHE_VERSION:
+            return
+        bundles = doc.get("bundles")
+        if not isinstance(bundles, dict):
+            return
+        for digest, records in bundles.items():
+            if isinstance(records, list) and all(isinstance(r, list) for r in records):
+                self._bundles[digest] = records
+
+    def get(self, digest: Optional[str]) -> Optional[List[list]]:
+        if digest is None:
+            return None
+        return self._bundles.get(digest)
+
+    def put(self, digest: str, records: List[list]) -> None:
+        self._bundles[digest] = records
+        self._dirty = True
+
+    def save(self, live_digests: Iterable[str]) -> bool:
+        """Persist, keeping only ``live_digests``. Never raises.
+
+        Returns True when a file was written.
+        """
+        if not self._persist:
+            return False
+        live = set(live_digests)
+        stale = [d for d in self._bundles if d not in live]
+        for digest in stale:
+            del self._bundles[digest]
+        if not (self._dirty or stale):
+            return False
+        self._dirty = False
+        text = json.dumps({"version": STATS_CACHE_VERSION,
+                           "bundles": self._bundles}, separators=(",", ":"))
+        return write_cache_text(self._path, text)
+
+    def __len__(self) -> int:
+        return len(self._bundles)
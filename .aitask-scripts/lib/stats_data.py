@@ -28,8 +28,14 @@ from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 _LIB_DIR = os.path.dirname(os.path.abspath(__file__))
 if _LIB_DIR not in sys.path:
     sys.path.insert(0, _LIB_DIR)
-from archive_iter import iter_all_archived_markdown  # noqa: E402
+from archive_iter import (  # noqa: E402
+    iter_all_archived_markdown,
+    iter_archive_bundles,
+    iter_loose_archived_markdown,
+    numbered_archive_paths,
+)
 from config_utils import task_dir as _config_task_dir  # noqa: E402
+from stats_cache import StatsCache, bundle_digest  # noqa: E402
 
 # Shared gate-ledger parser (t635_8). Content-level primitives only — the active
 # scan must never open a path (it operates on the content it already read), so it
@@ -958,21 +964,92 @@ def _span_hours(runs: dict, start_gate: str, end_gate: str) -> Optional[float]:
     return delta if delta >= 0 else None
 
 
+def _phase_spans(content: str) -> Tuple[Optional[float], Optional[float]]:
+    """This task's (implement, review->merge) span samples, ledger stamps only."""
+    if not has_gate_markers(content):
+        return None, None
+    runs = derive_gate_runs(content)
+    return (_span_hours(runs, "plan_approved", "review_approved"),
+            _span_hours(runs, "review_approved", "merge_approved"))
+
+
 def _accumulate_phase_timings(
     content: str, implement_hours: List[float], review_merge_hours: List[float]
 ) -> None:
     """Append this task's phase-span samples (t635_20 D-3), ledger stamps only."""
-    if not has_gate_markers(content):
-        return
-    runs = derive_gate_runs(content)
-    imp = _span_hours(runs, "plan_approved", "review_approved")
+    imp, rm = _phase_spans(content)
     if imp is not None:
         implement_hours.append(imp)
-    rm = _span_hours(runs, "review_approved", "merge_approved")
     if rm is not None:
         review_merge_hours.append(rm)
 
 
+# --- Archived task records (the unit lib/stats_cache.py persists) ---
+#
+# One flat JSON-safe list per counted task, holding only what does not depend
+# on "today" or on project metadata:
+#   [filename, completed_iso, issue_type, labels, implemented_with_raw,
+#    implement_hours, review_merge_hours]
+# Changing this layout or what goes into it requires bumping
+# stats_cache.STATS_CACHE_VERSION.
+
+def _extract_record(filename: str, content: str) -> Optional[list]:
+    frontmatter = parse_frontmatter(content)
+    completed = resolve_completion_date(content, frontmatter)
+    if completed is None:
+        return None
+    implement, review_merge = _phase_spans(content)
+    return [
+        filename,
+        completed.isoformat(),
+        frontmatter.get("issue_type") or "feature",
+        parse_labels(frontmatter.get("labels")),
+        frontmatter.get("implemented_with"),
+        implement,
+        review_merge,
+    ]
+
+
+def _extract_records(entries: Iterable[Tuple[str, str]]) -> List[list]:
+    records = []
+    for filename, content in entries:
+        record = _extract_record(filename, content)
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def iter_archived_records(project_root: Optional[Path] = None) -> Iterable[list]:
+    """Records for every archived task, in ``iter_archived_markdown_files`` order.
+
+    Loose files are always re-read (they are few, and about to be bundled).
+    Numbered bundles are served from the persisted per-bundle cache when their
+    content digest is known; only new or changed bundles are decoded — on the
+    archive_iter pool — and their records stored. A bundle that failed to
+    decode, or changed while it was being read, contributes whatever it
+    yielded but is not cached.
+    """
+    _, archive_dir, _ = _paths_for(project_root)
+    yield from _extract_records(iter_loose_archived_markdown(archive_dir))
+
+    cache = StatsCache.for_archive_dir(archive_dir)
+    paths = numbered_archive_paths(archive_dir)
+    digests = {path: bundle_digest(path) for path in paths}
+    misses = iter_archive_bundles(
+        [path for path in paths if cache.get(digests[path]) is None])
+    for path in paths:
+        records = cache.get(digests[path])
+        if records is None:
+            _path, entries, complete = next(misses)
+            records = _extract_records(entries)
+            digest = digests[path]
+            if complete and digest is not None and bundle_digest(path) == digest:
+                cache.put(digest, records)
+        yield from records
+    misses.close()
+    cache.save(d for d in digests.values() if d is not None)
+
+
 def collect_inflight(
     today: date,
     week_start_dow: int,
@@ -1036,17 +1113,23 @@ def collect_stats(
     implement_hours: List[float] = []
     review_merge_hours: List[float] = []
 
-    for filename, content in iter_archived_markdown_files(project_root=project_root):
-        frontmatter = parse_frontmatter(content)
-        completed = resolve_completion_date(content, frontmatter)
-        if completed is None:
-            continue
-
-        _accumulate_phase_timings(content, implement_hours, review_merge_hours)
-
-        issue_type = frontmatter.get("issue_type") or "feature"
-        labels = parse_labels(frontmatter.get("labels"))
-        implementation = normalize_implemented_with(frontmatter.get("implemented_with"), model_cli_ids)
+    implementations: Dict[Optional[str], ImplementationInfo] = {}
+
+    # Everything below the record is recomputed per run: it depends on `today`
+    # and on the models_*.json metadata, neither of which the cache can key on.
+    for record in iter_archived_records(project_root=project_root):
+        (filename, completed_iso, issue_type, labels, implemented_with,
+         implement, review_merge) = record
+        completed = date.fromisoformat(completed_iso)
+        if implement is not None:
+            implement_hours.append(implement)
+        if review_merge is not None:
+            review_merge_hours.append(review_merge)
+
+        implementation = implementations.get(implemented_with)
+        if implementation is None:
+            implementation = normalize_implemented_with(implemented_with, model_cli_ids)
+            implementations[implemented_with] = implementation
         task_type = "child" if is_child_task(filename) else "parent"
         task_id = Path(filename).stem
         week_offset = week_offset_for(completed, today, week_start_dow)
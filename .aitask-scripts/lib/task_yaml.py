@@ -34,6 +34,22 @@ for _ch in list('0123456789'):
     _TaskSafeLoader.yaml_implicit_resolvers[_ch] = _resolvers
 
 
+# libyaml-backed twin of _TaskSafeLoader. Only scanning, parsing and composing
+# move to C: implicit tag resolution still runs the Python resolver table, so
+# sharing _TaskSafeLoader's table keeps the digit_digit rule (and every other
+# type decision) identical. PyYAML built without libyaml has no CSafeLoader;
+# the pure-Python loader is then the only one.
+if getattr(yaml, "CSafeLoader", None) is not None:
+    class _TaskCSafeLoader(yaml.CSafeLoader):
+        """_TaskSafeLoader's resolvers on the libyaml parser."""
+        pass
+
+    _TaskCSafeLoader.yaml_implicit_resolvers = (
+        _TaskSafeLoader.yaml_implicit_resolvers)
+else:
+    _TaskCSafeLoader = None
+
+
 # --- YAML Dumper ---
 
 class _FlowListDumper(yaml.SafeDumper):
@@ -95,6 +111,154 @@ def normalize_board_idx(raw):
         return 0
 
 
+# --- Frontmatter loading ---
+#
+# parse_frontmatter is the hottest function of every full task-tree scan (board
+# refresh, stats, trail discovery), and almost all of its time used to be the
+# pure-Python SafeLoader. Two layers sit in front of it now:
+#
+#   1. _fast_load: a hand-written parser for the flat block mapping our own
+#      writers emit -- one ``key: scalar`` or ``key: [a, b]`` per line. It
+#      accepts only a conservative subset and answers _NOT_FAST for anything
+#      else (block lists, nested mappings, comments, multi-line or escaped
+#      strings, floats, dates, YAML 1.1 octal/sexagesimal ints, non-ASCII...).
+#      Scalar TYPES are decided by running _TaskSafeLoader's own implicit
+#      resolver table, so "85_2" stays a string and "yes" is still True.
+#   2. _yaml_load: _TaskCSafeLoader when libyaml is available, the pure loader
+#      otherwise. Anything libyaml rejects is re-parsed by the pure loader, so
+#      error types and messages -- and the odd input where libyaml is stricter
+#      -- match the reference exactly. The reverse (libyaml ACCEPTING what the
+#      pure loader rejects, or reading it differently) was mapped by fuzzing
+#      the two against each other; every such input contains one of the
+#      features in _LIBYAML_DIVERGENT_RE, and those skip libyaml entirely.
+#
+# tests/test_task_yaml_fast_path.py checks both against the pure loader.
+
+_NOT_FAST = object()
+
+_FAST_LINE_RE = re.compile(r'([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?')
+_FAST_SINGLE_QUOTED_RE = re.compile(r"'((?:[^']|'')*)'")
+_FAST_DOUBLE_QUOTED_RE = re.compile(r'"([^"\\]*)"')
+# Lines are printable ASCII by the time these run (_fast_load checks), so no
+# tabs, control characters or Unicode line separators reach them.
+# Block-context plain scalar on one line: no leading indicator, and the caller
+# also rejects ': ' (nested mapping), ' #' (comment) and a trailing ':'.
+_FAST_PLAIN_RE = re.compile(r'(?:[A-Za-z0-9_./~(+$^=<]|-(?=\S)).*')
+# Flow-sequence item: additionally no flow indicators and no ':' or '#' at all.
+_FAST_FLOW_ITEM_RE = re.compile(
+    r'(?:[A-Za-z0-9_./~(+$^=<]|-(?=\S))[^\[\]{},#:]*')
+_FAST_DECIMAL_RE = re.compile(r'[-+]?(?:0|[1-9][0-9]*)')
+
+_TAG_STR = 'tag:yaml.org,2002:str'
+_TAG_NULL = 'tag:yaml.org,2002:null'
+_TAG_BOOL = 'tag:yaml.org,2002:bool'
+_TAG_INT = 'tag:yaml.org,2002:int'
+
+
+def _fast_resolve(value: str):
+    """Construct a plain scalar exactly as _TaskSafeLoader would, or _NOT_FAST."""
+    resolvers = _TaskSafeLoader.yaml_implicit_resolvers
+    tag = _TAG_STR
+    for candidate, regexp in resolvers.get(value[:1] if value else '', []):
+        if regexp.match(value):
+            tag = candidate
+            break
+    if tag == _TAG_STR:
+        return value
+    if tag == _TAG_NULL:
+        return None
+    if tag == _TAG_BOOL:
+        return yaml.constructor.SafeConstructor.bool_values[value.lower()]
+    if tag == _TAG_INT and _FAST_DECIMAL_RE.fullmatch(value):
+        return int(value)
+    return _NOT_FAST     # float, timestamp, merge, value, exotic int forms
+
+
+def _fast_scalar(text: str):
+    m = _FAST_SINGLE_QUOTED_RE.fullmatch(text)
+    if m:
+        return m.group(1).replace("''", "'")
+    m = _FAST_DOUBLE_QUOTED_RE.fullmatch(text)
+    if m:
+        return m.group(1)
+    return _NOT_FAST
+
+
+def _fast_value(rest: str):
+    if not rest:
+        return None
+    if rest[0] == '[':
+        if rest[-1] != ']':
+            return _NOT_FAST
+        inner = rest[1:-1].strip()
+        if not inner:
+            return []
+        items = []
+        for raw in inner.split(','):
+            raw = raw.strip()
+            if raw[:1] in ("'", '"'):
+                item = _fast_scalar(raw)
+            elif _FAST_FLOW_ITEM_RE.fullmatch(raw):
+                item = _fast_resolve(raw)
+            else:
+                item = _NOT_FAST      # empty item, nested flow, ':' ...
+            if item is _NOT_FAST:
+                return _NOT_FAST
+            items.append(item)
+        return items
+    if rest[0] in ("'", '"'):
+        return _fast_scalar(rest)
+    if (not _FAST_PLAIN_RE.fullmatch(rest) or ': ' in rest or ' #' in rest
+            or rest.endswith(':')):
+        return _NOT_FAST
+    return _fast_resolve(rest)
+
+
+def _fast_load(text: str):
+    """Parse flat ``key: scalar`` / ``key: [a, b]`` frontmatter, or _NOT_FAST."""
+    data = {}
+    for line in text.split('\n'):
+        if not line:
+            continue
+        if not (line.isascii() and line.isprintable()):
+            return _NOT_FAST
+        m = _FAST_LINE_RE.fullmatch(line.rstrip(' '))
+        if m is None:
+            return _NOT_FAST
+        key, rest = m.group(1), m.group(2) or ''
+        if _fast_resolve(key) != key:
+            return _NOT_FAST         # "yes:", "null:" -- non-string keys
+        value = _fast_value(rest)
+        if value is _NOT_FAST:
+            return _NOT_FAST
+        data[key] = value
+    return data or None
+
+
+# Tabs, BOM and Unicode line breaks, tag / directive / complex-key indicators,
+# and a comment on a block scalar header line. None appear in frontmatter our
+# tools write; hand-edited files that use them just take the pure loader.
+_LIBYAML_DIVERGENT_RE = re.compile(
+    '[\t\ufeff\x85\u2028\u2029!%?]|[|>][^\n]*#')
+
+
+def _yaml_load(text: str):
+    if _TaskCSafeLoader is not None and not _LIBYAML_DIVERGENT_RE.search(text):
+        try:
+            return yaml.load(text, Loader=_TaskCSafeLoader)
+        except yaml.YAMLError:
+            pass          # re-raised below by the reference loader, verbatim
+    return yaml.load(text, Loader=_TaskSafeLoader)
+
+
+def load_frontmatter_yaml(text: str):
+    """Load a frontmatter block exactly like ``yaml.load(_TaskSafeLoader)``."""
+    data = _fast_load(text)
+    if data is _NOT_FAST:
+        data = _yaml_load(text)
+    return data
+
+
 # --- Helper Functions ---
 
 def _normalize_task_id(item):
@@ -143,7 +307,7 @@ def parse_frontmatter(raw_text: str):
     if not m:
         return None
 
-    metadata = yaml.load(m.group(1), Loader=_TaskSafeLoader) or {}
+    metadata = load_frontmatter_yaml(m.group(1)) or {}
     original_key_order = list(metadata.keys())
     body = m.group(2)
 
@@ -139,6 +139,7 @@ from gate_ledger import archive_status_from_text  # noqa: E402
 # The vocabulary-clamped field builder; shared with work_report_gather so
 # "neither sentinel means a real kind" holds by construction on both records.
 from followup_kinds import followup_kind_field  # noqa: E402
+from frontmatter_index import shared_index  # noqa: E402
 from record_protocol import (  # noqa: E402
     INVALID_ENUM, enum_field, has_record_breaking, sanitize_last_field,
 )
@@ -312,19 +313,29 @@ class ProjectTree:
     by_own_id: dict[str, TaskRow] = field(default_factory=dict)
 
 
-def _load_row(path: Path, project: str) -> TaskRow | None:
+def _load_row(path: Path, project: str, index=None) -> TaskRow | None:
     match = TASK_FILE_RE.match(path.name)
     if not match:
         return None
-    try:
-        raw = path.read_text(encoding="utf-8")
-    except OSError:
-        return None
-    try:
-        parsed = parse_frontmatter(raw)
-    except Exception:
-        # Board parity: a malformed file is simply absent from the universe.
-        parsed = None
+    if index is not None:
+        # Same contract as the read_text + parse_frontmatter pair below, served
+        # from the shared frontmatter index when the file is unchanged.
+        try:
+            parsed, raw = index.read(path)
+        except UnicodeDecodeError:
+            raise                   # read_text would have raised it too
+        except Exception:
+            return None             # unreadable, or malformed YAML
+    else:
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            parsed = parse_frontmatter(raw)
+        except Exception:
+            parsed = None
+    # Board parity: a malformed file is simply absent from the universe.
     metadata = parsed[0] if parsed else {}
     if not metadata or set(metadata.keys()) <= set(BOARD_KEYS):
         return None  # phantom stub or unparseable -- invisible on the board too
@@ -344,12 +355,14 @@ def load_tree(name: str, root: Path, is_local: bool) -> ProjectTree:
     tree = ProjectTree(name=name, root=root, task_dir=task_dir,
                        plan_dir=plan_dir, archived_dir=archived_dir)
     candidates = sorted(task_dir.glob("*.md")) + sorted(task_dir.glob("t*/t*_*.md"))
+    index = shared_index(task_dir)
     for path in candidates:
-        row = _load_row(path, name)
+        row = _load_row(path, name, index)
         if row is None:
             continue
         tree.rows.append(row)
         tree.by_own_id.setdefault(row.own_id, row)
+    index.save()
     return tree
 
 
@@ -0,0 +1,815 @@
+#!/usr/bin/env python3
+"""tui_zygote.py - single-interpreter launcher and resident "zygote" for the TUIs.
+
+Every ``ait board`` / ``ait monitor`` / ``ait codebrowser`` / … launch went
+through a bash wrapper that spawned one throwaway interpreter per dependency
+(``python -c "import textual"``, ``… yaml``, ``… linkify_it``) and then exec'd
+the real one, which imported Textual all over again. Hopping between TUIs with
+the ``j`` switcher paid that 1-2 s every time.
+
+The wrappers now end in ``exec python lib/tui_zygote.py launch --deps … SCRIPT
+ARGS…``, which always does the dependency check and the TUI run in ONE process:
+
+  * **in-process** (default): the deps are imported for real (so a broken
+    install — a venv that exists but lacks a package — is caught exactly like
+    the old ``python -c`` probes did, and the imports are then already warm for
+    the TUI) and the TUI script is run with ``runpy`` in the same interpreter
+    — one interpreter start instead of four.
+  * **zygote** (opt-in, ``AIT_TUI_ZYGOTE=1``, inside tmux): a resident launcher
+    per tmux session (and interpreter) that has Textual, Rich, yaml and the
+    shared ``lib/`` TUI modules already imported. ``launch`` hands it the
+    terminal (its stdin/stdout/stderr file descriptors, over a Unix socket with
+    ``SCM_RIGHTS``), the argv, cwd and environment; the zygote checks the deps
+    in its own already-warm process and ``fork()``s a child that adopts the
+    terminal and runs the TUI — no interpreter start, no Textual import. The
+    ``launch`` process stays as a thin stub: it forwards SIGWINCH / SIGHUP /
+    SIGTERM / SIGINT to the child and exits with the child's exit status, so the
+    tmux pane, ``pane-died`` hooks and callers see an ordinary foreground
+    process. The first opted-in launch in a session starts the zygote in the
+    background and runs in-process; later launches are forked.
+
+The zygote declines a launch (the stub then runs it in-process) when there is
+no terminal to hand over (stdin is not a tty: a piped or redirected launch), or
+when the preloaded state could be wrong for it: when a pinned environment variable
+differs (``TEXTUAL*``, ``AITASKS_*``, ``NO_COLOR``, ``FORCE_COLOR`` — read at
+import time by Textual and by the tmux gateway), or when a preloaded module's
+file changed on disk since it started (an ``ait upgrade`` / ``ait setup``). A
+stale zygote also unlinks its socket so the next launch starts a fresh one. It
+exits on its own after :data:`IDLE_EXIT_S` with no launches and no live
+children.
+
+Known limit of the forked mode: the child's terminal is not its *controlling*
+terminal (that belongs to the pane shell's session), so ``/dev/tty`` is not
+available to it. The TUIs only use fds 0-2; anything that insists on
+``/dev/tty`` should be launched with ``AIT_TUI_ZYGOTE`` unset.
+
+``importtime`` prints a ``python -X importtime`` summary per TUI (total import
+time, module count, top packages by self time) and, with ``--baseline``,
+fails when a TUI's import time regressed past ``--max-regression`` percent —
+the number the zygote saves, tracked so it does not creep back.
+
+Usage:
+    tui_zygote.py launch [--deps MOD[=DIST],...] SCRIPT [ARGS...]
+    tui_zygote.py serve [--socket PATH] [--preload MOD,...] [--idle-exit S]
+    tui_zygote.py status | stop
+    tui_zygote.py importtime [--tui NAME]... [--top N] [--json]
+                             [--baseline FILE] [--max-regression PCT]
+
+Stdlib only; the launch path imports nothing heavier than ``socket``/``json``.
+"""
+from __future__ import annotations
+
+import json
+import os
+import selectors
+import signal
+import socket
+import sys
+
+from private_socket import peer_uid, private_dir
+
+ENABLE_ENV = "AIT_TUI_ZYGOTE"
+
+# Idle lifetime of a zygote with no launches and no live children.
+IDLE_EXIT_S = 30 * 60
+
+# What the zygote imports up front: the third-party stack every TUI pays for,
+# then the shared lib/ modules (board, monitor, codebrowser, settings, … all
+# import the switcher, shortcut and launch helpers). ``module:attr,attr``
+# resolves lazily-exported names too (textual.widgets loads each widget module
+# on attribute access). Modules here must not capture per-launch state at
+# import time beyond the environment variables pinned below.
+PRELOAD = (
+    "yaml",
+    "linkify_it",
+    "rich.text",
+    "rich.markup",
+    "rich.cells",
+    "rich.syntax",
+    "textual.app",
+    "textual.binding",
+    "textual.command",
+    "textual.containers",
+    "textual.css.query",
+    "textual.message",
+    "textual.screen",
+    "textual.timer",
+    "textual.widgets:Button,Collapsible,DataTable,DirectoryTree,Footer,Header,"
+    "Input,Label,ListItem,ListView,LoadingIndicator,Markdown,SelectionList,"
+    "Static,TabbedContent,TextArea",
+    "config_utils",
+    "tmux_exec",
+    "keybinding_registry",
+    "multirow_footer",
+    "shortcuts_mixin",
+    "tui_clipboard",
+    "agent_launch_utils",
+    "agent_command_screen",
+    "tui_switcher",
+)
+
+# Environment read at import time by preloaded modules (Textual's constants,
+# the tmux gateway's socket choice): a launch whose values differ is declined.
+_PINNED_PREFIXES = ("TEXTUAL", "AITASKS_")
+_PINNED_NAMES = ("NO_COLOR", "FORCE_COLOR")
+
+# The TUIs `importtime` knows, relative to .aitask-scripts/.
+TUI_SCRIPTS = {
+    "board": "board/aitask_board.py",
+    "monitor": "monitor/monitor_app.py",
+    "codebrowser": "codebrowser/codebrowser_app.py",
+    "settings": "settings/settings_app.py",
+    "stats": "stats/stats_app.py",
+    "brainstorm": "brainstorm/brainstorm_app.py",
+}
+
+_LIB_DIR = os.path.dirname(os.path.abspath(__file__))
+_SCRIPTS_DIR = os.path.dirname(_LIB_DIR)
+
+_RED = "\033[0;31m"
+_NC = "\033[0m"
+
+
+def _error(msg: str) -> None:
+    """Same shape as terminal_compat.sh's ``die`` message."""
+    print(f"{_RED}Error: {msg}{_NC}", file=sys.stderr)
+
+
+def _missing_message(missing: list[str]) -> str:
+    return (f"Missing Python packages: {' '.join(missing)}. "
+            "Run 'ait setup' to install all dependencies.")
+
+
+def parse_deps(spec: str) -> list[tuple[str, str]]:
+    """``"textual,yaml=pyyaml"`` -> ``[("textual", "textual"), ("yaml", "pyyaml")]``
+    (import name, distribution name reported when it is missing)."""
+    deps = []
+    for item in spec.split(","):
+        item = item.strip()
+        if item:
+            mod, _, dist = item.partition("=")
+            deps.append((mod, dist or mod))
+    return deps
+
+
+def _import_deps(deps) -> list[str]:
+    """Import each dependency for real; the distribution names that failed."""
+    import importlib
+    missing = []
+    for mod, dist in deps:
+        try:
+            importlib.import_module(mod)
+        except Exception:
+            missing.append(dist)
+    return missing
+
+
+def _pinned_env(env) -> dict:
+    return {k: v for k, v in env.items()
+            if k.startswith(_PINNED_PREFIXES) or k in _PINNED_NAMES}
+
+
+# -- socket location --------------------------------------------------------
+
+def socket_path(env=None) -> str | None:
+    """The zygote socket for the current tmux session and interpreter, or
+    ``None`` outside tmux.
+
+    One zygote per tmux session (``$TMUX`` is ``<server socket>,<server
+    pid>,<session id>``) per interpreter (the board may run on PyPy) per
+    framework checkout, in a private per-user directory.
+    """
+    env = os.environ if env is None else env
+    tmux = env.get("TMUX", "")
+    if not tmux:
+        return None
+    import hashlib
+    key = "\0".join((tmux, env.get("AITASKS_TMUX_SOCKET", "\1"),
+                     os.path.realpath(sys.executable), _SCRIPTS_DIR))
+    base = env.get("XDG_RUNTIME_DIR") or "/tmp"
+    run_dir = os.path.join(base, f"aitasks-zygote-{os.getuid()}")
+    name = hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()[:16]
+    return os.path.join(run_dir, f"{name}.sock")
+
+
+def _connect(path: str | None):
+    """A connection to the zygote at ``path``, or ``None``.
+
+    ``None`` as well when the socket directory is not ours alone or the
+    process listening is another user's: a launch hands the zygote its whole
+    environment and terminal, and the ``/tmp`` fallback directory name is
+    guessable (see ``private_socket``).
+    """
+    if not path or not private_dir(os.path.dirname(path)):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    uid = peer_uid(sock)
+    if uid is not None and uid != os.getuid():
+        sock.close()
+        return None
+    return sock
+
+
+def _request(sock, payload: dict, fds=()) -> None:
+    data = json.dumps(payload).encode("utf-8", "surrogateescape") + b"\n"
+    if fds:
+        sent = socket.send_fds(sock, [data], list(fds))
+        data = data[sent:]
+    sock.sendall(data)
+
+
+# -- launch (the wrapper entry point) ---------------------------------------
+
+# _launch_via_zygote outcomes other than an exit status.
+_NOT_RUNNING = "not-running"
+_DECLINED = "declined"
+_RESPAWN = "respawn"
+
+
+def launch(script: str, args: list[str], deps) -> int:
+    """Check ``deps`` and run ``script`` — forked by the session's zygote when
+    one is enabled and willing, else in this process."""
+    script = os.path.abspath(script)
+    if os.environ.get(ENABLE_ENV) == "1":
+        path = socket_path()
+        outcome = _launch_via_zygote(path, script, args, deps)
+        if isinstance(outcome, int):
+            return outcome
+        if outcome in (_NOT_RUNNING, _RESPAWN) and path:
+            _spawn_zygote(path)
+    return run_in_process(script, args, deps)
+
+
+def run_in_process(script: str, args: list[str], deps) -> int:
+    missing = _import_deps(deps)
+    if missing:
+        _error(_missing_message(missing))
+        return 1
+    import runpy
+    sys.argv = [script, *args]
+    sys.path[0] = os.path.dirname(script)   # what `python SCRIPT` would set
+    runpy.run_path(script, run_name="__main__")
+    return 0
+
+
+def _launch_via_zygote(path, script, args, deps):
+    sock = _connect(path)
+    if sock is None:
+        return _NOT_RUNNING
+    with sock:
+        try:
+            _request(sock, {
+                "op": "launch", "script": script, "argv": args,
+                "cwd": os.getcwd(), "env": dict(os.environ), "deps": deps,
+            }, fds=(0, 1, 2))
+            reader = sock.makefile("rb")
+            reply = json.loads(reader.readline() or b"{}")
+        except (OSError, ValueError):
+            return _NOT_RUNNING
+        if "missing" in reply:
+            _error(_missing_message(reply["missing"]))
+            return 1
+        pid = reply.get("pid")
+        if not pid:
+            return _RESPAWN if reply.get("respawn") else _DECLINED
+
+        def forward(signum, _frame):
+            try:
+                os.kill(pid, signum)
+            except OSError:
+                pass
+        for sig in (signal.SIGWINCH, signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, forward)
+        try:
+            line = reader.readline()
+        except OSError:
+            line = b""
+        if line:
+            return int(json.loads(line).get("exit", 1))
+        # The zygote went away under a running child: it is not ours to
+        # wait() for, so watch it until it is gone.
+        import time
+        while _alive(pid):
+            time.sleep(0.2)
+        return 1
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _spawn_zygote(path: str) -> None:
+    """Start a zygote for ``path`` in the background (its own session, no
+    controlling terminal). A concurrent duplicate loses the lock and exits."""
+    import subprocess
+    if not private_dir(os.path.dirname(path)):
+        return
+    try:
+        log = open(path[:-len(".sock")] + ".log", "ab")
+    except OSError:
+        return
+    with log:
+        try:
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "serve", "--socket", path],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=log,
+                cwd=_LIB_DIR, start_new_session=True, close_fds=True,
+            )
+        except OSError:
+            pass
+
+
+# -- the zygote -------------------------------------------------------------
+
+class _ChildLaunch:
+    """What a freshly forked child runs once it has left the server loop."""
+
+    def __init__(self, request: dict, fds: list[int]):
+        self.request = request
+        self.fds = fds
+
+    def run(self) -> int:
+        req = self.request
+        os.setsid()
+        for target, fd in enumerate(self.fds):
+            os.dup2(fd, target)
+        for fd in self.fds:
+            if fd > 2:
+                os.close(fd)
+        _rebind_stdio()
+        os.chdir(req["cwd"])
+        os.environ.clear()
+        os.environ.update(req["env"])
+        sys.argv = [req["script"], *req["argv"]]
+        sys.path[0] = os.path.dirname(req["script"])
+        import runpy
+        runpy.run_path(req["script"], run_name="__main__")
+        return 0
+
+
+def _rebind_stdio() -> None:
+    """Re-open sys.std* over the adopted fds 0-2: the zygote's were /dev/null
+    and a log file, so their buffering and tty-ness were decided for those."""
+    import io
+    for fd, name, mode in ((0, "stdin", "r"), (1, "stdout", "w"), (2, "stderr", "w")):
+        old = getattr(sys, name)
+        try:
+            old.flush()
+        except (OSError, ValueError):
+            pass
+        stream = io.TextIOWrapper(
+            io.open(fd, mode + "b", closefd=False), encoding="utf-8",
+            errors="backslashreplace" if fd == 2 else "strict",
+            line_buffering=fd == 2 or (fd == 1 and os.isatty(fd)))
+        setattr(sys, name, stream)
+        setattr(sys, f"__{name}__", stream)
+
+
+class Zygote:
+    """Preloads :data:`PRELOAD` and forks a child per launch request."""
+
+    def __init__(self, path: str, preload=PRELOAD, idle_exit_s: float = IDLE_EXIT_S):
+        self.path = path
+        self.preload = tuple(preload)
+        self.idle_exit_s = idle_exit_s
+        self.pid = os.getpid()
+        self.preload_ms = 0.0
+        self.preload_failed: list[str] = []
+        self.launches = 0
+        self.started = 0.0
+        self._mtimes: dict[str, int] = {}
+        self._env = _pinned_env(os.environ)
+        self._children: dict[int, socket.socket | None] = {}
+        self._stale = False
+
+    # ---- startup ----
+
+    def warm(self) -> None:
+        import importlib
+        import time
+        self.started = time.time()
+        t0 = time.perf_counter()
+        for spec in self.preload:
+            mod_name, _, attrs = spec.partition(":")
+            try:
+                mod = importlib.import_module(mod_name)
+                for attr in filter(None, attrs.split(",")):
+                    getattr(mod, attr)
+            except Exception as exc:     # a TUI that needs it will report it
+                self.preload_failed.append(f"{spec}: {exc.__class__.__name__}")
+        self.preload_ms = (time.perf_counter() - t0) * 1000
+        # Remember every preloaded file (the lib/ modules and the preloaded
+        # packages) so an upgrade on disk retires this zygote.
+        roots = {spec.partition(":")[0].split(".")[0] for spec in self.preload}
+        self._mtimes = {}
+        for mod in list(sys.modules.values()):
+            path = getattr(mod, "__file__", None)
+            if path and (path.startswith(_SCRIPTS_DIR)
+                         or mod.__name__.split(".")[0] in roots):
+                try:
+                    self._mtimes[path] = os.stat(path).st_mtime_ns
+                except OSError:
+                    pass
+
+    def _is_stale(self) -> bool:
+        for path, mtime in self._mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    # ---- server loop ----
+
+    def serve(self) -> "_ChildLaunch | None":
+        """Run until idle / stopped. Returns a :class:`_ChildLaunch` in a
+        forked child (the caller runs it), ``None`` in the zygote itself."""
+        import fcntl
+        import time
+
+        if not private_dir(os.path.dirname(self.path)):
+            _error(f"{os.path.dirname(self.path)} is not a private directory "
+                   "of this user; not serving")
+            return None
+        lock = open(self.path + ".lock", "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return None                  # another zygote owns this session
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.warm()
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.path)
+        os.chmod(self.path, 0o600)
+        listener.listen(16)
+
+        wake_r, wake_w = socket.socketpair()
+        wake_r.setblocking(False)
+        wake_w.setblocking(False)
+        stop = []
+        signal.set_wakeup_fd(wake_w.fileno())
+        signal.signal(signal.SIGCHLD, lambda *_: None)
+        signal.signal(signal.SIGTERM, lambda *_: stop.append(True))
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        sel = selectors.DefaultSelector()
+        sel.register(listener, selectors.EVENT_READ, "accept")
+        sel.register(wake_r, selectors.EVENT_READ, "wake")
+        last_activity = time.monotonic()
+        print(f"zygote {self.pid}: serving {self.path} "
+              f"(preload {self.preload_ms:.0f} ms, failed: {self.preload_failed or 'none'})",
+              file=sys.stderr, flush=True)
+        child = None
+        try:
+            while True:
+                if stop or (self._stale and not self._children):
+                    break
+                if (not self._children
+                        and time.monotonic() - last_activity > self.idle_exit_s):
+                    break
+                for key, _ev in sel.select(timeout=5.0):
+                    if key.data == "wake":
+                        try:
+                            while wake_r.recv(512):
+                                pass
+                        except BlockingIOError:
+                            pass
+                        self._reap(sel)
+                    elif key.data == "accept":
+                        last_activity = time.monotonic()
+                        try:
+                            conn, _ = listener.accept()
+                        except OSError:
+                            continue
+                        child = self._handle(conn, sel)
+                        if child is not None:
+                            # Forked child: shed every zygote resource.
+                            signal.set_wakeup_fd(-1)
+                            for sig in (signal.SIGCHLD, signal.SIGTERM, signal.SIGHUP):
+                                signal.signal(sig, signal.SIG_DFL)
+                            sel.close()
+                            for c in self._children.values():
+                                if c is not None:
+                                    c.close()
+                            for s in (listener, wake_r, wake_w):
+                                s.close()
+                            lock.close()
+                            return child
+                        if self._stale:
+                            self._stop_listening(sel, listener)
+                    else:
+                        self._client_gone(key.fileobj, key.data, sel)
+        finally:
+            if os.getpid() == self.pid:
+                if listener.fileno() != -1:
+                    self._stop_listening(sel, listener)
+                for pid in list(self._children):
+                    try:
+                        os.kill(pid, signal.SIGHUP)
+                    except OSError:
+                        pass
+                lock.close()
+        return None
+
+    def _stop_listening(self, sel, listener) -> None:
+        try:
+            sel.unregister(listener)
+        except (KeyError, ValueError):
+            pass
+        listener.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def _handle(self, conn, sel) -> "_ChildLaunch | None":
+        fds: list[int] = []
+        try:
+            uid = peer_uid(conn)
+            if uid is not None and uid != os.getuid():
+                conn.close()
+                return None
+            conn.settimeout(5.0)
+            data, fds, _flags, _addr = socket.recv_fds(conn, 1 << 16, 3)
+            while not data.endswith(b"\n"):
+                more = conn.recv(1 << 16)
+                if not more:
+                    raise ValueError("truncated request")
+                data += more
+            req = json.loads(data.decode("utf-8", "surrogateescape"))
+            conn.settimeout(None)
+        except (OSError, ValueError):
+            for fd in fds:
+                os.close(fd)
+            conn.close()
+            return None
+
+        op = req.get("op")
+        if op != "launch":
+            for fd in fds:
+                os.close(fd)
+            if op == "status":
+                self._reply(conn, self.status())
+            elif op == "stop":
+                self._reply(conn, {"stopping": True})
+                os.kill(self.pid, signal.SIGTERM)
+            conn.close()
+            return None
+
+        reply = self._vet(req, fds)
+        if reply is not None:
+            for fd in fds:
+                os.close(fd)
+            self._reply(conn, reply)
+            conn.close()
+            return None
+
+        pid = os.fork()
+        if pid == 0:
+            conn.close()
+            return _ChildLaunch(req, fds)
+        for fd in fds:
+            os.close(fd)
+        self.launches += 1
+        self._children[pid] = conn
+        sel.register(conn, selectors.EVENT_READ, pid)
+        self._reply(conn, {"pid": pid})
+        return None
+
+    def _vet(self, req: dict, fds: list[int]) -> dict | None:
+        """``None`` when the launch may be forked, else the reply declining it."""
+        if len(fds) != 3 or not os.isatty(fds[0]):
+            # A piped or redirected launch (`ait board < file`, a script) has
+            # no terminal for a forked TUI to adopt; run it in-process.
+            return {"declined": "no terminal"}
+        if self._is_stale():
+            self._stale = True
+            return {"declined": "stale", "respawn": True}
+        if _pinned_env(req.get("env", {})) != self._env:
+            return {"declined": "environment"}
+        missing = _import_deps([tuple(d) for d in req.get("deps", [])])
+        if missing:
+            return {"missing": missing}
+        return None
+
+    @staticmethod
+    def _reply(conn, payload: dict) -> None:
+        try:
+            conn.sendall(json.dumps(payload).encode() + b"\n")
+        except OSError:
+            pass
+
+    def _reap(self, sel) -> None:
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            code = os.waitstatus_to_exitcode(status)
+            if code < 0:
+                code = 128 - code
+            conn = self._children.pop(pid, None)
+            if conn is not None:
+                try:
+                    sel.unregister(conn)
+                except (KeyError, ValueError):
+                    pass
+                self._reply(conn, {"exit": code})
+                conn.close()
+
+    def _client_gone(self, conn, pid: int, sel) -> None:
+        """The launch stub's end became readable: it only ever closes, so its
+        pane went away without the signal reaching us — hang the child up."""
+        try:
+            sel.unregister(conn)
+        except (KeyError, ValueError):
+            pass
+        conn.close()
+        if self._children.get(pid) is conn:
+            self._children[pid] = None
+            try:
+                os.kill(pid, signal.SIGHUP)
+            except OSError:
+                pass
+
+    def status(self) -> dict:
+        return {
+            "pid": self.pid, "socket": self.path, "started": self.started,
+            "preload_ms": round(self.preload_ms, 1),
+            "preload_failed": self.preload_failed,
+            "launches": self.launches, "children": sorted(self._children),
+            "stale": self._stale,
+        }
+
+
+# -- import-time report -----------------------------------------------------
+
+def summarize_importtime(stderr: str) -> dict:
+    """Fold ``python -X importtime`` output into totals per top-level package.
+
+    Self times are summed per root package (``textual.widgets._tree`` counts
+    for ``textual``), so the figure is what the package costs no matter which
+    module happened to import it first.
+    """
+    packages: dict[str, int] = {}
+    modules = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _tag, self_us, _cum, name = (p.strip() for p in
+                                         line.replace("import time:", "|", 1).split("|"))
+            self_us = int(self_us)
+        except ValueError:
+            continue
+        root = name.split(".")[0]
+        packages[root] = packages.get(root, 0) + self_us
+        modules += 1
+    total = sum(packages.values())
+    return {
+        "total_ms": round(total / 1000, 1),
+        "modules": modules,
+        "packages": {k: round(v / 1000, 1)
+                     for k, v in sorted(packages.items(), key=lambda kv: -kv[1])},
+    }
+
+
+def measure_importtime(script: str) -> dict:
+    """Import ``script`` as a module (its ``__main__`` block does not run)
+    under ``-X importtime`` in a fresh interpreter and summarise it."""
+    import subprocess
+    code = (
+        "import importlib.util, sys\n"
+        f"sys.path[:0] = [{os.path.dirname(script)!r}, {_LIB_DIR!r}, {_SCRIPTS_DIR!r}]\n"
+        f"spec = importlib.util.spec_from_file_location('_ait_tui', {script!r})\n"
+        "mod = sys.modules['_ait_tui'] = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(mod)\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (_SCRIPTS_DIR, env.get("PYTHONPATH"))))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, env=env)
+    summary = summarize_importtime(proc.stderr)
+    if proc.returncode != 0:
+        summary["error"] = proc.stderr.strip().splitlines()[-1:] or ["failed"]
+    return summary
+
+
+def _importtime_cmd(args) -> int:
+    names = args.tui or list(TUI_SCRIPTS)
+    report = {}
+    for name in names:
+        if name not in TUI_SCRIPTS:
+            _error(f"unknown TUI '{name}' (known: {', '.join(TUI_SCRIPTS)})")
+            return 2
+        report[name] = measure_importtime(os.path.join(_SCRIPTS_DIR, TUI_SCRIPTS[name]))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, s in report.items():
+            err = f"  [import failed: {s['error'][0]}]" if "error" in s else ""
+            print(f"{name}: {s['total_ms']:.1f} ms over {s['modules']} modules{err}")
+            for pkg, ms in list(s["packages"].items())[:args.top]:
+                print(f"    {pkg:28s} {ms:8.1f} ms")
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    rc = 0
+    for name, s in report.items():
+        base = baseline.get(name, {}).get("total_ms")
+        if base and s["total_ms"] > base * (1 + args.max_regression / 100):
+            print(f"REGRESSION: {name} import {s['total_ms']:.1f} ms vs baseline "
+                  f"{base:.1f} ms (> {args.max_regression:g}%)", file=sys.stderr)
+            rc = 1
+    return rc
+
+
+# -- CLI --------------------------------------------------------------------
+
+def _launch_cmd(argv: list[str]) -> int:
+    """``launch [--deps SPEC] SCRIPT ARGS...`` — parsed by hand so ARGS reach
+    the TUI verbatim (argparse would eat a ``--`` or a ``--help``)."""
+    deps = ""
+    if argv[:1] == ["--deps"] and len(argv) >= 2:
+        deps, argv = argv[1], argv[2:]
+    elif argv[:1] and argv[0].startswith("--deps="):
+        deps, argv = argv[0][len("--deps="):], argv[1:]
+    if not argv or argv[0] in ("-h", "--help"):
+        _error("usage: tui_zygote.py launch [--deps MOD[=DIST],...] SCRIPT [ARGS...]")
+        return 2
+    return launch(argv[0], argv[1:], parse_deps(deps))
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["launch"]:
+        return _launch_cmd(argv[1:])
+    import argparse
+    parser = argparse.ArgumentParser(prog="tui_zygote.py", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("launch", help="check deps and run a TUI script")
+    p.add_argument("--deps", default="", help="MOD[=DIST],... to import first")
+    p.add_argument("script")
+    p.add_argument("args", nargs=argparse.REMAINDER)
+
+    p = sub.add_parser("serve", help="run the zygote for this tmux session")
+    p.add_argument("--socket", help="socket path (default: this session's)")
+    p.add_argument("--preload", help="comma-separated modules instead of the default set")
+    p.add_argument("--idle-exit", type=float, default=IDLE_EXIT_S)
+
+    sub.add_parser("status", help="print this session's zygote status")
+    sub.add_parser("stop", help="stop this session's zygote")
+
+    p = sub.add_parser("importtime", help="python -X importtime summary per TUI")
+    p.add_argument("--tui", action="append", help=f"one of {', '.join(TUI_SCRIPTS)}")
+    p.add_argument("--top", type=int, default=8)
+    p.add_argument("--json", action="store_true")
+    p.add_argument("--baseline", help="JSON from an earlier --json run")
+    p.add_argument("--max-regression", type=float, default=20.0)
+
+    args = parser.parse_args(argv)
+
+    if args.cmd == "serve":
+        path = args.socket or socket_path()
+        if not path:
+            _error("not inside tmux and no --socket given")
+            return 1
+        preload = PRELOAD if args.preload is None else tuple(
+            s for s in args.preload.split(",") if s)
+        sys.path.insert(0, _LIB_DIR)
+        sys.path.insert(1, _SCRIPTS_DIR)
+        child = Zygote(path, preload, args.idle_exit).serve()
+        return child.run() if child is not None else 0
+    if args.cmd in ("status", "stop"):
+        sock = _connect(socket_path())
+        if sock is None:
+            print("no zygote running for this session")
+            return 1
+        with sock:
+            _request(sock, {"op": args.cmd})
+            print(sock.makefile("rb").readline().decode().strip())
+        return 0
+    return _importtime_cmd(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
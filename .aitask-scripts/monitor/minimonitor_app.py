@@ -740,6 +740,8 @@ class MiniMonitorApp(
         target_width: int = 40,
         mark_pane: bool = False,
         session_bar: bool = False,
+        event_driven: bool = False,
+        shared_capture: bool = False,
     ) -> None:
         super().__init__()
         self.current_tui_name = "minimonitor"
@@ -758,6 +760,8 @@ class MiniMonitorApp(
         self._agent_prefixes = agent_prefixes
         self._tui_names = tui_names
         self._compare_mode_default = compare_mode_default
+        self._event_driven = event_driven
+        self._shared_capture = shared_capture
         # Configured width of this companion side-column. tmux rescales panes
         # proportionally on a window resize (incl. detach->reattach), so the
         # pane spawned at this width drifts wider; on_resize re-pins it.
@@ -1050,6 +1054,8 @@ class MiniMonitorApp(
             capture_lines=self._capture_lines,
             idle_threshold=self._idle_threshold,
             compare_mode_default=self._compare_mode_default,
+            event_driven=self._event_driven,
+            shared_capture=self._shared_capture,
             **kwargs,
         )
 
@@ -4222,6 +4228,8 @@ def main() -> None:
         agent_prefixes=config.get("agent_prefixes"),
         tui_names=config.get("tui_names"),
         compare_mode_default=config.get("compare_mode_default", "stripped"),
+        event_driven=config.get("event_driven", False),
+        shared_capture=config.get("shared_capture", False),
         target_width=target_width,
         mark_pane=True,   # production launcher only — see MiniMonitorApp.__init__
         session_bar=session_bar,
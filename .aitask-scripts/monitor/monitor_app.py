@@ -522,6 +522,8 @@ class MonitorApp(
         compare_mode_default: str = "stripped",
         rename_window: bool = False,
         mark_pane: bool = False,
+        event_driven: bool = False,
+        shared_capture: bool = False,
     ) -> None:
         super().__init__()
         self.current_tui_name = "monitor"
@@ -545,6 +547,8 @@ class MonitorApp(
         self._project_root = project_root
         self._multi_session = multi_session
         self._compare_mode_default = compare_mode_default
+        self._event_driven = event_driven
+        self._shared_capture = shared_capture
         self._snapshots: dict[str, PaneSnapshot] = {}
         self._focused_pane_id: str | None = None
         # Per-pane scroll memory: pane_id → (was_at_bottom, anchor_text).
@@ -800,6 +804,8 @@ class MonitorApp(
             idle_threshold=self._idle_threshold,
             multi_session=self._multi_session,
             compare_mode_default=self._compare_mode_default,
+            event_driven=self._event_driven,
+            shared_capture=self._shared_capture,
             **kwargs,
         )
 
@@ -3532,6 +3538,8 @@ def main() -> None:
         tui_names=config.get("tui_names"),
         expected_session=expected_session,
         compare_mode_default=config.get("compare_mode_default", "stripped"),
+        event_driven=config.get("event_driven", False),
+        shared_capture=config.get("shared_capture", False),
         rename_window=True,
         mark_pane=True,   # production launcher only — see MonitorApp.__init__
     )
@@ -52,7 +52,7 @@ from agent_launch_utils import (  # noqa: E402
     tmux_window_target,
 )
 from followup_kinds import normalize_followup_kind  # noqa: E402
-from task_yaml import parse_frontmatter  # noqa: E402
+from frontmatter_index import shared_index  # noqa: E402
 import gate_ledger  # noqa: E402  (shared gate-ledger parser; single derivation path)
 import workflow_phase  # noqa: E402  (advisory phase seam, t1420 — never a gate)
 
@@ -62,9 +62,9 @@ try:
         PromptPattern,
         agent_key_from_pane,
         all_patterns,
-        scope_patterns,
+        prompt_matcher,
     )
-    from .ansi_utils import strip_ansi
+    from .ansi_utils import ANSI_OSC_RE, strip_ansi
     from .concern_parser import (
         contains_block_evidence,
         parse_block_meta,
@@ -76,9 +76,9 @@ except ImportError:  # imported top-level (tests put MONITOR_DIR on PYTHONPATH)
         PromptPattern,
         agent_key_from_pane,
         all_patterns,
-        scope_patterns,
+        prompt_matcher,
     )
-    from ansi_utils import strip_ansi  # noqa: E402
+    from ansi_utils import ANSI_OSC_RE, strip_ansi  # noqa: E402
     from concern_parser import (  # noqa: E402
         contains_block_evidence,
         parse_block_meta,
@@ -185,6 +185,37 @@ def _prompt_detection_text(s: str) -> str:
     return "\n".join(lines[-_PROMPT_DETECTION_TAIL_LINES:])
 
 
+def _stripped_prompt_detection_text(content: str) -> str:
+    """``_prompt_detection_text(strip_ansi(content))``, stripping only the tail.
+
+    Raw compare mode has no use for a stripped copy of the whole capture, so
+    only the last few raw lines are stripped. That is exact as long as the cut
+    does not split an escape sequence and the stripped tail still holds enough
+    lines: CSI sequences never contain a line break, but an OSC body may, so
+    an OSC spanning the cut falls back to the full strip, and a tail that
+    stripping shortened (newlines inside an OSC) is widened and retried.
+    """
+    n = _PROMPT_DETECTION_TAIL_LINES
+    raw_lines = content.splitlines(keepends=True)
+    k = n
+    while k < len(raw_lines):
+        tail = "".join(raw_lines[-k:])
+        cut = len(content) - len(tail)
+        osc = content.rfind("\x1b]", 0, cut)
+        if osc >= 0:
+            m = ANSI_OSC_RE.match(content, osc)
+            if m is not None and m.end() > cut:
+                break
+        stripped = strip_ansi(tail)
+        if content[cut - 1] == "\r" and stripped.startswith("\n"):
+            break  # stripping would join a "\r" + "\n" across the cut
+        lines = stripped.splitlines()
+        if len(lines) >= n:
+            return "\n".join(lines[-n:])
+        k *= 2
+    return _prompt_detection_text(strip_ansi(content))
+
+
 @dataclass
 class ClassifyResult:
     """Pure result of off-loop content classification for one pane (t1111_4).
@@ -223,7 +254,8 @@ def classify_content(
 
     Since t1467 matching is **scoped to the pane's own agent**: ``agent`` is a
     resolved key from ``lib/agent_keys.agent_key_from_pane``, and patterns owned
-    by a different agent are dropped (``prompt_patterns.scope_patterns``). The
+    by a different agent are dropped (``prompt_patterns.scope_patterns``, applied
+    once per agent by the cached ``prompt_matcher``). The
     default ``""`` preserves the pre-t1467 flat-list behaviour, which is also
     what an unresolvable pane command gets — so no caller is broken and no
     working detection is lost.
@@ -238,13 +270,14 @@ def classify_content(
     awaiting_input = False
     awaiting_input_kind = ""
     if category == PaneCategory.AGENT and prompt_patterns:
-        stripped_text = compare_value if mode == COMPARE_MODE_STRIPPED else strip_ansi(content)
-        prompt_text = _prompt_detection_text(stripped_text)
-        for p in scope_patterns(prompt_patterns, agent_key):
-            if p.regex.search(prompt_text):
-                awaiting_input = True
-                awaiting_input_kind = p.name
-                break
+        if mode == COMPARE_MODE_STRIPPED:
+            prompt_text = _prompt_detection_text(compare_value)
+        else:
+            prompt_text = _stripped_prompt_detection_text(content)
+        kind = prompt_matcher(prompt_patterns, agent_key).first_match(prompt_text)
+        if kind is not None:
+            awaiting_input = True
+            awaiting_input_kind = kind
     return ClassifyResult(
         compare_value=compare_value,
         awaiting_input=awaiting_input,
@@ -928,17 +961,81 @@ def _quote_arg(arg: str) -> str:
     return '"' + arg.replace("\\", "\\\\").replace('"', '\\"') + '"'
 
 
+# Pane-content notifications the event-driven refresh listens for. Matched on
+# the raw bytes BEFORE decoding: an `%output` line carries the pane's whole
+# (octal-escaped) output chunk and only its pane id is of interest.
+_PANE_EVENT_PREFIXES = (b"%output ", b"%extended-output ", b"%pane-mode-changed ")
+# Window-level notifications after which any pane of the session may capture
+# differently with no `%output` of its own (a resize reflows the history).
+_LAYOUT_EVENT_PREFIXES = (b"%layout-change ", b"%window-pane-changed ")
+
+
+class PaneDirtyTracker:
+    """Thread-safe set of panes whose content changed since their last capture.
+
+    Fed from the control client's reader (on the backend's bg thread) by
+    :meth:`on_event`, drained from the refresh (on the UI loop) by
+    :meth:`claim`. Starts "all dirty", and goes back to it whenever the event
+    stream may have had a gap (a reconnect, a layout change), so a pane is
+    only ever treated as clean on the strength of an unbroken stream.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dirty: set[str] = set()
+        self._all = True
+
+    def on_event(self, pane_id: str | None) -> None:
+        """Mark ``pane_id`` dirty; ``None`` marks every pane dirty."""
+        with self._lock:
+            if pane_id is None:
+                self._all = True
+            else:
+                self._dirty.add(pane_id)
+
+    def mark(self, pane_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._dirty.update(pane_ids)
+
+    def claim(self, pane_ids: Iterable[str]) -> set[str]:
+        """Return which of ``pane_ids`` are dirty, and clear them.
+
+        Clearing at claim time (before the capture is issued) is what keeps
+        the tracker race-free: output arriving while the capture is in flight
+        re-marks the pane, so the next tick captures it again.
+        """
+        ids = set(pane_ids)
+        with self._lock:
+            if self._all:
+                self._all = False
+                self._dirty.clear()
+                return ids
+            claimed = self._dirty & ids
+            self._dirty -= claimed
+            return claimed
+
+
 class TmuxControlClient:
-    """Single persistent `tmux -C` control client."""
+    """Single persistent `tmux -C` control client.
+
+    With ``on_pane_event`` set the client also subscribes to pane output: the
+    attach drops the ``no-output`` flag and every ``%output`` /
+    ``%pane-mode-changed`` notification calls ``on_pane_event(pane_id)``
+    (``None`` for a layout change) from the reader task. Only panes of the
+    attached session are reported — tmux sends a control client the output of
+    its own session's windows only.
+    """
 
     def __init__(
         self,
         session: str,
         command_timeout: float = 5.0,
         socket_args: list[str] | None = None,
+        on_pane_event: Callable[[str | None], None] | None = None,
     ):
         self.session = session
         self.command_timeout = command_timeout
+        self._on_pane_event = on_pane_event
         # Socket flag (``-L <name>`` or ``[]``) cached once — never re-read
         # per request (this client serves the monitor refresh hot path). When
         # not supplied, resolved from ``AITASKS_TMUX_SOCKET`` via the gateway so
@@ -967,9 +1064,10 @@ class TmuxControlClient:
         channel exactly as it reaches TmuxClient's subprocess path. Extracted as
         a method so the argv is unit-testable without spawning a process.
         """
+        flags = "ignore-size" if self._on_pane_event else "no-output,ignore-size"
         return [
             "tmux", *self._socket_args, "-C", "attach", "-t", self.session,
-            "-f", "no-output,ignore-size",
+            "-f", flags,
         ]
 
     async def start(self) -> bool:
@@ -1013,6 +1111,18 @@ class TmuxControlClient:
                 line_bytes = await self._proc.stdout.readline()
                 if not line_bytes:
                     break  # EOF
+                # tmux never interleaves notifications with a %begin/%end
+                # block, so outside one a `%output` prefix is always an event.
+                if self._capturing is None and self._on_pane_event is not None:
+                    if line_bytes.startswith(_PANE_EVENT_PREFIXES):
+                        parts = line_bytes.split(b" ", 2)
+                        if len(parts) > 1:
+                            self._on_pane_event(
+                                parts[1].decode("ascii", errors="replace").strip())
+                        continue
+                    if line_bytes.startswith(_LAYOUT_EVENT_PREFIXES):
+                        self._on_pane_event(None)
+                        continue
                 line = line_bytes.decode("utf-8", errors="replace")
                 if line.endswith("\n"):
                     line = line[:-1]
@@ -1038,9 +1148,9 @@ class TmuxControlClient:
                 elif _EXIT_RE.match(line):
                     break  # tmux server is going away
                 # Any other %-line outside a Capturing block is an async
-                # event (filtered to `no-output`-only by the spawn flags,
-                # but tmux can still emit %sessions-changed, %client-detached,
-                # etc.). Discard.
+                # event (pane output is filtered by the `no-output` spawn
+                # flag unless subscribed above, but tmux can still emit
+                # %sessions-changed, %client-detached, etc.). Discard.
         except (asyncio.CancelledError, ConnectionResetError, OSError):
             pass
         finally:
@@ -1185,9 +1295,14 @@ class TmuxControlBackend:
         session: str,
         command_timeout: float = 5.0,
         socket_args: list[str] | None = None,
+        on_pane_event: Callable[[str | None], None] | None = None,
     ):
         self.session = session
         self.command_timeout = command_timeout
+        # Output subscription (event-driven refresh), threaded into every
+        # client like the socket flag. Invoked with ``None`` after a reconnect:
+        # notifications emitted while the channel was down are lost.
+        self._on_pane_event = on_pane_event
         # Cached socket flag, passed to every client this backend constructs
         # (initial start + every supervisor reconnect) so a reconnected channel
         # keeps the same socket. Resolved from AITASKS_TMUX_SOCKET when not
@@ -1240,9 +1355,7 @@ class TmuxControlBackend:
             self._loop = None
             return False
         self._thread = thread
-        client = TmuxControlClient(
-            self.session, self.command_timeout, socket_args=self._socket_args
-        )
+        client = self._new_client()
         cf = asyncio.run_coroutine_threadsafe(client.start(), self._loop)
         try:
             ok = cf.result(timeout=_BACKEND_START_TIMEOUT)
@@ -1257,6 +1370,12 @@ class TmuxControlBackend:
         self.stop()
         return False
 
+    def _new_client(self) -> TmuxControlClient:
+        return TmuxControlClient(
+            self.session, self.command_timeout,
+            socket_args=self._socket_args, on_pane_event=self._on_pane_event,
+        )
+
     def _spawn_supervisor(self) -> None:
         """Schedule the reconnect supervisor on the bg loop (fire-and-forget).
 
@@ -1312,12 +1431,11 @@ class TmuxControlBackend:
                     await asyncio.sleep(delay)
                     if self._stop_requested:
                         return
-                    new_client = TmuxControlClient(
-                        self.session, self.command_timeout,
-                        socket_args=self._socket_args,
-                    )
+                    new_client = self._new_client()
                     if await new_client.start():
                         self._client = new_client
+                        if self._on_pane_event is not None:
+                            self._on_pane_event(None)
                         self._set_state(TmuxControlState.CONNECTED)
                         reconnected = True
                         break
@@ -1448,6 +1566,29 @@ class TmuxControlBackend:
             return (-1, "")
 
 
+# Upper bound on how long event-driven mode trusts a pane's cached capture
+# without a notification (see `TmuxMonitor._split_clean_panes`).
+_EVENT_RESYNC_SECONDS = 30.0
+
+
+def _classify_key(pane: TmuxPaneInfo, mode: str) -> tuple:
+    """Every per-pane input of `classify_content` besides the content itself."""
+    return (mode, pane.category, pane.current_command, pane.pane_pid)
+
+
+@dataclass
+class _CachedCapture:
+    """One pane's last capture + classification, reused while it stays clean."""
+    content: str
+    result: ClassifyResult
+    captured_at: float          # TmuxMonitor._monotonic() at capture
+    key: tuple                  # _classify_key() the result was computed for
+    patterns: list              # prompt_patterns object used (identity check)
+
+    def matches(self, pane: TmuxPaneInfo, mode: str, patterns: list) -> bool:
+        return self.patterns is patterns and self.key == _classify_key(pane, mode)
+
+
 class TmuxMonitor:
     # Session-discovery cache TTL: `discover_aitasks_sessions()` runs `tmux
     # list-sessions` plus a serial `list-panes -s` per session, which is
@@ -1467,6 +1608,8 @@ class TmuxMonitor:
         multi_session: bool = True,
         compare_mode_default: str = DEFAULT_COMPARE_MODE,
         prompt_patterns: list[PromptPattern] | None = None,
+        event_driven: bool = False,
+        shared_capture: bool = False,
     ):
         self.session = session
         self.capture_lines = capture_lines
@@ -1532,6 +1675,24 @@ class TmuxMonitor:
         self._sessions_cache: tuple[float, list[AitasksSession]] | None = None
         self._compare_mode_overrides: dict[str, str] = {}
         self._backend: TmuxControlBackend | None = None
+        # Event-driven refresh: the control client subscribes to pane output
+        # and this tracker records which panes produced any since their last
+        # capture. While the channel is CONNECTED, `capture_all_classified_async`
+        # recaptures only those (plus panes outside the attached session, which
+        # the channel cannot see) and reuses `_event_captures` for the rest.
+        # None = poll every pane every tick, exactly as before.
+        self._dirty_tracker: PaneDirtyTracker | None = (
+            PaneDirtyTracker() if event_driven else None
+        )
+        self._event_captures: dict[str, _CachedCapture] = {}
+        # Shared capture: subscribe to the per-tmux-server snapshot service
+        # (monitor/snapshot_service.py) and adopt its batches instead of
+        # running discovery + capture + classify here. The feed is created on
+        # the first async capture (it needs a running loop); until it has a
+        # fresh batch — and whenever the service is gone — the local pipeline
+        # runs as before.
+        self.shared_capture = shared_capture
+        self._snapshot_feed = None
         # Gateway owns the exec strategy (control-client-vs-subprocess dispatch)
         # and the socket flag; tmux_run / _tmux_async delegate to it (t952_3).
         self._tmux = TmuxClient()
@@ -1543,7 +1704,11 @@ class TmuxMonitor:
         do not need to change. The body is synchronous — the bg thread does
         the actual asyncio work — so awaiting it just yields once.
         """
-        backend = TmuxControlBackend(session=self.session)
+        tracker = self._dirty_tracker
+        backend = TmuxControlBackend(
+            session=self.session,
+            on_pane_event=tracker.on_event if tracker is not None else None,
+        )
         if backend.start():
             self._backend = backend
             return True
@@ -1555,6 +1720,9 @@ class TmuxMonitor:
             with contextlib.suppress(Exception):
                 self._backend.stop()
             self._backend = None
+        feed, self._snapshot_feed = self._snapshot_feed, None
+        if feed is not None:
+            await feed.close()
 
     def has_control_client(self) -> bool:
         return self._backend is not None and self._backend.is_alive
@@ -2508,6 +2676,8 @@ class TmuxMonitor:
             del self._last_content[pid]
             self._last_change_time.pop(pid, None)
             self._pane_cache.pop(pid, None)
+        for pid in [pid for pid in self._event_captures if pid not in current_ids]:
+            del self._event_captures[pid]
         for pid in list(self._compare_mode_overrides):
             if pid not in current_ids:
                 self._compare_mode_overrides.pop(pid, None)
@@ -2550,6 +2720,11 @@ class TmuxMonitor:
         immediately before the raw-capture gather — not here beside ``gen``. See
         the comment at that site (t1216_1).
         """
+        batch = self._shared_batch()
+        if batch is not None:
+            adopted = await self._adopt_feed_batch(batch)
+            if adopted is not None:
+                return adopted
         gen = self._next_generation()
         # Caller-owned sink: the enumerated-session set belongs to THIS call, so
         # an overlapping discovery cannot hand its answer to our generation.
@@ -2589,32 +2764,196 @@ class TmuxMonitor:
         # commit anyway — `commit_snapshots` rejects it at the same check).
         if gen == self._capture_generation:
             self._full_shadow_seq = (gen, self._next_shadow_write_seq())
+        # Event-driven mode: only panes with output since their last capture
+        # (or that the channel cannot vouch for) are fetched; the rest reuse
+        # their cached capture. Without a live subscription, fetch everything.
+        tracker = self._dirty_tracker
+        if tracker is not None and self.control_state() != TmuxControlState.CONNECTED:
+            tracker = None
+        if tracker is not None:
+            to_fetch, clean = self._split_clean_panes(all_panes, tracker)
+        else:
+            to_fetch, clean = all_panes, {}
         raw_results = await asyncio.gather(
-            *(self.capture_pane_content_async(p.pane_id, pane=p) for p in all_panes),
+            *(self.capture_pane_content_async(p.pane_id, pane=p) for p in to_fetch),
             return_exceptions=True,
         )
+        fetched = {p.pane_id: res for p, res in zip(to_fetch, raw_results)}
 
         # Read per-pane mode on the loop (invariant B) and assemble the batch.
+        # A clean pane whose classify inputs are unchanged keeps its cached
+        # result; one whose mode/category/command moved is reclassified from
+        # its cached content (no capture needed).
+        patterns = self.prompt_patterns  # read on loop, passed by value
         to_classify: list[tuple[TmuxPaneInfo, str, str]] = []
+        reused: dict[str, tuple[str, ClassifyResult]] = {}
         failed: list[TmuxPaneInfo] = []
-        for pane, res in zip(all_panes, raw_results):
+        for pane in all_panes:
+            mode = self.get_compare_mode(pane.pane_id)
+            cached = clean.get(pane.pane_id)
+            if cached is not None:
+                if cached.matches(pane, mode, patterns):
+                    reused[pane.pane_id] = (cached.content, cached.result)
+                else:
+                    to_classify.append((pane, cached.content, mode))
+                continue
+            res = fetched.get(pane.pane_id)
             if isinstance(res, tuple):
                 _, content = res
-                to_classify.append((pane, content, self.get_compare_mode(pane.pane_id)))
+                to_classify.append((pane, content, mode))
             else:
                 # None (fetch miss) or an Exception (fault): keep prior content.
                 failed.append(pane)
 
-        patterns = self.prompt_patterns  # read on loop, passed by value
         classified_ok = await self._run_offloaded(
             lambda: _classify_batch(to_classify, patterns)
         )
-        classified: list[tuple[TmuxPaneInfo, str | None, ClassifyResult | None]] = list(
-            classified_ok
-        )
+        if tracker is not None:
+            self._store_event_captures(gen, tracker, classified_ok, failed)
+        by_id = {pane.pane_id: (pane, content, result)
+                 for pane, content, result in classified_ok}
+        classified: list[tuple[TmuxPaneInfo, str | None, ClassifyResult | None]] = []
+        for pane in all_panes:
+            if pane.pane_id in by_id:
+                classified.append(by_id[pane.pane_id])
+            elif pane.pane_id in reused:
+                classified.append((pane, *reused[pane.pane_id]))
         classified.extend((pane, None, None) for pane in failed)
         return gen, classified
 
+    def _shared_batch(self):
+        """The snapshot service's latest batch, or None to capture locally."""
+        if not self.shared_capture:
+            return None
+        feed = self._snapshot_feed
+        if feed is None:
+            try:
+                from .snapshot_service import SnapshotFeed
+            except ImportError:  # imported top-level (tests)
+                from snapshot_service import SnapshotFeed  # noqa: E402
+            feed = SnapshotFeed.for_monitor(self)
+            if feed is None:
+                self.shared_capture = False   # no private socket dir
+                return None
+            self._snapshot_feed = feed
+            feed.start()
+        return feed.current()
+
+    async def _adopt_feed_batch(self, batch):
+        """Produce phase from a shared batch — the same contract as the local
+        pipeline below, without touching tmux.
+
+        The service runs multi-session with no excluded pane, so this viewer
+        drops its own ``exclude_pane`` and, in single-session mode, every pane
+        outside ``self.session``; a session the service did not enumerate
+        returns None (capture locally — its view cannot vouch for it). Pane
+        cache, discovery facts and the shadow seq are updated exactly as local
+        discovery would. Results are reused when the service classified the
+        pane in this viewer's compare mode and reclassified locally from the
+        shared content otherwise.
+        """
+        if not self.multi_session and self.session not in batch.enumerated:
+            return None
+        gen = self._next_generation()
+        entries = [
+            e for e in batch.entries
+            if e[0].pane_id != self.exclude_pane
+            and (self.multi_session or e[0].session_name == self.session)
+        ]
+        panes = [e[0] for e in entries if not e[0].shadow_target]
+        shadows = [e[0] for e in entries if e[0].shadow_target]
+        for pane in panes:
+            self._pane_cache[pane.pane_id] = pane
+        if batch.sessions is not None:
+            self._sessions_cache = (time.monotonic(), list(batch.sessions))
+        enumerated = (batch.enumerated if self.multi_session
+                      else frozenset({self.session}))
+        self._record_discovery_facts(gen, panes, shadows, enumerated)
+        if gen == self._capture_generation:
+            self._full_shadow_seq = (gen, self._next_shadow_write_seq())
+        patterns = self.prompt_patterns
+        to_classify: list[tuple[TmuxPaneInfo, str, str]] = []
+        for pane, content, result, mode in entries:
+            want = self.get_compare_mode(pane.pane_id)
+            if content is not None and (result is None or mode != want):
+                to_classify.append((pane, content, want))
+        reclassified: dict[str, tuple] = {}
+        if to_classify:
+            reclassified = {
+                pane.pane_id: (pane, content, result)
+                for pane, content, result in await self._run_offloaded(
+                    lambda: _classify_batch(to_classify, patterns))
+            }
+        classified: list[tuple[TmuxPaneInfo, str | None, ClassifyResult | None]] = []
+        failed: list[TmuxPaneInfo] = []
+        for pane, content, result, _mode in entries:
+            if pane.pane_id in reclassified:
+                classified.append(reclassified[pane.pane_id])
+            elif content is None:
+                failed.append(pane)
+            else:
+                classified.append((pane, content, result))
+        classified.extend((pane, None, None) for pane in failed)
+        return gen, classified
+
+    def _split_clean_panes(
+        self, panes: list[TmuxPaneInfo], tracker: PaneDirtyTracker
+    ) -> tuple[list[TmuxPaneInfo], dict[str, "_CachedCapture"]]:
+        """Partition ``panes`` into ``(to_fetch, clean)`` for event-driven mode.
+
+        A pane is clean when it lives in the attached session (the only one
+        whose output the channel reports), has a cached capture younger than
+        ``_EVENT_RESYNC_SECONDS`` and produced no output since. The resync
+        bound is a backstop against anything that changes a capture without
+        emitting a notification — it keeps a missed event from freezing a pane
+        for longer than that, not something correctness relies on.
+        """
+        watched = [p for p in panes if p.session_name == self.session]
+        dirty = tracker.claim(p.pane_id for p in watched)
+        now = self._monotonic()
+        clean: dict[str, _CachedCapture] = {}
+        for pane in watched:
+            cached = self._event_captures.get(pane.pane_id)
+            if (
+                pane.pane_id not in dirty
+                and cached is not None
+                and now - cached.captured_at < _EVENT_RESYNC_SECONDS
+            ):
+                clean[pane.pane_id] = cached
+        return [p for p in panes if p.pane_id not in clean], clean
+
+    def _store_event_captures(
+        self,
+        gen: int,
+        tracker: PaneDirtyTracker,
+        classified: list[tuple[TmuxPaneInfo, str, ClassifyResult]],
+        failed: list[TmuxPaneInfo],
+    ) -> None:
+        """Cache this cycle's fresh captures for reuse by later clean ticks.
+
+        A superseded cycle must not cache: its captures may be older than
+        ones a newer cycle already stored. It re-marks its panes dirty
+        instead, because it already claimed them from the tracker and the
+        newer cycle will not see them as dirty. Failed fetches are re-marked
+        for the same reason.
+        """
+        tracker.mark(p.pane_id for p in failed)
+        if gen != self._capture_generation:
+            tracker.mark(pane.pane_id for pane, _, _ in classified)
+            return
+        now = self._monotonic()
+        patterns = self.prompt_patterns
+        for pane, content, result in classified:
+            prev = self._event_captures.get(pane.pane_id)
+            # A clean pane reclassified from its cache keeps its capture time,
+            # so the resync bound still counts from the real capture.
+            captured_at = (prev.captured_at
+                           if prev is not None and prev.content is content else now)
+            self._event_captures[pane.pane_id] = _CachedCapture(
+                content, result, captured_at,
+                _classify_key(pane, self.get_compare_mode(pane.pane_id)), patterns,
+            )
+
     def commit_snapshots(
         self,
         gen: int,
@@ -2944,6 +3283,8 @@ def load_monitor_config(project_root: Path) -> dict:
         "agent_prefixes": list(DEFAULT_AGENT_PREFIXES),
         "tui_names": set(DEFAULT_TUI_NAMES),
         "compare_mode_default": DEFAULT_COMPARE_MODE,
+        "event_driven": False,
+        "shared_capture": False,
     }
     config_path = project_root / "aitasks" / "metadata" / "project_config.yaml"
     if not config_path.is_file():
@@ -2969,6 +3310,10 @@ def load_monitor_config(project_root: Path) -> dict:
             val = str(monitor["compare_mode_default"])
             if val in COMPARE_MODES:
                 defaults["compare_mode_default"] = val
+        if "event_driven_refresh" in monitor:
+            defaults["event_driven"] = bool(monitor["event_driven_refresh"])
+        if "shared_capture" in monitor:
+            defaults["shared_capture"] = bool(monitor["shared_capture"])
     except Exception:
         pass
     return defaults
@@ -3649,10 +3994,9 @@ class TaskInfoCache:
             if exclude_id is not None and sib_id == exclude_id:
                 continue
             try:
-                raw = path.read_text(encoding="utf-8")
+                parsed = shared_index(root / "aitasks").parse_file(path)
             except OSError:
                 continue
-            parsed = parse_frontmatter(raw)
             if parsed is None:
                 continue
             metadata, body, _ = parsed
@@ -3718,10 +4062,9 @@ class TaskInfoCache:
             sib_child = m.group(1)
             sib_id = f"{parent}_{sib_child}"
             try:
-                raw = path.read_text(encoding="utf-8")
+                parsed = shared_index(root / "aitasks").parse_file(path)
             except OSError:
                 continue
-            parsed = parse_frontmatter(raw)
             if parsed is None:
                 continue
             metadata, body, _ = parsed
@@ -3815,11 +4158,12 @@ class TaskInfoCache:
         identity = _file_identity(str(task_path))
 
         try:
+            st = task_path.stat()           # before the read, same rule
             raw = task_path.read_text(encoding="utf-8")
         except OSError:
             return None
 
-        parsed = parse_frontmatter(raw)
+        parsed = shared_index(tasks_dir).parse_text(task_path, raw, st)
         if parsed is None:
             return None
         metadata, body, _ = parsed
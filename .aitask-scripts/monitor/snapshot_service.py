@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+"""snapshot_service.py - one shared capture pipeline per tmux server.
+
+In an ``ait ide`` layout the monitor, one minimonitor per agent window and the
+applink server each own a :class:`~monitor.monitor_core.TmuxMonitor` and poll
+tmux on their own timers — eight agents meant about eight independent
+discover / capture / classify loops against the same tmux server. With
+``tmux.monitor.shared_capture: true`` the produce phase moves here:
+
+  * :class:`SnapshotService` (``snapshot_service.py serve``) owns ONE
+    multi-session ``TmuxMonitor`` and runs its ``capture_all_classified_async``
+    at the fastest cadence any subscriber asks for, then publishes the batch to
+    every subscriber over a Unix socket. Load on the tmux server is one
+    pipeline, however many viewers are open.
+  * :class:`SnapshotFeed` lives inside each viewer's ``TmuxMonitor``
+    (``shared_capture=True``) and keeps the latest batch. The viewer's
+    ``capture_all_classified_async`` adopts it instead of touching tmux, and
+    keeps its own commit: idle clock, shadow merge, discovery facts and
+    compare-mode overrides stay per viewer, exactly as before. A pane whose
+    compare mode differs from the service's is reclassified locally from the
+    shared content (no capture).
+
+The service is an optimization, never a dependency. No socket, a dead service
+or a batch older than the staleness bound makes :meth:`SnapshotFeed.current`
+return ``None`` and the viewer captures in-process for that tick, while the
+feed (re)spawns the service in the background. The service exits on its own
+after :data:`IDLE_EXIT_S` without subscribers.
+
+Wire: newline-delimited JSON. A subscriber sends ``{"op": "subscribe",
+"interval": S}`` and later ``{"op": "interval", "interval": S}`` whenever its
+own refresh cadence changes; the service answers with one ``batch`` per tick::
+
+    {"type": "batch", "v": N, "base": N-1, "t": <epoch>, "interval": S,
+     "order": [pane ids], "enumerated": [sessions],
+     "sessions": [...],                       # only when it changed
+     "changed": {pane_id: {"pane", "content", "result", "mode"}},
+     "removed": [pane ids]}
+
+``base == 0`` is a full batch (the first one on every connection); otherwise
+``base`` must equal the subscriber's current version or the subscriber
+reconnects for a fresh full batch. A tick that changed nothing still sends a
+(near-empty) batch — it is the heartbeat the staleness bound is measured
+against. A subscriber that stops reading is dropped, not waited for.
+
+One service per tmux server *and* capture configuration (capture lines, agent
+prefixes, TUI names, default compare mode, event-driven refresh): the socket
+name hashes them, so viewers of two projects with different
+``tmux.monitor`` settings never share a pipeline. Sockets live in a private
+``${XDG_RUNTIME_DIR:-/tmp}/aitasks-monitor-<uid>/`` directory and peers of
+another uid are refused.
+
+Usage:
+    snapshot_service.py serve --socket PATH [--params JSON] [--idle-exit S]
+    snapshot_service.py status | stop
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+_MONITOR_DIR = Path(__file__).resolve().parent
+_SCRIPTS_DIR = _MONITOR_DIR.parent
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+if str(_SCRIPTS_DIR / "lib") not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR / "lib"))
+
+from monitor.monitor_core import (  # noqa: E402
+    AitasksSession,
+    ClassifyResult,
+    PaneCategory,
+    TmuxMonitor,
+    TmuxPaneInfo,
+    tmux_socket_args,
+)
+from private_socket import peer_uid, private_dir  # noqa: E402
+
+# Bumped on any incompatible wire change; part of the socket name, so an old
+# service left running by a previous checkout is simply never found.
+PROTOCOL = 1
+
+IDLE_EXIT_S = 60.0
+DEFAULT_INTERVAL_S = 2.0
+MIN_INTERVAL_S = 0.5
+MAX_INTERVAL_S = 30.0
+# A batch older than max(STALE_FLOOR_S, STALE_TICKS × service interval) is not
+# served: the viewer captures in-process instead of freezing on old content.
+STALE_FLOOR_S = 10.0
+STALE_TICKS = 3
+# Reconnect backoff, and the minimum gap between two spawn attempts from one
+# feed (a service that cannot start must not be re-spawned every tick).
+RETRY_MIN_S = 0.25
+RETRY_MAX_S = 5.0
+SPAWN_RETRY_S = 30.0
+# One full batch of 200-line captures across many panes can run to megabytes.
+STREAM_LIMIT = 64 * 1024 * 1024
+# Outbound bytes queued for one subscriber before it is dropped as too slow.
+HIGH_WATER_BYTES = 32 * 1024 * 1024
+# Gaps between a viewer's own refreshes kept for its cadence estimate.
+_CADENCE_SAMPLES = 8
+
+
+# -- wire helpers ------------------------------------------------------------
+
+def pane_to_wire(pane: TmuxPaneInfo) -> dict:
+    d = dataclasses.asdict(pane)
+    d["category"] = pane.category.value
+    return d
+
+
+def pane_from_wire(d: dict) -> TmuxPaneInfo:
+    return TmuxPaneInfo(**{**d, "category": PaneCategory(d["category"])})
+
+
+def session_to_wire(s: AitasksSession) -> dict:
+    d = dataclasses.asdict(s)
+    d["project_root"] = str(s.project_root)
+    return d
+
+
+def session_from_wire(d: dict) -> AitasksSession:
+    return AitasksSession(**{**d, "project_root": Path(d["project_root"])})
+
+
+def _encode(msg: dict) -> bytes:
+    return json.dumps(msg, separators=(",", ":")).encode(
+        "utf-8", "surrogateescape") + b"\n"
+
+
+def _clamp_interval(value) -> float:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_INTERVAL_S
+    if value != value:   # NaN
+        return DEFAULT_INTERVAL_S
+    return min(MAX_INTERVAL_S, max(MIN_INTERVAL_S, value))
+
+
+# -- socket location ---------------------------------------------------------
+
+def run_dir(env=None) -> str:
+    env = os.environ if env is None else env
+    base = env.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(base, f"aitasks-monitor-{os.getuid()}")
+
+
+def service_params(monitor: TmuxMonitor) -> dict:
+    """The configuration a service must share with ``monitor`` to serve it.
+
+    Everything that shapes the produced batch. ``idle_threshold`` and compare
+    overrides are deliberately absent — they only affect the viewer-side
+    commit — and so is ``session``, which only picks the control client's
+    attach target (the service enumerates every aitasks session).
+    """
+    return {
+        "capture_lines": monitor.capture_lines,
+        "agent_prefixes": list(monitor.agent_prefixes),
+        "tui_names": sorted(monitor.tui_names),
+        "compare_mode_default": monitor.compare_mode_default,
+        "event_driven": monitor._dirty_tracker is not None,
+    }
+
+
+def socket_path(params: dict, env=None) -> str:
+    """The service socket for the current tmux server and ``params``."""
+    env = os.environ if env is None else env
+    server = tmux_socket_args()
+    if not server:
+        # Ambient resolution: the server is whatever $TMUX points at.
+        server = [env.get("TMUX", "").split(",", 1)[0]]
+    key = json.dumps({
+        "protocol": PROTOCOL,
+        "server": server,
+        "tmpdir": env.get("TMUX_TMPDIR", ""),
+        "params": params,
+    }, sort_keys=True)
+    name = hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()[:16]
+    return os.path.join(run_dir(env), f"{name}.sock")
+
+
+# -- publisher (service side) ------------------------------------------------
+
+class BatchPublisher:
+    """Turn successive produced batches into versioned delta messages.
+
+    Pure bookkeeping, no I/O: remembers the last published entry per pane so a
+    tick only ships the panes whose pane info, content, result or mode moved,
+    and can rebuild the full current state for a subscriber that just joined.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._entries: dict[str, dict] = {}
+        self._order: list[str] = []
+        self._enumerated: list[str] = []
+        self._sessions: list[dict] | None = None
+        self._stamp = 0.0
+
+    def publish(self, classified, enumerated, sessions, mode_of) -> dict:
+        entries: dict[str, dict] = {}
+        for pane, content, result in classified:
+            entries[pane.pane_id] = {
+                "pane": pane_to_wire(pane),
+                "content": content,
+                "result": (dataclasses.asdict(result)
+                           if result is not None else None),
+                "mode": mode_of(pane.pane_id),
+            }
+        old = self._entries
+        self.version += 1
+        self._stamp = time.time()
+        msg = {
+            "type": "batch", "v": self.version, "base": self.version - 1,
+            "t": self._stamp, "order": list(entries),
+            "enumerated": sorted(enumerated),
+            "changed": {pid: e for pid, e in entries.items() if old.get(pid) != e},
+            "removed": [pid for pid in old if pid not in entries],
+        }
+        wire_sessions = [session_to_wire(s) for s in sessions]
+        if wire_sessions != self._sessions:
+            msg["sessions"] = wire_sessions
+        self._entries, self._order = entries, msg["order"]
+        self._enumerated, self._sessions = msg["enumerated"], wire_sessions
+        return msg
+
+    def full(self) -> dict | None:
+        """The current state as a ``base: 0`` batch; None before the first tick."""
+        if not self.version:
+            return None
+        return {
+            "type": "batch", "v": self.version, "base": 0, "t": self._stamp,
+            "order": list(self._order), "enumerated": list(self._enumerated),
+            "sessions": self._sessions, "changed": dict(self._entries),
+            "removed": [],
+        }
+
+
+# -- feed (viewer side) ------------------------------------------------------
+
+class FeedBatch(NamedTuple):
+    """The latest shared batch, decoded for :meth:`TmuxMonitor._adopt_feed_batch`.
+
+    ``entries`` are ``(pane, content, result, mode)`` in the service's batch
+    order — ``(pane, None, None, mode)`` for a pane whose capture failed there.
+    ``sessions`` is None when the service has not reported any yet.
+    """
+    version: int
+    entries: list
+    enumerated: frozenset
+    sessions: list | None
+
+
+class SnapshotFeed:
+    """Subscriber end: keep the latest batch from the service at ``path``.
+
+    :meth:`start` launches the connection task on the running loop; it
+    reconnects with backoff and, when ``spawn_argv`` is given, starts the
+    service itself if nothing listens. :meth:`current` is the per-tick read —
+    synchronous, never waits on the socket.
+    """
+
+    def __init__(self, path: str, *, spawn_argv: list[str] | None = None,
+                 interval: float = DEFAULT_INTERVAL_S, clock=time.monotonic):
+        self.path = path
+        self.spawn_argv = spawn_argv
+        self._clock = clock
+        self._interval = _clamp_interval(interval)
+        self._sent_interval: float | None = None
+        self._gaps: list[float] = []
+        self._last_call: float | None = None
+        self._version = 0
+        self._entries: dict[str, tuple] = {}
+        self._order: list[str] = []
+        self._enumerated: frozenset = frozenset()
+        self._sessions: list | None = None
+        self._service_interval = DEFAULT_INTERVAL_S
+        self._received = 0.0
+        self._batch: FeedBatch | None = None
+        self._writer = None
+        self._task: asyncio.Task | None = None
+        self._spawned_at: float | None = None
+
+    @classmethod
+    def for_monitor(cls, monitor: TmuxMonitor) -> "SnapshotFeed | None":
+        """A feed for the service matching ``monitor``'s configuration, or
+        None when no private socket directory is available."""
+        params = service_params(monitor)
+        path = socket_path(params)
+        if not private_dir(os.path.dirname(path)):
+            return None
+        argv = [sys.executable, str(Path(__file__).resolve()), "serve",
+                "--socket", path, "--session", monitor.session,
+                "--params", json.dumps(params)]
+        return cls(path, spawn_argv=argv)
+
+    # -- state ------------------------------------------------------------
+
+    def apply(self, msg: dict) -> bool:
+        """Fold one ``batch`` message in; False on a version gap."""
+        base = msg.get("base", 0)
+        if base == 0:
+            entries: dict[str, tuple] = {}
+            self._sessions = None
+        elif base != self._version:
+            return False
+        else:
+            entries = self._entries
+        for pid in msg.get("removed", ()):
+            entries.pop(pid, None)
+        for pid, e in msg.get("changed", {}).items():
+            result = e.get("result")
+            entries[pid] = (
+                pane_from_wire(e["pane"]), e.get("content"),
+                ClassifyResult(**result) if result is not None else None,
+                e.get("mode", ""),
+            )
+        if msg.get("sessions") is not None:
+            self._sessions = [session_from_wire(s) for s in msg["sessions"]]
+        self._entries = entries
+        self._order = [pid for pid in msg.get("order", ()) if pid in entries]
+        self._enumerated = frozenset(msg.get("enumerated", ()))
+        self._service_interval = _clamp_interval(msg.get("interval"))
+        self._version = msg.get("v", self._version + 1)
+        self._received = self._clock()
+        self._batch = None
+        return True
+
+    def reset(self) -> None:
+        self._version = 0
+        self._entries = {}
+        self._batch = None
+
+    @property
+    def stale_after(self) -> float:
+        return max(STALE_FLOOR_S, STALE_TICKS * self._service_interval)
+
+    def current(self) -> FeedBatch | None:
+        """The latest batch, or None when disconnected or stale.
+
+        Also the cadence probe: the gaps between a viewer's calls are its
+        refresh interval, reported to the service so the shared pipeline
+        runs exactly as often as its fastest viewer needs.
+        """
+        now = self._clock()
+        if self._last_call is not None:
+            self._note_gap(now - self._last_call)
+        self._last_call = now
+        if not self._version or now - self._received > self.stale_after:
+            return None
+        if self._batch is None:
+            self._batch = FeedBatch(
+                self._version, [self._entries[pid] for pid in self._order],
+                self._enumerated, self._sessions,
+            )
+        return self._batch
+
+    def _note_gap(self, gap: float) -> None:
+        self._gaps.append(gap)
+        del self._gaps[:-_CADENCE_SAMPLES]
+        gaps = sorted(self._gaps)
+        self._interval = _clamp_interval(gaps[len(gaps) // 2])
+        sent = self._sent_interval
+        if sent is not None and abs(self._interval - sent) > 0.1 * sent:
+            self._send({"op": "interval", "interval": self._interval})
+
+    def _send(self, msg: dict) -> None:
+        writer = self._writer
+        if writer is None:
+            return
+        if msg.get("interval") is not None:
+            self._sent_interval = msg["interval"]
+        with contextlib.suppress(Exception):
+            writer.write(_encode(msg))
+
+    # -- connection -------------------------------------------------------
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(BaseException):
+                await task
+        self.reset()
+
+    async def _run(self) -> None:
+        delay = RETRY_MIN_S
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    self.path, limit=STREAM_LIMIT)
+            except OSError:
+                self._maybe_spawn()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RETRY_MAX_S)
+                continue
+            delay = RETRY_MIN_S
+            self._writer = writer
+            try:
+                self._send({"op": "subscribe", "interval": self._interval})
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    msg = json.loads(line)
+                    if msg.get("type") == "batch" and not self.apply(msg):
+                        break   # version gap: reconnect for a full batch
+            except (OSError, ValueError):
+                pass
+            finally:
+                self._writer = None
+                self.reset()
+                writer.close()
+            await asyncio.sleep(RETRY_MIN_S)
+
+    def _maybe_spawn(self) -> None:
+        if self.spawn_argv is None:
+            return
+        now = time.monotonic()
+        if self._spawned_at is not None and now - self._spawned_at < SPAWN_RETRY_S:
+            return
+        self._spawned_at = now
+        import subprocess
+        # The service is nobody's pane: without TMUX_PANE its monitor
+        # excludes no pane, and each viewer filters its own.
+        env = {k: v for k, v in os.environ.items() if k != "TMUX_PANE"}
+        try:
+            log = open(self.path[:-len(".sock")] + ".log", "ab")
+        except OSError:
+            return
+        with log:
+            with contextlib.suppress(OSError):
+                subprocess.Popen(
+                    self.spawn_argv, stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL, stderr=log, env=env,
+                    cwd=str(_SCRIPTS_DIR), start_new_session=True,
+                    close_fds=True,
+                )
+
+
+# -- service -----------------------------------------------------------------
+
+class _Subscriber:
+    __slots__ = ("writer", "interval")
+
+    def __init__(self, writer, interval: float):
+        self.writer = writer
+        self.interval = interval
+
+
+class SnapshotService:
+    """Run ``monitor``'s produce phase for every subscriber of ``path``."""
+
+    def __init__(self, path: str, monitor: TmuxMonitor, *,
+                 idle_exit_s: float = IDLE_EXIT_S):
+        self.path = path
+        self.monitor = monitor
+        self.idle_exit_s = idle_exit_s
+        self.publisher = BatchPublisher()
+        self.ticks = 0
+        self.started = time.time()
+        self._subs: set[_Subscriber] = set()
+        self._wake = asyncio.Event()
+        self._stop = asyncio.Event()
+
+    def interval(self) -> float:
+        if not self._subs:
+            return DEFAULT_INTERVAL_S
+        return min(sub.interval for sub in self._subs)
+
+    def status(self) -> dict:
+        return {
+            "pid": os.getpid(), "socket": self.path, "started": self.started,
+            "subscribers": len(self._subs), "interval": self.interval(),
+            "ticks": self.ticks, "version": self.publisher.version,
+        }
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    async def run(self) -> int:
+        import fcntl
+
+        if not private_dir(os.path.dirname(self.path)):
+            print(f"snapshot service: {os.path.dirname(self.path)} is not a "
+                  f"private directory", file=sys.stderr, flush=True)
+            return 1
+        lock = open(self.path + ".lock", "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return 0                     # another service owns this socket
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(
+            self._on_client, path=self.path, limit=STREAM_LIMIT)
+        os.chmod(self.path, 0o600)
+        with contextlib.suppress(Exception):
+            await self.monitor.start_control_client()
+        print(f"snapshot service {os.getpid()}: serving {self.path}",
+              file=sys.stderr, flush=True)
+        try:
+            await self._loop()
+        finally:
+            server.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+            for sub in list(self._subs):
+                sub.writer.close()
+            self._subs.clear()
+            with contextlib.suppress(Exception):
+                await self.monitor.close_control_client()
+            lock.close()
+        return 0
+
+    async def _loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        idle_since = loop.time()
+        while not self._stop.is_set():
+            if not self._subs:
+                if loop.time() - idle_since >= self.idle_exit_s:
+                    return
+                await self._sleep(min(1.0, self.idle_exit_s))
+                continue
+            started = loop.time()
+            try:
+                await self.tick()
+            except Exception as exc:     # keep serving; the next tick retries
+                print(f"snapshot service: tick failed: {exc!r}",
+                      file=sys.stderr, flush=True)
+            idle_since = loop.time()
+            await self._sleep(self.interval() - (loop.time() - started))
+
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep, cut short by a new subscriber, a faster interval or stop."""
+        if seconds > 0:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), seconds)
+        self._wake.clear()
+
+    async def tick(self) -> None:
+        mon = self.monitor
+        gen, classified = await mon.capture_all_classified_async()
+        if mon.commit_snapshots(gen, classified) is None:
+            return
+        cache = mon._sessions_cache
+        msg = self.publisher.publish(
+            classified, mon.last_enumerated_sessions(),
+            cache[1] if cache is not None else [], mon.get_compare_mode,
+        )
+        self.ticks += 1
+        msg["interval"] = self.interval()
+        self._broadcast(_encode(msg))
+
+    def _broadcast(self, data: bytes) -> None:
+        for sub in list(self._subs):
+            transport = sub.writer.transport
+            if transport.is_closing():
+                self._subs.discard(sub)
+            elif transport.get_write_buffer_size() > HIGH_WATER_BYTES:
+                # Too slow to keep up: drop it; it reconnects for a full batch.
+                self._subs.discard(sub)
+                sub.writer.close()
+            else:
+                sub.writer.write(data)
+
+    async def _on_client(self, reader, writer) -> None:
+        uid = peer_uid(writer.get_extra_info("socket"))
+        if uid is not None and uid != os.getuid():
+            writer.close()
+            return
+        sub = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                msg = json.loads(line)
+                op = msg.get("op")
+                if op == "subscribe" and sub is None:
+                    sub = _Subscriber(writer, _clamp_interval(msg.get("interval")))
+                    self._subs.add(sub)
+                    full = self.publisher.full()
+                    if full is not None:
+                        full["interval"] = self.interval()
+                        writer.write(_encode(full))
+                    self._wake.set()
+                elif op == "interval" and sub is not None:
+                    faster = _clamp_interval(msg.get("interval")) < self.interval()
+                    sub.interval = _clamp_interval(msg.get("interval"))
+                    if faster:
+                        self._wake.set()
+                elif op == "status":
+                    writer.write(_encode(self.status()))
+                    await writer.drain()
+                elif op == "stop":
+                    writer.write(_encode({"stopping": os.getpid()}))
+                    await writer.drain()
+                    self.stop()
+        except (OSError, ValueError):
+            pass
+        finally:
+            if sub is not None:
+                self._subs.discard(sub)
+            writer.close()
+
+
+# -- CLI ---------------------------------------------------------------------
+
+def _serve(args) -> int:
+    params = json.loads(args.params) if args.params else {}
+    if "tui_names" in params:
+        params["tui_names"] = set(params["tui_names"])
+    # Never exclude a pane here: the service is nobody's pane, and every
+    # viewer drops its own exclude pane from the shared batch.
+    os.environ.pop("TMUX_PANE", None)
+    monitor = TmuxMonitor(session=args.session, multi_session=True, **params)
+    return asyncio.run(
+        SnapshotService(args.socket, monitor, idle_exit_s=args.idle_exit).run())
+
+
+def _query_all(op: str) -> int:
+    found = 0
+    try:
+        names = sorted(n for n in os.listdir(run_dir()) if n.endswith(".sock"))
+    except OSError:
+        names = []
+    for name in names:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(5.0)
+            sock.connect(os.path.join(run_dir(), name))
+            sock.sendall(_encode({"op": op}))
+            print(sock.makefile("rb").readline().decode().strip())
+            found += 1
+        except OSError:
+            continue
+        finally:
+            sock.close()
+    if not found:
+        print("no snapshot service running")
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(prog="snapshot_service.py", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("serve", help="run a snapshot service")
+    p.add_argument("--socket", required=True)
+    p.add_argument("--session", default="aitasks",
+                   help="session the control client attaches to")
+    p.add_argument("--params", help="TmuxMonitor capture settings (JSON)")
+    p.add_argument("--idle-exit", type=float, default=IDLE_EXIT_S)
+    sub.add_parser("status", help="print every running service's status")
+    sub.add_parser("stop", help="stop every running service")
+    args = parser.parse_args(argv)
+    if args.cmd == "serve":
+        return _serve(args)
+    return _query_all(args.cmd)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Benchmark the applink live-frame content pipeline: before vs after.
+
+Replays a recorded agent session — a sequence of `tmux capture-pane -e`
+captures of one pane — through the per-tick work `pusher._push_pane` does for
+a changed pane: parse the live viewport, sign every row, try the `append`
+fast path, else `deltify`, else a keyframe, and encode the frame. Two
+pipelines, asserted to emit byte-identical frames before timing:
+
+  * before — every visible row re-parsed through `parse_sgr_line` and
+    re-signed every tick, `deltify` hashing the rows again, and the
+    quadratic prefix-scan `detect_append` (`_legacy_detect_append`);
+  * after  — `content.parse_viewport` (per-line LRU memo of spans and
+    signature), `deltify` reusing those signatures, and the Z-array
+    `content.detect_append`.
+
+Reports frames by type, bytes/frame (identical by construction — the wire
+format did not change) and CPU µs/frame (process time, median of --repeat
+replays), plus the line-memo hit rate.
+
+Sessions:
+  * default — three synthetic agent sessions generated in-process: a
+    streaming log (pure scrolls -> `append`), a TUI agent (scrolling
+    transcript above a fixed, spinner-animated prompt box -> `delta`), and a
+    blank-heavy idle pane with a ticking status row (the repetitive worst case
+    for the old shift scan);
+  * --session FILE — a recorded session: JSON lines of
+    `{"content": <capture -e text>, "height": <pane rows>}`;
+  * --record TARGET --out FILE — record one: capture tmux pane TARGET
+    --frames times, --interval seconds apart, into FILE (then --session it).
+
+Usage:
+    python3 aidocs/benchmarks/bench_applink_content.py [--session FILE ...]
+        [--height N] [--frames N] [--repeat N] [--seed N]
+    python3 aidocs/benchmarks/bench_applink_content.py --record %3 \\
+        --out /tmp/agent.jsonl [--frames N] [--interval S]
+
+Needs msgpack (the frame encoders), as the applink server does.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / ".aitask-scripts" / "applink"))
+
+import content as C  # noqa: E402
+
+CURSOR = [0, 0, False, 0]
+
+
+# -- recorded / synthetic sessions --------------------------------------------
+
+def _sgr(code: str, text: str) -> str:
+    return f"\x1b[{code}m{text}\x1b[0m"
+
+
+def _streaming_log(rng, height, frames):
+    """`tail -f` of a build / agent log: 1-3 new coloured lines per tick."""
+    levels = [("32", "INFO "), ("33", "WARN "), ("36", "DEBUG"), ("1;31", "ERROR")]
+    lines, n = [], 0
+    for _ in range(height):
+        n += 1
+        lines.append(f"{_sgr('2', f'{n:06d}')} {_sgr('32', 'INFO ')} warming up")
+    out = []
+    for _ in range(frames):
+        for _ in range(rng.randint(1, 3)):
+            n += 1
+            code, lvl = rng.choice(levels)
+            lines.append(f"{_sgr('2', f'{n:06d}')} {_sgr(code, lvl)} "
+                         f"step {rng.randint(0, 999)}: compiled "
+                         f"{_sgr('1', f'module_{rng.randint(0, 99)}.py')} in "
+                         f"{rng.random() * 3:.2f}s")
+        out.append({"content": "\n".join(lines[-height:]) + "\n", "height": height})
+    return out
+
+
+def _tui_agent(rng, height, frames):
+    """Agent TUI: transcript scrolling above a fixed prompt box and a spinner."""
+    spinner = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+    box = [_sgr("38;5;244", "╭" + "─" * 78 + "╮"),
+           _sgr("38;5;244", "│") + " > " + " " * 75 + _sgr("38;5;244", "│"),
+           _sgr("38;5;244", "╰" + "─" * 78 + "╯")]
+    body_h = height - len(box) - 1
+    transcript = [""] * body_h
+    out = []
+    for t in range(frames):
+        if rng.random() < 0.4:
+            transcript.append(_sgr("38;2;215;119;87", "●") + " "
+                              + " ".join(rng.choice(["Read", "Edit", "the", "file",
+                                                     "tests", "pass", "now", "ok"])
+                                         for _ in range(rng.randint(3, 12))))
+        status = (_sgr("38;2;215;119;87", spinner[t % len(spinner)])
+                  + f" Working… ({t // 5}s · esc to interrupt)")
+        rows = transcript[-body_h:] + [status] + box
+        out.append({"content": "\n".join(rows) + "\n", "height": height})
+    return out
+
+
+def _idle_blank(rng, height, frames):
+    """Mostly-blank pane with one ticking status row at the top."""
+    out = []
+    for t in range(frames):
+        rows = [_sgr("7", f" agent idle {t:5d}s ")] + [""] * (height - 1)
+        out.append({"content": "\n".join(rows) + "\n", "height": height})
+    return out
+
+
+def _synthetic(args):
+    rng = random.Random(args.seed)
+    return {
+        "streaming-log": _streaming_log(rng, args.height, args.frames),
+        "tui-agent": _tui_agent(rng, args.height, args.frames),
+        "idle-blank": _idle_blank(rng, args.height, args.frames),
+    }
+
+
+def _load(path: str):
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def _record(args) -> None:
+    with open(args.out, "w", encoding="utf-8") as fh:
+        for _ in range(args.frames):
+            text = subprocess.run(["tmux", "capture-pane", "-p", "-e", "-t", args.record],
+                                  check=True, capture_output=True, text=True).stdout
+            height = int(subprocess.run(
+                ["tmux", "display-message", "-p", "-t", args.record, "#{pane_height}"],
+                check=True, capture_output=True, text=True).stdout.strip() or 0)
+            fh.write(json.dumps({"content": text, "height": height}) + "\n")
+            time.sleep(args.interval)
+    print(f"recorded {args.frames} captures of {args.record} -> {args.out}")
+
+
+# -- the two pipelines -----------------------------------------------------------
+
+def _legacy_detect_append(prev_sigs, new_sigs):
+    if prev_sigs is None:
+        return None
+    H = len(new_sigs)
+    if H == 0 or len(prev_sigs) != H:
+        return None
+    for k in range(1, H):
+        if all(new_sigs.get(i) == prev_sigs.get(i + k) for i in range(H - k)):
+            return k
+    return None
+
+
+def _parse_before(text, height):
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines = lines[:-1]
+    lines = lines[-height:] if height > 0 else []
+    parsed = []
+    for row_id, line in enumerate(lines):
+        spans, urls = C.parse_sgr_line(line)
+        parsed.append((row_id, spans, urls))
+    sigs = {row_id: C.row_signature(spans) for row_id, spans, _u in parsed}
+    return parsed, sigs
+
+
+def _replay(session, after: bool):
+    """Run the push decision over every capture; returns ([frame bytes], kinds)."""
+    if after:
+        C.clear_line_cache()
+    frames, kinds = [], []
+    prev = None
+    for fid, cap in enumerate(session, 1):
+        height = cap["height"]
+        if after:
+            parsed, sigs = C.parse_viewport(cap["content"], height)
+            k = C.detect_append(prev, sigs)
+        else:
+            parsed, sigs = _parse_before(cap["content"], height)
+            k = _legacy_detect_append(prev, sigs)
+        if prev is not None and sigs == prev:
+            kinds.append("none")
+            continue
+        frame = None
+        if k is not None:
+            appended = parsed[len(parsed) - k:]
+            if not any(u for _r, _s, urls in appended for u in urls):
+                frame = C.encode_append("%1", fid, [[r, s] for r, s, _u in appended])
+                kinds.append("append")
+        if frame is None and prev is not None:
+            changed, removed, _ns, subset = (C.deltify(prev, parsed, sigs) if after
+                                             else C.deltify(prev, parsed))
+            if len(changed) + len(removed) < len(parsed):
+                frame = C.encode_delta("%1", fid, fid - 1, CURSOR,
+                                       changed + [[r, []] for r in removed],
+                                       C.build_osc8(subset) or None)
+                kinds.append("delta")
+        if frame is None:
+            frame = C.encode_keyframe("%1", fid, 80, height, CURSOR,
+                                      [[r, s] for r, s, _u in parsed],
+                                      C.build_osc8(parsed) or None)
+            kinds.append("keyframe")
+        frames.append(frame)
+        prev = sigs
+    return frames, kinds
+
+
+def _cpu(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.process_time()
+        fn()
+        samples.append(time.process_time() - t0)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--session", action="append", default=[],
+                        help="recorded session JSONL (repeatable); default: synthetic")
+    parser.add_argument("--height", type=int, default=50)
+    parser.add_argument("--frames", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--record", metavar="TARGET", help="tmux pane to record")
+    parser.add_argument("--out", help="output JSONL for --record")
+    parser.add_argument("--interval", type=float, default=0.2)
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.out:
+            parser.error("--record needs --out")
+        _record(args)
+        return
+
+    sessions = ({Path(p).name: _load(p) for p in args.session} if args.session
+                else _synthetic(args))
+    print(f"median process time of {args.repeat} replays; CPU covers parse + "
+          f"sign + append/delta detection + encode")
+    for name, session in sessions.items():
+        before, kinds = _replay(session, after=False)
+        after, kinds_after = _replay(session, after=True)
+        assert before == after and kinds == kinds_after, f"{name}: pipelines disagree"
+        hit_rate = C.line_cache_stats["hits"] / max(
+            1, C.line_cache_stats["hits"] + C.line_cache_stats["misses"])
+        n = len(session)
+        counts = {k: kinds.count(k) for k in ("keyframe", "delta", "append", "none")}
+        nbytes = sum(len(f) for f in before)
+        t_before = _cpu(lambda s=session: _replay(s, after=False), args.repeat)
+        t_after = _cpu(lambda s=session: _replay(s, after=True), args.repeat)
+        print(f"\n{name}: {n} captures, {counts}")
+        print(f"  bytes/frame  {nbytes / n:9.1f}  (before == after)")
+        print(f"  before       {t_before / n * 1e6:9.1f} us/frame")
+        print(f"  after        {t_after / n * 1e6:9.1f} us/frame   "
+              f"({t_before / max(t_after, 1e-9):.1f}x faster, "
+              f"line-memo hit rate {hit_rate:.0%})")
+
+
+if __name__ == "__main__":
+    main()
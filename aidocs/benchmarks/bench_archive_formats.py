@@ -5,6 +5,12 @@ Compares tar.gz (current), tar.zst, zip, tar.xz, and uncompressed tar
 across five operations: list files, check file existence, extract single
 file, create archive, and compression ratio.
 
+"tar.zst (indexed)" is the random-access layout from
+.aitask-scripts/lib/archive_index.py: one zstd frame per member plus an
+.idx sidecar, so extract_single is one seek + one frame decode. It is the
+format to compare against "tar.zst (pipe)" (the streaming path
+archive_iter.find_archived_markdown_by_id used before the index).
+
 Uses existing old*.tar.gz archives as test data.
 
 Usage:
@@ -337,6 +343,43 @@ class TarZstPipe(ArchiveFormat):
         raise FileNotFoundError(f"{filename} not in {archive_path}")
 
 
+class TarZstIndexed(ArchiveFormat):
+    """tar.zst in the indexed layout (lib/archive_index.py) + .idx sidecar."""
+    name = "tar.zst (indexed)"
+    extension = ".indexed.tar.zst"
+
+    def __init__(self, archive_index):
+        self._ai = archive_index
+
+    def create(self, source_dir: Path, output_path: Path) -> None:
+        self._ai.write_indexed_archive(source_dir, output_path)
+
+    def list_files(self, archive_path: Path) -> List[str]:
+        members = self._ai.load_index(archive_path) or []
+        return [_normalize_tar_name(name) for name, _off, _len in members]
+
+    def check_file_exists(self, archive_path: Path, filename: str) -> bool:
+        return filename in set(self.list_files(archive_path))
+
+    def extract_single(self, archive_path: Path, filename: str) -> bytes:
+        base = os.path.basename(filename)
+        found = self._ai.read_indexed_member(archive_path, lambda n: n == base)
+        if not isinstance(found, tuple):
+            raise FileNotFoundError(f"{filename} not in {archive_path}")
+        return found[1].encode("utf-8")
+
+
+def load_archive_index(project_root: Path):
+    """Import lib/archive_index.py from the project under test, or None."""
+    lib = project_root / ".aitask-scripts" / "lib"
+    if not (lib / "archive_index.py").is_file():
+        return None
+    if str(lib) not in sys.path:
+        sys.path.insert(0, str(lib))
+    import archive_index
+    return archive_index
+
+
 class ZipPython(ArchiveFormat):
     name = "zip (Python)"
     extension = ".zip"
@@ -669,6 +712,13 @@ def main() -> None:
                 all_formats.append(TarZstPipe())
             else:
                 print("WARN: zstd CLI not found, skipping tar.zst")
+            archive_index = load_archive_index(root)
+            if archive_index is None:
+                print("WARN: lib/archive_index.py not found, skipping indexed tar.zst")
+            elif caps.has_zstd_cli or archive_index._BINDING is not None:
+                print(f"Indexed tar.zst decoder: "
+                      f"{archive_index._BINDING_NAME or 'zstd CLI (one frame)'}")
+                all_formats.append(TarZstIndexed(archive_index))
         if not want or "tar.xz" in want:
             all_formats.append(TarPython("tar.xz (Python)", ".tar.xz", "w:xz", "r:xz"))
         if not want or "zip" in want:
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark `KanbanApp.refresh_board` against board size: teardown vs reconcile.
+
+Builds a synthetic board per size (`tests/lib/board_fixture.wide_topology`:
+N parent tasks spread round-robin over five columns), boots the real board in
+a headless Textual pilot, and times one refresh — from the call until the
+message pump has settled the resulting mounts, removals and the deferred
+`apply_filter` — in two modes:
+
+  * teardown  — the old path: `#board_container.remove_children()` and every
+    column and card remounted (`_reconcile_kanban` patched to refuse);
+  * reconcile — the keyed path: columns by `col_id`, cards by task filename,
+    only changed units rebuilt.
+
+Two refresh shapes per size:
+
+  * idle    — nothing changed on disk (the auto-refresh tick);
+  * one     — one task file rewritten in between (the common edit).
+
+Reports the median wall ms over --repeat refreshes, plus how many TaskCards
+the refresh mounted (0 for an idle reconcile).
+
+Usage:
+    python3 aidocs/benchmarks/bench_board_refresh.py [--sizes 50,200,600]
+        [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO / "tests" / "lib"))
+sys.path.insert(0, str(REPO / ".aitask-scripts" / "board"))
+sys.path.insert(0, str(REPO / ".aitask-scripts" / "lib"))
+
+import board_fixture as bf  # noqa: E402
+
+
+async def _settle(pilot, times=3):
+    for _ in range(times):
+        await pilot.pause()
+
+
+async def _measure(ab, n, mode, shape, repeat):
+    timings, mounted = [], []
+    app = ab.KanbanApp()
+    patch = (mock.patch.object(ab.KanbanApp, "_reconcile_kanban",
+                               lambda self, *a, **k: False)
+             if mode == "teardown" else contextlib.nullcontext())
+    tasks_dir = Path("aitasks")
+    with patch:
+        async with app.run_test(size=(200, 60)) as pilot:
+            await _settle(pilot)
+            for i in range(repeat):
+                if shape == "one":
+                    task = bf.wide_topology(n)[i % n]
+                    task = bf.FixtureTask(task_id=task.task_id, col=task.col,
+                                          idx=task.idx, slug=task.slug,
+                                          extra={"effort": f"{mode}{i}"})
+                    task.path_in(tasks_dir).write_text(task.text())
+                app.manager.load_tasks()
+                before = set(app.query(ab.TaskCard))
+                t0 = time.perf_counter()
+                app.refresh_board()
+                await _settle(pilot)
+                timings.append((time.perf_counter() - t0) * 1000)
+                mounted.append(sum(1 for c in app.query(ab.TaskCard)
+                                   if c not in before))
+    return statistics.median(timings), statistics.median(mounted)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="50,200,600")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'cards':>6} {'shape':>5} {'teardown ms':>12} {'reconcile ms':>13} "
+          f"{'mounted (td/rc)':>16}")
+    cwd = os.getcwd()
+    for n in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory(prefix="bench_board_") as tmp:
+            tree = bf.build_fixture_tree(Path(tmp), bf.wide_topology(n))
+            os.chdir(tree)
+            try:
+                ab = bf.load_board_module(bf.TASK_DIR_VALUE, tag=f"bench{n}")
+                for shape in ("idle", "one"):
+                    td, td_m = asyncio.run(_measure(ab, n, "teardown", shape, args.repeat))
+                    rc, rc_m = asyncio.run(_measure(ab, n, "reconcile", shape, args.repeat))
+                    print(f"{n:>6} {shape:>5} {td:>12.1f} {rc:>13.1f} "
+                          f"{f'{td_m:.0f}/{rc_m:.0f}':>16}")
+            finally:
+                os.chdir(cwd)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark windowed kanban columns against fully mounted ones, by board size.
+
+Builds a synthetic board per size (`tests/lib/board_fixture.wide_topology`:
+N parent tasks spread round-robin over five columns, so N/5 rows a column),
+boots the real board in a headless Textual pilot and times, in two modes:
+
+  * full     — every row mounted (`KanbanColumn.VIRTUALIZE_MIN_ROWS` patched
+    out of reach): the board before windowing;
+  * windowed — the shipped threshold: columns above it mount their viewport
+    plus `WINDOW_OVERSCAN` rows and spacers stand in for the rest.
+
+Three shapes, each until the message pump has settled:
+
+  * boot    — `run_test` start to a settled first frame;
+  * search  — one narrowing search keystroke's `apply_filter`, then clearing it;
+  * scroll  — every column scrolled to its end and back to the top.
+
+Reports wall ms per shape plus the TaskCards mounted after boot.
+
+Usage:
+    python3 aidocs/benchmarks/bench_board_virtual_column.py [--sizes 500,1500]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO / "tests" / "lib"))
+sys.path.insert(0, str(REPO / ".aitask-scripts" / "board"))
+sys.path.insert(0, str(REPO / ".aitask-scripts" / "lib"))
+
+import board_fixture as bf  # noqa: E402
+
+
+async def _settle(pilot, times=4):
+    for _ in range(times):
+        await pilot.pause()
+
+
+async def _measure(ab, mode):
+    patch = (mock.patch.object(ab.KanbanColumn, "VIRTUALIZE_MIN_ROWS", 10**9)
+             if mode == "full" else contextlib.nullcontext())
+    out = {}
+    with patch:
+        app = ab.KanbanApp()
+        t0 = time.perf_counter()
+        async with app.run_test(size=(200, 60)) as pilot:
+            await _settle(pilot)
+            out["boot"] = (time.perf_counter() - t0) * 1000
+            out["cards"] = len(app.query(ab.TaskCard))
+
+            t0 = time.perf_counter()
+            app.search_filter = "wide7"
+            app.apply_filter()
+            await _settle(pilot)
+            app.search_filter = ""
+            app.apply_filter()
+            await _settle(pilot)
+            out["search"] = (time.perf_counter() - t0) * 1000
+
+            t0 = time.perf_counter()
+            for col in app.query(ab.KanbanColumn):
+                col.scroll_end(animate=False, immediate=True)
+            await _settle(pilot)
+            for col in app.query(ab.KanbanColumn):
+                col.scroll_home(animate=False, immediate=True)
+            await _settle(pilot)
+            out["scroll"] = (time.perf_counter() - t0) * 1000
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="500,1500")
+    args = ap.parse_args()
+
+    print(f"{'cards':>6} {'mode':>9} {'boot ms':>9} {'search ms':>10} "
+          f"{'scroll ms':>10} {'mounted':>8}")
+    cwd = os.getcwd()
+    for n in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory(prefix="bench_board_") as tmp:
+            tree = bf.build_fixture_tree(Path(tmp), bf.wide_topology(n))
+            os.chdir(tree)
+            try:
+                ab = bf.load_board_module(bf.TASK_DIR_VALUE, tag=f"bench{n}")
+                for mode in ("full", "windowed"):
+                    r = asyncio.run(_measure(ab, mode))
+                    print(f"{n:>6} {mode:>9} {r['boot']:>9.0f} {r['search']:>10.0f} "
+                          f"{r['scroll']:>10.0f} {r['cards']:>8}")
+            finally:
+                os.chdir(cwd)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark gate_ledger.code_digest on a synthetic dirty tree.
+
+Builds a throwaway git repo with --tracked committed files, --edited of them
+modified in the worktree, and --untracked untracked "build outputs" of
+--untracked-kb KiB each, then times, median of --repeat runs:
+
+  * uncached  — `_compute_code_digest` with no memo: `git rev-parse`,
+    one `git status --porcelain=v2`, then reads and hashes every edited and
+    untracked byte (what every call cost before the per-file memo);
+  * warm      — `code_digest()` with the per-file memo populated: the same two
+    git calls plus an `os.lstat` per listed path, no file read;
+  * one edit  — `code_digest()` right after one more file changed: only that
+    file is re-read.
+
+All three return the same digest; that is asserted before timing.
+
+Usage:
+    python3 aidocs/benchmarks/bench_code_digest.py [--tracked N] [--edited N]
+        [--untracked N] [--untracked-kb N] [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _build_tree(repo: Path, args) -> None:
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "bench@example.com")
+    _git(repo, "config", "user.name", "bench")
+    for i in range(args.tracked):
+        d = repo / "src" / f"pkg{i % 50}"
+        d.mkdir(parents=True, exist_ok=True)
+        (d / f"mod{i}.py").write_text(f"VALUE = {i}\n" * 40)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-qm", "seed")
+    for i in range(args.edited):
+        (repo / "src" / f"pkg{i % 50}" / f"mod{i}.py").write_text(f"VALUE = {-i}\n" * 40)
+    out = repo / "build"
+    out.mkdir()
+    blob = os.urandom(args.untracked_kb * 1024)
+    for i in range(args.untracked):
+        (out / f"artifact{i}.bin").write_bytes(blob[i:] + blob[:i])
+    # Back-date everything past the memo's racy window.
+    stamp = time.time() - 3600
+    for root, dirs, files in os.walk(repo):
+        dirs[:] = [d for d in dirs if d != ".git"]
+        for name in files:
+            os.utime(os.path.join(root, name), (stamp, stamp))
+
+
+def _median(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracked", type=int, default=2000)
+    parser.add_argument("--edited", type=int, default=200)
+    parser.add_argument("--untracked", type=int, default=200)
+    parser.add_argument("--untracked-kb", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent.parent
+    sys.path.insert(0, str(repo_root / ".aitask-scripts" / "lib"))
+    tmp = Path(tempfile.mkdtemp(prefix="bench_code_digest_"))
+    os.environ["XDG_CACHE_HOME"] = str(tmp / "xdg")
+    os.environ["AIT_DIGEST_CACHE"] = "1"
+    import gate_ledger as gl  # noqa: E402
+
+    try:
+        repo = tmp / "repo"
+        repo.mkdir()
+        _build_tree(repo, args)
+        cwd = str(repo)
+        total_mb = args.untracked * args.untracked_kb / 1024
+        print(f"{args.tracked} tracked files, {args.edited} edited, "
+              f"{args.untracked} untracked ({total_mb:.0f} MiB), "
+              f"median of {args.repeat}")
+
+        expected = gl._compute_code_digest(cwd)
+        assert gl.code_digest(cwd) == expected     # populates the memo
+        assert gl.code_digest(cwd) == expected     # served from it
+
+        uncached = _median(lambda: gl._compute_code_digest(cwd), args.repeat)
+        warm = _median(lambda: gl.code_digest(cwd), args.repeat)
+
+        target = repo / "src" / "pkg0" / "mod0.py"
+        counter = [0]
+
+        def one_edit():
+            counter[0] += 1
+            target.write_text(f"VALUE = 'edit {counter[0]}'\n")
+            stamp = time.time() - 3600 + counter[0]
+            os.utime(target, (stamp, stamp))
+            return gl.code_digest(cwd)
+
+        t_edit = _median(one_edit, args.repeat)
+        assert one_edit() == gl._compute_code_digest(cwd)
+
+        print(f"  uncached: {uncached * 1e3:8.1f} ms")
+        print(f"  warm:     {warm * 1e3:8.1f} ms   ({uncached / warm:.1f}x faster)")
+        print(f"  one edit: {t_edit * 1e3:8.1f} ms   (rehashes the edited file only)")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark CodeViewer.load_file on large files: one-shot vs background highlighting.
+
+Writes a synthetic Python file per size and opens it in a headless Textual pilot
+hosting a single `CodeViewer`, in two modes:
+
+  * one-shot — `SYNC_HIGHLIGHT_MAX_LINES` patched out of reach: the whole file
+    is highlighted inside `load_file`, as before the highlight engine;
+  * chunked  — the shipped behaviour: plain lines first, the worker swaps
+    highlighted chunks in (`codebrowser/highlight_engine.py`).
+
+Shapes, each with a fresh highlight cache unless noted:
+
+  * open   — `load_file` call until it returns (the UI thread is blocked);
+  * full   — `load_file` until the file is fully highlighted;
+  * reopen — a second `load_file` of the same file (served by the cache).
+
+Usage:
+    python3 aidocs/benchmarks/bench_code_viewer_highlight.py [--sizes 5000,20000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO / ".aitask-scripts" / "codebrowser"))
+sys.path.insert(0, str(REPO / ".aitask-scripts" / "lib"))
+
+from textual.app import App, ComposeResult  # noqa: E402
+
+from code_viewer import CodeViewer  # noqa: E402
+from highlight_engine import HighlightCache  # noqa: E402
+
+
+class _Host(App):
+    def compose(self) -> ComposeResult:
+        yield CodeViewer()
+
+
+def _source(lines: int) -> str:
+    block = ('def f{i}(x):\n    """Doc {i}."""\n'
+             '    return x + {i}  # c\n\n')
+    return "".join(block.format(i=i) for i in range(lines // 4))
+
+
+async def _measure(path: Path, mode: str) -> dict:
+    patch = (mock.patch.object(CodeViewer, "SYNC_HIGHLIGHT_MAX_LINES", 10**9)
+             if mode == "one-shot" else contextlib.nullcontext())
+    out = {}
+    with patch:
+        CodeViewer._highlight_cache = HighlightCache()
+        app = _Host()
+        async with app.run_test(size=(120, 40)) as pilot:
+            viewer = app.query_one(CodeViewer)
+            await pilot.pause()
+            t0 = time.perf_counter()
+            viewer.load_file(path)
+            out["open"] = (time.perf_counter() - t0) * 1000
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            out["full"] = (time.perf_counter() - t0) * 1000
+            t0 = time.perf_counter()
+            viewer.load_file(path)
+            out["reopen"] = (time.perf_counter() - t0) * 1000
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="5000,20000")
+    args = ap.parse_args()
+
+    print(f"{'lines':>7} {'mode':>9} {'open ms':>9} {'full ms':>9} {'reopen ms':>10}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory(prefix="bench_highlight_") as tmp:
+            path = Path(tmp) / "generated.py"
+            path.write_text(_source(n))
+            for mode in ("one-shot", "chunked"):
+                r = asyncio.run(_measure(path, mode))
+                print(f"{n:>7} {mode:>9} {r['open']:>9.0f} {r['full']:>9.0f} "
+                      f"{r['reopen']:>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,24 @@
 #!/usr/bin/env python3
-"""Benchmark monitor refresh: subprocess vs tmux -C control-mode.
+"""Benchmark monitor refresh: subprocess vs tmux -C control-mode vs event-driven.
 
-Spins up an isolated tmux server with N agent windows, then runs
-TmuxMonitor.capture_all_async() M times under two configurations:
+Spins up an isolated tmux server with N agent windows (B of them printing a
+line every 0.2 s, the rest silent), then runs TmuxMonitor.capture_all_async()
+M times under three configurations:
 
-  * subprocess — control client never started; every per-tick
+  * subprocess   — control client never started; every per-tick
     list-panes/capture-pane spawns a fresh `tmux ...` subprocess.
-  * control    — `await mon.start_control_client()` first; per-tick
+  * control      — `await mon.start_control_client()` first; per-tick
     requests go over a single persistent `tmux -C` connection.
+  * event-driven — `TmuxMonitor(event_driven=True)`: the control client
+    subscribes to `%output`, and only panes that printed since their last
+    capture are recaptured and reclassified.
 
-Reports median + p95 wall time, fork count per mode, and the
-speedup / fork-reduction ratios.
+Reports median + p95 wall time, fork count and capture-pane count per mode,
+and the speedup / fork-reduction ratios against the subprocess baseline.
 
 Usage:
     python3 aidocs/benchmarks/bench_monitor_refresh.py [--panes N]
-        [--iterations M] [--warmup K]
+        [--busy B] [--iterations M] [--warmup K]
 """
 from __future__ import annotations
 
@@ -32,9 +36,11 @@ from pathlib import Path
 WARMUP_DEFAULT = 3
 ITERATIONS_DEFAULT = 50
 PANES_DEFAULT = 5
+BUSY_DEFAULT = 1
+BUSY_COMMAND = "while :; do date; sleep 0.2; done"
 
 
-def setup_fixture(panes: int) -> tuple[str, Path]:
+def setup_fixture(panes: int, busy: int) -> tuple[str, Path]:
     tmpdir = Path(tempfile.mkdtemp(prefix="ait_bench_"))
     os.environ["TMUX_TMPDIR"] = str(tmpdir)
     os.environ["AITASKS_TMUX_SOCKET"] = ""
@@ -45,10 +51,11 @@ def setup_fixture(panes: int) -> tuple[str, Path]:
         check=True,
     )
     for i in range(panes):
+        command = BUSY_COMMAND if i < busy else "tail -f /dev/null"
         subprocess.run(
             [
                 "tmux", "new-window", "-t", f"{session}:",
-                "-n", f"agent-{i}", "tail -f /dev/null",
+                "-n", f"agent-{i}", command,
             ],
             check=True,
         )
@@ -60,20 +67,39 @@ def teardown_fixture(tmpdir: Path) -> None:
     shutil.rmtree(tmpdir, ignore_errors=True)
 
 
-async def measure(monitor, iterations: int, warmup: int) -> list[float]:
+async def measure(
+    monitor, iterations: int, warmup: int, interval: float
+) -> tuple[list[float], int]:
+    """Time `iterations` refreshes `interval` apart; also count capture-panes."""
+    captures = {"n": 0}
+    orig_capture = monitor.capture_pane_content_async
+
+    async def _counting_capture(*args, **kwargs):
+        captures["n"] += 1
+        return await orig_capture(*args, **kwargs)
+
+    monitor.capture_pane_content_async = _counting_capture
     for _ in range(warmup):
         await monitor.capture_all_async()
+    captures["n"] = 0
     times: list[float] = []
     for _ in range(iterations):
+        # Real refreshes are seconds apart; the gap is what lets a silent
+        # pane stay clean between ticks in the event-driven configuration.
+        await asyncio.sleep(interval)
         t0 = time.perf_counter()
         await monitor.capture_all_async()
         times.append(time.perf_counter() - t0)
-    return times
+    return times, captures["n"]
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--panes", type=int, default=PANES_DEFAULT)
+    parser.add_argument("--busy", type=int, default=BUSY_DEFAULT,
+                        help="how many of the panes keep printing output")
+    parser.add_argument("--interval", type=float, default=0.05,
+                        help="seconds between measured refreshes")
     parser.add_argument("--iterations", type=int, default=ITERATIONS_DEFAULT)
     parser.add_argument("--warmup", type=int, default=WARMUP_DEFAULT)
     args = parser.parse_args()
@@ -100,49 +126,52 @@ def main() -> None:
 
     TmuxClient.run_async = _counting_run_async
 
-    session, tmpdir = setup_fixture(args.panes)
+    session, tmpdir = setup_fixture(args.panes, args.busy)
     try:
-        async def run() -> tuple[list[float], list[float], int, int]:
-            mon_sub = TmuxMonitor(session=session, multi_session=False)
-            mon_ctrl = TmuxMonitor(session=session, multi_session=False)
-
-            # start_control_client itself spawns one subprocess
-            # (`tmux -C attach`) — reset the counter after that so the
-            # measurement window only sees per-tick activity.
-            await mon_ctrl.start_control_client()
-            try:
-                counts["n"] = 0
-                t_sub = await measure(mon_sub, args.iterations, args.warmup)
-                forks_sub = counts["n"]
-                counts["n"] = 0
-                t_ctrl = await measure(mon_ctrl, args.iterations, args.warmup)
-                forks_ctrl = counts["n"]
-            finally:
-                await mon_ctrl.close_control_client()
-            return t_sub, t_ctrl, forks_sub, forks_ctrl
-
-        t_sub, t_ctrl, forks_sub, forks_ctrl = asyncio.run(run())
-
-        for label, ts, forks in [
-            ("subprocess", t_sub, forks_sub),
-            ("control",    t_ctrl, forks_ctrl),
-        ]:
+        async def run() -> list[tuple[str, list[float], int, int]]:
+            configs = [
+                ("subprocess", TmuxMonitor(session=session, multi_session=False)),
+                ("control", TmuxMonitor(session=session, multi_session=False)),
+                ("event-driven", TmuxMonitor(session=session, multi_session=False,
+                                             event_driven=True)),
+            ]
+            results = []
+            for label, mon in configs:
+                # start_control_client itself spawns one subprocess
+                # (`tmux -C attach`) — reset the counter after that so the
+                # measurement window only sees per-tick activity.
+                if label != "subprocess":
+                    await mon.start_control_client()
+                try:
+                    counts["n"] = 0
+                    ts, captures = await measure(
+                        mon, args.iterations, args.warmup, args.interval)
+                    results.append((label, ts, counts["n"], captures))
+                finally:
+                    await mon.close_control_client()
+            return results
+
+        results = asyncio.run(run())
+
+        for label, ts, forks, captures in results:
             sorted_ts = sorted(ts)
             p95_idx = max(0, min(len(sorted_ts) - 1, int(len(sorted_ts) * 0.95)))
             p95 = sorted_ts[p95_idx]
             print(
-                f"{label}: median={statistics.median(ts) * 1000:7.2f} ms  "
-                f"p95={p95 * 1000:7.2f} ms  forks={forks}"
+                f"{label:>12}: median={statistics.median(ts) * 1000:7.2f} ms  "
+                f"p95={p95 * 1000:7.2f} ms  forks={forks}  captures={captures}"
             )
 
+        _, t_sub, forks_sub, _ = results[0]
         median_sub = statistics.median(t_sub)
-        median_ctrl = statistics.median(t_ctrl)
-        if median_ctrl > 0:
-            print(f"speedup:    {median_sub / median_ctrl:.2f}x")
-        if forks_ctrl > 0:
-            print(f"fork ratio: {forks_sub / forks_ctrl:.1f}x")
-        else:
-            print(f"fork ratio: subprocess={forks_sub} forks vs control=0 forks")
+        for label, ts, forks, _ in results[1:]:
+            median = statistics.median(ts)
+            if median > 0:
+                print(f"speedup ({label}):    {median_sub / median:.2f}x")
+            if forks > 0:
+                print(f"fork ratio ({label}): {forks_sub / forks:.1f}x")
+            else:
+                print(f"fork ratio ({label}): subprocess={forks_sub} forks vs 0 forks")
     finally:
         TmuxClient.run_async = _orig_run_async
         teardown_fixture(tmpdir)
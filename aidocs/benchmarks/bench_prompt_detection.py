@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark awaiting-input prompt detection over recorded pane captures.
+
+Runs `classify_content` against every live-captured fixture in
+tests/review_loop_fixtures.py (Claude, Codex and OpenCode panes at rest,
+working, and blocked on each dialog), in both compare modes, and compares it
+with the previous implementation reproduced inline below:
+
+  * loop     — `scope_patterns(...)` rebuilt per call and every regex searched
+    in turn; raw mode ANSI-strips the whole capture before taking the tail.
+  * matcher  — the cached per-agent `PromptMatcher` (literal prefilter, then
+    only the candidate regexes); raw mode strips only the detection tail.
+
+Reports the median cost per pane and per tick, where a tick classifies every
+fixture once (one pane each — ~40 agent panes, a busy monitor), plus the
+pattern-matching stage on its own: in stripped mode (the default) the full
+ANSI strip that `compare_value` needs dominates the total and is unchanged.
+
+Usage:
+    python3 aidocs/benchmarks/bench_prompt_detection.py [--repeat N]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPEAT_DEFAULT = 200
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=REPEAT_DEFAULT)
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent.parent
+    sys.path.insert(0, str(repo_root / ".aitask-scripts"))
+    sys.path.insert(0, str(repo_root / ".aitask-scripts" / "lib"))
+    sys.path.insert(0, str(repo_root / "tests"))
+    import review_loop_fixtures  # noqa: E402
+    from monitor.monitor_core import (  # noqa: E402
+        COMPARE_MODE_RAW,
+        COMPARE_MODE_STRIPPED,
+        ClassifyResult,
+        PaneCategory,
+        _prompt_detection_text,
+        classify_content,
+    )
+    from monitor.prompt_patterns import (  # noqa: E402
+        AGENT_KEYS,
+        all_patterns,
+        prompt_matcher,
+        scope_patterns,
+    )
+    from monitor.ansi_utils import strip_ansi  # noqa: E402
+
+    def classify_loop(content, mode, patterns, category, agent=""):
+        compare_value = strip_ansi(content) if mode == COMPARE_MODE_STRIPPED else content
+        agent_key = (agent or "").strip().lower()
+        scoped = agent_key in AGENT_KEYS
+        kind = ""
+        stripped = compare_value if mode == COMPARE_MODE_STRIPPED else strip_ansi(content)
+        prompt_text = _prompt_detection_text(stripped)
+        for p in scope_patterns(patterns, agent_key):
+            if p.regex.search(prompt_text):
+                kind = p.name
+                break
+        return ClassifyResult(compare_value, bool(kind), kind,
+                              agent_key if scoped else "", scoped)
+
+    panes = []
+    for name, value in vars(review_loop_fixtures).items():
+        if name.isupper() and isinstance(value, str):
+            agent = name.split("_", 1)[0].lower()
+            panes.append((value, agent if agent in AGENT_KEYS else "claude"))
+    patterns = all_patterns()
+
+    def tick(fn, mode):
+        t0 = time.perf_counter()
+        for content, agent in panes:
+            fn(content, mode, patterns, PaneCategory.AGENT, agent)
+        return time.perf_counter() - t0
+
+    print(f"{len(panes)} recorded captures, {args.repeat} ticks each")
+    for mode in (COMPARE_MODE_STRIPPED, COMPARE_MODE_RAW):
+        for content, agent in panes:   # same answers before timing anything
+            a = classify_loop(content, mode, patterns, PaneCategory.AGENT, agent)
+            b = classify_content(content, mode, patterns, PaneCategory.AGENT, agent)
+            assert a == b, (mode, agent)
+        impls = (("loop", classify_loop), ("matcher", classify_content))
+        ticks = {label: [] for label, _ in impls}
+        for fn in (f for _, f in impls):
+            tick(fn, mode)   # warm caches
+        # Interleaved, so background load drifts both series alike.
+        for _ in range(args.repeat):
+            for label, fn in impls:
+                ticks[label].append(tick(fn, mode))
+        medians = {}
+        for label, _ in impls:
+            medians[label] = statistics.median(ticks[label])
+            print(f"{mode:>8} {label:>8}: per tick={medians[label] * 1e3:7.3f} ms  "
+                  f"per pane={medians[label] / len(panes) * 1e6:7.2f} us")
+        print(f"{mode:>8} speedup: {medians['loop'] / medians['matcher']:.2f}x")
+
+    def match_loop(text, agent):
+        for p in scope_patterns(patterns, agent):
+            if p.regex.search(text):
+                return p.name
+        return None
+
+    def match_matcher(text, agent):
+        return prompt_matcher(patterns, agent).first_match(text)
+
+    texts = [(_prompt_detection_text(strip_ansi(c)), a) for c, a in panes]
+    match_ticks = {"loop": [], "matcher": []}
+    for _ in range(args.repeat):
+        for label, fn in (("loop", match_loop), ("matcher", match_matcher)):
+            t0 = time.perf_counter()
+            for text, agent in texts:
+                fn(text, agent)
+            match_ticks[label].append(time.perf_counter() - t0)
+    loop_m = statistics.median(match_ticks["loop"])
+    matcher_m = statistics.median(match_ticks["matcher"])
+    print(f"   match     loop: per pane={loop_m / len(panes) * 1e6:7.2f} us")
+    print(f"   match  matcher: per pane={matcher_m / len(panes) * 1e6:7.2f} us")
+    print(f"   match speedup: {loop_m / matcher_m:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
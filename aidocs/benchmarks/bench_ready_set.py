@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark agentcrew ReadySet against a full rescan on a synthetic crew DAG.
+
+Builds --agents agents in --layers layers; each agent depends on up to
+--fanin random agents of earlier layers. The crew is then played to the end
+the way the runner sees it: every ready agent goes Running, then Completed,
+one status change at a time, and after EACH change the ready set is asked
+for again. Timed, median of --repeat plays:
+
+  * rescan   — `_rescan_ready`, the pre-ReadySet algorithm (every Waiting
+    agent's depends_on checked on every question), as the runner and
+    `ait crew status list` used to answer;
+  * readyset — one long-lived `ReadySet`, told each change with `set_agent`;
+  * sync     — one long-lived `ReadySet` fed the whole status map through
+    `sync()` (what the runner does per iteration: no re-walk of dependency
+    lists, only an O(agents) comparison of (status, depends_on)).
+
+The three are asserted to agree at every step before timing.
+
+Usage:
+    python3 aidocs/benchmarks/bench_ready_set.py [--agents N] [--layers N]
+        [--fanin N] [--repeat N] [--seed N]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / ".aitask-scripts"))
+
+from agentcrew.agentcrew_utils import ReadySet  # noqa: E402
+
+
+def _rescan_ready(agent_data: dict[str, dict]) -> list[str]:
+    ready = []
+    for name, data in agent_data.items():
+        if data.get("status") != "Waiting":
+            continue
+        deps = data.get("depends_on", [])
+        if all(agent_data.get(dep, {}).get("status") == "Completed" for dep in deps):
+            ready.append(name)
+    return sorted(ready)
+
+
+def _build_dag(args) -> dict[str, dict]:
+    rng = random.Random(args.seed)
+    per_layer = max(1, args.agents // args.layers)
+    agents: dict[str, dict] = {}
+    layers: list[list[str]] = []
+    for i in range(args.agents):
+        layer = min(i // per_layer, args.layers - 1)
+        if layer == len(layers):
+            layers.append([])
+        name = f"agent_{i:04d}"
+        earlier = [n for lay in layers[:layer] for n in lay]
+        deps = rng.sample(earlier, min(len(earlier), rng.randint(0, args.fanin)))
+        agents[name] = {"agent_name": name, "status": "Waiting", "depends_on": deps}
+        layers[layer].append(name)
+    return agents
+
+
+def _play(agents: dict[str, dict], strategy: str, check: bool = False) -> int:
+    """Drive the crew to completion; returns the number of status changes."""
+    state = {n: dict(d) for n, d in agents.items()}
+    rs = ReadySet(state) if strategy != "rescan" else None
+
+    def ask() -> list[str]:
+        if strategy == "rescan":
+            return _rescan_ready(state)
+        if strategy == "sync":
+            rs.sync(state)
+        return rs.ready()
+
+    def change(name: str, status: str) -> None:
+        state[name]["status"] = status
+        if strategy == "readyset":
+            rs.set_agent(name, status, state[name]["depends_on"])
+
+    changes = 0
+    ready = ask()
+    while ready:
+        for name in ready:
+            for status in ("Running", "Completed"):
+                change(name, status)
+                changes += 1
+                got = ask()
+                if check:
+                    assert got == _rescan_ready(state), (strategy, name, status)
+        ready = ask()
+    assert all(d["status"] == "Completed" for d in state.values()), strategy
+    return changes
+
+
+def _median(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--layers", type=int, default=20)
+    parser.add_argument("--fanin", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    agents = _build_dag(args)
+    edges = sum(len(d["depends_on"]) for d in agents.values())
+    changes = 0
+    for strategy in ("rescan", "readyset", "sync"):
+        changes = _play(agents, strategy, check=True)
+    print(f"{args.agents} agents, {edges} dependency edges, {args.layers} layers; "
+          f"{changes} status changes, ready set asked after each; "
+          f"median of {args.repeat}")
+
+    timings = {s: _median(lambda s=s: _play(agents, s), args.repeat)
+               for s in ("rescan", "readyset", "sync")}
+    base = timings["rescan"]
+    for strategy, t in timings.items():
+        per = t / changes * 1e6
+        speedup = "" if strategy == "rescan" else f"   ({base / t:.1f}x faster)"
+        print(f"  {strategy:9s} {t * 1e3:9.1f} ms total  {per:8.1f} us/change{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""pytest setup shared by every module in tests/.
+
+Each test process gets a private, throwaway ``XDG_CACHE_HOME``. The persisted
+caches (``lib/cache_store.py``: frontmatter index, stats cache, history index,
+gate result cache, code-digest memo) write one file per directory they see,
+and nearly every test builds a fresh temp tree — pointed at the real
+``~/.cache/ait`` a single suite run left ~100 new files there. Subprocesses
+inherit the variable; tests that pin their own value still override it.
+``tests/run_all_python_tests.sh`` does the same for the unittest fallback.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+_CACHE_HOME = tempfile.mkdtemp(prefix="ait_test_cache_")
+os.environ["XDG_CACHE_HOME"] = _CACHE_HOME
+atexit.register(shutil.rmtree, _CACHE_HOME, True)
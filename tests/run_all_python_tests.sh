@@ -71,6 +71,13 @@ export PYTHONDONTWRITEBYTECODE=1
 # when redirected and would otherwise flush at exit — i.e. BELOW the framework's
 # stderr verdict, making a failed run read as green from the tail.
 export PYTHONUNBUFFERED=1
+# Throwaway cache root. The persisted caches (lib/cache_store.py) write one file
+# per directory they see, and nearly every test builds a fresh temp tree — run
+# against the real ~/.cache/ait, one suite run left ~100 new files there.
+# tests/conftest.py does the same per pytest process; this covers unittest.
+TEST_CACHE_HOME="$(mktemp -d "${TMPDIR:-/tmp}/ait_test_cache.XXXXXX")"
+trap 'rm -rf "$TEST_CACHE_HOME"' EXIT
+export XDG_CACHE_HOME="$TEST_CACHE_HOME"
 
 # Serial carve-out: modules that must NOT run inside the parallel pool.
 # test_board_header_row_live.py boots the real `ait board` in a tmux pane against
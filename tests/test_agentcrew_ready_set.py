@@ -0,0 +1,98 @@
+"""Unit tests for the incremental agentcrew ReadySet.
+
+ReadySet must always answer exactly what the full rescan answers — Waiting,
+and every ``depends_on`` entry Completed, a missing dependency counting as not
+Completed — whatever the order of status changes, dependency edits,
+additions and removals, whether it is told each change (``set_agent`` /
+``remove``) or handed the whole map (``sync``).
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts"))
+
+from agentcrew.agentcrew_utils import (  # noqa: E402
+    AGENT_STATUSES,
+    ReadySet,
+    compute_ready_agents,
+)
+
+
+def _rescan(agents: dict[str, dict]) -> list[str]:
+    return sorted(
+        name for name, d in agents.items()
+        if d.get("status") == "Waiting"
+        and all(agents.get(dep, {}).get("status") == "Completed"
+                for dep in d.get("depends_on") or [])
+    )
+
+
+class ReadySetTests(unittest.TestCase):
+    def test_chain_and_unmet(self):
+        agents = {
+            "a": {"status": "Running", "depends_on": []},
+            "b": {"status": "Waiting", "depends_on": ["a"]},
+            "c": {"status": "Waiting", "depends_on": ["a", "b", "ghost"]},
+            "d": {"status": "Waiting"},
+        }
+        rs = ReadySet(agents)
+        self.assertEqual(rs.ready(), ["d"])
+        self.assertEqual(rs.unmet("c"), ["a", "b", "ghost"])
+        rs.set_agent("a", "Completed")
+        self.assertEqual(rs.ready(), ["b", "d"])
+        rs.set_agent("b", "Completed", ["a"])
+        self.assertEqual(rs.unmet("c"), ["ghost"])
+        self.assertFalse(rs.is_ready("c"))
+        rs.set_agent("ghost", "Completed")
+        self.assertTrue(rs.is_ready("c"))
+        rs.remove("ghost")
+        self.assertEqual(rs.ready(), ["d"])
+        self.assertEqual(compute_ready_agents(agents), ["d"])
+
+    def test_self_and_duplicate_dependencies(self):
+        rs = ReadySet({"x": {"status": "Waiting", "depends_on": ["x"]},
+                       "y": {"status": "Waiting", "depends_on": ["z", "z"]},
+                       "z": {"status": "Running"}})
+        self.assertEqual(rs.ready(), [])
+        rs.set_agent("z", "Completed")
+        self.assertEqual(rs.ready(), ["y"])
+        rs.set_agent("x", "Completed", ["x"])
+        rs.set_agent("x", "Waiting", ["x"])
+        self.assertFalse(rs.is_ready("x"))
+
+    def test_random_changes_match_rescan(self):
+        rng = random.Random(1234)
+        names = [f"n{i}" for i in range(40)]
+        statuses = AGENT_STATUSES
+        for _round in range(20):
+            agents: dict[str, dict] = {}
+            told, synced = ReadySet(), ReadySet()
+            for _step in range(300):
+                name = rng.choice(names)
+                op = rng.random()
+                if op < 0.1 and name in agents:
+                    del agents[name]
+                    told.remove(name)
+                elif op < 0.3 or name not in agents:
+                    deps = rng.sample(names, rng.randint(0, 4))
+                    agents[name] = {"status": rng.choice(statuses), "depends_on": deps}
+                    told.set_agent(name, agents[name]["status"], deps)
+                else:
+                    agents[name]["status"] = rng.choice(statuses)
+                    told.set_agent(name, agents[name]["status"],
+                                   agents[name]["depends_on"])
+                synced.sync(agents)
+                expected = _rescan(agents)
+                self.assertEqual(told.ready(), expected)
+                self.assertEqual(synced.ready(), expected)
+            self.assertEqual(len(synced), len(agents))
+
+
+if __name__ == "__main__":
+    unittest.main()
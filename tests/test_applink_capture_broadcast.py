@@ -0,0 +1,236 @@
+"""Shared capture fan-out for applink connections (server.CaptureBroadcast).
+
+N connected devices must cost one tmux capture, one cursor query per changed
+pane and one viewport parse per distinct content per tick — not N of each —
+while every connection still gets exactly the frames it would have got from a
+private monitor (its delta state stays its own). Schedulers wake on the
+broadcast's clock, so connections on one cadence share a tick whatever phase
+they connected at.
+
+Run:
+  python3 tests/test_applink_capture_broadcast.py
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / ".aitask-scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / ".aitask-scripts" / "applink"))
+
+from monitor.monitor_core import (  # noqa: E402
+    PaneCategory,
+    PaneSnapshot,
+    TmuxPaneInfo,
+)
+import content  # noqa: E402
+from server import CaptureBroadcast  # noqa: E402
+
+try:
+    import msgpack  # noqa: F401
+    from pusher import PushScheduler
+except ImportError:      # the encoders need msgpack; the fan-out itself does not
+    PushScheduler = None
+
+
+def _snap(pane_id: str, text: str) -> PaneSnapshot:
+    pane = TmuxPaneInfo(
+        window_index="1", window_name="agent-pick-7", pane_index="0",
+        pane_id=pane_id, pane_pid=4242, current_command="claude",
+        width=40, height=4, category=PaneCategory.AGENT, session_name="demo",
+    )
+    return PaneSnapshot(pane=pane, content=text, timestamp=0.0,
+                        idle_seconds=0.0, is_idle=False)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingMonitor:
+    def __init__(self):
+        self.snaps: dict[str, PaneSnapshot] = {}
+        self.captures = 0
+        self.cursor_calls: list[str] = []
+
+    async def capture_all_async(self):
+        self.captures += 1
+        await asyncio.sleep(0)           # let concurrent callers pile up
+        return dict(self.snaps)
+
+    async def capture_cursor_async(self, pane_id):
+        self.cursor_calls.append(pane_id)
+        await asyncio.sleep(0)
+        return (3, 0, True, 0)
+
+    def get_session_to_project_mapping(self):
+        return {}
+
+
+class _FakeWS:
+    def __init__(self):
+        self.sent: list = []
+        self.transport = None
+
+    async def send(self, data):
+        self.sent.append(data)
+
+
+class _Conn:
+    def __init__(self):
+        self.subscription = content.Subscription()
+        self.subscription.apply_subscribe({"panes": ["%1", "%2"]})
+        self.paused = False
+
+
+class CaptureBroadcastTest(unittest.TestCase):
+    def setUp(self):
+        self.monitor = CountingMonitor()
+        self.monitor.snaps = {"%1": _snap("%1", "a\nb\nc\nd\n"),
+                              "%2": _snap("%2", "w\nx\ny\nz\n")}
+        self.clock = _Clock()
+        self.bc = CaptureBroadcast(self.monitor, clock=self.clock)
+
+    def test_concurrent_and_recent_callers_share_one_capture(self):
+        async def go():
+            first = await asyncio.gather(*(self.bc.capture_all_async() for _ in range(5)))
+            self.clock.now += 0.05
+            recent = await self.bc.capture_all_async()
+            self.clock.now += 1.0
+            fresh = await self.bc.capture_all_async()
+            return first, recent, fresh
+        first, recent, fresh = asyncio.run(go())
+        self.assertEqual(self.monitor.captures, 2)
+        self.assertTrue(all(r is first[0] for r in first))
+        self.assertIs(recent, first[0])
+        self.assertIsNot(fresh, first[0])
+        self.assertEqual(self.bc.stats["captures_shared"], 5)
+
+    def test_failed_capture_skips_joiners_and_is_retried(self):
+        async def boom():
+            await asyncio.sleep(0)
+            raise RuntimeError("tmux gone")
+        self.monitor.capture_all_async = boom
+
+        async def go():
+            return await asyncio.gather(self.bc.capture_all_async(),
+                                        self.bc.capture_all_async(),
+                                        return_exceptions=True)
+        initiator, joiner = asyncio.run(go())
+        self.assertIsInstance(initiator, RuntimeError)
+        self.assertIsNone(joiner)
+        self.assertIsNone(self.bc._inflight)
+
+    def test_cursor_and_parse_once_per_generation(self):
+        async def go():
+            await self.bc.capture_all_async()
+            a = await asyncio.gather(*(self.bc.capture_cursor_async("%1") for _ in range(3)))
+            self.clock.now += 1.0
+            await self.bc.capture_all_async()
+            b = await self.bc.capture_cursor_async("%1")
+            return a, b
+        a, b = asyncio.run(go())
+        self.assertEqual(self.monitor.cursor_calls, ["%1", "%1"])
+        self.assertEqual(a, [(3, 0, True, 0)] * 3)
+
+        text = self.monitor.snaps["%1"].content
+        p1 = self.bc.parse_viewport("%1", text, 4)
+        p2 = self.bc.parse_viewport("%1", "".join(text), 4)      # equal, not identical
+        self.assertIs(p1[0], p2[0])
+        self.assertEqual(p1[0], content.parse_snapshot(text, 4))
+        self.bc.parse_viewport("%1", text, 3)                     # resize re-parses
+        self.assertEqual((self.bc.stats["parses"], self.bc.stats["parses_shared"]), (2, 1))
+
+    def test_ticks_are_multiples_of_the_period_on_the_shared_clock(self):
+        self.clock.now = 100.05
+        self.assertAlmostEqual(self.bc.next_tick_delay(0.3), 0.15)
+        self.assertAlmostEqual(self.bc.next_tick_delay(3.0), 1.95)
+        self.clock.now = 100.2 - 0.001          # woken a hair early: skip this tick
+        self.assertAlmostEqual(self.bc.next_tick_delay(0.3), 0.301)
+        self.clock.now = 100.2                  # on the tick: the next one
+        self.assertAlmostEqual(self.bc.next_tick_delay(0.3), 0.3)
+
+    def test_delegates_everything_else(self):
+        self.assertEqual(self.bc.get_session_to_project_mapping(), {})
+        with self.assertRaises(AttributeError):
+            self.bc.no_such_method  # noqa: B018
+
+
+@unittest.skipIf(PushScheduler is None, "msgpack not installed")
+class FanOutPushTest(unittest.TestCase):
+    def _run_tick(self, monitors, conns, wss):
+        async def go():
+            pushers = [PushScheduler(c, ws, m) for c, ws, m in zip(conns, wss, monitors)]
+            await asyncio.gather(*(p._run_once() for p in pushers))
+        asyncio.run(go())
+
+    def test_three_connections_cost_one_pass_and_get_identical_frames(self):
+        shared_mon, private_mon = CountingMonitor(), CountingMonitor()
+        for mon in (shared_mon, private_mon):
+            mon.snaps = {"%1": _snap("%1", "a\nb\nc\nd\n"),
+                         "%2": _snap("%2", "w\nx\ny\nz\n")}
+        bc = CaptureBroadcast(shared_mon)
+        conns, wss = [_Conn() for _ in range(3)], [_FakeWS() for _ in range(3)]
+        ref_conn, ref_ws = _Conn(), _FakeWS()
+
+        self._run_tick([bc] * 3, conns, wss)
+        self._run_tick([private_mon], [ref_conn], [ref_ws])
+        self.assertEqual(shared_mon.captures, 1)
+        self.assertEqual(sorted(shared_mon.cursor_calls), ["%1", "%2"])
+        self.assertEqual(bc.stats["parses"], 2)
+        for ws in wss:
+            self.assertEqual(ws.sent, ref_ws.sent)
+
+        # Next tick: one pane scrolls. Each connection appends against its own
+        # baseline; the work is still one capture, one cursor, one parse.
+        for mon in (shared_mon, private_mon):
+            mon.snaps["%1"] = _snap("%1", "b\nc\nd\ne\n")
+        for c in conns + [ref_conn]:
+            c.subscription.state_for("%1").last_send_t = -1e9
+        bc._snaps_t = -1e9
+        for ws in wss + [ref_ws]:
+            ws.sent.clear()
+        self._run_tick([bc] * 3, conns, wss)
+        self._run_tick([private_mon], [ref_conn], [ref_ws])
+        self.assertEqual(shared_mon.captures, 2)
+        self.assertEqual(bc.stats["parses"], 3)
+        self.assertTrue(ref_ws.sent)
+        for ws in wss:
+            self.assertEqual(ws.sent, ref_ws.sent)
+
+    def test_out_of_phase_connections_share_each_tick(self):
+        """Schedulers started at different phases still capture together: the
+        tmux pass count follows the cadence, not the number of connections."""
+        mon = CountingMonitor()
+        mon.snaps = {"%1": _snap("%1", "a\nb\nc\nd\n")}
+        bc = CaptureBroadcast(mon)
+        n = 4
+
+        async def go():
+            pushers = []
+            for _ in range(n):
+                conn = _Conn()
+                conn.subscription.apply_subscribe(
+                    {"panes": ["%1"], "cadence_idle_ms": 500})
+                pusher = PushScheduler(conn, _FakeWS(), bc)
+                pusher.start()
+                pushers.append(pusher)
+                await asyncio.sleep(0.12)       # out of phase with the others
+            await asyncio.sleep(1.5)
+            for pusher in pushers:
+                await pusher.stop()
+        asyncio.run(go())
+        # ~2s of 500 ms ticks is 4-5 captures; one per connection per tick
+        # would be about n times that.
+        self.assertLessEqual(mon.captures, 6)
+        self.assertGreaterEqual(bc.stats["captures_shared"], mon.captures)
+
+
+if __name__ == "__main__":
+    unittest.main()
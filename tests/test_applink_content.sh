@@ -229,6 +229,54 @@ check("detect_append differing row counts -> None",
 # None baseline -> None (caller routes the first frame via the keyframe path).
 check("detect_append None baseline -> None", C.detect_append(None, _sigs("a\nb\n")) is None)
 
+# The Z-array scan must pick exactly the k the quadratic prefix scan picked,
+# including on repetitive grids (blank runs) where shifts match deep and fail.
+import random
+def _brute_append(prev, new):
+    H = len(new)
+    if H == 0 or len(prev) != H:
+        return None
+    for k in range(1, H):
+        if all(new.get(i) == prev.get(i + k) for i in range(H - k)):
+            return k
+    return None
+rng = random.Random(822)
+agree = True
+for _ in range(2000):
+    H = rng.randint(0, 12)
+    prev = {i: rng.randint(0, 2) for i in range(H)}
+    if rng.random() < 0.5 and H:
+        k = rng.randint(1, H)
+        new = {i: prev[i + k] if i + k < H else rng.randint(0, 2) for i in range(H)}
+    else:
+        new = {i: rng.randint(0, 2) for i in range(H)}
+    agree = agree and C.detect_append(prev, new) == _brute_append(prev, new)
+check("detect_append (Z-array) agrees with the prefix scan on random grids", agree)
+
+# --- per-line parse memo (LRU) ---------------------------------------------
+C.clear_line_cache()
+text = "\x1b[31mred\x1b[0m\nplain\n\x1b]8;;u\x1b\\l\x1b]8;;\x1b\\\nplain\n"
+pv, pv_sigs = C.parse_viewport(text, 4)
+check("parse_viewport rows == parse_snapshot rows", pv == C.parse_snapshot(text, 4))
+check("parse_viewport sigs == row_signature per row",
+      pv_sigs == {rid: C.row_signature(spans) for rid, spans, _u in pv})
+check("parse_viewport rows == an uncached parse",
+      [(s, u) for _r, s, u in pv] == [C.parse_sgr_line(l) for l in text.split("\n")[:4]])
+check("identical raw lines are parsed once", C.line_cache_stats["misses"] == 3)
+C.parse_viewport("plain\nnew\n", 2)
+check("unchanged rows hit the memo on the next tick",
+      C.line_cache_stats["misses"] == 4 and C.line_cache_stats["hits"] >= 5)
+check("deltify reuses precomputed sigs",
+      C.deltify(pv_sigs, pv, pv_sigs)[:2] == ([], []))
+saved = C.LINE_CACHE_SIZE
+C.LINE_CACHE_SIZE = 4
+for i in range(10):
+    C.parse_viewport(f"row{i}\n", 1)
+check("line memo stays bounded (LRU eviction)", len(C._line_cache) == 4
+      and "row9" in C._line_cache and "row0" not in C._line_cache)
+C.LINE_CACHE_SIZE = saved
+C.clear_line_cache()
+
 # --- Subscription ----------------------------------------------------------
 sub = C.Subscription()
 accepted = sub.apply_subscribe({
@@ -0,0 +1,176 @@
+"""Tests for lib/archive_index.py — indexed (random-access) numbered bundles.
+
+An indexed bundle must stay a plain ``.tar.zst`` to every existing reader, and
+``find_archived_markdown_by_id`` must return exactly what the streaming scan
+returns — from the index when it is trustworthy, from the scan when it is not.
+
+Run: python3 -m pytest tests/test_archive_index.py -v
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_lib_dir = Path(__file__).resolve().parents[1] / ".aitask-scripts" / "lib"
+sys.path.insert(0, str(_lib_dir))
+
+import archive_index  # noqa: E402
+import archive_iter  # noqa: E402
+from archive_index import (  # noqa: E402
+    INDEX_UNAVAILABLE,
+    frame_bounds,
+    index_path_for,
+    load_index,
+    read_indexed_member,
+    reindex_archive,
+    write_indexed_archive,
+)
+from archive_iter import find_archived_markdown_by_id  # noqa: E402
+
+HAS_ZSTD_CLI = shutil.which("zstd") is not None
+
+FILES = {
+    "t100_alpha.md": "---\nstatus: Done\n---\n# Alpha\n",
+    "t101_beta.md": "---\nstatus: Done\n---\n# Beta\n" + "x" * 3000,
+    "t101/t101_1_child.md": "---\nstatus: Done\n---\n# Child\n",
+    "t101/t101_2_other.md": "---\nstatus: Done\n---\n# Other\n",
+}
+
+
+@unittest.skipUnless(HAS_ZSTD_CLI or archive_index._BINDING is not None,
+                     "needs the zstd CLI or a zstd binding")
+class IndexedArchiveTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix="archive_index_"))
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.src = self.tmp / "src"
+        for rel, text in FILES.items():
+            path = self.src / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text, encoding="utf-8")
+        self.archived = self.tmp / "archived"
+        self.bundle = self.archived / "_b0" / "old1.tar.zst"
+        write_indexed_archive(self.src, self.bundle)
+
+    def _members_via_plain_decode(self):
+        raw = archive_index.decompress_frames(self.bundle.read_bytes())
+        with tarfile.open(fileobj=io.BytesIO(raw), mode="r:") as tf:
+            return {m.name: tf.extractfile(m).read().decode()
+                    for m in tf.getmembers() if m.isfile()}
+
+    def test_bundle_is_still_a_plain_tar_zst(self):
+        members = self._members_via_plain_decode()
+        self.assertEqual({k.removeprefix("./"): v for k, v in members.items()},
+                         FILES)
+        streamed = dict(archive_iter._iter_single_archive(self.bundle))
+        self.assertEqual(streamed["t101_1_child.md"], FILES["t101/t101_1_child.md"])
+
+    @unittest.skipUnless(HAS_ZSTD_CLI, "zstd CLI not installed")
+    def test_zstd_cli_lists_every_member(self):
+        zstd = subprocess.Popen(["zstd", "-dc", str(self.bundle)],
+                                stdout=subprocess.PIPE)
+        listing = subprocess.run(["tar", "-tf", "-"], stdin=zstd.stdout,
+                                 capture_output=True, text=True, check=True)
+        zstd.wait()
+        self.assertIn("./t101/t101_2_other.md", listing.stdout.split())
+
+    def test_one_frame_per_member_plus_trailer(self):
+        members = load_index(self.bundle)
+        bounds = frame_bounds(self.bundle.read_bytes())
+        self.assertEqual(len(bounds), len(members) + 1)
+        self.assertEqual([(off, ln) for _n, off, ln in members], bounds[:-1])
+
+    def test_lookup_matches_streaming_scan(self):
+        for task_id in ("100", "101", "101_1", "101_2", "199", "101_9"):
+            with self.subTest(task_id=task_id):
+                expected = archive_iter._find_in_archive_iter(
+                    task_id, archive_iter._iter_single_archive(self.bundle))
+                self.assertEqual(
+                    find_archived_markdown_by_id(task_id, self.archived),
+                    expected)
+
+    def test_valid_index_answers_without_scanning(self):
+        with mock.patch.object(archive_iter, "_iter_single_archive",
+                               side_effect=AssertionError("scanned")):
+            self.assertEqual(
+                find_archived_markdown_by_id("101", self.archived),
+                ("t101_beta.md", FILES["t101_beta.md"]))
+            # A miss is authoritative too: the bundle is not decoded at all.
+            self.assertIsNone(
+                find_archived_markdown_by_id("150", self.archived))
+
+    @unittest.skipUnless(HAS_ZSTD_CLI, "zstd CLI not installed")
+    def test_stale_index_falls_back_to_the_scan(self):
+        # Rewrite the bundle as a single stream behind the sidecar's back.
+        raw = archive_index.decompress_frames(self.bundle.read_bytes())
+        subprocess.run(["zstd", "-q", "-19", "-f", "-o", str(self.bundle)],
+                       input=raw, check=True)
+        self.assertIs(read_indexed_member(self.bundle, lambda n: True),
+                      INDEX_UNAVAILABLE)
+        self.assertEqual(
+            find_archived_markdown_by_id("101_2", self.archived),
+            ("t101_2_other.md", FILES["t101/t101_2_other.md"]))
+
+    def test_index_pointing_at_the_wrong_member_is_rejected(self):
+        idx = index_path_for(self.bundle)
+        doc = json.loads(idx.read_text())
+        names = [row[0] for row in doc["members"]]
+        alpha = names.index("./t100_alpha.md")
+        beta = names.index("./t101_beta.md")
+        doc["members"][alpha][0], doc["members"][beta][0] = (
+            doc["members"][beta][0], doc["members"][alpha][0])
+        idx.write_text(json.dumps(doc))
+        self.assertIs(read_indexed_member(self.bundle,
+                                          lambda n: n == "t100_alpha.md"),
+                      INDEX_UNAVAILABLE)
+
+    def test_missing_or_corrupt_sidecar_is_unavailable(self):
+        idx = index_path_for(self.bundle)
+        idx.write_text("{nope")
+        self.assertIs(read_indexed_member(self.bundle, lambda n: True),
+                      INDEX_UNAVAILABLE)
+        idx.unlink()
+        self.assertIs(read_indexed_member(self.bundle, lambda n: True),
+                      INDEX_UNAVAILABLE)
+
+    def test_reindex_converts_a_plain_bundle(self):
+        raw = archive_index.decompress_frames(self.bundle.read_bytes())
+        plain = archive_index._compress_chunks([raw])[0]
+        self.bundle.write_bytes(plain)
+        index_path_for(self.bundle).unlink()
+        reindex_archive(self.bundle)
+        self.assertEqual(read_indexed_member(self.bundle,
+                                             lambda n: n == "t101_1_child.md"),
+                         ("t101_1_child.md", FILES["t101/t101_1_child.md"]))
+
+    @unittest.skipUnless(HAS_ZSTD_CLI, "zstd CLI not installed")
+    def test_cli_codec_path_matches_binding_path(self):
+        with mock.patch.object(archive_index, "_BINDING_NAME", None):
+            other = self.archived / "_b0" / "old2.tar.zst"
+            write_indexed_archive(self.src, other)
+            self.assertEqual(
+                read_indexed_member(other, lambda n: n == "t100_alpha.md"),
+                ("t100_alpha.md", FILES["t100_alpha.md"]))
+
+
+class FrameBoundsTests(unittest.TestCase):
+    def test_rejects_garbage(self):
+        with self.assertRaises(ValueError):
+            frame_bounds(b"not a zstd frame at all")
+
+    def test_skippable_frame(self):
+        skip = (0x184D2A50).to_bytes(4, "little") + (3).to_bytes(4, "little")
+        self.assertEqual(frame_bounds(skip + b"abc"), [(0, 11)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Tests for archive_iter's decode backends and the parallel bundle scan.
+
+The pooled scan must yield exactly the serial scan's sequence — same entries,
+same bundle order — whatever the pool size, and the in-process backend must
+yield exactly what the ``zstd -dc`` pipe yields.
+
+Run: python3 -m pytest tests/test_archive_iter_backends.py -v
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_lib_dir = Path(__file__).resolve().parents[1] / ".aitask-scripts" / "lib"
+sys.path.insert(0, str(_lib_dir))
+
+import archive_iter  # noqa: E402
+from archive_iter import (  # noqa: E402
+    _iter_archives_ordered,
+    numbered_archive_paths,
+    iter_numbered_archives,
+)
+
+HAS_ZSTD_CLI = shutil.which("zstd") is not None
+
+
+def _tar_bytes(files: dict[str, str]) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tf:
+        for name, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _bundle_files(bundle: int) -> dict[str, str]:
+    base = bundle * 100
+    return {
+        f"t{base + i}_task.md": f"---\nstatus: Done\n---\nbundle {bundle} #{i}\n"
+        for i in range(3)
+    }
+
+
+@unittest.skipUnless(HAS_ZSTD_CLI, "zstd CLI not installed")
+class ParallelScanTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix="archive_iter_backends_"))
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.archived = self.tmp / "archived"
+        for bundle in range(12):
+            path = self.archived / f"_b{bundle // 10}" / f"old{bundle}.tar.zst"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            subprocess.run(["zstd", "-q", "-f", "-o", str(path)],
+                           input=_tar_bytes(_bundle_files(bundle)), check=True)
+
+    def _scan(self, workers: str):
+        with mock.patch.dict(os.environ,
+                             {archive_iter.SCAN_WORKERS_ENV: workers}):
+            return list(iter_numbered_archives(self.archived))
+
+    def test_pooled_scan_matches_serial_order(self):
+        serial = self._scan("1")
+        self.assertEqual(len(serial), 36)
+        for workers in ("2", "4", "16"):
+            with self.subTest(workers=workers):
+                self.assertEqual(self._scan(workers), serial)
+
+    def test_corrupt_bundle_is_skipped_in_place(self):
+        (self.archived / "_b0" / "old3.tar.zst").write_bytes(b"not zstd")
+        serial = self._scan("1")
+        self.assertEqual(self._scan("4"), serial)
+        names = [name for name, _text in serial]
+        self.assertNotIn("t300_task.md", names)
+        self.assertIn("t400_task.md", names)
+
+    def test_early_close_stops_the_scan(self):
+        paths = numbered_archive_paths(self.archived)
+        with mock.patch.object(archive_iter, "_read_single_archive",
+                               wraps=archive_iter._read_single_archive) as read:
+            gen = _iter_archives_ordered(paths, workers=2)
+            first = next(gen)
+            gen.close()
+        self.assertEqual(first[0], "t0_task.md")
+        # Only the prefetch window was ever submitted, not all 12 bundles.
+        self.assertLessEqual(read.call_count,
+                             2 * archive_iter._PREFETCH_PER_WORKER + 1)
+
+    def test_invalid_env_falls_back_to_default(self):
+        with mock.patch.dict(os.environ,
+                             {archive_iter.SCAN_WORKERS_ENV: "lots"}):
+            self.assertGreaterEqual(archive_iter._scan_workers(), 1)
+        with mock.patch.dict(os.environ,
+                             {archive_iter.SCAN_WORKERS_ENV: "0"}):
+            self.assertEqual(archive_iter._scan_workers(), 1)
+
+    def test_inprocess_backend_matches_pipe(self):
+        bundle = self.archived / "_b0" / "old5.tar.zst"
+        piped = list(archive_iter._iter_zst_subprocess(bundle))
+        # Force the in-process branch; without a binding installed the frame
+        # decode itself still goes through archive_index's CLI fallback, which
+        # is enough to exercise the tar handling on this side.
+        with mock.patch.object(archive_iter, "inprocess_codec",
+                               return_value="test"), \
+                mock.patch.object(archive_iter, "_iter_zst_subprocess",
+                                  side_effect=AssertionError("forked")):
+            inproc = list(archive_iter._iter_single_archive(bundle))
+        self.assertEqual(inproc, piped)
+        self.assertEqual(dict(inproc), _bundle_files(5))
+
+    def test_inprocess_backend_skips_corrupt_bundle(self):
+        bad = self.archived / "_b0" / "old2.tar.zst"
+        bad.write_bytes(b"\x28\xb5\x2f\xfdgarbage")
+        with mock.patch.object(archive_iter, "inprocess_codec",
+                               return_value="test"):
+            self.assertEqual(list(archive_iter._iter_single_archive(bad)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
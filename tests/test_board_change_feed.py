@@ -0,0 +1,264 @@
+"""Change-driven board refresh (`lib/board_change_feed.py`, `TaskManager.sync_tasks`).
+
+The auto-refresh tick used to re-read every task file and run `git status` and
+`aitask_lock.sh --list` on the UI thread whether or not anything had changed.
+Now the change feed reports which task files changed, `sync_tasks` reloads only
+those, and the subprocess probes run in a worker. The properties pinned here:
+
+1. `DirSetWatcher` reports changed entries and vanished directories on BOTH
+   backends, and never blocks.
+2. `TaskChangeFeed` maps events to task basenames — parent files, child files,
+   children of a parent dir that appeared after the feed — reports git index
+   writes apart from task changes, and falls back to `rescan` when a parent
+   dir vanishes.
+3. `sync_tasks` reloads exactly the reported files as fresh objects, drops
+   deleted ones, and leaves every other `Task` object untouched.
+4. An idle `_refresh_board_data` renders nothing and spawns nothing on the UI
+   thread; a probe result only re-renders when it differs.
+
+Run: bash tests/run_all_python_tests.sh
+  or: python3 -m pytest tests/test_board_change_feed.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "tests" / "lib"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "board"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "lib"))
+
+import board_fixture as bf  # noqa: E402
+from board_change_feed import TaskChangeFeed  # noqa: E402
+from fs_watch import DirSetWatcher  # noqa: E402
+
+BACKENDS = (("inotify", False), ("poll", True))
+
+
+class _TmpDirTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix="change_feed_"))
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+
+    def _watcher(self, force_poll, paths=()):
+        w = DirSetWatcher(paths, force_poll=force_poll)
+        self.addCleanup(w.close)
+        if not force_poll and w.backend != "inotify":
+            self.skipTest("inotify unavailable")
+        return w
+
+
+class DirSetWatcherTests(_TmpDirTest):
+
+    def test_reports_entries_and_vanished_dirs(self):
+        for backend, force_poll in BACKENDS:
+            with self.subTest(backend=backend):
+                a, b = self.tmp / f"a_{backend}", self.tmp / f"b_{backend}"
+                a.mkdir()
+                b.mkdir()
+                w = self._watcher(force_poll, [a])
+                self.assertEqual(w.poll(), set())
+                (a / "x.md").write_text("one")
+                self.assertEqual(w.poll(), {(str(a), "x.md")})
+                self.assertEqual(w.poll(), set(), "a poll drains what it reports")
+                self.assertTrue(w.add(b))
+                self.assertFalse(w.add(self.tmp / "missing"))
+                (b / "y.md").write_text("two")
+                shutil.rmtree(a)
+                got = w.poll()
+                self.assertIn((str(b), "y.md"), got)
+                self.assertIn((str(a), ""), got)
+                self.assertFalse(w.watching(a), "a vanished dir's watch is dropped")
+                self.assertTrue(w.watching(b))
+
+    def test_remove_releases_the_kernel_watch(self):
+        w = self._watcher(False)
+
+        def kernel_watches():
+            with open(f"/proc/self/fdinfo/{w.fileno()}") as fh:
+                return sum(line.startswith("inotify wd:") for line in fh)
+
+        dirs = []
+        for i in range(20):
+            d = self.tmp / f"t{i}"
+            d.mkdir()
+            self.assertTrue(w.add(d))
+            dirs.append(d)
+        self.assertEqual(kernel_watches(), 20)
+        for d in dirs[:10]:
+            w.remove(d)
+        shutil.rmtree(dirs[10])            # the kernel drops this one itself
+        w.poll()
+        w.remove(dirs[11])
+        w.remove(dirs[10])                 # already gone: EINVAL, ignored
+        self.assertEqual(kernel_watches(), 8)
+        self.assertFalse(w.watching(dirs[0]))
+        self.assertTrue(w.add(dirs[0]), "a removed dir can be watched again")
+        (dirs[0] / "x.md").write_text("one")
+        self.assertEqual(w.poll(), {(str(dirs[0]), "x.md")})
+
+
+class TaskChangeFeedTests(_TmpDirTest):
+
+    def _tree(self, backend):
+        tasks = self.tmp / backend / "aitasks"
+        git_dir = self.tmp / backend / ".git"
+        (tasks / "t2").mkdir(parents=True)
+        git_dir.mkdir()
+        (tasks / "t1_a.md").write_text("a")
+        (tasks / "t2" / "t2_1_b.md").write_text("b")
+        return tasks, git_dir
+
+    def _feed(self, tasks, git_dir, force_poll):
+        feed = TaskChangeFeed(tasks, git_dir, force_poll=force_poll)
+        self.addCleanup(feed.close)
+        if not force_poll and feed.backend != "inotify":
+            self.skipTest("inotify unavailable")
+        return feed
+
+    def test_events_map_to_task_names(self):
+        for backend, force_poll in BACKENDS:
+            with self.subTest(backend=backend):
+                tasks, git_dir = self._tree(backend)
+                feed = self._feed(tasks, git_dir, force_poll)
+                idle = feed.poll()
+                self.assertFalse(idle.git, "an untouched tree reports nothing")
+
+                (tasks / "t1_a.md").write_text("a, edited")
+                (tasks / "t2" / "t2_2_c.md").write_text("c")
+                (tasks / "notes.txt").write_text("not a task")
+                changes = feed.poll()
+                self.assertEqual(changes.tasks, {"t1_a.md", "t2_2_c.md"})
+                self.assertFalse(changes.rescan)
+
+                # A parent dir that appears after the feed: its files may predate
+                # the watch, so they are reported, and later writes are seen.
+                (tasks / "t3").mkdir()
+                (tasks / "t3" / "t3_1_d.md").write_text("d")
+                self.assertEqual(feed.poll().tasks, {"t3_1_d.md"})
+                (tasks / "t3" / "t3_2_e.md").write_text("e")
+                self.assertEqual(feed.poll().tasks, {"t3_2_e.md"})
+
+                (git_dir / "ORIG_HEAD").write_text("x")
+                self.assertFalse(feed.poll().index)
+                (git_dir / "index").write_text("x")
+                changes = feed.poll()
+                self.assertTrue(changes.index)
+                self.assertFalse(changes.data, "an index write is not a task change")
+
+                shutil.rmtree(tasks / "t2")
+                self.assertTrue(feed.poll().rescan,
+                                "a vanished parent dir takes unknown children with it")
+                self.assertFalse(feed.poll().data)
+
+    def test_without_a_git_dir_every_poll_reports_index(self):
+        tasks, _git_dir = self._tree("nogit")
+        feed = self._feed(tasks, None, force_poll=True)
+        changes = feed.poll()
+        self.assertTrue(changes.index)
+        self.assertFalse(changes.data)
+
+
+def _wide(i: int, **kw) -> bf.FixtureTask:
+    fields = dict(task_id=str(9000 + i), col=bf.COLUMN_ORDER[i % len(bf.COLUMN_ORDER)],
+                  idx=(i + 1) * 10, slug=f"wide{i}")
+    fields.update(kw)
+    return bf.FixtureTask(**fields)
+
+
+class _SyncTestBase(bf.FixtureBoardTestBase, bf.PristineTreeMixin):
+    FIXTURE_TASKS = bf.wide_topology(6)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._snapshot_pristine()
+
+    def _manager(self):
+        manager = self.ab.TaskManager()
+        self.addCleanup(manager.close_change_feed)
+        return manager
+
+
+class SyncTasksTests(_SyncTestBase, unittest.TestCase):
+
+    def test_only_reported_files_are_reloaded(self):
+        manager = self._manager()
+        self.assertTrue(manager.sync_tasks().rescan, "the first sync is a full load")
+        self.assertFalse(manager.sync_tasks().data)
+        before = dict(manager.task_datas)
+
+        removed = self.tasks_dir / "t9004_wide4.md"
+        self.addCleanup(removed.write_bytes, removed.read_bytes())
+        removed.unlink()
+        edited = _wide(2, extra={"effort": "high"})
+        edited.path_in(self.tasks_dir).write_text(edited.text())
+        changes = manager.sync_tasks()
+
+        self.assertEqual(changes.tasks, {"t9002_wide2.md", "t9004_wide4.md"})
+        self.assertNotIn("t9004_wide4.md", manager.task_datas)
+        fresh = manager.task_datas["t9002_wide2.md"]
+        self.assertIsNot(fresh, before["t9002_wide2.md"],
+                         "a reloaded task is a fresh object")
+        self.assertEqual(fresh.metadata.get("effort"), "high")
+        kept = {f for f, t in manager.task_datas.items() if t is before.get(f)}
+        self.assertEqual(kept, set(before) - {"t9002_wide2.md", "t9004_wide4.md"})
+
+
+class IdleRefreshTests(_SyncTestBase, unittest.TestCase):
+
+    def test_idle_refresh_renders_nothing_and_spawns_nothing(self):
+        seen = {}
+
+        async def go():
+            app = self.ab.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await pilot.pause()
+                app.manager.sync_tasks()                    # create the feed
+                renders, probes, spawns = [], [], []
+                real_run = subprocess.run
+
+                def spy(argv, **kwargs):
+                    spawns.append([str(a) for a in argv])
+                    return real_run(argv, **kwargs)
+
+                with mock.patch.object(app, "refresh_board",
+                                       side_effect=lambda **kw: renders.append(kw)), \
+                        mock.patch.object(app, "_probe_worker",
+                                          side_effect=lambda *a: probes.append(a)), \
+                        mock.patch("subprocess.run", side_effect=spy):
+                    app._refresh_board_data()
+                    seen["idle"] = (list(renders), list(spawns), len(probes))
+                    # Same answer as what is on screen: nothing to re-render.
+                    app._on_probe(app._probe_gen, set(app.manager.modified_files),
+                                  dict(app.manager.lock_map))
+                    seen["same_probe"] = len(renders)
+                    # A superseded probe is dropped even if it differs.
+                    lock = {"9001": {"locked_by": "a@b", "hostname": "h",
+                                     "locked_at": "now"}}
+                    app._on_probe(app._probe_gen - 1, None, lock)
+                    seen["stale_probe"] = len(renders)
+                    app._on_probe(app._probe_gen, None, lock)
+                    seen["new_lock"] = (len(renders), dict(app.manager.lock_map))
+
+        asyncio.run(go())
+        renders, spawns, probes = seen["idle"]
+        self.assertEqual(renders, [], "an idle refresh must not re-render")
+        self.assertEqual(spawns, [], "git/lock probes must not run on the UI thread")
+        self.assertEqual(probes, 1)
+        self.assertEqual(seen["same_probe"], 0)
+        self.assertEqual(seen["stale_probe"], 0)
+        self.assertEqual(seen["new_lock"][0], 1)
+        self.assertIn("9001", seen["new_lock"][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
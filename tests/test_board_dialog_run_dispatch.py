@@ -17,7 +17,7 @@ Coverage split:
 - Worker-level tests cover BOTH dispatch paths. The no-terminal ``suspend()``
   branch is the one neither the construction spies nor a live manual check
   reach (a manual check runs with a real terminal available), so its full side
-  effect set — argv, ``manager.load_tasks()``, ``refresh_board(refocus_filename=…)``
+  effect set — argv, ``manager.sync_tasks()``, ``refresh_board(refocus_filename=…)``
   — is asserted explicitly.
 """
 
@@ -226,7 +226,7 @@ class RunDialogCommandWorkerTests(DialogRunTestBase):
             self._call(app, refocus_filename=TASK_FILE)
         spawn.assert_called_once_with("footerm", ["sh", "-c", OVERRIDE])
         # Fire-and-forget: the dialog callback owns the post-run refresh.
-        app.manager.load_tasks.assert_not_called()
+        app.manager.sync_tasks.assert_not_called()
         app.refresh_board.assert_not_called()
 
     def test_suspend_path_dispatches_reloads_and_refocuses(self):
@@ -236,7 +236,7 @@ class RunDialogCommandWorkerTests(DialogRunTestBase):
                 patch.object(ab.subprocess, "call", return_value=0) as call:
             self._call(app, refocus_filename=TASK_FILE)
         call.assert_called_once_with(["sh", "-c", OVERRIDE])
-        app.manager.load_tasks.assert_called_once_with()
+        app.manager.sync_tasks.assert_called_once_with()
         app.refresh_board.assert_called_once_with(refocus_filename=TASK_FILE)
         app.notify.assert_not_called()
 
@@ -256,7 +256,7 @@ class RunDialogCommandWorkerTests(DialogRunTestBase):
             self._call(app, refocus_filename=TASK_FILE)
         app.notify.assert_called_once_with(
             ab.CODEAGENT_FAILURE_NOTICE, severity="error")
-        app.manager.load_tasks.assert_called_once_with()
+        app.manager.sync_tasks.assert_called_once_with()
         app.refresh_board.assert_called_once_with(refocus_filename=TASK_FILE)
 
     def test_suspend_path_stays_silent_when_notice_suppressed(self):
@@ -267,7 +267,7 @@ class RunDialogCommandWorkerTests(DialogRunTestBase):
                 patch.object(ab.subprocess, "call", return_value=1):
             self._call(app, refocus_filename=TASK_FILE, error_notice=None)
         app.notify.assert_not_called()
-        app.manager.load_tasks.assert_called_once_with()
+        app.manager.sync_tasks.assert_called_once_with()
         app.refresh_board.assert_called_once_with(refocus_filename=TASK_FILE)
 
 
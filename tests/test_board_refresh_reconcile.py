@@ -0,0 +1,278 @@
+"""Keyed board reconciliation on refresh (`KanbanApp._reconcile_kanban`).
+
+`refresh_board` used to tear `#board_container` down and remount every column
+and card on each `r`, auto-refresh tick and view switch. It now diffs the
+freshly loaded tasks against the mounted widgets — columns by `col_id`, cards by
+task filename — and only adds, removes, moves or rebuilds what changed.
+
+The properties pinned here, each against the manager as ground truth:
+
+1. **An unchanged refresh mounts nothing**: every column and card survives by
+   identity and no column is recomposed.
+2. **A changed task replaces exactly its card**, and the replacement renders the
+   change.
+3. **Add / remove / move** converge on the model's per-column order, with each
+   task mounted exactly once.
+4. **Filter state carries over**: a kept card keeps the display a narrowing pass
+   gave it, so leaving that view must re-decide every card, not just the touched
+   columns.
+5. **Coming back from a derived view** (In-Flight) still rebuilds the kanban
+   board.
+
+Run: bash tests/run_all_python_tests.sh
+  or: python3 -m pytest tests/test_board_refresh_reconcile.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "tests" / "lib"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "board"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "lib"))
+
+import board_fixture as bf  # noqa: E402
+from textual.color import Color  # noqa: E402
+
+#: c0 of `wide_topology(15, with_children=True)` holds t9000 (idx 10, with two
+#: children), t9005 (60) and t9010 (110).
+MID = "t9005_wide5.md"
+
+
+def _wide(i: int, **kw) -> bf.FixtureTask:
+    """The `wide_topology` task `i`, with `kw` overriding its fields."""
+    fields = dict(task_id=str(9000 + i), col=bf.COLUMN_ORDER[i % len(bf.COLUMN_ORDER)],
+                  idx=(i + 1) * 10, slug=f"wide{i}")
+    fields.update(kw)
+    return bf.FixtureTask(**fields)
+
+
+class _ReconcileTestBase(bf.FixtureBoardTestBase, bf.PristineTreeMixin):
+    FIXTURE_TASKS = bf.wide_topology(15, with_children=True)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.KanbanApp = cls.ab.KanbanApp
+        cls.KanbanColumn = cls.ab.KanbanColumn
+        cls.TaskCard = cls.ab.TaskCard
+        cls._snapshot_pristine()
+
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    async def _settle(self, pilot, times=4):
+        for _ in range(times):
+            await pilot.pause()
+        await pilot.wait_for_scheduled_animations()
+        await pilot.pause()
+
+    def _write(self, task: bf.FixtureTask) -> None:
+        task.path_in(self.tasks_dir).write_text(task.text())
+
+    def _spy_recompose(self):
+        calls: list[str] = []
+        original = self.ab.KanbanApp._recompose_column
+
+        def wrapper(app, col_widget):
+            calls.append(col_widget.col_id)
+            return original(app, col_widget)
+
+        patcher = mock.patch.object(self.ab.KanbanApp, "_recompose_column", wrapper)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return calls
+
+    # --- oracles -------------------------------------------------------------
+
+    def _columns(self, app):
+        return list(app.query_one("#board_container").children)
+
+    def _parent_cards(self, app):
+        """Filename -> mounted parent card, asserting each is mounted once."""
+        cards = {}
+        for card in app.query(self.TaskCard):
+            if card.is_child:
+                continue
+            self.assertNotIn(card.task_data.filename, cards,
+                             f"{card.task_data.filename} is mounted twice")
+            cards[card.task_data.filename] = card
+        return cards
+
+    def _dom_orders(self, app):
+        return {col.col_id: [w.task_data.filename for w in col.children
+                             if isinstance(w, self.TaskCard) and not w.is_child]
+                for col in app.query(self.KanbanColumn)}
+
+    def _model_orders(self, app):
+        return {col.col_id: [t.filename for t in app.manager.get_column_tasks(col.col_id)]
+                for col in app.query(self.KanbanColumn)}
+
+
+class UnchangedRefreshTests(_ReconcileTestBase, unittest.TestCase):
+
+    def test_unchanged_refresh_keeps_every_widget(self):
+        calls = self._spy_recompose()
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            app.expanded_tasks.add("t9000_wide0.md")
+            async with app.run_test(size=(160, 48)) as pilot:
+                app.refresh_board()
+                await self._settle(pilot)
+                before_cols = self._columns(app)
+                before_cards = list(app.query(self.TaskCard))
+                self._parent_cards(app)[MID].focus()
+                await self._settle(pilot)
+                app._refresh_board_data()
+                await self._settle(pilot)
+                seen["cols"] = self._columns(app) == before_cols
+                seen["cards"] = list(app.query(self.TaskCard)) == before_cards
+                seen["children"] = sum(1 for c in before_cards if c.is_child)
+                seen["focused"] = app.focused.task_data.filename
+                seen["dom"], seen["model"] = self._dom_orders(app), self._model_orders(app)
+
+        self._run(go())
+        self.assertTrue(seen["cols"], "an unchanged refresh must keep every column")
+        self.assertTrue(seen["cards"], "an unchanged refresh must keep every card")
+        self.assertEqual(seen["children"], 2, "the expanded parent's child rows count")
+        self.assertEqual(calls, [], "no column may be recomposed")
+        self.assertEqual(seen["focused"], MID)
+        self.assertEqual(seen["dom"], seen["model"])
+
+
+    def test_place_children_reorders_kept_widgets_in_place(self):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                col = next(c for c in app.query(self.KanbanColumn) if c.col_id == "c0")
+                head, cards = list(col.children[:2]), list(col.children[2:])
+                extra = self.ab.Static("extra")
+                ordered = head + cards[::-1] + [extra]
+                self.ab._place_children(col, ordered, {extra})
+                await self._settle(pilot)
+                seen["same"] = list(col.children) == ordered
+
+        self._run(go())
+        self.assertTrue(seen["same"])
+
+
+class ChangedTaskRefreshTests(_ReconcileTestBase, unittest.TestCase):
+
+    def test_changed_task_replaces_only_its_card(self):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                before = self._parent_cards(app)
+                self._write(_wide(5, extra={"effort": "high", "priority": "high"}))
+                app._refresh_board_data()
+                await self._settle(pilot)
+                after = self._parent_cards(app)
+                seen["replaced"] = sorted(f for f in after if after[f] is not before[f])
+                card = after[MID]
+                seen["info"] = [str(lbl.render()) for lbl in card.query(".task-info")]
+                seen["border"] = card.styles.border_top[1]
+                seen["task_data"] = all(c.task_data is app.manager.task_datas[f]
+                                        for f, c in after.items())
+
+        self._run(go())
+        self.assertEqual(seen["replaced"], [MID])
+        self.assertTrue(any("high" in line for line in seen["info"]), seen["info"])
+        self.assertEqual(seen["border"], Color.parse("red"))
+        self.assertTrue(seen["task_data"],
+                        "kept cards must adopt the freshly loaded Task objects")
+
+    def test_add_remove_and_move_converge_on_the_model(self):
+        seen = {}
+        # PristineTreeMixin restores bytes, not presence: undo both by hand.
+        removed = self.tasks_dir / "t9010_wide10.md"
+        self.addCleanup(removed.write_bytes, removed.read_bytes())
+        added = _wide(20, col="c0", idx=5)
+        self.addCleanup(added.path_in(self.tasks_dir).unlink, missing_ok=True)
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                before = self._parent_cards(app)
+                self._write(added)                                # new, top of c0
+                removed.unlink()
+                self._write(_wide(6, col="c0", idx=70))           # c1 -> c0
+                self._write(_wide(2, idx=1))                      # reordered in c2
+                app._refresh_board_data()
+                await self._settle(pilot)
+                after = self._parent_cards(app)
+                seen["dom"], seen["model"] = self._dom_orders(app), self._model_orders(app)
+                seen["kept"] = sorted(f for f in after
+                                      if f in before and after[f] is before[f])
+                seen["gone"] = "t9010_wide10.md" in after
+
+        self._run(go())
+        self.assertEqual(seen["dom"], seen["model"])
+        self.assertEqual(seen["dom"]["c0"][0], "t9020_wide20.md")
+        self.assertIn("t9006_wide6.md", seen["dom"]["c0"])
+        self.assertEqual(seen["dom"]["c2"][0], "t9002_wide2.md")
+        self.assertFalse(seen["gone"])
+        # c0's untouched cards shift under the new top card by identity; the
+        # rewritten ones are rebuilt (the dirty `*` is part of what they render).
+        self.assertIn("t9005_wide5.md", seen["kept"])
+        self.assertNotIn("t9006_wide6.md", seen["kept"])
+
+
+class ViewSwitchReconcileTests(_ReconcileTestBase, unittest.TestCase):
+
+    def test_leaving_a_narrowing_view_re_decides_kept_cards(self):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                await pilot.press("l")                            # locked: nothing busy
+                await self._settle(pilot)
+                seen["locked_visible"] = sum(
+                    c.styles.display != "none" for c in self._parent_cards(app).values())
+                await pilot.press("a")
+                await self._settle(pilot)
+                seen["all_hidden"] = sorted(
+                    f for f, c in self._parent_cards(app).items()
+                    if c.styles.display == "none")
+
+        self._run(go())
+        self.assertEqual(seen["locked_visible"], 0,
+                         "control: the locked view must actually hide cards")
+        self.assertEqual(seen["all_hidden"], [])
+
+    def test_returning_from_inflight_rebuilds_the_kanban_board(self):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                await pilot.press("i")
+                await self._settle(pilot)
+                await pilot.press("a")
+                await self._settle(pilot)
+                seen["types"] = {type(c).__name__ for c in self._columns(app)}
+                seen["dom"], seen["model"] = self._dom_orders(app), self._model_orders(app)
+
+        self._run(go())
+        self.assertEqual(seen["types"], {"KanbanColumn"})
+        self.assertEqual(seen["dom"], seen["model"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,304 @@
+"""Windowed (virtualized) kanban columns (`KanbanColumn.VIRTUALIZE_MIN_ROWS`).
+
+A column holding more rows than the threshold keeps a `ColumnRow` for every
+unit but mounts only the rows around its viewport, with `RowSpacer`s standing
+in for the rest. The properties pinned here, each against the column's row
+models as ground truth:
+
+1. **The window is a slice, the geometry is whole**: fewer widgets mount than
+   the column holds, yet the scroll height equals a fully mounted column's.
+2. **Scrolling re-cuts the window**, and the mounted widgets always read the
+   rows' order with each unit at most once.
+3. **`↓` walks every row**, across window edges, in row order.
+4. **The filter decides unmounted rows from data**: a child-aware match deep in
+   the column is mounted and focusable, and a collapsed group mounted after
+   the pass carries its `· N match` badge.
+5. **Marks and refocus survive unmounting**: a marked card rebuilt by the
+   window paints ☑, and a move to the top refocuses a card that had to be
+   mounted first.
+
+The threshold and overscan are patched down so a 30-row fixture column is
+windowed; every other board test runs below the real threshold.
+
+Run: bash tests/run_all_python_tests.sh
+  or: python3 -m pytest tests/test_board_virtual_column.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "tests" / "lib"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "board"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "lib"))
+
+import board_fixture as bf  # noqa: E402
+
+DEEP = "deep_grp"
+#: c0 of `wide_topology(150)` holds t9000, t9005, …, t9145 (30 cards). Three of
+#: them form a group a third of the way down, and t9140 — far below the first
+#: window — gets a child whose slug appears nowhere else.
+_GROUPED = {"9050", "9055", "9060"}
+TOPOLOGY = tuple(
+    bf.FixtureTask(task_id=t.task_id, col=t.col, idx=t.idx, slug=t.slug,
+                   extra={"boardgroup": DEEP} if t.task_id in _GROUPED else None)
+    for t in bf.wide_topology(150)
+) + (bf.FixtureTask(task_id="9140_1", col="c0", idx=10, slug="needlechild"),)
+
+FIRST = "t9000_wide0.md"
+DEEP_PARENT = "t9140_wide140.md"
+DEEP_CARD = "t9145_wide145.md"
+
+
+class _VirtualBase(bf.FixtureBoardTestBase, bf.PristineTreeMixin):
+    FIXTURE_TASKS = TOPOLOGY
+    THRESHOLD = 20
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.KanbanApp = cls.ab.KanbanApp
+        cls.KanbanColumn = cls.ab.KanbanColumn
+        cls.TaskCard = cls.ab.TaskCard
+        cls._snapshot_pristine()
+
+    def setUp(self):
+        super().setUp()
+        for name, value in (("VIRTUALIZE_MIN_ROWS", self.THRESHOLD),
+                            ("WINDOW_OVERSCAN", 3)):
+            patcher = mock.patch.object(self.KanbanColumn, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    async def _settle(self, pilot, times=4):
+        for _ in range(times):
+            await pilot.pause()
+        await pilot.wait_for_scheduled_animations()
+        await pilot.pause()
+
+    def _c0(self, app):
+        return next(c for c in app.query(self.KanbanColumn) if c.col_id == "c0")
+
+    def _mounted_keys(self, col):
+        return [k for k in (self.ab._column_unit_key(w) for w in col.children
+                            if not w._pruning)
+                if k is not None and k[0] in ("group", "card", "child")]
+
+    def _assert_row_order(self, col, mounted):
+        """Mounted unit keys are an in-order, duplicate-free slice of the rows."""
+        self.assertEqual(len(mounted), len(set(mounted)), mounted)
+        order = [r.key for r in col.rows]
+        positions = [order.index(k) for k in mounted]
+        self.assertEqual(positions, sorted(positions), mounted)
+
+    def _focused_key(self, app):
+        w = app.focused
+        if isinstance(w, self.ab.GroupHeader):
+            return ("group", w.slug)
+        if isinstance(w, self.TaskCard):
+            return ("child" if w.is_child else "card", w.task_data.filename)
+        return None
+
+
+class WindowGeometryTests(_VirtualBase, unittest.TestCase):
+
+    def _column_shape(self, threshold):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                col = self._c0(app)
+                seen["windowed"] = col.windowed
+                seen["rows"] = len(col.rows)
+                seen["mounted"] = self._mounted_keys(col)
+                seen["height"] = col.virtual_size.height
+                col.scroll_end(animate=False, immediate=True)
+                await self._settle(pilot)
+                seen["end_mounted"] = self._mounted_keys(col)
+                seen["end_height"] = col.virtual_size.height
+                seen["last_row"] = col.rows[-1].key
+                self._assert_row_order(col, seen["mounted"])
+                self._assert_row_order(col, seen["end_mounted"])
+
+        with mock.patch.object(self.KanbanColumn, "VIRTUALIZE_MIN_ROWS", threshold):
+            self._run(go())
+        return seen
+
+    def test_window_is_a_slice_with_the_full_scroll_height(self):
+        windowed = self._column_shape(self.THRESHOLD)
+        full = self._column_shape(10_000)
+        self.assertTrue(windowed["windowed"])
+        self.assertFalse(full["windowed"], "control: above the patched threshold")
+        self.assertEqual(windowed["rows"], 31, "30 cards and one group header")
+        self.assertEqual(len(full["mounted"]), 31)
+        self.assertLess(len(windowed["mounted"]), 20)
+        self.assertEqual(windowed["mounted"][0], ("card", FIRST))
+        # Until a row has been laid out its spacer reserves the estimate; the one
+        # card here that renders taller (t9140, which has a child) is a line
+        # short until the window reaches it, and exact from then on.
+        self.assertEqual(windowed["height"], full["height"] - 1)
+        self.assertEqual(windowed["end_height"], full["height"],
+                         "spacers must reserve exactly the measured rows' lines")
+
+    def test_scrolling_to_the_end_re_cuts_the_window(self):
+        seen = self._column_shape(self.THRESHOLD)
+        self.assertIn(seen["last_row"], seen["end_mounted"])
+        self.assertIn(("card", FIRST), seen["end_mounted"],
+                      "the focused row stays mounted wherever the view is")
+        self.assertNotIn(("card", "t9005_wide5.md"), seen["end_mounted"],
+                         "rows scrolled far out of view are unmounted")
+
+
+class WindowNavigationTests(_VirtualBase, unittest.TestCase):
+
+    def test_down_walks_every_row_across_window_edges(self):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                col = self._c0(app)
+                app._refocus_card(FIRST)
+                await self._settle(pilot)
+                walked = [self._focused_key(app)]
+                for _ in range(len(col.rows) - 1):
+                    await pilot.press("down")
+                    await self._settle(pilot, times=2)
+                    walked.append(self._focused_key(app))
+                seen["walked"] = walked
+                seen["rows"] = [r.key for r in col.rows]
+                seen["mounted"] = len(self._mounted_keys(col))
+
+        self._run(go())
+        self.assertEqual(seen["walked"], seen["rows"])
+        self.assertLess(seen["mounted"], 20, "the window follows focus down")
+
+
+class WindowFilterTests(_VirtualBase, unittest.TestCase):
+
+    def test_child_match_deep_in_the_column_is_mounted_and_focused(self):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                col = self._c0(app)
+                app._refocus_card(FIRST)
+                await self._settle(pilot)
+                seen["before"] = ("card", DEEP_PARENT) in self._mounted_keys(col)
+                app.search_filter = "needlechild"
+                app.apply_filter()
+                await self._settle(pilot)
+                shown = [w for w in app.query(self.TaskCard)
+                         if w.column_id == "c0" and w.styles.display != "none"]
+                seen["shown"] = [w.task_data.filename for w in shown]
+                seen["focused"] = self._focused_key(app)
+                seen["placeholder"] = app._column_placeholder("c0").styles.display
+
+                app.search_filter = ""
+                app.apply_filter()
+                await self._settle(pilot)
+                seen["restored"] = len(col.rows) - len(col.hidden_rows)
+
+        self._run(go())
+        self.assertFalse(seen["before"], "control: the parent starts unmounted")
+        self.assertEqual(seen["shown"], [DEEP_PARENT],
+                         "a parent is shown through its child (t1469)")
+        self.assertEqual(seen["focused"], ("card", DEEP_PARENT),
+                         "the rescue lands on the row the pass mounted")
+        self.assertEqual(seen["placeholder"], "none")
+        self.assertEqual(seen["restored"], 31)
+
+    def test_collapsed_group_mounted_after_the_pass_carries_its_badge(self):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                app.manager.toggle_group_collapsed("c0", DEEP)
+                app.refresh_board()
+                await self._settle(pilot)
+                col = self._c0(app)
+                seen["rows"] = len(col.rows)
+                app.search_filter = "wide55"
+                app.apply_filter()
+                await self._settle(pilot)
+                headers = [w for w in app.query(self.ab.GroupHeader)
+                           if w.column_id == "c0"]
+                seen["headers"] = [(h.slug, h.match_count, h.styles.display)
+                                   for h in headers]
+
+        self._run(go())
+        self.assertEqual(seen["rows"], 28, "members of a collapsed group have no rows")
+        self.assertEqual(seen["headers"], [(DEEP, 1, "block")])
+
+
+class WindowStateTests(_VirtualBase, unittest.TestCase):
+
+    def test_a_marked_card_rebuilt_by_the_window_paints_its_mark(self):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                col = self._c0(app)
+                app._refocus_card(FIRST)
+                await self._settle(pilot)
+                await pilot.press("space")
+                app.focused.blur()
+                col._focus_key = None
+                col.scroll_end(animate=False, immediate=True)
+                await self._settle(pilot)
+                seen["unmounted"] = ("card", FIRST) not in self._mounted_keys(col)
+                col.scroll_home(animate=False, immediate=True)
+                await self._settle(pilot)
+                card = next(c for c in app.query(self.TaskCard)
+                            if c.task_data.filename == FIRST)
+                seen["painted"] = card.painted_mark
+
+        self._run(go())
+        self.assertTrue(seen["unmounted"], "control: the marked card left the window")
+        self.assertTrue(seen["painted"])
+
+    def test_move_to_top_refocuses_a_card_that_was_not_mounted(self):
+        seen = {}
+
+        async def go():
+            app = self.KanbanApp()
+            async with app.run_test(size=(160, 48)) as pilot:
+                await self._settle(pilot)
+                col = self._c0(app)
+                seen["before"] = ("card", DEEP_CARD) in self._mounted_keys(col)
+                app._refocus_card(DEEP_CARD)
+                await self._settle(pilot)
+                seen["revealed"] = self._focused_key(app)
+                await pilot.press("ctrl+up")
+                await self._settle(pilot)
+                seen["focused"] = self._focused_key(app)
+                seen["first_row"] = col.rows[0].key
+                mounted = self._mounted_keys(col)
+                self._assert_row_order(col, mounted)
+
+        self._run(go())
+        self.assertFalse(seen["before"], "control: the card starts unmounted")
+        self.assertEqual(seen["revealed"], ("card", DEEP_CARD))
+        self.assertEqual(seen["focused"], ("card", DEEP_CARD))
+        self.assertEqual(seen["first_row"], ("card", DEEP_CARD))
+
+
+if __name__ == "__main__":
+    unittest.main()
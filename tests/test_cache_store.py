@@ -0,0 +1,96 @@
+"""Unit tests for lib/cache_store.py — shared plumbing of the persisted caches.
+
+Each persisted cache writes one file per directory it has seen under
+``${XDG_CACHE_HOME:-~/.cache}/ait/<kind>/``; a directory that disappears (a
+test's temp tree, a removed worktree) leaves its file behind. Pinned here: a
+write that creates a file prunes the kind dir to ``MAX_FILES`` files written
+within ``MAX_AGE_S``, nothing but ``*.json`` is touched, the file just written
+always survives, and a cache given a path outside the cache root never prunes
+its neighbours.
+
+No sleeps: mtimes are moved with ``os.utime`` (per
+aidocs/framework/testing_conventions.md).
+
+Run: bash tests/run_all_python_tests.sh
+  or: python3 tests/test_cache_store.py
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / ".aitask-scripts"
+sys.path.insert(0, str(SCRIPTS_DIR / "lib"))
+
+import cache_store  # noqa: E402
+
+
+class CacheStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix="cache_store_"))
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.tmp / "xdg")})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.kind = cache_store.cache_root() / "frontmatter"
+        self.kind.mkdir(parents=True)
+
+    def _old(self, name: str, age_s: float) -> Path:
+        path = self.kind / name
+        path.write_text("{}")
+        when = time.time() - age_s
+        os.utime(path, (when, when))
+        return path
+
+    def test_dir_cache_path_is_per_resolved_directory(self):
+        a = cache_store.dir_cache_path("stats", self.tmp)
+        self.assertEqual(a.parent, self.tmp / "xdg" / "ait" / "stats")
+        self.assertEqual(a, cache_store.dir_cache_path("stats", self.tmp / "x" / ".."))
+        self.assertNotEqual(a, cache_store.dir_cache_path("stats", self.tmp / "x"))
+
+    def test_json_safe(self):
+        self.assertTrue(cache_store.json_safe({"a": [1, 2.5, None, True, "s"]}))
+        self.assertFalse(cache_store.json_safe({"a": (1, 2)}))
+        self.assertFalse(cache_store.json_safe({1: "int key"}))
+
+    def test_new_file_prunes_old_and_surplus_files(self):
+        aged = self._old("aged.json", cache_store.MAX_AGE_S + 60)
+        for i in range(cache_store.MAX_FILES + 5):
+            self._old(f"f{i:03d}.json", 60 + i)          # f000 is the newest
+        temp = self._old(".f.json.123.tmp", cache_store.MAX_AGE_S + 60)
+
+        new = self.kind / "new.json"
+        self.assertTrue(cache_store.write_cache_text(new, "{}"))
+        names = {p.name for p in self.kind.iterdir()}
+        self.assertIn("new.json", names)
+        self.assertNotIn(aged.name, names)
+        self.assertIn(temp.name, names, "a writer's temp file is not ours to delete")
+        kept = sorted(n for n in names if n.startswith("f"))
+        self.assertEqual(len(kept) + 1, cache_store.MAX_FILES)
+        self.assertEqual(kept[0], "f000.json")           # newest kept, oldest gone
+
+    def test_rewriting_an_existing_file_does_not_scan(self):
+        existing = self._old("existing.json", 60)
+        aged = self._old("aged.json", cache_store.MAX_AGE_S + 60)
+        self.assertTrue(cache_store.write_cache_text(existing, '{"v": 1}'))
+        self.assertTrue(aged.exists())
+
+    def test_path_outside_the_cache_root_never_prunes(self):
+        elsewhere = self.tmp / "project"
+        elsewhere.mkdir()
+        other = elsewhere / "package.json"
+        other.write_text("{}")
+        os.utime(other, (0, 0))
+        self.assertTrue(cache_store.write_cache_text(elsewhere / "index.json", "{}"))
+        self.assertTrue(other.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -489,6 +489,7 @@ for extra in (scripts_dir, scripts_dir / "lib"):
 before = set(sys.modules)
 import chatlink.relay          # noqa: F401
 import chatlink.relay_ask      # noqa: F401
+import chatlink.relay_watch    # noqa: F401
 import chatlink.relay_payload  # noqa: F401
 new_modules = set(sys.modules) - before
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env bash
+# test_chatlink_relay_watch.sh — spool-write wakeups for the Q&A relay.
+#
+# Covers chatlink/relay_watch.py and its two consumers, once per backend
+# (inotify, then AIT_FS_WATCH=poll):
+#   - SpoolWatcher over one session dir: question / answer (os.link publish)
+#     / status / payload writes become typed events; *.tmp staging is never
+#     reported; a timeout returns [].
+#   - SpoolWatcher over the relay root: a new session dir is reported and
+#     watched, writes inside it are attributed to it, removal is reported.
+#   - relay_ask: an answer written mid-wait ends the wait promptly (inotify:
+#     well under the POLL_INTERVAL_S cadence it used to sleep).
+#   - flow pump: a spooled question reaches flow_q without waiting for the
+#     (here: one-minute) consistency sweep, via a scan of that session only.
+# Run: bash tests/test_chatlink_relay_watch.sh
+
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"
+
+# shellcheck source=../.aitask-scripts/lib/python_resolve.sh
+source "$PROJECT_DIR/.aitask-scripts/lib/python_resolve.sh"
+
+PYTHON="$(require_ait_python)"
+
+run_suite() {
+"$PYTHON" - "$PROJECT_DIR" <<'PYEOF'
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+root = Path(sys.argv[1])
+sys.path.insert(0, str(root / ".aitask-scripts"))
+
+import chatlink.flow as flow_mod
+from chatlink.relay import (
+    Answer, Question, assign_option_values, create_session_dir,
+)
+from chatlink.relay_watch import SESSION, SpoolEvent, SpoolWatcher
+from chatlink.sessions_store import SessionsStore
+
+PASS = 0
+def check(label, cond):
+    global PASS
+    assert cond, f"FAIL: {label}"
+    PASS += 1
+    print(f"ok - {label}")
+
+
+class AuditSpy:
+    def __init__(self):
+        self.lines = []
+    def _rec(self, level, msg, *args):
+        self.lines.append((level, (msg % args) if args else msg))
+    def info(self, msg, *a): self._rec("info", msg, *a)
+    def warning(self, msg, *a): self._rec("warning", msg, *a)
+    def error(self, msg, *a): self._rec("error", msg, *a)
+
+
+def question(sid, seq):
+    return Question(id=f"q-{sid}-{seq}", seq=seq, session_id=sid,
+                    text=f"Question {seq}?",
+                    options=assign_option_values([("A", ""), ("B", "")]))
+
+
+def collect(watcher, want, timeout=5.0):
+    """Gather events until every ``want`` event was seen (or timeout)."""
+    seen = []
+    deadline = time.monotonic() + timeout
+    while not set(want) <= set(seen) and time.monotonic() < deadline:
+        got = watcher.wait(deadline - time.monotonic())
+        assert got is not None, "unexpected rescan"
+        seen.extend(got)
+    return seen
+
+
+tmp = Path(tempfile.mkdtemp(prefix="relay_watch_"))
+POLL = 0.1
+try:
+    relay_root = tmp / "relay"
+    relay_root.mkdir()
+    sess = create_session_dir(relay_root)
+    sid = sess.session_id
+    with SpoolWatcher(sess.path, poll_interval=POLL) as w:
+        backend = w.backend
+        print(f"# backend: {backend}")
+        if os.environ.get("AIT_FS_WATCH") == "poll":
+            check("AIT_FS_WATCH=poll forces the poll backend", backend == "poll")
+        check("fileno only on inotify",
+              (w.fileno() is None) == (backend == "poll"))
+
+        check("quiet spool: wait times out with []", w.wait(0.3) == [])
+        (sess.path / "question-9.json.tmp").write_text("{}")
+        got = w.wait(0.3)
+        check("*.tmp staging writes are not reported", got == [])
+
+        sess.write_question(question(sid, 1))
+        check("question write → question event",
+              SpoolEvent(sid, "question", 1) in collect(
+                  w, [SpoolEvent(sid, "question", 1)]))
+        sess.write_answer(Answer(id=f"q-{sid}-1", seq=1, status="timeout"))
+        check("answer publish (os.link) → answer event",
+              SpoolEvent(sid, "answer", 1) in collect(
+                  w, [SpoolEvent(sid, "answer", 1)]))
+        sess.write_status({"state": "working"})
+        sess.write_payload({"session_id": sid})
+        both = [SpoolEvent(sid, "status"), SpoolEvent(sid, "payload")]
+        check("status + payload writes → events",
+              set(both) <= set(collect(w, both)))
+
+    with SpoolWatcher(relay_root, root=True, poll_interval=POLL) as rw:
+        new = create_session_dir(relay_root)
+        nid = new.session_id
+        check("root watch: a new session dir is reported",
+              SpoolEvent(nid, SESSION) in collect(rw, [SpoolEvent(nid, SESSION)]))
+        new.write_question(question(nid, 1))
+        check("root watch: writes inside a new session are attributed",
+              SpoolEvent(nid, "question", 1) in collect(
+                  rw, [SpoolEvent(nid, "question", 1)]))
+        sess.write_question(question(sid, 2))
+        check("root watch: writes inside a pre-existing session too",
+              SpoolEvent(sid, "question", 2) in collect(
+                  rw, [SpoolEvent(sid, "question", 2)]))
+        shutil.rmtree(new.path)
+        check("root watch: a removed session dir is reported",
+              SpoolEvent(nid, SESSION) in collect(rw, [SpoolEvent(nid, SESSION)]))
+
+    # relay_ask: the answer ends the wait as it lands.
+    ask_sess = create_session_dir(relay_root)
+    env = dict(os.environ, PYTHONPATH=str(root / ".aitask-scripts"))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "chatlink.relay_ask", "--relay-dir",
+         str(ask_sess.path), "--text", "A or B?", "--option", "A",
+         "--option", "B", "--timeout", "20"],
+        stdout=subprocess.PIPE, text=True, env=env)
+    deadline = time.monotonic() + 10
+    while not ask_sess.question_path(1).exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    time.sleep(0.3)   # let the helper reach its wait
+    t0 = time.monotonic()
+    ask_sess.write_answer(Answer(id=f"q-{ask_sess.session_id}-1", seq=1,
+                                 status="answered", values=["o1"],
+                                 answered_by="tester"))
+    out, _ = proc.communicate(timeout=20)
+    latency = time.monotonic() - t0
+    print(f"# relay_ask answer latency: {latency * 1000:.0f} ms")
+    check("relay_ask: answered round trip",
+          proc.returncode == 0 and "STATUS:answered" in out and "VALUE:B" in out)
+    if backend == "inotify":
+        check("relay_ask: woken by the write, not by a poll tick",
+              latency < 0.5)
+
+    # flow pump: the write, not the sweep, gets the question queued.
+    async def pump_case():
+        store = SessionsStore(tmp / "sessions")
+        psess = create_session_dir(relay_root)
+        store.save(store.new_record(psess.session_id, "U1"))
+        sweeps = []
+        real = store.list_records
+        store.list_records = lambda: (sweeps.append(1), real())[1]
+        flow_q = asyncio.Queue(maxsize=16)
+        stop = asyncio.Event()
+        task = asyncio.create_task(flow_mod.run_flow_pump(
+            store=store, relay_root=relay_root, flow_q=flow_q, stop=stop,
+            audit=AuditSpy(), interval_s=60.0))
+        while not sweeps:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.2)
+        t0 = time.monotonic()
+        await asyncio.to_thread(psess.write_question,
+                                question(psess.session_id, 1))
+        ev = await asyncio.wait_for(flow_q.get(), timeout=10)
+        latency = time.monotonic() - t0
+        stop.set()
+        await asyncio.wait_for(task, timeout=5)
+        return ev, latency, len(sweeps), psess.session_id
+
+    ev, latency, n_sweeps, psid = asyncio.run(pump_case())
+    print(f"# pump question latency: {latency * 1000:.0f} ms")
+    check("pump: question queued from the spool write",
+          ev == flow_mod.FlowEvent(flow_mod.QUESTION_READY, psid, seq=1))
+    check("pump: only the initial sweep listed every record", n_sweeps == 1)
+
+    scoped = flow_mod.scan_flow_events(
+        SessionsStore(tmp / "sessions"), relay_root, session_ids={"snope"})
+    check("scan_flow_events: session_ids scopes the pass", scoped == [])
+finally:
+    shutil.rmtree(tmp, ignore_errors=True)
+
+print(f"\nPASS: {PASS}, FAIL: 0")
+PYEOF
+}
+
+run_suite
+echo
+AIT_FS_WATCH=poll run_suite
+
+echo
+echo "PASS: test_chatlink_relay_watch.sh"
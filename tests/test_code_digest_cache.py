@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Tests for code_digest and its per-file memo (lib/gate_ledger.py).
+
+``code_digest`` is persisted in human-gate witnesses and ``stuckhash:`` notes,
+so the memo must return exactly what the uncached computation returns for
+every worktree state: tracked edits, staged edits, untracked files, commits.
+The value depends on content alone (a staged-then-restored file is clean, a
+file's blob id is git's own). A call re-reads only the files whose stat
+changed, and a file touched within the racy window, or changed while it was
+read, is not remembered.
+
+Run: python3 -m pytest tests/test_code_digest_cache.py -v
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", ".aitask-scripts", "lib"))
+
+import gate_ledger as gl  # noqa: E402
+
+
+class CodeDigestMemoTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="digest_memo_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.repo = os.path.join(self.tmp, "repo")
+        os.makedirs(os.path.join(self.repo, "src"))
+        os.makedirs(os.path.join(self.repo, "aitasks"))
+        env = mock.patch.dict(os.environ, {
+            "XDG_CACHE_HOME": os.path.join(self.tmp, "xdg"),
+            "AIT_DIGEST_CACHE": "1"})
+        env.start()
+        self.addCleanup(env.stop)
+        self._git("init", "-q")
+        self._git("config", "user.email", "t@t")
+        self._git("config", "user.name", "t")
+        self._write("src/a.py", "a = 1\n")
+        self._write("src/b.py", "b = 2\n")
+        self._write("aitasks/t1_x.md", "task\n")
+        self._git("add", "-A")
+        self._git("commit", "-qm", "init")
+        self._age = 1000
+
+    def _git(self, *args):
+        subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+
+    def _write(self, rel, text):
+        path = os.path.join(self.repo, rel)
+        with open(path, "w") as fh:
+            fh.write(text)
+
+    def _settle(self):
+        """Back-date every file (a distinct stamp per step) so nothing is racy."""
+        self._age -= 10
+        stamp = time.time() - self._age
+        for root, dirs, files in os.walk(self.repo):
+            dirs[:] = [d for d in dirs if d != ".git"]
+            for name in files:
+                os.utime(os.path.join(root, name), (stamp, stamp))
+
+    def _uncached(self):
+        with mock.patch.dict(os.environ, {"AIT_DIGEST_CACHE": "0"}):
+            return gl.code_digest(self.repo)
+
+    def _reads(self):
+        """code_digest(), returning ``(digest, paths it read)``."""
+        read = []
+        real = gl._blob_oid
+
+        def spy(data, algo):
+            read.append(data)
+            return real(data, algo)
+
+        with mock.patch.object(gl, "_blob_oid", side_effect=spy):
+            digest = gl.code_digest(self.repo)
+        return digest, read
+
+    def _check(self):
+        self._settle()
+        expected = self._uncached()
+        self.assertEqual(gl.code_digest(self.repo), expected)   # may store
+        digest, read = self._reads()
+        self.assertEqual(digest, expected)
+        self.assertEqual(read, [], "an unchanged tree re-read a file")
+        return expected
+
+    def test_memo_matches_uncached_digest_across_changes(self):
+        seen = [self._check()]
+        self._write("src/a.py", "a = 9\n")          # same size, new content
+        seen.append(self._check())
+        self._git("add", "src/a.py")                 # staged instead of unstaged
+        seen.append(self._check())
+        self._write("build.out", "x" * 5000)         # untracked
+        seen.append(self._check())
+        os.remove(os.path.join(self.repo, "build.out"))
+        self._git("commit", "-qm", "edit a")         # new HEAD
+        seen.append(self._check())
+        # Staged or not, the worktree is the same; every other step differs.
+        self.assertEqual(seen[1], seen[2])
+        self.assertEqual(len(set(seen)), len(seen) - 1)
+
+        self._write("aitasks/t1_x.md", "ledger churn\n")   # excluded path
+        self.assertEqual(self._check(), seen[-1])
+        self._write("src/a.py", "a = 1\n")           # back to an earlier state
+        self._git("commit", "-qam", "revert")
+        self.assertNotIn(self._check(), seen)        # HEAD differs, so does the digest
+
+    def test_only_changed_files_are_reread(self):
+        self._write("src/a.py", "a = 9\n")
+        self._write("big.bin", "x" * 100_000)
+        self._write("notes.txt", "n\n")
+        self._check()
+        self._write("src/a.py", "a = 8\n")
+        stamp = time.time() - 100                    # only this file's stat moves
+        os.utime(os.path.join(self.repo, "src/a.py"), (stamp, stamp))
+        digest, read = self._reads()
+        self.assertEqual(read, [b"a = 8\n"])
+        self.assertEqual(digest, self._uncached())
+
+    def test_content_alone_decides(self):
+        clean = self._check()
+        self._write("src/a.py", "a = 9\n")
+        self._git("add", "src/a.py")
+        self._write("src/a.py", "a = 1\n")           # staged, then restored
+        self.assertEqual(self._check(), clean)
+        os.chmod(os.path.join(self.repo, "src/b.py"), 0o755)
+        self.assertNotEqual(self._check(), clean)    # a mode change is a change
+
+    def test_blob_id_is_gits(self):
+        self._write("build.out", "payload\n")
+        oid = subprocess.run(["git", "hash-object", "build.out"], cwd=self.repo,
+                             check=True, capture_output=True, text=True).stdout.strip()
+        self.assertEqual(gl._blob_oid(b"payload\n", "sha1"), oid)
+
+    def test_racy_file_is_not_remembered(self):
+        self._write("src/b.py", "b = 3\n")           # mtime is "now"
+        expected = self._uncached()
+        self.assertEqual(gl.code_digest(self.repo), expected)
+        digest, read = self._reads()
+        self.assertEqual(digest, expected)
+        self.assertEqual(read, [b"b = 3\n"])
+
+    def test_edit_during_read_is_not_remembered(self):
+        self._write("src/a.py", "a = 9\n")
+        self._settle()
+        real = gl._blob_oid
+
+        def read_then_edit(data, algo):
+            self._write("src/a.py", "a = 7\n")      # lands after the read
+            return real(data, algo)
+
+        with mock.patch.object(gl, "_blob_oid", side_effect=read_then_edit):
+            gl.code_digest(self.repo)
+        stamp = os.stat(os.path.join(self.repo, "src/a.py")).st_mtime - 100
+        os.utime(os.path.join(self.repo, "src/a.py"), (stamp, stamp))
+        digest, read = self._reads()
+        self.assertEqual(read, [b"a = 7\n"])
+        self.assertEqual(digest, self._uncached())
+
+    def test_upstream_ahead_behind_does_not_invalidate(self):
+        branch = subprocess.run(["git", "symbolic-ref", "--short", "HEAD"], cwd=self.repo,
+                                check=True, capture_output=True, text=True).stdout.strip()
+        upstream = f"refs/remotes/origin/{branch}"
+        self._git("remote", "add", "origin", self.repo)
+        self._git("update-ref", upstream, "HEAD")
+        self._git("branch", f"--set-upstream-to=origin/{branch}")
+        self._write("src/a.py", "a = 9\n")
+        expected = self._check()
+        tree = subprocess.run(["git", "rev-parse", "HEAD^{tree}"], cwd=self.repo,
+                              check=True, capture_output=True, text=True).stdout.strip()
+        ahead = subprocess.run(["git", "commit-tree", tree, "-p", "HEAD", "-m", "remote"],
+                               cwd=self.repo, check=True, capture_output=True,
+                               text=True).stdout.strip()
+        self._git("update-ref", upstream, ahead)     # what a fetch does
+        self.assertEqual(self._reads(), (expected, []))
+
+    def test_disabled_and_corrupt_cache(self):
+        self._write("src/a.py", "a = 9\n")
+        self._settle()
+        expected = gl._compute_code_digest(self.repo)
+        with mock.patch.dict(os.environ, {"AIT_DIGEST_CACHE": "0"}):
+            self.assertEqual(gl.code_digest(self.repo), expected)
+        self.assertFalse(os.path.exists(gl._digest_cache_path(self.repo)))
+        path = gl._digest_cache_path(self.repo)
+        os.makedirs(os.path.dirname(path))
+        with open(path, "w") as fh:
+            fh.write("{nope")
+        self.assertEqual(gl.code_digest(self.repo), expected)
+        self.assertEqual(gl.code_digest(self.repo), expected)
+
+    def test_no_git_is_still_none(self):
+        plain = os.path.join(self.tmp, "plain")
+        os.makedirs(plain)
+        with mock.patch.dict(os.environ, {"GIT_CEILING_DIRECTORIES": self.tmp}):
+            self.assertIsNone(gl.code_digest(plain))
+
+
+if __name__ == "__main__":
+    unittest.main()
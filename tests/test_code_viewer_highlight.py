@@ -0,0 +1,211 @@
+"""Incremental highlighting in codebrowser's CodeViewer (``codebrowser/highlight_engine.py``).
+
+``load_file`` used to highlight the whole file before showing anything. Files
+above ``CodeViewer.SYNC_HIGHLIGHT_MAX_LINES`` now render plain lines at once
+and a background worker swaps highlighted chunks in; finished highlights are
+cached per ``(path, blob hash)``. The properties pinned here:
+
+1. **Chunked equals one-shot**: ``highlight_chunks`` resumes the lexer across
+   chunk boundaries (a multi-line string straddling one is still a string), and
+   the concatenated chunks equal ``Syntax.highlight(code).split("\\n")``
+   line for line, spans and base style included.
+2. **Plain first, highlighted after**: right after ``load_file`` the viewer
+   holds plain lines with the final line count; once the worker is done they
+   are the one-shot highlight.
+3. **Reopen is instant**: a cached file is highlighted on load with no worker;
+   an edited file (new blob) is not served the old lines.
+4. **A superseded worker paints nothing**: chunks for a file that was replaced
+   are dropped.
+5. **The cache is an LRU** bounded by entries and by total lines.
+
+Run: bash tests/run_all_python_tests.sh
+  or: python3 -m pytest tests/test_code_viewer_highlight.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "codebrowser"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "lib"))
+
+from rich.syntax import Syntax  # noqa: E402
+from textual.app import App, ComposeResult  # noqa: E402
+
+from code_viewer import CodeViewer  # noqa: E402
+from highlight_engine import (  # noqa: E402
+    HighlightCache, blob_hash, highlight_chunks, plain_lines,
+)
+
+
+def _one_shot(code: str, lexer: str = "python"):
+    return list(Syntax(code, lexer, theme="monokai").highlight(code).split("\n"))
+
+
+def _shape(line):
+    return (line.plain, line.spans, line.style, line.justify, line.end)
+
+
+def _python_source(blocks: int) -> str:
+    """Python with a triple-quoted string every block, so chunk edges land inside some."""
+    return "".join(
+        f"def f{i}(x):\n"
+        f'    """Doc {i},\n'
+        f"    continued over lines.\n"
+        f'    """\n'
+        f"    return x + {i}  # c\n"
+        for i in range(blocks)
+    )
+
+
+class _HostApp(App):
+    def compose(self) -> ComposeResult:
+        yield CodeViewer(id="viewer")
+
+
+class HighlightChunksTests(unittest.TestCase):
+
+    def test_chunks_concatenate_to_the_one_shot_highlight(self):
+        code = _python_source(40)
+        expected = _one_shot(code)
+        for first, size in ((1, 1), (2, 7), (200, 2000)):
+            with self.subTest(first=first, size=size):
+                chunks = list(highlight_chunks(code, "python", first, size))
+                starts = [start for start, _ in chunks]
+                got = [line for _, chunk in chunks for line in chunk]
+                self.assertEqual([_shape(l) for l in got],
+                                 [_shape(l) for l in expected])
+                self.assertEqual(starts[0], 0)
+                self.assertEqual(len(chunks[0][1]), min(first, len(expected)))
+                self.assertEqual(starts, sorted(starts))
+
+    def test_plain_lines_match_the_highlight_count_and_base_style(self):
+        for code in ("a", "a\n", "a\n\n", "\n\nx\n", _python_source(3)):
+            with self.subTest(code=code[:12]):
+                expected = _one_shot(code)
+                plain = plain_lines(code)
+                self.assertEqual([l.plain for l in plain], [l.plain for l in expected])
+                self.assertEqual(plain[0].style, expected[0].style)
+                self.assertFalse(any(l.spans for l in plain))
+
+
+class HighlightCacheTests(unittest.TestCase):
+
+    def test_lru_eviction_by_entries_and_lines(self):
+        cache = HighlightCache(max_entries=2, max_lines=10)
+        cache.put("a", "1", plain_lines("a\n"))
+        cache.put("b", "1", plain_lines("b\n"))
+        self.assertIsNotNone(cache.get("a", "1"), "promotes a over b")
+        cache.put("c", "1", plain_lines("c\n"))
+        self.assertIsNone(cache.get("b", "1"))
+        self.assertIsNotNone(cache.get("a", "1"))
+        self.assertIsNone(cache.get("a", "2"), "another blob is another entry")
+
+        cache.put("big", "1", plain_lines("x\n" * 9))
+        self.assertIsNone(cache.get("c", "1"), "over the line budget: LRU goes first")
+        self.assertEqual(len(cache), 2, "a (1 line) + big (9 lines) fit exactly")
+        cache.put("huge", "1", plain_lines("x\n" * 11))
+        self.assertIsNone(cache.get("huge", "1"), "larger than the budget: not kept")
+        self.assertIsNotNone(cache.get("big", "1"))
+
+    def test_blob_hash_is_gits(self):
+        # `printf 'hello\n' | git hash-object --stdin`
+        self.assertEqual(blob_hash("hello\n"),
+                         "ce013625030ba8dba906f756967f9e9ca394464a")
+
+
+class ViewerBackgroundHighlightTests(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        # A private cache per test: the class-level one is shared by design.
+        CodeViewer._highlight_cache = HighlightCache()
+        self.addCleanup(setattr, CodeViewer, "_highlight_cache", HighlightCache())
+
+    def _write(self, name: str, content: str) -> Path:
+        path = self.dir / name
+        path.write_text(content)
+        return path
+
+    async def _drain(self, app, pilot):
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+    def test_large_file_shows_plain_lines_then_the_highlight(self):
+        code = _python_source(600)          # 3000 lines: viewport mode
+        path = self._write("big.py", code)
+        seen = {}
+
+        async def go():
+            app = _HostApp()
+            async with app.run_test(size=(100, 30)) as pilot:
+                viewer = app.query_one(CodeViewer)
+                await pilot.pause()
+                viewer.load_file(path)
+                seen["highlighting"] = viewer.highlighting
+                seen["plain"] = not any(l.spans for l in viewer._lines)
+                seen["total"] = viewer._total_lines
+                seen["rows"] = viewer._table.row_count
+                seen["viewport"] = viewer._viewport_size
+                await self._drain(app, pilot)
+                seen["done"] = not viewer.highlighting
+                seen["lines"] = [_shape(l) for l in viewer._lines]
+                seen["painted"] = any(
+                    c.spans for c in viewer._table.columns[1]._cells)
+
+                # Reopen: served from the cache, no worker.
+                viewer.load_file(path)
+                seen["reopen_busy"] = viewer.highlighting
+                seen["reopen_spans"] = all(
+                    l.spans for l in viewer._lines if l.plain)
+
+                # Edited file: a new blob is highlighted afresh.
+                path.write_text(code + "x = 1\n")
+                viewer.load_file(path)
+                seen["edited_busy"] = viewer.highlighting
+                await self._drain(app, pilot)
+
+        asyncio.run(go())
+        expected = _one_shot(code)
+        self.assertTrue(seen["highlighting"])
+        self.assertTrue(seen["plain"], "nothing is highlighted before the first frame")
+        self.assertEqual(seen["total"], len(expected))
+        self.assertEqual(seen["rows"], seen["viewport"] + 1,
+                         "the viewport rows plus the lines-below indicator")
+        self.assertTrue(seen["done"])
+        self.assertEqual(seen["lines"], [_shape(l) for l in expected])
+        self.assertTrue(seen["painted"], "the rendered table shows the highlight")
+        self.assertFalse(seen["reopen_busy"])
+        self.assertTrue(seen["reopen_spans"])
+        self.assertTrue(seen["edited_busy"], "a changed blob misses the cache")
+
+    def test_a_replaced_file_is_not_painted_by_the_old_worker(self):
+        big = self._write("big.py", _python_source(600))
+        small = self._write("small.txt", "one\ntwo\n")
+        seen = {}
+
+        async def go():
+            app = _HostApp()
+            async with app.run_test(size=(100, 30)) as pilot:
+                viewer = app.query_one(CodeViewer)
+                await pilot.pause()
+                viewer.load_file(big)
+                viewer.load_file(small)
+                await self._drain(app, pilot)
+                seen["lines"] = [l.plain for l in viewer._lines]
+                seen["busy"] = viewer.highlighting
+
+        asyncio.run(go())
+        self.assertEqual(seen["lines"], ["one", "two"])
+        self.assertFalse(seen["busy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""Tests for the agentcrew runner's watch mode (``--watch``).
+
+A dependent must launch as soon as its dependency's status file says
+Completed — not an interval later — under both DirWatcher backends, and the
+git traffic of a whole run must collapse into a handful of commits.
+AgentStatusCache must re-read only status files whose stat changed, and
+GitSyncBatcher must hold commits until the latency window closes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts"))
+
+from agentcrew import agentcrew_runner as runner  # noqa: E402
+from agentcrew.agentcrew_utils import (  # noqa: E402
+    read_yaml,
+    update_yaml_field,
+    write_yaml,
+)
+
+
+def _git(cwd: str, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=cwd, check=True,
+                          capture_output=True, text=True).stdout
+
+
+class _CrewDir(unittest.TestCase):
+    def setUp(self):
+        self.wt = tempfile.mkdtemp(prefix="crew_watch_")
+        self.addCleanup(shutil.rmtree, self.wt, True)
+
+    def _agent(self, name: str, status: str, depends_on=()):
+        write_yaml(os.path.join(self.wt, f"{name}_status.yaml"), {
+            "agent_name": name, "agent_type": "impl", "status": status,
+            "depends_on": list(depends_on)})
+
+    def _status(self, name: str) -> str:
+        return read_yaml(os.path.join(self.wt, f"{name}_status.yaml"))["status"]
+
+
+class AgentStatusCacheTests(_CrewDir):
+    def test_rereads_only_changed_files(self):
+        for n in ("a", "b", "c"):
+            self._agent(n, "Waiting")
+        cache = runner.AgentStatusCache(self.wt)
+        self.assertEqual(sorted(cache.refresh()), ["a", "b", "c"])
+        self.assertEqual(cache.reads, 3)
+        cache.refresh()
+        cache.refresh(["a_status.yaml", "_crew_status.yaml", "a_alive.yaml"])
+        self.assertEqual(cache.reads, 3)
+
+        self._agent("b", "Completed")
+        agents = cache.refresh(["b_status.yaml"])
+        self.assertEqual((cache.reads, agents["b"]["status"]), (4, "Completed"))
+
+        with open(os.path.join(self.wt, "c_status.yaml"), "w") as fh:
+            fh.write("status: [unclosed\n")
+        self.assertEqual(cache.refresh(["c_status.yaml"])["c"]["status"], "Waiting")
+        os.remove(os.path.join(self.wt, "a_status.yaml"))
+        self.assertEqual(sorted(cache.refresh()), ["b", "c"])
+
+
+class GitSyncBatcherTests(unittest.TestCase):
+    def test_urgent_changes_wait_for_the_window(self):
+        with mock.patch.object(runner, "git_commit_push_if_changes") as push:
+            sync = runner.GitSyncBatcher("/nowhere", 0.2, batch=True)
+            self.assertFalse(sync.maybe_flush("m"))
+            sync.mark(urgent=False)
+            self.assertIsNone(sync.deadline)
+            sync.mark()
+            sync.mark()
+            self.assertFalse(sync.maybe_flush("m"))
+            time.sleep(0.25)
+            self.assertTrue(sync.maybe_flush("m"))
+            self.assertFalse(sync.flush("m"))
+            self.assertEqual(push.call_count, 1)
+
+            dry = runner.GitSyncBatcher("/nowhere", 0, batch=True, dry_run=True)
+            dry.mark()
+            self.assertFalse(dry.flush("m"))
+            self.assertEqual(push.call_count, 1)
+
+
+class WatchLoopTests(_CrewDir):
+    def setUp(self):
+        super().setUp()
+        _git(self.wt, "init", "-q")
+        _git(self.wt, "config", "user.email", "t@t")
+        _git(self.wt, "config", "user.name", "t")
+        write_yaml(os.path.join(self.wt, runner.CREW_META_FILE), {
+            "heartbeat_timeout_minutes": 5,
+            "agent_types": {"impl": {"agent_string": "claudecode/opus4_6"}}})
+        write_yaml(os.path.join(self.wt, runner.CREW_STATUS_FILE),
+                   {"status": "Running", "progress": 0})
+        self._agent("a", "Running")
+        self._agent("b", "Waiting", ["a"])
+        self._agent("c", "Waiting", ["b"])
+        _git(self.wt, "add", "-A")
+        _git(self.wt, "commit", "-qm", "seed")
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            self.addCleanup(signal.signal, sig, signal.getsignal(sig))
+        self.addCleanup(setattr, runner, "_should_stop", False)
+        self.launched: list[tuple[str, float]] = []
+
+    def _fake_launch(self, worktree, name, agents, meta, dry_run, batch):
+        update_yaml_field(os.path.join(worktree, f"{name}_status.yaml"),
+                          "status", "Running")
+        agents[name]["status"] = "Running"
+        self.launched.append((name, time.monotonic()))
+
+    def _complete_chain(self, done: threading.Event):
+        """Play the agents: each completes once the runner has launched it."""
+        time.sleep(0.3)
+        for name, nxt in (("a", "b"), ("b", "c"), ("c", None)):
+            update_yaml_field(os.path.join(self.wt, f"{name}_status.yaml"),
+                              "status", "Completed")
+            deadline = time.monotonic() + 10
+            while nxt and self._status(nxt) != "Running":
+                if time.monotonic() > deadline or done.is_set():
+                    return
+                time.sleep(0.02)
+
+    def _run(self, backend: str) -> str:
+        done = threading.Event()
+        player = threading.Thread(target=self._complete_chain, args=(done,))
+        out = io.StringIO()
+        with mock.patch.dict(os.environ, {"AIT_FS_WATCH": backend}), \
+                mock.patch.object(runner, "launch_agent", self._fake_launch), \
+                contextlib.redirect_stdout(out):
+            player.start()
+            t0 = time.monotonic()
+            rc = runner.run_watch_loop(self.wt, "testcrew", interval=30,
+                                       max_concurrent=3, dry_run=False,
+                                       batch=True)
+            elapsed = time.monotonic() - t0
+            done.set()
+        player.join()
+        self.assertEqual(rc, 0)
+        # A 30s interval loop would need a minute to get c running.
+        self.assertLess(elapsed, 8)
+        self.assertEqual([n for n, _ in self.launched], ["b", "c"])
+        return out.getvalue()
+
+    def _runner_commits(self) -> list[str]:
+        return [s for s in _git(self.wt, "log", "--format=%s").splitlines()
+                if s.startswith("runner:")]
+
+    def test_dependents_launch_on_inotify_events(self):
+        out = self._run("inotify")
+        if "WATCH_MODE:poll" in out:
+            self.skipTest("inotify unavailable here")
+        self.assertIn("WATCH_MODE:inotify", out)
+        self.assertIn("ALL_TERMINAL", out)
+        commits = self._runner_commits()
+        self.assertEqual(commits[0], "runner: all agents terminal")
+        self.assertLessEqual(len(commits), 4)
+        self.assertEqual(read_yaml(os.path.join(self.wt, runner.RUNNER_ALIVE_FILE))
+                         ["status"], "stopped")
+        self.assertEqual(_git(self.wt, "status", "--porcelain"), "")
+
+    def test_dependents_launch_under_polling(self):
+        out = self._run("poll")
+        self.assertIn("WATCH_MODE:poll", out)
+        self.assertIn("ALL_TERMINAL", out)
+        self.assertLessEqual(len(self._runner_commits()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import difflib
 import os
+import random
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add the .aitask-scripts directory to path for imports
 SCRIPTS_DIR = Path(__file__).resolve().parents[1] / ".aitask-scripts"
 sys.path.insert(0, str(SCRIPTS_DIR))
 
 from diffviewer.plan_loader import load_plan
+import diffviewer.diff_engine as diff_engine
 from diffviewer.diff_engine import (
     DiffHunk,
     MultiDiffResult,
@@ -450,5 +454,90 @@ class TestComputeMultiDiffStructural(unittest.TestCase):
             self.assertGreater(len(comp.hunks), 0)
 
 
+def _brute_force_content_matches(main, other, unmatched_main, unmatched_other,
+                                 similarity_threshold):
+    """The pre-pruning matcher: every pair's full ratio, stable sort, greedy."""
+    candidates = []
+    for mi in unmatched_main:
+        mc = main.contents[mi]
+        for oi in unmatched_other:
+            oc = other.contents[oi]
+            if not mc and not oc:
+                continue
+            ratio = difflib.SequenceMatcher(None, mc, oc).ratio()
+            if ratio > similarity_threshold:
+                candidates.append((ratio, mi, oi))
+    candidates.sort(key=lambda x: x[0], reverse=True)
+    taken_main, taken_other, matches = set(), set(), []
+    for _ratio, mi, oi in candidates:
+        if mi not in taken_main and oi not in taken_other:
+            matches.append((mi, oi))
+            taken_main.add(mi)
+            taken_other.add(oi)
+    return matches
+
+
+def _random_plan(rng, n_sections):
+    words = ["setup", "build", "test", "deploy", "verify", "step", "the",
+             "config", "a", "run", "files", "and"]
+    lines = []
+    for _ in range(n_sections):
+        lines.append(f"## {rng.choice(['Step', 'Notes', 'Plan'])} "
+                     f"{rng.randint(0, n_sections)}\n")
+        for _ in range(rng.randint(0, 4)):
+            lines.append(" ".join(rng.choice(words)
+                                  for _ in range(rng.randint(0, 8))) + "\n")
+    return lines
+
+
+class TestStructuralMatchingParity(unittest.TestCase):
+    """Pruned, lazily-evaluated similarity matching == the brute-force greedy."""
+
+    def _pairs(self):
+        plans = sorted(TEST_PLANS.glob("*.md"))
+        for a in plans:
+            for b in plans:
+                yield (load_plan(str(a))[2], load_plan(str(b))[2])
+        rng = random.Random(1010)
+        for _ in range(60):
+            main = _random_plan(rng, rng.randint(0, 25))
+            other = list(main)
+            rng.shuffle(other)
+            yield main, _random_plan(rng, rng.randint(0, 25)) + other[:20]
+
+    def test_hunks_match_brute_force(self):
+        for n, (main, other) in enumerate(self._pairs()):
+            fast = compute_structural_diff(main, other, source_plan="x.md")
+            with mock.patch.object(diff_engine, "_match_by_content",
+                                   _brute_force_content_matches):
+                slow = compute_structural_diff(main, other, source_plan="x.md")
+            with self.subTest(pair=n):
+                self.assertEqual(fast, slow)
+
+    def test_thresholds(self):
+        rng = random.Random(7)
+        main = diff_engine._parse_plan(tuple(_random_plan(rng, 30)))
+        other = diff_engine._parse_plan(tuple(_random_plan(rng, 30)))
+        mains = list(range(len(main.sections)))
+        others = list(range(len(other.sections)))
+        for threshold in (0.0, 0.3, 0.6, 0.9, 1.0):
+            with self.subTest(threshold=threshold):
+                self.assertEqual(
+                    diff_engine._match_by_content(main, other, mains, others,
+                                                  threshold),
+                    _brute_force_content_matches(main, other, mains, others,
+                                                 threshold))
+
+    def test_parsed_plans_are_shared_across_a_multi_diff(self):
+        diff_engine._parse_plan.cache_clear()
+        others = [str(TEST_PLANS / f"plan_{n}.md")
+                  for n in ("beta", "gamma", "delta", "epsilon")]
+        compute_multi_diff(str(TEST_PLANS / "plan_alpha.md"), others,
+                           mode="structural")
+        info = diff_engine._parse_plan.cache_info()
+        self.assertEqual(info.misses, 5)
+        self.assertEqual(info.hits, 3)
+
+
 if __name__ == "__main__":
     unittest.main()
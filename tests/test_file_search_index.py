@@ -0,0 +1,134 @@
+"""Tests for the code browser's fuzzy file search index (codebrowser/file_search.py).
+
+``PathSearchIndex`` only decides which paths reach ``PathFuzzySearch``; the
+results must be exactly what scoring every path and stably sorting the lot
+gives, including when a query is narrowed from the previous keystroke's
+matches. The widget scores on a worker thread, so the pilot test also checks
+that only the latest query's results land.
+
+Run: python3 -m pytest tests/test_file_search_index.py -v
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from operator import itemgetter
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "codebrowser"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "lib"))
+
+from textual.app import App, ComposeResult  # noqa: E402
+from textual.widgets import Input, OptionList  # noqa: E402
+
+from file_search import (  # noqa: E402
+    FileSearchWidget,
+    PathFuzzySearch,
+    PathSearchIndex,
+    _MAX_RESULTS,
+)
+
+_WORDS = ["src", "lib", "tests", "Board", "codebrowser", "history", "data",
+          "index", "file_search", "widget", "App", "config", "Straße", "ß"]
+
+
+def _paths(n: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    out = set()
+    while len(out) < n:
+        parts = [rng.choice(_WORDS) for _ in range(rng.randint(1, 4))]
+        out.add("/".join(parts) + f"_{rng.randint(0, 50)}.py")
+    return sorted(out)
+
+
+def _reference(paths, query, fuzzy=PathFuzzySearch()):
+    """The pre-index search: score every path, stable sort, take the top."""
+    scored = []
+    for path in paths:
+        score, positions = fuzzy.match(query, path)
+        if score > 0:
+            scored.append((score, positions, path))
+    scored.sort(key=itemgetter(0), reverse=True)
+    return scored[:_MAX_RESULTS]
+
+
+class PathSearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.paths = _paths(800)
+        self.index = PathSearchIndex(self.paths)
+        self.fuzzy = PathFuzzySearch()
+
+    def test_results_match_full_scan(self):
+        for query in ["h", "hist", "cbw", "SS", "ss", "app.py", "z", "s/t_1",
+                      "wdgt", "B/c", "straße"]:
+            with self.subTest(query=query):
+                top, matched = self.index.search(query, self.fuzzy, _MAX_RESULTS)
+                self.assertEqual(top, _reference(self.paths, query))
+                self.assertEqual(
+                    matched,
+                    [i for i, p in enumerate(self.paths)
+                     if self.fuzzy.match(query, p)[0] > 0])
+
+    def test_narrowing_from_previous_matches_is_exact(self):
+        within = None
+        query = ""
+        for ch in "hist/idx":
+            query += ch
+            with self.subTest(query=query):
+                top, within = self.index.search(query, self.fuzzy,
+                                                _MAX_RESULTS, within)
+                self.assertEqual(top, _reference(self.paths, query))
+
+    def test_cancelled_search_returns_none(self):
+        self.assertIsNone(self.index.search("s", self.fuzzy, _MAX_RESULTS,
+                                            cancelled=lambda: True))
+
+    def test_empty_path_list(self):
+        empty = PathSearchIndex([])
+        self.assertEqual(empty.search("abc", self.fuzzy, _MAX_RESULTS), ([], []))
+
+
+class _HostApp(App):
+    def compose(self) -> ComposeResult:
+        yield FileSearchWidget(id="file_search")
+
+
+class FileSearchWidgetTests(unittest.IsolatedAsyncioTestCase):
+    async def _settle(self, app, pilot):
+        for _ in range(3):
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+    def _shown(self, app):
+        ol = app.query_one("#file_search_results", OptionList)
+        return [ol.get_option_at_index(i).id for i in range(ol.option_count)]
+
+    async def test_typing_shows_latest_query_results(self):
+        paths = _paths(400)
+        app = _HostApp()
+        async with app.run_test() as pilot:
+            search = app.query_one("#file_search", FileSearchWidget)
+            search.set_files(paths)
+            box = app.query_one("#file_search_input", Input)
+            for query in ("h", "hi", "his", "hist"):
+                box.value = query
+            await self._settle(app, pilot)
+            self.assertEqual(self._shown(app),
+                             [p for _s, _pos, p in _reference(paths, "hist")])
+
+            box.value = "his"       # widening must not reuse "hist"'s matches
+            await self._settle(app, pilot)
+            self.assertEqual(self._shown(app),
+                             [p for _s, _pos, p in _reference(paths, "his")])
+
+            box.value = ""
+            await self._settle(app, pilot)
+            ol = app.query_one("#file_search_results", OptionList)
+            self.assertTrue(ol.has_class("-hidden"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+"""Unit tests for lib/frontmatter_index.py — the persistent parsed-frontmatter cache.
+
+The index must be indistinguishable from ``read_text`` + ``parse_frontmatter``
+for every caller: same tuple, same raise on malformed YAML, same ``None`` for a
+file without frontmatter. What it adds is that an unchanged file — identity
+``(st_size, st_mtime_ns, st_ino)`` — is not re-parsed, in this process or (via
+the persisted JSON) the next one.
+
+No sleeps: mtimes are moved with ``os.utime`` (per
+aidocs/framework/testing_conventions.md).
+
+Run: bash tests/run_all_python_tests.sh
+  or: python3 tests/test_frontmatter_index.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / ".aitask-scripts"
+sys.path.insert(0, str(SCRIPTS_DIR / "lib"))
+
+import frontmatter_index  # noqa: E402
+from frontmatter_index import FrontmatterIndex  # noqa: E402
+from task_yaml import parse_frontmatter  # noqa: E402
+
+TASK_TEXT = (
+    "---\n"
+    "priority: medium\n"
+    "status: Ready\n"
+    "depends: [85_2, 16]\n"
+    "labels: [ui, perf]\n"
+    "boardcol: now\n"
+    "---\n\n"
+    "# Title\n\nbody line\n"
+)
+
+
+class _Base(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix="fm_index_"))
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.index_path = self.tmp / "cache" / "index.json"
+        self.task = self.tmp / "t1_alpha.md"
+        self.task.write_text(TASK_TEXT, encoding="utf-8")
+
+    def _index(self, persist=True):
+        return FrontmatterIndex(self.index_path, persist=persist)
+
+    def _bump_mtime(self, path: Path):
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class ParityTests(_Base):
+    def test_read_matches_parse_frontmatter_on_miss_and_hit(self):
+        index = self._index()
+        expected = parse_frontmatter(TASK_TEXT)
+        miss, raw = index.read(self.task)
+        hit, raw2 = index.read(self.task)
+        self.assertEqual(miss, expected)
+        self.assertEqual(hit, expected)
+        self.assertEqual(raw, TASK_TEXT)
+        self.assertEqual(raw2, TASK_TEXT)
+        self.assertEqual((index.misses, index.hits), (1, 1))
+        # Normalisation survives the cache: the child ref gained its prefix.
+        self.assertEqual(hit[0]["depends"], ["t85_2", 16])
+
+    def test_no_frontmatter_is_none_and_cached(self):
+        doc = self.tmp / "README.md"
+        doc.write_text("# just a doc\n", encoding="utf-8")
+        index = self._index()
+        self.assertIsNone(index.parse_file(doc))
+        self.assertIsNone(index.parse_file(doc))
+        self.assertEqual(index.hits, 1)
+
+    def test_malformed_yaml_raises_every_time(self):
+        bad = self.tmp / "t2_bad.md"
+        bad.write_text("---\nlabels: [a, b\n---\nbody\n", encoding="utf-8")
+        index = self._index()
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                index.parse_file(bad)
+        self.assertEqual(len(index), 0)    # a raise is never recorded
+
+    def test_returned_metadata_is_a_private_copy(self):
+        index = self._index()
+        meta, _body, order = index.parse_file(self.task)
+        meta["status"] = "Done"
+        meta["labels"].append("mutated")
+        order.append("bogus")
+        again = index.parse_file(self.task)
+        self.assertEqual(again[0]["status"], "Ready")
+        self.assertEqual(again[0]["labels"], ["ui", "perf"])
+        self.assertNotIn("bogus", again[2])
+
+    def test_non_json_metadata_is_served_but_not_persisted(self):
+        dated = self.tmp / "t3_dated.md"
+        dated.write_text("---\ncreated: 2024-01-02\n---\nbody\n",
+                         encoding="utf-8")
+        index = self._index()
+        first = index.parse_file(dated)
+        self.assertEqual(index.parse_file(dated), first)
+        self.assertEqual(index.hits, 1)
+        index.save()
+        doc = json.loads(self.index_path.read_text(encoding="utf-8"))
+        self.assertNotIn(str(dated), doc["entries"])
+
+
+class InvalidationTests(_Base):
+    def test_mtime_change_reparses(self):
+        index = self._index()
+        index.read(self.task)
+        self.task.write_text(TASK_TEXT.replace("Ready", "Done"),
+                             encoding="utf-8")
+        self._bump_mtime(self.task)
+        meta = index.parse_file(self.task)[0]
+        self.assertEqual(meta["status"], "Done")
+        self.assertEqual(index.misses, 2)
+
+    def test_rename_replace_with_same_size_and_mtime_reparses(self):
+        """A rewrite by rename (every in-tree writer) changes the inode even
+        when size and mtime collide — the inode is what catches it."""
+        index = self._index()
+        index.read(self.task)
+        st = self.task.stat()
+        other = self.tmp / "staged.md"
+        other.write_text(TASK_TEXT.replace("Ready", "Later"), encoding="utf-8")
+        os.utime(other, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(other, self.task)
+        self.assertEqual(self.task.stat().st_size, st.st_size)
+        self.assertEqual(index.parse_file(self.task)[0]["status"], "Later")
+
+
+class PersistenceTests(_Base):
+    def test_saved_index_serves_a_new_process_without_parsing(self):
+        first = self._index()
+        first.read(self.task)
+        self.assertTrue(first.save())
+        self.assertFalse(first.save())     # nothing changed since
+
+        second = self._index()
+        with mock.patch.object(frontmatter_index, "parse_frontmatter",
+                               side_effect=AssertionError("re-parsed")):
+            parsed = second.parse_file(self.task)
+        self.assertEqual(parsed, parse_frontmatter(TASK_TEXT))
+        self.assertEqual(second.hits, 1)
+
+    def test_save_prunes_deleted_files(self):
+        index = self._index()
+        index.read(self.task)
+        index.save()
+        self.task.unlink()
+        index.forget(self.tmp / "unrelated.md")   # no-op, not dirty
+        other = self.tmp / "t9_other.md"
+        other.write_text(TASK_TEXT, encoding="utf-8")
+        index.read(other)
+        index.save()
+        doc = json.loads(self.index_path.read_text(encoding="utf-8"))
+        self.assertEqual(list(doc["entries"]), [str(other)])
+
+    def test_corrupt_or_stale_version_file_is_ignored(self):
+        self.index_path.parent.mkdir(parents=True)
+        for payload in ("{not json", json.dumps({"version": -1, "entries": {}})):
+            self.index_path.write_text(payload, encoding="utf-8")
+            index = self._index()
+            self.assertEqual(len(index), 0)
+            self.assertEqual(index.parse_file(self.task),
+                             parse_frontmatter(TASK_TEXT))
+
+    def test_persist_off_writes_nothing(self):
+        index = self._index(persist=False)
+        index.read(self.task)
+        self.assertFalse(index.save())
+        self.assertFalse(self.index_path.exists())
+
+
+class SharedIndexTests(_Base):
+    def test_shared_index_is_per_directory_and_honours_env(self):
+        env = {"XDG_CACHE_HOME": str(self.tmp / "xdg"),
+               "AIT_FRONTMATTER_INDEX": "0"}
+        with mock.patch.dict(os.environ, env), \
+                mock.patch.dict(frontmatter_index._SHARED, clear=True):
+            a = frontmatter_index.shared_index(self.tmp)
+            self.assertIs(frontmatter_index.shared_index(self.tmp), a)
+            self.assertIsNot(frontmatter_index.shared_index(self.tmp / "x"), a)
+            a.read(self.task)
+            self.assertFalse(a.save())
+            path = frontmatter_index.default_index_path(self.tmp)
+        self.assertEqual(path.parent, self.tmp / "xdg" / "ait" / "frontmatter")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""Tests for the in-process batched ledger writer (lib/gate_ledger.py).
+
+``ledger_transaction`` must take the very lock ``aitask_gate.sh append`` takes
+— same path, same guard / pid / owner protocol as lib/stale_lock.sh — so the
+two writers exclude each other; apply a whole batch with one write; honor the
+``--only-if-running`` rule; and count contention. The orchestrator must open
+the gates it admits together with one write.
+
+Run: python3 -m pytest tests/test_gate_ledger_batch.py -v
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(HERE)
+LIB = os.path.join(PROJECT_DIR, ".aitask-scripts", "lib")
+sys.path.insert(0, LIB)
+
+import gate_ledger as gl  # noqa: E402
+import gate_orchestrator as go  # noqa: E402
+
+TASK = "---\nstatus: Implementing\n---\nBody.\n"
+
+
+def _bash_lock(script: str, env: dict) -> subprocess.Popen:
+    return subprocess.Popen(
+        ["bash", "-c", f'source "{LIB}/terminal_compat.sh"; '
+                       f'source "{LIB}/stale_lock.sh"; {script}'],
+        env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+class LockParityTests(unittest.TestCase):
+    def test_cksum_matches_coreutils(self):
+        for data in (b"", b"a", b"/root/package", os.urandom(300)):
+            out = subprocess.run(["cksum"], input=data, capture_output=True,
+                                 check=True).stdout.split()[0]
+            self.assertEqual(gl.posix_cksum(data), int(out))
+
+    def test_default_lock_path_matches_ait_lock_dir(self):
+        tmp = tempfile.mkdtemp(prefix="gate_lockbase_")
+        self.addCleanup(shutil.rmtree, tmp, True)
+        env = {k: v for k, v in os.environ.items() if k != "AITASKS_LOCK_DIR"}
+        env["TMPDIR"] = tmp
+        bash = _bash_lock("ait_lock_dir gate_42_3", env)
+        out, err = bash.communicate()
+        self.assertEqual(bash.returncode, 0, err)
+        with mock.patch.dict(os.environ, env, clear=True):
+            self.assertEqual(gl.lock_dir("gate_42_3"), out.strip())
+
+
+class CrossImplementationLockTests(unittest.TestCase):
+    """lib/stale_lock.sh and gate_ledger's Python port must agree on every
+    lock-dir state: each side sees the other's lock as held, refuses to
+    release it without its token, and reclaims exactly the same stale ones."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="gate_lockparity_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.env = dict(os.environ, AITASKS_LOCK_DIR=os.path.join(self.tmp, "locks"))
+        patcher = mock.patch.dict(os.environ, self.env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = gl.lock_dir("gate_9")
+
+    def _bash(self, script: str) -> subprocess.CompletedProcess:
+        proc = _bash_lock(f'd="{self.path}"; {script}', self.env)
+        out, err = proc.communicate(timeout=30)
+        return subprocess.CompletedProcess(proc.args, proc.returncode, out, err)
+
+    def _bash_acquires(self) -> bool:
+        r = self._bash('stale_lock_acquire "$d" 2 0.01 t || exit 1; '
+                       'stale_lock_release "$d" "$STALE_LOCK_TOKEN"')
+        return r.returncode == 0
+
+    def _python_acquires(self) -> bool:
+        with mock.patch("sys.stderr"):
+            got = gl._dir_lock_acquire(self.path, "t", 2, 0.01)
+        if got is None:
+            return False
+        self.assertTrue(gl._dir_lock_release(self.path, got[0]))
+        return True
+
+    def _dead_pid(self) -> int:
+        proc = subprocess.Popen(["true"])
+        proc.wait()
+        return proc.pid
+
+    def test_both_sides_judge_every_lock_state_alike(self):
+        live = subprocess.Popen(["sleep", "30"])
+        self.addCleanup(live.wait)
+        self.addCleanup(live.kill)
+        aged = time.time() - 1000
+        states = {
+            # name: (pid file content or None, mtime or None, acquirable)
+            "live holder": (str(live.pid), None, False),
+            "dead holder": (str(self._dead_pid()), None, True),
+            "no pid, fresh": (None, None, False),
+            "no pid, aged": (None, aged, True),
+            "malformed pid, aged": ("x1", aged, True),
+        }
+        for name, (pid, mtime, acquirable) in states.items():
+            for side, acquire in (("bash", self._bash_acquires),
+                                  ("python", self._python_acquires)):
+                with self.subTest(state=name, side=side):
+                    shutil.rmtree(self.path, ignore_errors=True)
+                    os.makedirs(self.path)
+                    if pid is not None:
+                        with open(os.path.join(self.path, "pid"), "w") as fh:
+                            fh.write(pid + "\n")
+                    if mtime is not None:
+                        os.utime(self.path, (mtime, mtime))
+                    self.assertEqual(acquire(), acquirable)
+                    self.assertEqual(os.path.exists(self.path), not acquirable)
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_python_holder_is_held_for_bash(self):
+        token, _ = gl._dir_lock_acquire(self.path, "t", 1, 0.01)
+        self.assertFalse(self._bash_acquires())
+        r = self._bash('stale_lock_release "$d" not-the-token')
+        self.assertEqual(r.returncode, 0)
+        self.assertIn("not owner", r.stderr)
+        self.assertTrue(os.path.isdir(self.path), "a foreign token releases nothing")
+        r = self._bash(f'stale_lock_release "$d" {token}')
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertFalse(os.path.exists(self.path), "the owner token is read alike")
+
+    def test_bash_holder_is_held_for_python(self):
+        holder = _bash_lock(
+            f'd="{self.path}"; stale_lock_acquire "$d" 1 0.01 t || exit 9; '
+            'echo "$STALE_LOCK_TOKEN"; exec sleep 30', self.env)  # the holder pid lives on
+        self.addCleanup(holder.wait)
+        self.addCleanup(holder.kill)
+        token = holder.stdout.readline().strip()
+        self.assertTrue(token)
+        self.assertFalse(self._python_acquires())
+        with mock.patch("sys.stderr"):
+            self.assertTrue(gl._dir_lock_release(self.path, "not-the-token"))
+        self.assertTrue(os.path.isdir(self.path), "a foreign token releases nothing")
+        self.assertTrue(gl._dir_lock_release(self.path, token))
+        self.assertFalse(os.path.exists(self.path), "the owner token is read alike")
+
+    def test_dead_bash_holder_is_reclaimed_by_python(self):
+        r = self._bash('stale_lock_acquire "$d" 1 0.01 t')     # exits still holding
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertTrue(os.path.isdir(self.path))
+        with mock.patch("sys.stderr") as err:
+            got = gl._dir_lock_acquire(self.path, "t", 2, 0.01)
+        self.assertIsNotNone(got)
+        self.assertIn("dead holder", "".join(c.args[0] for c in err.write.call_args_list))
+        self.assertTrue(gl._dir_lock_release(self.path, got[0]))
+
+    def test_dead_python_holder_is_reclaimed_by_bash(self):
+        child = subprocess.run(
+            [sys.executable, "-c",
+             f"import sys; sys.path.insert(0, {LIB!r}); import gate_ledger as gl; "
+             f"assert gl._dir_lock_acquire({self.path!r}, 't', 1, 0.01)"],
+            env=self.env, capture_output=True, text=True)
+        self.assertEqual(child.returncode, 0, child.stderr)
+        self.assertTrue(os.path.isdir(self.path))
+        r = self._bash('stale_lock_acquire "$d" 2 0.01 t || exit 1; '
+                       'stale_lock_release "$d" "$STALE_LOCK_TOKEN"')
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertIn("dead holder", r.stderr)
+
+
+class TransactionTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="gate_batch_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.locks = os.path.join(self.tmp, "locks")
+        env = mock.patch.dict(os.environ, {"AITASKS_LOCK_DIR": self.locks})
+        env.start()
+        self.addCleanup(env.stop)
+        self.task = os.path.join(self.tmp, "t7_x.md")
+        with open(self.task, "w") as fh:
+            fh.write(TASK)
+        gl.reset_writer_stats()
+
+    def _text(self):
+        with open(self.task, encoding="utf-8") as fh:
+            return fh.read()
+
+    def test_batch_matches_sequential_appends_with_one_write(self):
+        ops = [("build", "running", {"run": "r1", "attempt": "1", "note": ""}),
+               ("build", "pass", {"run": "r1", "attempt": "1"}, "r1"),
+               ("lint", "fail", {"run": "r2", "result": "2 errors"})]
+        expected = TASK
+        for gate, status, fields, *_ in ops:
+            expected, _ = gl.append_block(expected, gate, status,
+                                          {k: v for k, v in fields.items() if v})
+        with mock.patch.object(gl, "_atomic_write", wraps=gl._atomic_write) as write:
+            blocks = gl.append_batch(self.task, "7", ops)
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(self._text(), expected)
+        self.assertTrue(all(blocks))
+        st = gl.writer_stats()
+        self.assertEqual((st["transactions"], st["writes"], st["blocks"]), (1, 1, 3))
+        self.assertFalse(os.path.exists(os.path.join(self.locks, "gate_7")))
+
+    def test_only_if_running_and_failed_body_write_nothing(self):
+        gl.append_batch(self.task, "7", [("t", "running", {"run": "r1"})])
+        before = self._text()
+        blocks = gl.append_batch(self.task, "7", [
+            ("t", "fail", {"run": "r1"}, "r1"),
+            ("t", "pass", {"run": "r1"}, "r1"),      # closed by the op above
+            ("t", "pass", {"run": "r9"}, "r9")])     # never opened
+        self.assertEqual([b is not None for b in blocks], [True, False, False])
+        self.assertEqual(gl.run_status(self._text(), "r1"), "fail")
+        self.assertEqual(gl.writer_stats()["skipped"], 2)
+
+        after = self._text()
+        with self.assertRaises(RuntimeError):
+            with gl.ledger_transaction(self.task, "7") as tx:
+                tx.append("t", "pass", {"run": "r2"})
+                raise RuntimeError("abort")
+        self.assertEqual(self._text(), after)
+        self.assertNotEqual(before, after)
+        with self.assertRaises(ValueError):
+            gl.append_batch(self.task, "7", [("t", "bogus", {})])
+
+    def test_bash_holder_blocks_python_and_contention_is_counted(self):
+        env = dict(os.environ)
+        holder = _bash_lock(
+            f'd="$(ait_lock_dir gate_7)"; stale_lock_acquire "$d" 5 0.1 t || exit 9; '
+            'echo held; sleep 1; stale_lock_release "$d" "$STALE_LOCK_TOKEN"', env)
+        self.assertEqual(holder.stdout.readline().strip(), "held")
+        t0 = time.monotonic()
+        gl.append_batch(self.task, "7", [("t", "pass", {"run": "r1"})])
+        self.assertGreater(time.monotonic() - t0, 0.5)
+        self.assertEqual(holder.wait(), 0)
+        st = gl.writer_stats()
+        self.assertEqual(st["lock_contended"], 1)
+        self.assertGreater(st["lock_wait_s"], 0.5)
+
+    def test_threads_serialize_without_lost_appends(self):
+        def worker(n):
+            for i in range(10):
+                gl.append_batch(self.task, "7", [(f"g{n}", "pass", {"run": f"{n}-{i}"})])
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(gl.parse_gate_run_blocks(self._text())), 40)
+
+    def test_dead_holder_is_reclaimed(self):
+        path = gl.lock_dir("gate_7")
+        os.makedirs(path)
+        dead = subprocess.Popen(["true"])
+        dead.wait()
+        with open(os.path.join(path, "pid"), "w") as fh:
+            fh.write(f"{dead.pid}\n")
+        with mock.patch("sys.stderr") as err:
+            gl.append_batch(self.task, "7", [("t", "pass", {"run": "r1"})])
+        self.assertIn("dead holder", "".join(c.args[0] for c in err.write.call_args_list))
+        self.assertFalse(os.path.exists(path))
+
+    def test_fsync_policy(self):
+        self.assertEqual(gl.fsync_policy(), "never")
+        with mock.patch.dict(os.environ, {"AIT_GATE_FSYNC": "always"}):
+            self.assertEqual(gl.fsync_policy(), "always")
+            with mock.patch.object(os, "fsync", wraps=os.fsync) as fsync:
+                gl.append_batch(self.task, "7", [("t", "pass", {})])
+            self.assertEqual(fsync.call_count, 2)      # file + directory
+        self.assertEqual(gl.writer_stats()["fsyncs"], 1)
+        with self.assertRaises(ValueError):
+            gl.fsync_policy("sometimes")
+
+    def test_cli_append_batch(self):
+        r = subprocess.run(
+            [sys.executable, os.path.join(LIB, "gate_ledger.py"), "append-batch",
+             self.task, "7", "--", "b", "running", "run=r1",
+             "--", "--only-if-running", "r1", "b", "pass", "run=r1", "attempt=1",
+             "--", "--only-if-running", "r1", "b", "fail", "run=r1"],
+            capture_output=True, text=True)
+        self.assertEqual(r.returncode, 0, r.stderr)
+        self.assertEqual(r.stdout.count("gate:b"), 2)
+        self.assertEqual(gl.derive_gate_runs(self._text())["b"].status, "pass")
+
+
+class EngineBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="gate_batch_engine_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        os.makedirs(os.path.join(self.tmp, "aitasks", "metadata"))
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+        self.addCleanup(os.chdir, cwd)
+        env = mock.patch.dict(os.environ, {
+            "TASK_DIR": os.path.join(self.tmp, "aitasks"),
+            "AITASKS_LOCK_DIR": os.path.join(self.tmp, "locks")})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_admitted_gates_open_in_one_write(self):
+        stub = os.path.join(self.tmp, "ok.sh")
+        with open(stub, "w") as fh:
+            fh.write("#!/usr/bin/env bash\nexit 0\n")
+        os.chmod(stub, 0o755)
+        reg = os.path.join(self.tmp, "aitasks", "metadata", "gates.yaml")
+        with open(reg, "w") as fh:
+            fh.write("gates:\n" + "".join(
+                f"  {g}:\n    type: machine\n    verifier: {stub}\n    unlocks: []\n"
+                for g in ("a", "b", "c")))
+        task = os.path.join(self.tmp, "aitasks", "t7_x.md")
+        with open(task, "w") as fh:
+            fh.write("---\nstatus: Implementing\ngates: [a, b, c]\n---\nBody.\n")
+        rc, reports = go.run(task, "7", registry_file=reg)
+        self.assertEqual(rc, 0)
+        with open(task, encoding="utf-8") as fh:
+            state = gl.derive_gate_runs(fh.read())
+        self.assertEqual({g: r.status for g, r in state.items()},
+                         {"a": "pass", "b": "pass", "c": "pass"})
+        # Three `running` blocks in one write, then one reconcile per gate.
+        self.assertIn("Ledger: 6 block(s) in 4 write(s); lock waited", reports[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Tests for the orchestrator's dataflow scheduler (gate_orchestrator.Engine).
+
+``Engine.run`` no longer runs gates in waves: a gate starts as soon as its own
+predecessors are satisfied, on a shared pool of ``max_parallel`` workers, with
+state folded in memory between completions. Checked here with stub verifiers
+that log start/end times:
+
+  - a slow gate does not hold back an independent gate's successor;
+  - retries are re-dispatched within the budget and the ledger matches a
+    re-parse of the task file;
+  - the worker budget is respected;
+  - per-attempt queue / run latency is reported;
+  - a verifier that does not resolve closes its gate with ONE error block.
+
+Run: python3 -m pytest tests/test_gate_orchestrator_dataflow.py -v
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", ".aitask-scripts", "lib"))
+
+import gate_ledger as gl  # noqa: E402
+import gate_orchestrator as go  # noqa: E402
+
+
+class DataflowSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        # A NON-git dir: code_digest -> None, so the retry budget governs.
+        self.tmp = tempfile.mkdtemp(prefix="test_orch_dataflow_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        os.makedirs(os.path.join(self.tmp, "aitasks", "metadata"))
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+        self.addCleanup(os.chdir, cwd)
+        env = mock.patch.dict(os.environ,
+                              {"TASK_DIR": os.path.join(self.tmp, "aitasks")})
+        env.start()
+        self.addCleanup(env.stop)
+        self.log = os.path.join(self.tmp, "events.log")
+
+    def _stub(self, name, code=0, sleep=0.0):
+        path = os.path.join(self.tmp, f"stub_{name}.sh")
+        with open(path, "w") as fh:
+            fh.write("#!/usr/bin/env bash\n"
+                     f'echo "{name} start $(date +%s.%N)" >> "{self.log}"\n'
+                     f"sleep {sleep}\n"
+                     f'echo "{name} end $(date +%s.%N)" >> "{self.log}"\n'
+                     f"exit {code}\n")
+        os.chmod(path, 0o755)
+        return path
+
+    def _setup(self, registry, gates):
+        reg = os.path.join(self.tmp, "aitasks", "metadata", "gates.yaml")
+        with open(reg, "w") as fh:
+            fh.write("gates:\n" + registry)
+        task = os.path.join(self.tmp, "aitasks", "t7_x.md")
+        with open(task, "w") as fh:
+            fh.write(f"---\nstatus: Implementing\ngates: [{gates}]\n---\nBody.\n")
+        return task, reg
+
+    def _engine(self, task, reg, max_parallel=2):
+        reports = []
+        engine = go.Engine(task, "7", reg, max_parallel, reports)
+        # The constructor caps the pool at os.cpu_count(); pin it so the
+        # overlap below is tested on single-core runners too.
+        engine.max_parallel = max_parallel
+        return engine, reports
+
+    def _events(self):
+        out = {}
+        with open(self.log) as fh:
+            for line in fh:
+                name, what, stamp = line.split()
+                out.setdefault(name, {}).setdefault(what, []).append(float(stamp))
+        return out
+
+    def _ledger(self, task):
+        with open(task, encoding="utf-8") as fh:
+            return gl.derive_gate_runs(fh.read())
+
+    def test_slow_gate_does_not_hold_back_independent_successor(self):
+        task, reg = self._setup(
+            f"  build:\n    type: machine\n    verifier: {self._stub('build')}\n"
+            "    unlocks: [test]\n"
+            f"  lint:\n    type: machine\n    verifier: {self._stub('lint', sleep=3)}\n"
+            "    unlocks: []\n"
+            f"  test:\n    type: machine\n    verifier: {self._stub('test')}\n",
+            "build, lint, test")
+        engine, reports = self._engine(task, reg)
+        self.assertEqual(engine.run(), 0)
+        ev = self._events()
+        # Under the wave scheduler `test` waited for the whole build+lint wave.
+        self.assertLess(ev["test"]["start"][0], ev["lint"]["end"][0])
+        self.assertEqual({g: r.status for g, r in self._ledger(task).items()},
+                         {"build": "pass", "lint": "pass", "test": "pass"})
+        self.assertIn("All gates satisfied. Task ready for archive "
+                      "(suggest status: Done — not auto-applied).", reports)
+
+    def test_retries_run_within_budget_and_match_the_ledger(self):
+        task, reg = self._setup(
+            f"  flaky:\n    type: machine\n    verifier: {self._stub('flaky', code=1)}\n"
+            "    max_retries: 2\n    unlocks: []\n"
+            f"  ok:\n    type: machine\n    verifier: {self._stub('ok')}\n"
+            "    unlocks: []\n",
+            "flaky, ok")
+        engine, reports = self._engine(task, reg)
+        engine.run()
+        self.assertEqual(len(self._events()["flaky"]["start"]), 3)
+        with open(task, encoding="utf-8") as fh:
+            runs = gl.parse_gate_run_blocks(fh.read())
+        self.assertEqual(sum(1 for r in runs if r.name == "flaky" and r.status == "fail"), 3)
+        self.assertEqual(self._ledger(task)["ok"].status, "pass")
+        self.assertIn("  flaky: blocked: exhausted (retry budget spent)", reports)
+
+    def test_worker_budget_is_shared(self):
+        registry = ""
+        for name in ("a", "b", "c", "d"):
+            registry += (f"  {name}:\n    type: machine\n"
+                         f"    verifier: {self._stub(name, sleep=0.5)}\n"
+                         "    unlocks: []\n")
+        task, reg = self._setup(registry, "a, b, c, d")
+        engine, reports = self._engine(task, reg, max_parallel=2)
+        engine.run()
+        spans = [(v["start"][0], v["end"][0]) for v in self._events().values()]
+        for t0, _ in spans:
+            self.assertLessEqual(sum(1 for s, e in spans if s <= t0 < e), 2)
+        timing = reports[reports.index("Gate timing (queued / ran):") + 1:]
+        self.assertEqual(len([line for line in timing if "(attempt 1)" in line]), 4)
+
+    def test_unresolvable_verifier_appends_one_error_block(self):
+        task, reg = self._setup(
+            "  ghost:\n    type: machine\n    verifier: no-such-verifier\n"
+            "    max_retries: 3\n    unlocks: []\n"
+            f"  ok:\n    type: machine\n    verifier: {self._stub('ok')}\n"
+            "    unlocks: []\n",
+            "ghost, ok")
+        engine, reports = self._engine(task, reg)
+        real = go.resolve_verifier
+        with mock.patch.object(go, "resolve_verifier",
+                               side_effect=lambda v: None if v == "no-such-verifier"
+                               else real(v)):
+            engine.run()
+        with open(task, encoding="utf-8") as fh:
+            ghost = [r for r in gl.parse_gate_run_blocks(fh.read()) if r.name == "ghost"]
+        self.assertEqual([r.status for r in ghost], ["error"])
+        self.assertIn("could not be resolved", ghost[0].body_fields.get("note", ""))
+        self.assertEqual(self._ledger(task)["ok"].status, "pass")
+
+    def test_dry_run_dispatches_nothing(self):
+        task, reg = self._setup(
+            f"  a:\n    type: machine\n    verifier: {self._stub('a')}\n", "a")
+        with open(task) as fh:
+            before = fh.read()
+        engine, reports = self._engine(task, reg)
+        engine.run(dry_run=True)
+        with open(task) as fh:
+            self.assertEqual(fh.read(), before)
+        self.assertEqual(reports[:2], ["Dry run — would dispatch:", "  unlocked: a"])
+        self.assertFalse(os.path.exists(self.log))
+
+
+if __name__ == "__main__":
+    unittest.main()
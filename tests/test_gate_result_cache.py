@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Tests for the verifier result cache (lib/gate_result_cache.py).
+
+A ``cache: true`` gate that already passed for the same verifier, code digest
+and ``cache_env`` values must not run its verifier again: the engine records a
+``pass`` citing the original run instead. Anything that changes the key — the
+code, the verifier, a listed env var — runs it. Eviction drops entries unused
+past the TTL, then the least recently used beyond the size cap.
+
+Run: python3 -m pytest tests/test_gate_result_cache.py -v
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", ".aitask-scripts", "lib"))
+
+import gate_ledger as gl  # noqa: E402
+import gate_orchestrator as go  # noqa: E402
+import gate_result_cache as grc  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CacheKeyTests(unittest.TestCase):
+    def test_key_covers_gate_verifier_digest_and_env(self):
+        base = grc.cache_key("tests", ["run_tests"], "d1", ["CI"], {"CI": "1"})
+        self.assertEqual(base, grc.cache_key("tests", ["run_tests"], "d1", ["CI"],
+                                             {"CI": "1", "OTHER": "x"}))
+        for other in (grc.cache_key("lint", ["run_tests"], "d1", ["CI"], {"CI": "1"}),
+                      grc.cache_key("tests", ["run_lint"], "d1", ["CI"], {"CI": "1"}),
+                      grc.cache_key("tests", ["run_tests"], "d2", ["CI"], {"CI": "1"}),
+                      grc.cache_key("tests", ["run_tests"], "d1", ["CI"], {"CI": "0"}),
+                      grc.cache_key("tests", ["run_tests"], "d1", ["CI"], {"CI": ""}),
+                      grc.cache_key("tests", ["run_tests"], "d1", ["CI"], {})):
+            self.assertNotEqual(base, other)
+        self.assertIsNone(grc.cache_key("tests", ["run_tests"], None))
+
+    def test_verifier_script_content_is_part_of_the_key(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".sh", delete=False) as fh:
+            fh.write("exit 0\n")
+        self.addCleanup(os.unlink, fh.name)
+        before = grc.cache_key("g", [fh.name], "d")
+        with open(fh.name, "w") as out:
+            out.write("exit 1\n")
+        self.assertNotEqual(before, grc.cache_key("g", [fh.name], "d"))
+
+
+class GateResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="gate_cache_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.path = os.path.join(self.tmp, "cache.json")
+        self.clock = _Clock()
+
+    def _cache(self, **kw):
+        return grc.GateResultCache(self.path, clock=self.clock, **kw)
+
+    def test_round_trip_and_counters(self):
+        c = self._cache()
+        self.assertIsNone(c.lookup("k"))
+        c.store("k", "tests", "run-1", "7", "d1")
+        self.assertTrue(c.save())
+        c2 = self._cache()
+        hit = c2.lookup("k")
+        self.assertEqual((hit["run"], hit["task"]), ("run-1", "7"))
+        c2.save()
+        st = self._cache().stats()
+        self.assertEqual((st["entries"], st["hits"], st["misses"], st["stores"]),
+                         (1, 1, 1, 1))
+        self.assertEqual(st["gates"], {"tests": {"entries": 1, "hits": 1}})
+
+    def test_concurrent_writers_are_merged(self):
+        a, b = self._cache(), self._cache()
+        a.store("ka", "lint", "run-a", "7", "d1")
+        b.store("kb", "tests", "run-b", "8", "d1")
+        a.save()
+        b.save()
+        merged = self._cache()
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(merged.stats()["stores"], 2)
+
+    def test_ttl_and_size_eviction(self):
+        c = self._cache(max_entries=2, ttl_seconds=100)
+        for i in range(3):
+            c.store(f"k{i}", "g", f"run-{i}", "7", "d")
+            self.clock.now += 10
+        c.lookup("k0")                  # k0 is now the most recently used
+        c.save()
+        self.assertEqual(sorted(self._cache()._entries), ["k0", "k2"])
+        self.clock.now += 101
+        self.assertIsNone(c.lookup("k2"))   # expired entries miss ...
+        c.save()                            # ... and are evicted on save
+        st = self._cache().stats()
+        self.assertEqual((st["entries"], st["evictions"]), (0, 3))
+
+    def test_corrupt_or_foreign_file_is_ignored(self):
+        with open(self.path, "w") as fh:
+            fh.write("{nope")
+        self.assertEqual(len(self._cache()), 0)
+        with open(self.path, "w") as fh:
+            fh.write('{"version": 1, "entries": {"k": {"gate": 1}}}')
+        self.assertIsNone(self._cache().lookup("k"))
+
+    def test_disabled_cache_never_hits(self):
+        c = grc.GateResultCache(self.path, persist=False)
+        c.store("k", "g", "run", "7", "d")
+        self.assertIsNone(c.lookup("k"))
+        self.assertFalse(c.save())
+        self.assertFalse(os.path.exists(self.path))
+
+
+class EngineCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="gate_cache_engine_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        os.makedirs(os.path.join(self.tmp, "aitasks", "metadata"))
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+        self.addCleanup(os.chdir, cwd)
+        env = mock.patch.dict(os.environ, {
+            "TASK_DIR": os.path.join(self.tmp, "aitasks"),
+            "XDG_CACHE_HOME": os.path.join(self.tmp, "xdg"),
+            "AIT_GATE_CACHE": "1", "GATE_FLAVOR": "a"})
+        env.start()
+        self.addCleanup(env.stop)
+        self.digest = "c0ffee"
+        patch = mock.patch.object(go, "code_digest", side_effect=lambda: self.digest)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.log = os.path.join(self.tmp, "runs.log")
+        stub = os.path.join(self.tmp, "stub.sh")
+        with open(stub, "w") as fh:
+            fh.write(f'#!/usr/bin/env bash\necho "$1 $3" >> "{self.log}"\nexit 0\n')
+        os.chmod(stub, 0o755)
+        self.reg = os.path.join(self.tmp, "aitasks", "metadata", "gates.yaml")
+        with open(self.reg, "w") as fh:
+            fh.write(f"gates:\n  tests:\n    type: machine\n    verifier: {stub}\n"
+                     "    cache: true\n    cache_env: [GATE_FLAVOR]\n")
+
+    def _run(self, task_id, **kw):
+        task = os.path.join(self.tmp, "aitasks", f"t{task_id}_x.md")
+        if not os.path.exists(task):
+            with open(task, "w") as fh:
+                fh.write("---\nstatus: Implementing\ngates: [tests]\n---\nBody.\n")
+        rc, reports = go.run(task, task_id, registry_file=self.reg, **kw)
+        with open(task, encoding="utf-8") as fh:
+            return reports, gl.derive_gate_runs(fh.read())["tests"]
+
+    def _verifier_runs(self):
+        with open(self.log) as fh:
+            return [line.split() for line in fh]
+
+    def test_sibling_task_reuses_the_pass(self):
+        _, first = self._run("7")
+        self.assertEqual(first.status, "pass")
+        reports, second = self._run("8")
+        self.assertEqual(len(self._verifier_runs()), 1)
+        self.assertEqual(second.status, "pass")
+        self.assertIn(f"reuses pass of run {first.run_id} (t7)",
+                      second.body_fields["note"])
+        self.assertTrue(any("cached from run " + first.run_id in r for r in reports))
+
+    def test_key_changes_and_forced_runs_run_the_verifier(self):
+        self._run("7")
+        self.digest = "d1ff"            # code changed
+        self._run("8")
+        with mock.patch.dict(os.environ, {"GATE_FLAVOR": "b"}):
+            self._run("9")
+        self.assertEqual([r[0] for r in self._verifier_runs()], ["7", "8", "9"])
+        self._run("9", gate="tests")    # --gate always runs
+        self.assertEqual(len(self._verifier_runs()), 4)
+
+    def test_opt_out_and_disable(self):
+        with mock.patch.dict(os.environ, {"AIT_GATE_CACHE": "0"}):
+            self._run("7")
+            self._run("8")
+        self.assertEqual(len(self._verifier_runs()), 2)
+        self.assertEqual(grc.GateResultCache.for_project().stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
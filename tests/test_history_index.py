@@ -0,0 +1,178 @@
+"""Tests for the persisted history index (codebrowser/history_index.py).
+
+A warm ``load_task_index`` must equal a cold one (``AIT_HISTORY_INDEX=0``)
+task for task, whatever happened to the repository in between: new commits,
+rewritten history, added or re-packed bundles. A warm open must not decode an
+unchanged bundle and must only log commits the index has not seen.
+
+Run: python3 -m pytest tests/test_history_index.py -v
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_scripts = Path(__file__).resolve().parents[1] / ".aitask-scripts"
+sys.path.insert(0, str(_scripts / "codebrowser"))
+sys.path.insert(0, str(_scripts / "lib"))
+
+import archive_iter  # noqa: E402
+import history_data  # noqa: E402
+from history_data import load_task_index, load_task_index_progressive  # noqa: E402
+from history_index import HistoryIndex, default_index_path  # noqa: E402
+
+HAS_ZSTD_CLI = shutil.which("zstd") is not None
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def _task(labels: str) -> str:
+    return f"---\nstatus: Done\nissue_type: feature\nlabels: [{labels}]\n---\nbody\n"
+
+
+def _write_bundle(path: Path, files: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tf:
+        for name, text in files.items():
+            data = text.encode("utf-8")
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    subprocess.run(["zstd", "-q", "-f", "-o", str(path)],
+                   input=buf.getvalue(), check=True)
+
+
+@unittest.skipUnless(HAS_ZSTD_CLI, "zstd CLI not installed")
+class HistoryIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix="history_index_"))
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        env = mock.patch.dict(os.environ, {
+            "XDG_CACHE_HOME": str(self.tmp / "xdg"), "AIT_HISTORY_INDEX": "1",
+            "AIT_ARCHIVE_SCAN_WORKERS": "2"})
+        env.start()
+        self.addCleanup(env.stop)
+
+        self.root = self.tmp / "project"
+        self.archived = self.root / "aitasks" / "archived"
+        self.archived.mkdir(parents=True)
+        _git(self.root, "init", "-q")
+        _git(self.root, "config", "user.email", "test@test.com")
+        _git(self.root, "config", "user.name", "Test")
+        (self.archived / "t42_loose.md").write_text(_task("loose"), encoding="utf-8")
+        _write_bundle(self.archived / "_b0" / "old0.tar.zst", {
+            "t1_a.md": _task("alpha"),
+            "t1/t1_1_child.md": _task("beta"),
+            "t2_archive_only.md": _task("gamma"),
+        })
+        self._commit("initial commit")
+        self._commit("feature: First (t1)", "2026-03-01T10:00:00+00:00")
+        self._commit("ait: Archive completed t2 task and plan files",
+                     "2026-03-02T10:00:00+00:00")
+
+    def _commit(self, message, date="2026-02-01T10:00:00+00:00"):
+        _git(self.root, "add", "-A")
+        subprocess.run(["git", "commit", "-q", "--allow-empty", "-m", message],
+                       cwd=self.root, check=True, capture_output=True,
+                       env={**os.environ, "GIT_AUTHOR_DATE": date,
+                            "GIT_COMMITTER_DATE": date})
+
+    def _cold(self):
+        with mock.patch.dict(os.environ, {"AIT_HISTORY_INDEX": "0"}):
+            return load_task_index(self.root)
+
+    def _warm(self):
+        return load_task_index(self.root)
+
+    def _anchors(self, tasks):
+        return {t.task_id: (t.commit_hash, t.commit_date) for t in tasks}
+
+    def test_warm_open_matches_cold_and_skips_decoding(self):
+        cold = self._cold()
+        self.assertFalse(default_index_path(self.root).exists())
+        self.assertEqual(self._warm(), cold)            # builds the index
+        self.assertEqual(len(HistoryIndex.for_project(self.root)), 1)
+        with mock.patch.object(archive_iter, "_read_single_archive",
+                               side_effect=AssertionError("decoded")), \
+                mock.patch.object(history_data, "_scan_task_commits",
+                                  side_effect=AssertionError("logged")):
+            self.assertEqual(self._warm(), cold)
+        self.assertNotEqual(self._anchors(cold)["2"][0], "")
+        self.assertFalse(
+            next(t for t in cold if t.task_id == "2").has_code_commits)
+
+    def test_warm_open_yields_index_first(self):
+        self._warm()
+        self._commit("feature: Later work (t1_1)", "2026-03-05T10:00:00+00:00")
+        chunks = list(load_task_index_progressive(self.root, chunk_size=1))
+        # Recorded index first (t1_1 still unanchored), then the exact index.
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(chunks[-1], self._cold())
+        self.assertNotEqual(chunks[0], chunks[-1])
+        self.assertEqual(self._anchors(chunks[-1])["1_1"][1],
+                         "2026-03-05T10:00:00+00:00")
+
+    def test_new_commits_are_logged_incrementally(self):
+        self._warm()
+        self._commit("feature: More (t1)", "2026-03-03T10:00:00+00:00")
+        with mock.patch.object(history_data, "_scan_task_commits",
+                               wraps=history_data._scan_task_commits) as scan:
+            warm = self._warm()
+        self.assertEqual(scan.call_count, 1)
+        self.assertTrue(any(rev.startswith("^") for rev in scan.call_args[0][1]))
+        self.assertEqual(warm, self._cold())
+        self.assertEqual(self._anchors(warm)["1"][1], "2026-03-03T10:00:00+00:00")
+
+    def test_rewritten_history_is_rescanned(self):
+        self._commit("feature: Doomed (t1)", "2026-03-04T10:00:00+00:00")
+        self._warm()
+        _git(self.root, "reset", "-q", "--hard", "HEAD~1")
+        warm = self._warm()
+        self.assertEqual(warm, self._cold())
+        self.assertEqual(self._anchors(warm)["1"][1], "2026-03-01T10:00:00+00:00")
+
+    def test_new_and_changed_bundles_are_decoded(self):
+        self._warm()
+        _write_bundle(self.archived / "_b0" / "old1.tar.zst",
+                      {"t3_new.md": _task("delta")})
+        (self.archived / "t3_new.md").touch()      # mtime anchor for t3
+        with mock.patch.object(archive_iter, "_read_single_archive",
+                               wraps=archive_iter._read_single_archive) as read:
+            warm = self._warm()
+        self.assertEqual([c[0][0].name for c in read.call_args_list],
+                         ["old1.tar.zst"])
+        self.assertEqual(warm, self._cold())
+        self.assertEqual(len(HistoryIndex.for_project(self.root)), 2)
+
+        _write_bundle(self.archived / "_b0" / "old0.tar.zst",
+                      {"t1_a.md": _task("epsilon")})
+        warm = self._warm()
+        self.assertEqual(warm, self._cold())
+        self.assertEqual(next(t for t in warm if t.task_id == "1").labels,
+                         ["epsilon"])
+        self.assertEqual(len(HistoryIndex.for_project(self.root)), 2)
+
+    def test_corrupt_index_file_is_ignored(self):
+        path = default_index_path(self.root)
+        path.parent.mkdir(parents=True)
+        path.write_text("{nope", encoding="utf-8")
+        self.assertEqual(self._warm(), self._cold())
+        path.write_text('{"version": 1, "refs": {}, "commits": {"1": "x"}}',
+                        encoding="utf-8")
+        self.assertEqual(self._warm(), self._cold())
+
+
+if __name__ == "__main__":
+    unittest.main()
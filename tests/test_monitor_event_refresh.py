@@ -0,0 +1,258 @@
+"""Tests for the event-driven monitor refresh (``TmuxMonitor(event_driven=True)``).
+
+With a CONNECTED control channel subscribed to pane output, the live refresh
+recaptures only panes the ``PaneDirtyTracker`` saw output from and reuses the
+cached capture for the rest. The snapshots — and the idle / awaiting-input
+bookkeeping behind them — must be exactly what polling every pane would give.
+
+Discovery, capture and the channel state are scripted; the reader-loop cases
+feed a ``StreamReader`` directly, so nothing here needs a tmux server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "lib"))
+
+import monitor.monitor_core as monitor_core  # noqa: E402
+from monitor.monitor_core import (  # noqa: E402
+    COMPARE_MODE_RAW,
+    PaneCategory,
+    PaneDirtyTracker,
+    TmuxControlClient,
+    TmuxControlState,
+    TmuxMonitor,
+    TmuxPaneInfo,
+)
+from monitor.prompt_patterns import all_patterns  # noqa: E402
+
+
+def _pane(pane_id: str, session: str = "demo") -> TmuxPaneInfo:
+    idx = int(pane_id.lstrip("%"))
+    return TmuxPaneInfo(
+        window_index=str(idx), window_name=f"agent-{idx}", pane_index="0",
+        pane_id=pane_id, pane_pid=1000 + idx, current_command="bash",
+        width=80, height=24, category=PaneCategory.AGENT, session_name=session,
+    )
+
+
+async def _sync_offloaded(fn):
+    return fn()
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _make_monitor(panes, content, *, event_driven=True):
+    """Scripted monitor; ``mon.fetches`` lists every pane id actually captured."""
+    mon = TmuxMonitor(
+        session="demo", multi_session=True, agent_prefixes=["agent-"],
+        prompt_patterns=all_patterns(), event_driven=event_driven,
+    )
+    mon._run_offloaded = _sync_offloaded
+    mon._monotonic = _Clock()
+    mon._backend = SimpleNamespace(state=TmuxControlState.CONNECTED,
+                                   is_alive=True)
+    mon.fetches = []
+    for p in panes:
+        mon._pane_cache[p.pane_id] = p
+
+    async def discover_with_shadows(*, enum_sink=None):
+        return list(panes), []
+
+    async def cap_content(pane_id, capture_lines=None, pane=None):
+        mon.fetches.append(pane_id)
+        if pane_id not in content:
+            return None
+        return pane or mon._pane_cache[pane_id], content[pane_id]
+
+    mon.discover_panes_with_shadows_async = discover_with_shadows
+    mon.capture_pane_content_async = cap_content
+    return mon
+
+
+async def _tick(mon):
+    mon.fetches.clear()
+    gen, classified = await mon.capture_all_classified_async()
+    return mon.commit_snapshots(gen, classified)
+
+
+class EventDrivenRefreshTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.panes = [_pane("%1"), _pane("%2")]
+        self.content = {"%1": "building...\n", "%2": "Do you want to proceed?\n"}
+        self.mon = _make_monitor(self.panes, self.content)
+        self.events = self.mon._dirty_tracker
+
+    async def test_first_tick_captures_everything_then_only_dirty_panes(self):
+        await _tick(self.mon)
+        self.assertEqual(sorted(self.mon.fetches), ["%1", "%2"])
+
+        snaps = await _tick(self.mon)
+        self.assertEqual(self.mon.fetches, [])
+        self.assertTrue(snaps["%2"].awaiting_input)
+        self.assertEqual(snaps["%1"].content, "building...\n")
+
+        self.content["%1"] = "built\n"
+        self.events.on_event("%1")
+        snaps = await _tick(self.mon)
+        self.assertEqual(self.mon.fetches, ["%1"])
+        self.assertEqual(snaps["%1"].content, "built\n")
+
+    async def test_idle_clock_matches_polling(self):
+        polled = _make_monitor(self.panes, self.content, event_driven=False)
+        for step in range(4):
+            if step == 2:
+                self.content["%1"] = "more output\n"
+                self.events.on_event("%1")
+            ev = await _tick(self.mon)
+            ref = await _tick(polled)
+            with self.subTest(step=step):
+                self.assertEqual(
+                    {k: (s.content, s.awaiting_input) for k, s in ev.items()},
+                    {k: (s.content, s.awaiting_input) for k, s in ref.items()})
+        # A clean pane's content never "changed", so its idle clock kept
+        # running from the first capture, exactly like the polled monitor's.
+        self.assertEqual(self.mon._last_content, polled._last_content)
+        self.assertLess(self.mon._last_change_time["%2"],
+                        self.mon._last_change_time["%1"])
+
+    async def test_output_during_capture_is_not_lost(self):
+        await _tick(self.mon)
+        self.events.on_event("%1")
+        orig = self.mon.capture_pane_content_async
+
+        async def racing(pane_id, capture_lines=None, pane=None):
+            res = await orig(pane_id, capture_lines, pane)
+            self.content["%1"] = "late output\n"
+            self.events.on_event("%1")       # arrives while this capture is out
+            return res
+
+        self.mon.capture_pane_content_async = racing
+        await _tick(self.mon)
+        self.mon.capture_pane_content_async = orig
+        snaps = await _tick(self.mon)
+        self.assertEqual(self.mon.fetches, ["%1"])
+        self.assertEqual(snaps["%1"].content, "late output\n")
+
+    async def test_without_connected_channel_every_pane_is_polled(self):
+        await _tick(self.mon)
+        self.mon._backend.state = TmuxControlState.RECONNECTING
+        await _tick(self.mon)
+        self.assertEqual(sorted(self.mon.fetches), ["%1", "%2"])
+
+    async def test_reconnect_marks_everything_dirty(self):
+        await _tick(self.mon)
+        self.events.on_event(None)
+        await _tick(self.mon)
+        self.assertEqual(sorted(self.mon.fetches), ["%1", "%2"])
+
+    async def test_panes_outside_attached_session_are_always_captured(self):
+        panes = self.panes + [_pane("%3", session="other")]
+        self.content["%3"] = "elsewhere\n"
+        mon = _make_monitor(panes, self.content)
+        await _tick(mon)
+        await _tick(mon)
+        self.assertEqual(mon.fetches, ["%3"])
+
+    async def test_compare_mode_change_reclassifies_without_capture(self):
+        self.content["%1"] = "\x1b[31mred\x1b[0m\n"
+        await _tick(self.mon)
+        self.mon.set_compare_mode("%1", COMPARE_MODE_RAW)
+        await _tick(self.mon)
+        self.assertEqual(self.mon.fetches, [])
+        self.assertIn("\x1b", self.mon._last_content["%1"])
+
+    async def test_failed_capture_is_retried(self):
+        await _tick(self.mon)
+        del self.content["%1"]
+        self.events.on_event("%1")
+        snaps = await _tick(self.mon)
+        self.assertNotIn("%1", snaps)
+        self.content["%1"] = "back\n"
+        snaps = await _tick(self.mon)
+        self.assertEqual(self.mon.fetches, ["%1"])
+        self.assertEqual(snaps["%1"].content, "back\n")
+
+    async def test_cached_capture_is_resynced_after_bound(self):
+        await _tick(self.mon)
+        self.mon._monotonic.now += monitor_core._EVENT_RESYNC_SECONDS + 1
+        await _tick(self.mon)
+        self.assertEqual(sorted(self.mon.fetches), ["%1", "%2"])
+
+    async def test_superseded_cycle_remarks_its_panes(self):
+        await _tick(self.mon)
+        self.events.on_event("%1")
+        self.content["%1"] = "new\n"
+
+        async def superseded(fn):
+            self.mon._next_generation()     # a newer cycle reserves meanwhile
+            return fn()
+
+        self.mon._run_offloaded = superseded
+        g_old, c_old = await self.mon.capture_all_classified_async()
+        self.mon._run_offloaded = _sync_offloaded
+        self.assertIsNone(self.mon.commit_snapshots(g_old, c_old))
+        snaps = await _tick(self.mon)
+        self.assertEqual(self.mon.fetches, ["%1"])
+        self.assertEqual(snaps["%1"].content, "new\n")
+
+
+class DirtyTrackerTests(unittest.TestCase):
+    def test_claim_clears_only_claimed_ids(self):
+        t = PaneDirtyTracker()
+        self.assertEqual(t.claim(["%1"]), {"%1"})   # starts all-dirty
+        t.on_event("%1")
+        t.on_event("%2")
+        self.assertEqual(t.claim(["%1"]), {"%1"})
+        self.assertEqual(t.claim(["%1", "%2"]), {"%2"})
+        self.assertEqual(t.claim(["%1", "%2"]), set())
+
+
+class ReaderSubscriptionTests(unittest.IsolatedAsyncioTestCase):
+    async def _read(self, data: bytes, subscribed: bool = True):
+        events = []
+        client = TmuxControlClient(
+            session="s", socket_args=[],
+            on_pane_event=events.append if subscribed else None)
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        client._proc = SimpleNamespace(stdout=reader)
+        fut = asyncio.get_running_loop().create_future()
+        client._pending.append(fut)
+        await client._reader_loop()
+        return events, fut.result()
+
+    async def test_output_notifications_mark_panes(self):
+        events, reply = await self._read(
+            b"%output %3 hello\\015\\012\n"
+            b"%begin 1 7 1\n%output %9 is body text here\n%end 1 7 1\n"
+            b"%pane-mode-changed %4\n"
+            b"%layout-change @1 b25d,80x24,0,0,2 b25d,80x24,0,0,2 *\n")
+        self.assertEqual(events, ["%3", "%4", None])
+        self.assertEqual(reply, (0, "%output %9 is body text here\n"))
+
+    def test_attach_keeps_output_only_when_subscribed(self):
+        sub = TmuxControlClient(session="s", socket_args=[],
+                                on_pane_event=lambda _pid: None)
+        self.assertEqual(sub._attach_argv()[-2:], ["-f", "ignore-size"])
+        plain = TmuxControlClient(session="s", socket_args=[])
+        self.assertEqual(plain._attach_argv()[-2:],
+                         ["-f", "no-output,ignore-size"])
+
+
+if __name__ == "__main__":
+    unittest.main()
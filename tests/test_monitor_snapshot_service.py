@@ -0,0 +1,287 @@
+"""Tests for the shared monitor snapshot service (``monitor/snapshot_service.py``).
+
+The publisher turns produced batches into versioned deltas and a subscriber's
+feed must rebuild exactly the batch the service produced — or refuse a delta
+it cannot apply. A ``TmuxMonitor(shared_capture=True)`` must adopt a fresh
+feed batch without touching tmux (dropping its own pane, honouring
+single-session mode and its own compare-mode overrides) and fall back to the
+local pipeline when the feed has nothing fresh. The live case runs a real
+service over a Unix socket with a scripted monitor: two subscribers, one
+capture pipeline. No tmux server anywhere.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "lib"))
+
+import monitor.snapshot_service as svc  # noqa: E402
+from monitor.monitor_core import (  # noqa: E402
+    COMPARE_MODE_RAW,
+    AitasksSession,
+    ClassifyResult,
+    PaneCategory,
+    TmuxMonitor,
+    TmuxPaneInfo,
+)
+from monitor.prompt_patterns import all_patterns  # noqa: E402
+
+
+def _pane(pane_id: str, session: str = "demo", shadow_target: str = "") -> TmuxPaneInfo:
+    idx = int(pane_id.lstrip("%"))
+    return TmuxPaneInfo(
+        window_index=str(idx), window_name=f"agent-{idx}", pane_index="0",
+        pane_id=pane_id, pane_pid=1000 + idx, current_command="bash",
+        width=80, height=24, category=PaneCategory.AGENT, session_name=session,
+        shadow_target=shadow_target, history_size=idx,
+    )
+
+
+def _result(text: str) -> ClassifyResult:
+    return ClassifyResult(compare_value=text)
+
+
+async def _sync_offloaded(fn):
+    return fn()
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _entries(batch):
+    return [(p.pane_id, c, r, m) for p, c, r, m in batch.entries]
+
+
+class PublisherFeedTests(unittest.TestCase):
+    def setUp(self):
+        self.pub = svc.BatchPublisher()
+        self.clock = _Clock()
+        self.feed = svc.SnapshotFeed("/nonexistent.sock", clock=self.clock)
+        self.sessions = [AitasksSession("demo", Path("/p/demo"), "demo")]
+
+    def _publish(self, classified, sessions=None):
+        return self.pub.publish(classified, {"demo"}, sessions or self.sessions,
+                                lambda _pid: "stripped")
+
+    def test_delta_round_trip(self):
+        first = self._publish([(_pane("%1"), "a", _result("a")),
+                               (_pane("%2"), None, None)])
+        self.assertEqual(first["base"], 0)
+        self.assertTrue(self.feed.apply(first))
+        batch = self.feed.current()
+        self.assertEqual(_entries(batch), [("%1", "a", _result("a"), "stripped"),
+                                           ("%2", None, None, "stripped")])
+        self.assertEqual(batch.entries[0][0], _pane("%1"))
+        self.assertEqual(batch.sessions, self.sessions)
+        self.assertEqual(batch.enumerated, frozenset({"demo"}))
+
+        second = self._publish([(_pane("%1"), "a", _result("a")),
+                                (_pane("%3"), "c", _result("c"))])
+        self.assertEqual(set(second["changed"]), {"%3"})   # %1 unchanged
+        self.assertEqual(second["removed"], ["%2"])
+        self.assertNotIn("sessions", second)                # unchanged too
+        self.assertTrue(self.feed.apply(second))
+        self.assertEqual([e[0] for e in _entries(self.feed.current())], ["%1", "%3"])
+        self.assertEqual(self.feed.current().sessions, self.sessions)
+
+    def test_version_gap_is_refused_and_full_batch_recovers(self):
+        self.feed.apply(self._publish([(_pane("%1"), "a", _result("a"))]))
+        self._publish([(_pane("%1"), "b", _result("b"))])   # missed
+        third = self._publish([(_pane("%1"), "c", _result("c"))])
+        self.assertFalse(self.feed.apply(third))
+        full = self.pub.full()
+        self.assertEqual(full["base"], 0)
+        self.assertTrue(self.feed.apply(full))
+        self.assertEqual(_entries(self.feed.current()),
+                         [("%1", "c", _result("c"), "stripped")])
+
+    def test_stale_batch_is_not_served(self):
+        self.assertIsNone(self.feed.current())              # nothing yet
+        self.feed.apply(self._publish([(_pane("%1"), "a", _result("a"))]))
+        self.assertIsNotNone(self.feed.current())
+        self.clock.now += self.feed.stale_after + 1
+        self.assertIsNone(self.feed.current())
+
+    def test_cadence_is_the_median_call_gap(self):
+        for gap in (3.0, 3.0, 0.01, 3.0):                   # one user-forced refresh
+            self.clock.now += gap
+            self.feed.current()
+        self.assertEqual(self.feed._interval, 3.0)
+
+
+class _FakeFeed:
+    def __init__(self, batch):
+        self.batch = batch
+        self.closed = False
+
+    def current(self):
+        return self.batch
+
+    async def close(self):
+        self.closed = True
+
+
+def _make_monitor(local_panes=(), local_content=None, **kw):
+    mon = TmuxMonitor(session="demo", agent_prefixes=["agent-"],
+                      prompt_patterns=all_patterns(), shared_capture=True,
+                      exclude_pane="%9", **kw)
+    mon._run_offloaded = _sync_offloaded
+    mon.local_captures = []
+    local_content = local_content or {}
+
+    async def discover_with_shadows(*, enum_sink=None):
+        return list(local_panes), []
+
+    async def cap_content(pane_id, capture_lines=None, pane=None):
+        mon.local_captures.append(pane_id)
+        return pane, local_content[pane_id]
+
+    mon.discover_panes_with_shadows_async = discover_with_shadows
+    mon.capture_pane_content_async = cap_content
+    return mon
+
+
+def _batch(*entries, enumerated=("demo", "other"), sessions=None):
+    return svc.FeedBatch(1, list(entries), frozenset(enumerated), sessions)
+
+
+class AdoptionTests(unittest.IsolatedAsyncioTestCase):
+    async def test_fresh_batch_is_adopted_without_capturing(self):
+        sessions = [AitasksSession("demo", Path("/p/demo"), "demo")]
+        mon = _make_monitor()
+        mon._snapshot_feed = _FakeFeed(_batch(
+            (_pane("%1"), "one", _result("one"), "stripped"),
+            (_pane("%9"), "me", _result("me"), "stripped"),     # our own pane
+            (_pane("%4", shadow_target="%1"), "sh", _result("sh"), "stripped"),
+            (_pane("%2"), None, None, "stripped"),
+            sessions=sessions,
+        ))
+        gen, classified = await mon.capture_all_classified_async()
+        self.assertEqual(mon.local_captures, [])
+        self.assertEqual([(p.pane_id, c) for p, c, _r in classified],
+                         [("%1", "one"), ("%4", "sh"), ("%2", None)])
+        snaps = mon.commit_snapshots(gen, classified)
+        self.assertEqual(set(snaps), {"%1"})
+        self.assertEqual(set(mon._shadow_snapshots), {"%1"})
+        self.assertEqual(set(mon._pane_cache), {"%1", "%2"})
+        self.assertEqual(mon.last_enumerated_sessions(), frozenset({"demo", "other"}))
+        self.assertEqual(await mon.get_session_to_project_mapping_async(),
+                         {"demo": Path("/p/demo")})
+
+    async def test_own_compare_mode_is_reclassified_locally(self):
+        mon = _make_monitor()
+        mon._compare_mode_overrides["%1"] = COMPARE_MODE_RAW
+        content = "\x1b[1mhello\x1b[0m"
+        mon._snapshot_feed = _FakeFeed(_batch(
+            (_pane("%1"), content, _result("hello"), "stripped"),
+            (_pane("%2"), "two", _result("service"), "stripped"),
+        ))
+        _gen, classified = await mon.capture_all_classified_async()
+        results = {p.pane_id: r for p, _c, r in classified}
+        self.assertEqual(results["%1"].compare_value, content)   # raw mode
+        self.assertEqual(results["%2"], _result("service"))      # reused
+
+    async def test_single_session_mode_filters_and_falls_back(self):
+        mon = _make_monitor(local_panes=[_pane("%5")],
+                            local_content={"%5": "local"}, multi_session=False)
+        mon._snapshot_feed = _FakeFeed(_batch(
+            (_pane("%1"), "one", _result("one"), "stripped"),
+            (_pane("%3", session="other"), "x", _result("x"), "stripped"),
+        ))
+        _gen, classified = await mon.capture_all_classified_async()
+        self.assertEqual([p.pane_id for p, _c, _r in classified], ["%1"])
+        self.assertEqual(mon.local_captures, [])
+        # A session the service never enumerated: capture it ourselves.
+        mon._snapshot_feed = _FakeFeed(_batch(enumerated=("other",)))
+        _gen, classified = await mon.capture_all_classified_async()
+        self.assertEqual(mon.local_captures, ["%5"])
+
+    async def test_no_fresh_batch_runs_the_local_pipeline(self):
+        mon = _make_monitor(local_panes=[_pane("%5")], local_content={"%5": "local"})
+        feed = mon._snapshot_feed = _FakeFeed(None)
+        _gen, classified = await mon.capture_all_classified_async()
+        self.assertEqual(mon.local_captures, ["%5"])
+        self.assertEqual([c for _p, c, _r in classified], ["local"])
+        await mon.close_control_client()
+        self.assertTrue(feed.closed)
+        self.assertIsNone(mon._snapshot_feed)
+
+
+class _ScriptedMonitor:
+    """Just the produce/commit surface the service drives."""
+
+    def __init__(self):
+        self.captures = 0
+        self._sessions_cache = None
+
+    async def capture_all_classified_async(self):
+        self.captures += 1
+        return self.captures, [(_pane("%1"), f"tick {self.captures}",
+                                _result(f"tick {self.captures}"))]
+
+    def commit_snapshots(self, gen, classified):
+        return {}
+
+    def last_enumerated_sessions(self):
+        return frozenset({"demo"})
+
+    def get_compare_mode(self, pane_id):
+        return "stripped"
+
+    async def start_control_client(self):
+        return False
+
+    async def close_control_client(self):
+        pass
+
+
+class LiveServiceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_two_subscribers_share_one_pipeline(self):
+        tmp = tempfile.mkdtemp(prefix="snapsvc_")
+        self.addCleanup(shutil.rmtree, tmp, True)
+        run = os.path.join(tmp, "run")
+        path = os.path.join(run, "t.sock")
+        monitor = _ScriptedMonitor()
+        service = svc.SnapshotService(path, monitor, idle_exit_s=0.5)
+        server = asyncio.create_task(service.run())
+        feeds = [svc.SnapshotFeed(path, interval=svc.MIN_INTERVAL_S) for _ in range(2)]
+        for feed in feeds:
+            feed.start()
+        try:
+            async def until(cond):
+                for _ in range(200):
+                    if cond():
+                        return
+                    await asyncio.sleep(0.02)
+                self.fail("timed out")
+
+            await until(lambda: all(f._version >= 3 for f in feeds))
+            self.assertEqual(oct(os.stat(run).st_mode & 0o777), "0o700")
+            self.assertEqual(service.status()["subscribers"], 2)
+            self.assertEqual(monitor.captures, service.ticks)   # not 2× ticks
+            seen = [f.current().entries[0][1] for f in feeds]
+            self.assertTrue(all(s.startswith("tick ") for s in seen))
+        finally:
+            for feed in feeds:
+                await feed.close()
+        # No subscribers left: the service exits on its own and cleans up.
+        self.assertEqual(await asyncio.wait_for(server, 10), 0)
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
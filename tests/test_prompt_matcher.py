@@ -0,0 +1,159 @@
+"""Parity tests for the prefiltered prompt matcher and the tail-only ANSI strip.
+
+``classify_content`` now asks a cached ``PromptMatcher`` instead of looping
+over ``scope_patterns(...)`` itself, and raw compare mode strips only the
+detection tail. Both are pure speedups: for every capture and every agent the
+reported kind must be exactly what the plain first-match-wins loop over the
+fully stripped capture reports.
+
+The corpus is every live-captured fixture in ``review_loop_fixtures`` plus a
+seeded fuzz over the escape sequences and line breaks that make the tail cut
+delicate.
+
+Run: python3 -m pytest tests/test_prompt_matcher.py -v
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts"))
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "lib"))
+sys.path.insert(0, str(REPO_ROOT / "tests"))
+
+import review_loop_fixtures  # noqa: E402
+from monitor.ansi_utils import strip_ansi  # noqa: E402
+from monitor.monitor_core import (  # noqa: E402
+    COMPARE_MODE_RAW,
+    COMPARE_MODE_STRIPPED,
+    PaneCategory,
+    _prompt_detection_text,
+    _stripped_prompt_detection_text,
+    classify_content,
+)
+from monitor.prompt_patterns import (  # noqa: E402
+    PromptMatcher,
+    PromptPattern,
+    _prefilter,
+    all_patterns,
+    prompt_matcher,
+    scope_patterns,
+)
+
+AGENTS = ["", "claude", "codex", "opencode", "node"]
+
+
+def _reference_kind(patterns, agent, text):
+    """The pre-matcher loop, verbatim."""
+    for p in scope_patterns(patterns, agent):
+        if p.regex.search(text):
+            return p.name
+    return None
+
+
+def _fixtures():
+    return [(name, value) for name, value in vars(review_loop_fixtures).items()
+            if name.isupper() and isinstance(value, str)]
+
+
+class PromptMatcherParityTests(unittest.TestCase):
+    def test_every_pattern_has_a_prefilter(self):
+        # Not required for correctness, but a pattern that silently lost its
+        # literal would quietly fall back to the slow path on every tick.
+        for p in all_patterns():
+            with self.subTest(pattern=p.name):
+                self.assertTrue(_prefilter(p.regex))
+
+    def test_recorded_captures_match_reference(self):
+        patterns = all_patterns()
+        fixtures = _fixtures()
+        self.assertGreater(len(fixtures), 20)
+        matched = set()
+        for name, capture in fixtures:
+            text = _prompt_detection_text(strip_ansi(capture))
+            for agent in AGENTS:
+                with self.subTest(fixture=name, agent=agent):
+                    kind = prompt_matcher(patterns, agent).first_match(text)
+                    self.assertEqual(kind, _reference_kind(patterns, agent, text))
+                    matched.add(kind)
+        # The corpus exercises both outcomes, not just "no prompt".
+        self.assertIn(None, matched)
+        self.assertGreater(len(matched), 3)
+
+    def test_first_match_wins_in_list_order(self):
+        late = PromptPattern("late", re.compile(r"^beta", re.M))
+        early = PromptPattern("early", re.compile(r"gamma"))
+        text = "beta\nalpha gamma"
+        # "late" matches earlier in the TEXT, "early" is earlier in the LIST.
+        self.assertEqual(PromptMatcher([early, late]).first_match(text), "early")
+        self.assertEqual(PromptMatcher([late, early]).first_match(text), "late")
+
+    def test_unfilterable_patterns_are_always_searched(self):
+        patterns = [PromptPattern("ci", re.compile(r"press ENTER", re.I)),
+                    PromptPattern("class", re.compile(r"\d{3}\s\d{3}")),
+                    PromptPattern("opt", re.compile(r"(?:abc)?\w"))]
+        for p in patterns:
+            self.assertIsNone(_prefilter(p.regex))
+        m = PromptMatcher(patterns)
+        self.assertEqual(m.first_match("Press enter"), "ci")
+        self.assertEqual(m.first_match("call 555 123"), "class")
+        self.assertEqual(m.first_match("x"), "opt")
+        self.assertEqual(_prefilter(re.compile(r"\d{3}-\d{3}")),
+                         frozenset({"-"}))
+
+    def test_cache_follows_in_place_list_changes(self):
+        patterns = [PromptPattern("one", re.compile("one"))]
+        self.assertIsNone(prompt_matcher(patterns, "").first_match("two"))
+        patterns.append(PromptPattern("two", re.compile("two")))
+        self.assertEqual(prompt_matcher(patterns, "").first_match("two"), "two")
+        self.assertIs(prompt_matcher(patterns, ""), prompt_matcher(patterns, ""))
+
+    def test_unknown_agents_share_the_unscoped_matcher(self):
+        patterns = all_patterns()
+        self.assertIs(prompt_matcher(patterns, "node"),
+                      prompt_matcher(patterns, ""))
+
+
+class TailStripParityTests(unittest.TestCase):
+    def _check(self, content):
+        self.assertEqual(_stripped_prompt_detection_text(content),
+                         _prompt_detection_text(strip_ansi(content)))
+
+    def test_recorded_captures(self):
+        for name, capture in _fixtures():
+            with self.subTest(fixture=name):
+                self._check(capture)
+                self._check(capture + "\n" * 3)
+
+    def test_seeded_fuzz(self):
+        alphabet = ["a", "b", " ", "\n", "\n", "\r", "\r\n", "\x0b", "\x1c",
+                    " ", "\x1b[31m", "\x1b[0m", "\x1b[", "m", "\x1b]8;;u",
+                    "\x1b]8;;\x1b\\", "\x07", "\x1b\\", "\x1b]0;t\n\n\x07",
+                    "\x1b]x\ny\n", "\x1b"]
+        rng = random.Random(825)
+        for _ in range(20000):
+            content = "".join(rng.choice(alphabet)
+                              for _ in range(rng.randint(0, 40)))
+            with self.subTest(content=content):
+                self._check(content)
+
+    def test_raw_mode_classification_unchanged(self):
+        patterns = all_patterns()
+        for name, capture in _fixtures():
+            raw = classify_content(capture, COMPARE_MODE_RAW, patterns,
+                                   PaneCategory.AGENT, "claude")
+            stripped = classify_content(capture, COMPARE_MODE_STRIPPED, patterns,
+                                        PaneCategory.AGENT, "claude")
+            with self.subTest(fixture=name):
+                self.assertEqual(raw.awaiting_input_kind,
+                                 stripped.awaiting_input_kind)
+                self.assertEqual(raw.compare_value, capture)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Tests for the persisted per-bundle stats records (lib/stats_cache.py).
+
+A cached ``collect_stats`` must equal an uncached one field for field — for
+any ``today``, since only time-independent records are cached — and a second
+run must not decode a single unchanged bundle.
+
+Run: python3 -m pytest tests/test_stats_cache.py -v
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+_lib_dir = Path(__file__).resolve().parents[1] / ".aitask-scripts" / "lib"
+sys.path.insert(0, str(_lib_dir))
+
+import archive_iter  # noqa: E402
+import stats_data as sd  # noqa: E402
+from stats_cache import StatsCache, bundle_digest, default_cache_path  # noqa: E402
+
+HAS_ZSTD_CLI = shutil.which("zstd") is not None
+
+
+def _task(completed: str, labels: str, impl: str = "codex/gpt5_4") -> str:
+    return (
+        "---\n"
+        "status: Done\n"
+        f"completed_at: {completed}\n"
+        f"labels: [{labels}]\n"
+        "issue_type: feature\n"
+        f"implemented_with: {impl}\n"
+        "---\n"
+        "body\n"
+    )
+
+
+def _write_bundle(path: Path, files: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tf:
+        for name, text in files.items():
+            data = text.encode("utf-8")
+            info = tarfile.TarInfo(name=name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    subprocess.run(["zstd", "-q", "-f", "-o", str(path)],
+                   input=buf.getvalue(), check=True)
+
+
+@unittest.skipUnless(HAS_ZSTD_CLI, "zstd CLI not installed")
+class StatsCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp(prefix="stats_cache_"))
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        env = mock.patch.dict(os.environ, {
+            "XDG_CACHE_HOME": str(self.tmp / "xdg"), "AIT_STATS_CACHE": "1",
+            "AIT_ARCHIVE_SCAN_WORKERS": "2"})
+        env.start()
+        self.addCleanup(env.stop)
+
+        self.project = self.tmp / "project"
+        self.archived = self.project / "aitasks" / "archived"
+        self.archived.mkdir(parents=True)
+        (self.archived / "t950_loose.md").write_text(
+            _task("2026-03-04 10:00", "loose"), encoding="utf-8")
+        self.b0 = self.archived / "_b0" / "old0.tar.zst"
+        self.b1 = self.archived / "_b0" / "old1.tar.zst"
+        _write_bundle(self.b0, {
+            "t10_a.md": _task("2026-03-02 10:00", "alpha"),
+            "t10/t10_1_child.md": _task("2026-02-20 10:00", "beta, alpha"),
+            "t11_undated.md": "---\nstatus: Ready\n---\nno date\n",
+        })
+        _write_bundle(self.b1, {
+            "t120_b.md": _task("2026-01-15 10:00", "gamma", "claudecode/x"),
+        })
+
+    def _collect(self, today=date(2026, 3, 5), cache=True):
+        with mock.patch.dict(os.environ,
+                             {"AIT_STATS_CACHE": "1" if cache else "0"}):
+            return sd.collect_stats(today=today, week_start_dow=1,
+                                    project_root=self.project)
+
+    def _cache(self):
+        return StatsCache(default_cache_path(self.archived))
+
+    def assertSameStats(self, a, b):
+        # Field by field: asdict() cannot rebuild the defaultdict fields.
+        for field in dataclasses.fields(a):
+            with self.subTest(field=field.name):
+                self.assertEqual(getattr(a, field.name), getattr(b, field.name))
+
+    def test_cached_run_matches_uncached_and_skips_decoding(self):
+        uncached = self._collect(cache=False)
+        self.assertEqual(uncached.total_tasks, 4)
+        self.assertEqual(len(self._cache()), 0)     # cache off wrote nothing
+
+        self.assertSameStats(self._collect(), uncached)
+        self.assertEqual(len(self._cache()), 2)
+        with mock.patch.object(archive_iter, "_read_single_archive",
+                               side_effect=AssertionError("decoded")):
+            self.assertSameStats(self._collect(), uncached)
+
+    def test_time_relative_buckets_follow_today(self):
+        self._collect()                                  # warm the cache
+        for today in (date(2026, 3, 20), date(2026, 1, 16)):
+            with self.subTest(today=today):
+                self.assertSameStats(self._collect(today=today),
+                                     self._collect(today=today, cache=False))
+
+    def test_changed_bundle_is_reingested_and_old_digest_pruned(self):
+        self._collect()
+        old_digest = bundle_digest(self.b1)
+        _write_bundle(self.b1, {
+            "t120_b.md": _task("2026-03-01 10:00", "delta"),
+            "t121_c.md": _task("2026-03-01 11:00", "delta"),
+        })
+        data = self._collect()
+        self.assertEqual(data.label_counts_total["delta"], 2)
+        self.assertNotIn("gamma", data.label_counts_total)
+        cache = self._cache()
+        self.assertIsNone(cache.get(old_digest))
+        self.assertIsNotNone(cache.get(bundle_digest(self.b1)))
+
+    def test_loose_files_are_always_reread(self):
+        self._collect()
+        (self.archived / "t951_new.md").write_text(
+            _task("2026-03-05 09:00", "fresh"), encoding="utf-8")
+        self.assertEqual(self._collect().label_counts_total["fresh"], 1)
+
+    def test_unreadable_bundle_is_not_cached(self):
+        self.b1.write_bytes(b"\x28\xb5\x2f\xfd not really zstd")
+        data = self._collect()
+        self.assertEqual(data.total_tasks, 3)
+        cache = self._cache()
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get(bundle_digest(self.b1)))
+
+    def test_corrupt_or_stale_cache_file_is_ignored(self):
+        path = default_cache_path(self.archived)
+        path.parent.mkdir(parents=True)
+        path.write_text("{nope", encoding="utf-8")
+        self.assertEqual(self._collect().total_tasks, 4)
+        path.write_text('{"version": -1, "bundles": {}}', encoding="utf-8")
+        self.assertEqual(self._collect().total_tasks, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+"""Parity tests for task_yaml's frontmatter loading fast paths.
+
+``parse_frontmatter`` now tries a hand-written parser for flat frontmatter and
+then the libyaml-backed ``_TaskCSafeLoader`` before the pure-Python
+``_TaskSafeLoader``. Every layer must be indistinguishable from the reference
+``yaml.load(text, Loader=_TaskSafeLoader)``: same keys in the same order, same
+values with the same TYPES (``True`` is not ``1``, ``"85_2"`` is not ``852``),
+and the same exception type for anything malformed.
+
+The corpus is a hand-picked set of edge cases, a seeded fuzz over the tokens
+our frontmatter actually uses and — when the checkout has one — every task in
+``aitasks/`` and ``aitasks/archived/`` (loose files and bundles).
+
+Run: python3 -m pytest tests/test_task_yaml_fast_path.py -v
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / ".aitask-scripts" / "lib"))
+
+import task_yaml  # noqa: E402
+from task_yaml import (  # noqa: E402
+    FRONTMATTER_RE,
+    _NOT_FAST,
+    _TaskSafeLoader,
+    _fast_load,
+    load_frontmatter_yaml,
+    parse_frontmatter,
+)
+
+
+def _typed(value):
+    """A comparison key that tells True from 1 and '1' from 1."""
+    if isinstance(value, dict):
+        return ("dict", [(_typed(k), _typed(v)) for k, v in value.items()])
+    if isinstance(value, list):
+        return ("list", [_typed(v) for v in value])
+    return (type(value).__name__, value)
+
+
+def _outcome(loader, text):
+    try:
+        return ("ok", _typed(loader(text)))
+    except Exception as exc:  # noqa: BLE001 - the exception TYPE is the result
+        return ("raise", type(exc).__name__)
+
+
+def _reference(text):
+    return yaml.load(text, Loader=_TaskSafeLoader)
+
+
+FLAT = (
+    "priority: medium\n"
+    "effort: low\n"
+    "depends: [85_2, 16, t12_3]\n"
+    "issue_type: feature\n"
+    "status: Implementing\n"
+    "labels: [ui, 'perf', \"board\"]\n"
+    "children_to_implement: []\n"
+    "assigned_to: someone@example.com\n"
+    "issue: https://github.com/org/repo/issues/12\n"
+    "created_at: 2026-01-05 10:30\n"
+    "updated_at: 2026-01-05 10:31\n"
+    "boardidx: 40\n"
+    "boardcol: now\n"
+    "verified: yes\n"
+    "locked_by:\n"
+    "anchor: 85_2\n"
+    "title: 'It''s done'\n"
+)
+
+EDGE_CASES = [
+    "",
+    "\n",
+    "a: 1\na: 2",
+    "k: 007", "k: 0x1F", "k: 1_000", "k: 10:30", "k: 1.5", "k: .inf",
+    "k: 2026-01-05", "k: 2026-01-05 10:30:00", "k: +5", "k: -0", "k: 0",
+    "k: ~", "k: null", "k: Null", "k: NULL", "k: 'null'", "k:", "k:    ",
+    "k: yes", "k: No", "k: ON", "k: off", "k: y", "k: n", "k: True",
+    "yes: 1", "null: 1", "on: x", "1: x", "_k: v", "k-dash: v",
+    "k: v # comment", "k: C#", "k: a: b", "k: ends:", "k: a:b",
+    "k: [a, b] # c", "k: [a,, b]", "k: [a, ]", "k: [[a]]", "k: [a: b]",
+    "k: [-1, +2, 007, yes, ~, '', \"\"]", "k: [ ]", "k: [a b, c]",
+    "k: ['a,b']", "k: [it's]", "k: {a: 1}", "k: - a", "k: -a",
+    "k: 'unterminated", "k: \"esc\\n\"", "k: \"plain\"", "k: 'x' y",
+    "k: |\n  block", "k:\n  - a\n  - b", "k:\n  nested: 1",
+    "k: v\n# comment\nj: w", "  k: v", "k:v", "---", "...", "k: v\n---",
+    "k: ☃", "k: a\tb", "k: v\r", "k: &a v", "k: *a", "k: !!str 1",
+    "k: %x", "k: @x", "k: `x", "k: ?x", "k: =", "k: <<", "k: >",
+    "just a scalar", "- a\n- b", "k: [a, b", "k: 'a''b'", "k: ''''",
+]
+
+
+class FastPathTests(unittest.TestCase):
+    def test_flat_frontmatter_takes_the_fast_path(self):
+        self.assertIsNot(_fast_load(FLAT), _NOT_FAST)
+        self.assertEqual(_outcome(load_frontmatter_yaml, FLAT),
+                         _outcome(_reference, FLAT))
+
+    def test_flat_frontmatter_never_reaches_yaml(self):
+        with mock.patch.object(task_yaml, "_yaml_load",
+                               side_effect=AssertionError("slow path")):
+            meta, _body, order = parse_frontmatter(f"---\n{FLAT}---\nbody\n")
+        self.assertEqual(meta["depends"], ["t85_2", 16, "t12_3"])
+        self.assertEqual(meta["anchor"], "t85_2")
+        self.assertIs(meta["verified"], True)
+        self.assertIsNone(meta["locked_by"])
+        self.assertEqual(order[0], "priority")
+
+    def test_edge_cases_match_reference(self):
+        for text in EDGE_CASES:
+            with self.subTest(text=text):
+                self.assertEqual(_outcome(load_frontmatter_yaml, text),
+                                 _outcome(_reference, text))
+
+    def test_fast_parser_alone_never_disagrees(self):
+        """Whatever _fast_load accepts must be exactly the reference result."""
+        for text in EDGE_CASES + [FLAT]:
+            fast = _fast_load(text)
+            if fast is _NOT_FAST:
+                continue
+            with self.subTest(text=text):
+                self.assertEqual(("ok", _typed(fast)),
+                                 _outcome(_reference, text))
+
+    def test_seeded_fuzz_matches_reference(self):
+        keys = ["status", "labels", "depends", "yes", "null", "k-1", "_x"]
+        atoms = ["85_2", "t85_2", "16", "007", "0x1", "1_0", "1.0", "yes",
+                 "No", "~", "null", "", "a b", "a#b", "a #b", "C#", "x:y",
+                 "x: y", "-1", "+1", "-", "'q'", "'it''s'", "\"dq\"", "'",
+                 "2026-01-05", "2026-01-05 10:30", "10:30", "http://h/p",
+                 "[a]", "[]", "a,b", "{", "}", "&a", "!t", "=", "<<", "?"]
+        rng = random.Random(1234)
+        for _ in range(3000):
+            lines = []
+            for _ in range(rng.randint(1, 4)):
+                key = rng.choice(keys)
+                if rng.random() < 0.3:
+                    items = ", ".join(rng.choice(atoms)
+                                      for _ in range(rng.randint(0, 3)))
+                    lines.append(f"{key}: [{items}]")
+                else:
+                    lines.append(f"{key}: {rng.choice(atoms)}".rstrip())
+            text = "\n".join(lines)
+            with self.subTest(text=text):
+                self.assertEqual(_outcome(load_frontmatter_yaml, text),
+                                 _outcome(_reference, text))
+
+
+@unittest.skipIf(task_yaml._TaskCSafeLoader is None,
+                 "PyYAML built without libyaml")
+class CLoaderTests(unittest.TestCase):
+    def _c_load(self, text):
+        return yaml.load(text, Loader=task_yaml._TaskCSafeLoader)
+
+    def test_c_loader_keeps_task_resolvers(self):
+        self.assertEqual(self._c_load("d: [85_2, 16]"), {"d": ["85_2", 16]})
+
+    def test_c_loader_matches_reference_on_full_yaml(self):
+        texts = EDGE_CASES + [
+            "gates:\n  tests: pass\n  lint: [a, b]\n",
+            "k: >\n  folded\n  text\n",
+            "k: \"esc\\t\\u00e9\"\n",
+            "created_at: 2026-01-05 10:30:00\n",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                try:
+                    expected = _outcome(_reference, text)
+                except Exception:  # noqa: BLE001
+                    continue
+                if expected[0] == "raise":
+                    continue
+                self.assertEqual(_outcome(self._c_load, text), expected)
+
+    def test_character_fuzz_matches_reference(self):
+        """libyaml and PyYAML disagree on a handful of constructs (tabs, tags,
+        '?' in flow context...); _LIBYAML_DIVERGENT_RE must route all of them
+        to the reference loader."""
+        alphabet = (list("ab1_:- #'\"[]{},\n?&*|>@`\\~.!%\t")
+                    + ["  ", "\n  ", "\n- ", "é", "\x07", "k: ", "\nk: ",
+                       "﻿", "\x85", " ", "[a, b]", "'q'", "85_2"])
+        rng = random.Random(4321)
+        for _ in range(20000):
+            text = "".join(rng.choice(alphabet)
+                           for _ in range(rng.randint(1, 16)))
+            with self.subTest(text=text):
+                self.assertEqual(_outcome(load_frontmatter_yaml, text),
+                                 _outcome(_reference, text))
+
+    def test_libyaml_errors_reraise_from_reference_loader(self):
+        with self.assertRaises(yaml.YAMLError) as ctx:
+            load_frontmatter_yaml("labels: [a, b\n")
+        with self.assertRaises(type(ctx.exception)):
+            _reference("labels: [a, b\n")
+
+
+def _corpus():
+    """(name, frontmatter) for every task in this checkout, if it has any."""
+    tasks = REPO_ROOT / "aitasks"
+    if not tasks.is_dir():
+        return
+    for path in sorted(tasks.glob("**/*.md")):
+        if "archived" in path.parts:
+            continue
+        yield str(path), path.read_text(encoding="utf-8", errors="replace")
+    archived = tasks / "archived"
+    if archived.is_dir():
+        from archive_iter import iter_all_archived_tar_files, \
+            iter_all_archived_markdown
+        yield from iter_all_archived_markdown(archived)
+        yield from iter_all_archived_tar_files(archived)
+
+
+class CorpusParityTests(unittest.TestCase):
+    def test_checkout_corpus_matches_reference(self):
+        seen = 0
+        for name, text in _corpus():
+            m = FRONTMATTER_RE.match(text)
+            if not m:
+                continue
+            seen += 1
+            with self.subTest(task=name):
+                self.assertEqual(_outcome(load_frontmatter_yaml, m.group(1)),
+                                 _outcome(_reference, m.group(1)))
+        if not seen:
+            self.skipTest("no task corpus in this checkout")
+
+
+if __name__ == "__main__":
+    unittest.main()
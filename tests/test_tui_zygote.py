@@ -0,0 +1,249 @@
+"""Tests for lib/tui_zygote.py — the single-interpreter TUI launcher and zygote.
+
+``launch`` must run the TUI script with its argv verbatim and its exit status,
+after a dependency check in the same process. With ``AIT_TUI_ZYGOTE=1`` and a
+running zygote the script must run in a forked child (a different pid) that
+writes to the launcher's stdout and whose exit status the launcher returns;
+launches the zygote cannot serve faithfully (stdin is not a terminal, a pinned
+env var differs, a preloaded file changed on disk) must still run, in-process.
+Only a peer with our uid is served, and a launcher hands its terminal only to a
+zygote of our uid listening in a directory private to us. No live tmux: ``$TMUX`` only keys the socket
+path; launches get a pty for stdin.
+
+Run: python3 tests/test_tui_zygote.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ZYGOTE = REPO_ROOT / ".aitask-scripts" / "lib" / "tui_zygote.py"
+sys.path.insert(0, str(ZYGOTE.parent))
+
+import tui_zygote  # noqa: E402
+
+_SCRIPT = """\
+import json, os, sys
+print(json.dumps({"argv": sys.argv[1:], "pid": os.getpid(), "cwd": os.getcwd(),
+                  "foo": os.environ.get("FOO")}))
+sys.exit(int(os.environ.get("RC", "0")))
+"""
+
+
+class _Tmp(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="tui_zygote_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.script = os.path.join(self.tmp, "fake_tui.py")
+        Path(self.script).write_text(_SCRIPT)
+        self.env = {k: v for k, v in os.environ.items()
+                    if not k.startswith(("TMUX", "AIT_TUI_ZYGOTE"))}
+
+    def _launch(self, *args, env=None, deps="json", tty=True):
+        out = os.path.join(self.tmp, "out.txt")
+        master, slave = os.openpty() if tty else (None, None)
+        try:
+            with open(out, "w") as fh:
+                proc = subprocess.Popen(
+                    [sys.executable, str(ZYGOTE), "launch", "--deps", deps,
+                     self.script, *args],
+                    stdin=slave if tty else subprocess.DEVNULL,
+                    stdout=fh, stderr=subprocess.PIPE, text=True, cwd=self.tmp,
+                    env=env or self.env)
+                _out, err = proc.communicate(timeout=60)
+        finally:
+            for fd in (master, slave):
+                if fd is not None:
+                    os.close(fd)
+        text = Path(out).read_text()
+        return proc, (json.loads(text) if text else None), err
+
+
+class InProcessLaunchTests(_Tmp):
+    def test_runs_script_with_verbatim_argv_and_exit_status(self):
+        env = dict(self.env, FOO="bar", RC="3")
+        proc, seen, _err = self._launch("--help", "--", "-x", env=env)
+        self.assertEqual(proc.returncode, 3)
+        self.assertEqual(seen["argv"], ["--help", "--", "-x"])
+        self.assertEqual(seen["pid"], proc.pid)          # same interpreter
+        self.assertEqual((seen["cwd"], seen["foo"]), (os.path.realpath(self.tmp), "bar"))
+
+    def test_missing_dependency_names_the_distribution(self):
+        proc, seen, err = self._launch(deps="json,no_such_mod_xyz=no-such-dist")
+        self.assertEqual(proc.returncode, 1)
+        self.assertIsNone(seen)
+        self.assertIn("Missing Python packages: no-such-dist", err)
+        self.assertIn("ait setup", err)
+
+    def test_importtime_summary(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |   textual._two\n"
+            "import time:       400 |        500 | textual.app\n"
+            "import time:      1000 |       1000 | yaml\n"
+            "garbage line\n"
+        )
+        summary = tui_zygote.summarize_importtime(stderr)
+        self.assertEqual(summary["modules"], 3)
+        self.assertEqual(summary["total_ms"], 1.5)
+        self.assertEqual(list(summary["packages"].items()),
+                         [("yaml", 1.0), ("textual", 0.5)])
+
+    def test_parse_deps(self):
+        self.assertEqual(tui_zygote.parse_deps("textual, yaml=pyyaml,,"),
+                         [("textual", "textual"), ("yaml", "pyyaml")])
+
+
+class ZygoteTests(_Tmp):
+    def setUp(self):
+        super().setUp()
+        self.env.update(TMUX=f"{self.tmp}/tmux,1,0", XDG_RUNTIME_DIR=self.tmp,
+                        AIT_TUI_ZYGOTE="1")
+        self.path = tui_zygote.socket_path(self.env)
+        # A preloaded module of our own, so "changed on disk" can be simulated.
+        self.mod = os.path.join(self.tmp, "zyg_preloaded.py")
+        Path(self.mod).write_text("VALUE = 1\n")
+        env = dict(self.env, PYTHONPATH=self.tmp)
+        self.server = subprocess.Popen(
+            [sys.executable, str(ZYGOTE), "serve", "--socket", self.path,
+             "--preload", "json,zyg_preloaded", "--idle-exit", "60"],
+            env=env, stderr=subprocess.DEVNULL, start_new_session=True)
+        self.addCleanup(self._stop_all)
+        deadline = time.monotonic() + 20
+        while not os.path.exists(self.path):
+            self.assertLess(time.monotonic(), deadline, "zygote never listened")
+            time.sleep(0.05)
+
+    def _stop_all(self):
+        # The stale-zygote test leaves a freshly spawned replacement behind.
+        subprocess.run([sys.executable, str(ZYGOTE), "stop"], env=self.env,
+                       capture_output=True, timeout=30)
+        if self.server.poll() is None:
+            self.server.terminate()
+        self.server.wait(timeout=30)
+
+    def _status(self) -> dict:
+        out = subprocess.run([sys.executable, str(ZYGOTE), "status"], env=self.env,
+                             capture_output=True, text=True, timeout=30).stdout
+        return json.loads(out)
+
+    def test_launch_is_forked_and_reports_the_child_exit(self):
+        env = dict(self.env, FOO="bar", RC="5")
+        proc, seen, _err = self._launch("a", "--b", env=env)
+        self.assertEqual(proc.returncode, 5)
+        self.assertNotEqual(seen["pid"], proc.pid)       # ran in the zygote's child
+        self.assertEqual(seen["argv"], ["a", "--b"])
+        self.assertEqual((seen["cwd"], seen["foo"]), (os.path.realpath(self.tmp), "bar"))
+        status = self._status()
+        self.assertEqual((status["launches"], status["children"]), (1, []))
+
+        proc, _seen, err = self._launch(env=env, deps="json,no_such_mod_xyz=nsd")
+        self.assertEqual(proc.returncode, 1)
+        self.assertIn("Missing Python packages: nsd", err)
+
+    def test_pinned_env_mismatch_runs_in_process(self):
+        env = dict(self.env, TEXTUAL_FPS="7")
+        proc, seen, _err = self._launch(env=env)
+        self.assertEqual((proc.returncode, seen["pid"]), (0, proc.pid))
+        self.assertEqual(self._status()["launches"], 0)
+
+    def test_no_terminal_on_stdin_runs_in_process(self):
+        proc, seen, _err = self._launch(tty=False)
+        self.assertEqual((proc.returncode, seen["pid"]), (0, proc.pid))
+        self.assertEqual(self._status()["launches"], 0)
+
+    def test_socket_dir_open_to_others_is_not_used(self):
+        run_dir = os.path.dirname(self.path)
+        os.chmod(run_dir, 0o755)
+        try:
+            proc, seen, _err = self._launch()
+        finally:
+            os.chmod(run_dir, 0o700)
+        self.assertEqual((proc.returncode, seen["pid"]), (0, proc.pid))
+        self.assertEqual(self._status()["launches"], 0)
+
+    def test_changed_preloaded_file_retires_the_zygote(self):
+        st = os.stat(self.mod)
+        os.utime(self.mod, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        proc, seen, _err = self._launch()
+        self.assertEqual((proc.returncode, seen["pid"]), (0, proc.pid))
+        self.server.wait(timeout=30)                      # drained and exited
+        # ...and the launch started a fresh one for the next time.
+        deadline = time.monotonic() + 60
+        while not os.path.exists(self.path):
+            self.assertLess(time.monotonic(), deadline, "no replacement zygote")
+            time.sleep(0.05)
+        self.assertNotEqual(self._status()["pid"], self.server.pid)
+
+
+@unittest.skipUnless(hasattr(socket, "SO_PEERCRED"), "no SO_PEERCRED")
+class PeerCredentialTests(unittest.TestCase):
+    """``_handle`` checks the uid field of ``struct ucred`` (pid, uid, gid)."""
+
+    def _handle(self, uid, gid):
+        conn = mock.Mock()
+        conn.getsockopt.return_value = struct.pack("3i", os.getpid(), uid, gid)
+        with mock.patch.object(tui_zygote.socket, "recv_fds",
+                               side_effect=OSError("stop here")) as recv:
+            tui_zygote.Zygote("unused.sock")._handle(conn, sel=None)
+        return recv.called
+
+    def test_same_uid_other_gid_is_served(self):
+        self.assertTrue(self._handle(os.getuid(), os.getuid() + 1))
+
+    def test_other_uid_is_refused_even_with_our_uid_as_gid(self):
+        self.assertFalse(self._handle(os.getuid() + 1, os.getuid()))
+
+
+class ClientTrustTests(unittest.TestCase):
+    """``_connect`` (every launch, status and stop goes through it) refuses a
+    socket directory that is not ours alone and a server of another uid."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="tui_zygote_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.run_dir = os.path.join(self.tmp, "run")
+        os.mkdir(self.run_dir, 0o700)
+        self.path = os.path.join(self.run_dir, "z.sock")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(listener.close)
+        listener.bind(self.path)
+        listener.listen(4)
+
+    def _connects(self, path=None) -> bool:
+        sock = tui_zygote._connect(path or self.path)
+        if sock is not None:
+            sock.close()
+        return sock is not None
+
+    def test_private_dir_and_our_server_connects(self):
+        self.assertTrue(self._connects())
+
+    def test_server_of_another_uid_is_refused(self):
+        with mock.patch.object(tui_zygote, "peer_uid", return_value=os.getuid() + 1):
+            self.assertFalse(self._connects())
+
+    def test_group_or_world_accessible_dir_is_refused(self):
+        os.chmod(self.run_dir, 0o750)
+        self.assertFalse(self._connects())
+
+    def test_symlinked_dir_is_refused(self):
+        link = os.path.join(self.tmp, "link")
+        os.symlink(self.run_dir, link)
+        self.assertFalse(self._connects(os.path.join(link, "z.sock")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -531,6 +531,49 @@ assert_contains_ci "Test 26: t prefix works" "UNPACKED_TASK:" "$output_26"
 assert_file_exists "Test 26: file extracted with t prefix" "$TMPDIR_26/aitasks/archived/t50_prefix_test.md"
 rm -rf "$TMPDIR_26"
 
+# --- Test 27: Indexed bundles (archive_index.py present) ---
+echo "--- Test 27: Indexed bundle + sidecar index ---"
+TMPDIR_27="$(setup_test_env)"
+(
+    cd "$TMPDIR_27"
+    cp "$PROJECT_DIR/.aitask-scripts/lib/archive_index.py" .aitask-scripts/lib/
+    create_archived_file aitasks/archived/t50_old.md
+    create_archived_file aitasks/archived/t51_old.md
+    git add -A && git commit -m "Add test files" --quiet
+)
+(cd "$TMPDIR_27" && bash .aitask-scripts/aitask_zip_old.sh 2>&1 >/dev/null)
+assert_file_exists "Test 27: bundle created" "$TMPDIR_27/aitasks/archived/_b0/old0.tar.zst"
+assert_file_exists "Test 27: sidecar index created" "$TMPDIR_27/aitasks/archived/_b0/old0.tar.zst.idx"
+tracked_27=$(cd "$TMPDIR_27" && git ls-files aitasks/archived/_b0)
+assert_contains_ci "Test 27: sidecar index committed" "old0.tar.zst.idx" "$tracked_27"
+tar_contents_27=$(zstd -dc "$TMPDIR_27/aitasks/archived/_b0/old0.tar.zst" 2>/dev/null | tar -tf -)
+assert_contains_ci "Test 27: bundle readable by plain zstd|tar" "t51_old.md" "$tar_contents_27"
+(cd "$TMPDIR_27" && bash .aitask-scripts/aitask_zip_old.sh unpack 50 >/dev/null 2>&1)
+assert_file_exists "Test 27: t50 unpacked" "$TMPDIR_27/aitasks/archived/t50_old.md"
+assert_file_exists "Test 27: index kept after rebuild" "$TMPDIR_27/aitasks/archived/_b0/old0.tar.zst.idx"
+(cd "$TMPDIR_27" && bash .aitask-scripts/aitask_zip_old.sh unpack 51 >/dev/null 2>&1)
+assert_file_not_exists "Test 27: emptied bundle removed" "$TMPDIR_27/aitasks/archived/_b0/old0.tar.zst"
+assert_file_not_exists "Test 27: index removed with its bundle" "$TMPDIR_27/aitasks/archived/_b0/old0.tar.zst.idx"
+rm -rf "$TMPDIR_27"
+
+# --- Test 28: A failing helper is warned about, then the plain layout is used ---
+echo "--- Test 28: Broken archive_index.py falls back with a warning ---"
+TMPDIR_28="$(setup_test_env)"
+(
+    cd "$TMPDIR_28"
+    printf 'raise SystemExit("helper exploded: bad zstd binding")\n' > .aitask-scripts/lib/archive_index.py
+    create_archived_file aitasks/archived/t60_old.md
+    git add -A && git commit -m "Add test files" --quiet
+)
+output_28=$(cd "$TMPDIR_28" && bash .aitask-scripts/aitask_zip_old.sh 2>&1 >/dev/null)
+assert_file_exists "Test 28: bundle still created" "$TMPDIR_28/aitasks/archived/_b0/old0.tar.zst"
+assert_file_not_exists "Test 28: no sidecar index" "$TMPDIR_28/aitasks/archived/_b0/old0.tar.zst.idx"
+assert_contains_ci "Test 28: fallback is warned about" "without the .idx index" "$output_28"
+assert_contains_ci "Test 28: warning carries the helper's error" "helper exploded: bad zstd binding" "$output_28"
+tar_contents_28=$(zstd -dc "$TMPDIR_28/aitasks/archived/_b0/old0.tar.zst" 2>/dev/null | tar -tf -)
+assert_contains_ci "Test 28: fallback bundle readable" "t60_old.md" "$tar_contents_28"
+rm -rf "$TMPDIR_28"
+
 # --- Summary ---
 echo ""
 echo "======================================="